@@ -275,7 +275,7 @@ echo "Git workflow completed successfully"
 
     # 리뷰 로그 디렉토리에서 JSON 파일 확인
     exit_code, json_files = container.exec(
-        f"bash -c 'find {review_log_dir} -name \"*.json\" -type f | head -5'"
+        f"bash -c 'find {review_log_dir} -name \"*_review_log.json*\" -type f | head -5'"
     )
     assert exit_code == 0, "Should be able to list JSON files"
 
@@ -287,7 +287,7 @@ echo "Git workflow completed successfully"
     # 가장 최근 JSON 파일의 내용 확인
     latest_json_file = json_files_list.split("\n")[0]
     # print(f"DEBUG: Latest JSON file: {latest_json_file!r}") # 디버그 로그 제거
-    exit_code, json_content = container.exec(f"bash -c 'cat \"{latest_json_file}\"'")
+    exit_code, json_content = container.exec(f"bash -c 'zcat -f \"{latest_json_file}\"'")
     assert exit_code == 0, (
         f"Should be able to read JSON file content. File: {latest_json_file}, Error: {json_content.decode('utf-8', errors='ignore')}"
     )
@@ -158,7 +158,7 @@ def verify_review_results(
 
     # 리뷰 로그 디렉토리에서 JSON 파일 확인
     exit_code, json_files = container.exec(
-        f"bash -c 'find {review_log_dir} -name \"*.json\" -type f | head -5'"
+        f"bash -c 'find {review_log_dir} -name \"*_review_log.json*\" -type f | head -5'"
     )
     assert exit_code == 0, "Should be able to list JSON files"
 
@@ -188,7 +188,7 @@ def verify_review_results(
     latest_json_file = json_files_list.split("\n")[0]
     print(f"Reading JSON file: {latest_json_file}")
 
-    exit_code, json_content = container.exec(f"bash -c 'cat \"{latest_json_file}\"'")
+    exit_code, json_content = container.exec(f"bash -c 'zcat -f \"{latest_json_file}\"'")
 
     if exit_code != 0:
         # 오류 상황에서 추가 디버깅 정보
@@ -2,45 +2,80 @@
 CLI 인터페이스를 제공하는 모듈입니다.
 """
 
+from __future__ import annotations
+
 import getpass
-import json
 import os
+import secrets
+import signal
+import socket
 import sys
+import threading
+from collections.abc import Callable
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 
 from selvage.__version__ import __version__
-from selvage.src.cache import CacheManager
 from selvage.src.config import (
+    CONFIG_DIR,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_DEBOUNCE_SECONDS,
+    DEFAULT_PROVIDER_CONCURRENCY,
+    DEFAULT_SHARD_CONCURRENCY,
+    DEFAULT_UI_PORT,
     get_api_key,
+    get_cache_remote_token,
+    get_default_cache_dir,
+    get_default_cache_ignore_whitespace_context,
+    get_default_cache_max_entries,
+    get_default_cache_max_size_mb,
+    get_default_cache_remote_url,
+    get_default_cache_ttl_hours,
     get_default_debug_mode,
     get_default_diff_only,
+    get_default_file_load_workers,
     get_default_model,
     get_default_review_log_dir,
+    get_default_token_count_policy,
     set_api_key,
+    set_default_cache_settings,
     set_default_debug_mode,
     set_default_diff_only,
+    set_default_file_load_workers,
     set_default_model,
+    set_default_token_count_policy,
 )
-from selvage.src.diff_parser import parse_git_diff
+from selvage.src.daemon.daemon_client import DAEMON_SOCKET_FILENAME, ReviewDaemonClient
 from selvage.src.exceptions.api_key_not_found_error import APIKeyNotFoundError
-from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+from selvage.src.exceptions.daemon_review_error import DaemonReviewError
+from selvage.src.exceptions.daemon_unavailable_error import DaemonUnavailableError
 from selvage.src.model_config import ModelProvider, get_model_info
-from selvage.src.models import ModelChoice, ReviewStatus
-from selvage.src.ui import run_app
+from selvage.src.models import ModelChoice, ReviewStatus, TokenCountPolicy
 from selvage.src.utils.base_console import console
-from selvage.src.utils.file_utils import find_project_root
-from selvage.src.utils.git_utils import GitDiffMode, GitDiffUtility
+from selvage.src.utils.file_utils import find_project_root, is_ignore_file
 from selvage.src.utils.logging import LOG_LEVEL_INFO, setup_logging
-from selvage.src.utils.prompts.models.review_prompt import ReviewPrompt
-from selvage.src.utils.prompts.models.review_prompt_with_file_content import (
-    ReviewPromptWithFileContent,
-)
-from selvage.src.utils.prompts.prompt_generator import PromptGenerator
-from selvage.src.utils.review_display import review_display
-from selvage.src.utils.token.models import EstimatedCost, ReviewRequest, ReviewResponse
+
+# 리뷰 데몬에 리뷰를 맡길 때는 위 모듈만 필요합니다. 배치, 캐시, 프롬프트,
+# LLM 게이트웨이 모듈은 불러오는 데 시간이 오래 걸리므로 사용하는 함수 안에서
+# 불러옵니다.
+if TYPE_CHECKING:
+    from selvage.src.batch import BatchJob, BatchSummary, BatchTarget, BatchTargetResult
+    from selvage.src.cache import CacheManager, HttpCacheBackend
+    from selvage.src.daemon.models import DaemonReviewRequest, DaemonReviewResult
+    from selvage.src.llm_gateway.base_gateway import BaseGateway
+    from selvage.src.utils.prompts.models.review_prompt import ReviewPrompt
+    from selvage.src.utils.prompts.models.review_prompt_with_file_content import (
+        ReviewPromptWithFileContent,
+    )
+    from selvage.src.utils.token.models import (
+        EstimatedCost,
+        ReviewRequest,
+        ReviewResponse,
+    )
 
 
 @click.group(invoke_without_command=True)
@@ -111,6 +146,8 @@ def get_diff_content(
     target_branch: str | None = None,
 ) -> str:
     """Git diff 내용을 가져옵니다."""
+    from selvage.src.utils.git_utils import GitDiffMode, GitDiffUtility
+
     try:
         # 모드 결정
         mode = GitDiffMode.UNSTAGED
@@ -192,6 +229,102 @@ def config_debug_mode(value: str | None = None) -> None:
         )
 
 
+def config_token_count(value: str | None = None) -> None:
+    """토큰 계산 정책 설정을 처리합니다."""
+    if value is not None:
+        policy = TokenCountPolicy(value.lower())
+        if set_default_token_count_policy(policy):
+            console.success(f"토큰 계산 정책이 {policy.value}로 설정되었습니다.")
+        else:
+            console.error("토큰 계산 정책 설정에 실패했습니다.")
+    else:
+        # 값이 지정되지 않은 경우 현재 설정을 표시
+        current_value = get_default_token_count_policy()
+        console.info(f"현재 토큰 계산 정책: {current_value.value}")
+        console.info(
+            "정책을 변경하려면 'selvage config token-count auto|local|remote' "
+            "명령어를 사용하세요."
+        )
+
+
+def config_file_load_workers(value: int | None = None) -> None:
+    """전체 파일 컨텍스트를 읽을 스레드 수 설정을 처리합니다."""
+    if value is not None:
+        if set_default_file_load_workers(value):
+            console.success(f"파일 읽기 스레드 수가 {value}(으)로 설정되었습니다.")
+        else:
+            console.error("파일 읽기 스레드 수 설정에 실패했습니다.")
+    else:
+        # 값이 지정되지 않은 경우 현재 설정을 표시
+        console.info(f"현재 파일 읽기 스레드 수: {get_default_file_load_workers()}")
+        console.info(
+            "스레드 수를 변경하려면 'selvage config file-load-workers <N>' "
+            "명령어를 사용하세요."
+        )
+
+
+def config_cache(
+    ttl_hours: int | None = None,
+    max_entries: int | None = None,
+    max_size_mb: int | None = None,
+    ignore_whitespace_context: str | None = None,
+    cache_dir: str | None = None,
+    remote_url: str | None = None,
+) -> None:
+    """리뷰 캐시 설정을 처리합니다."""
+    changes = (
+        ttl_hours,
+        max_entries,
+        max_size_mb,
+        ignore_whitespace_context,
+        cache_dir,
+        remote_url,
+    )
+    if any(change is not None for change in changes):
+        if set_default_cache_settings(
+            ttl_hours,
+            max_entries,
+            max_size_mb,
+            None
+            if ignore_whitespace_context is None
+            else ignore_whitespace_context.lower() == "true",
+            cache_dir,
+            remote_url,
+        ):
+            console.success("캐시 설정이 변경되었습니다.")
+        else:
+            console.error("캐시 설정 변경에 실패했습니다.")
+            return
+
+    # 현재 설정 표시
+    console.info(_format_cache_settings())
+    if all(change is None for change in changes):
+        console.info(
+            "설정을 변경하려면 'selvage config cache --ttl-hours 72 "
+            "--max-entries 1000 --max-size-mb 200 "
+            "--ignore-whitespace-context true --dir /shared/selvage-cache "
+            "--remote-url http://cache.internal:8765' "
+            "명령어를 사용하세요. "
+            "(항목 수와 크기는 0이면 제한 없음)"
+        )
+
+
+def _format_cache_settings() -> str:
+    """현재 캐시 설정을 한 줄로 표시할 문자열을 반환합니다."""
+    max_entries = get_default_cache_max_entries()
+    max_size_mb = get_default_cache_max_size_mb()
+    cache_dir = get_default_cache_dir()
+    remote_url = get_default_cache_remote_url()
+    return (
+        f"캐시 디렉토리: {cache_dir if cache_dir else '기본 위치'}, "
+        f"원격 캐시: {remote_url if remote_url else '사용 안 함'}, "
+        f"유효기간 {get_default_cache_ttl_hours()}시간, "
+        f"최대 {max_entries if max_entries > 0 else '무제한'}개, "
+        f"최대 {f'{max_size_mb}MB' if max_size_mb > 0 else '무제한'}, "
+        f"공백 컨텍스트 무시 {get_default_cache_ignore_whitespace_context()}"
+    )
+
+
 def config_list() -> None:
     """모든 설정을 표시합니다."""
     console.print("==== selvage 설정 ====", style="bold cyan")
@@ -235,6 +368,15 @@ def config_list() -> None:
     # 기본 diff-only 설정
     console.info(f"기본 diff-only 값: {get_default_diff_only()}")
 
+    # 토큰 계산 정책
+    console.info(f"토큰 계산 정책: {get_default_token_count_policy().value}")
+
+    # 전체 파일 컨텍스트를 읽을 스레드 수
+    console.info(f"파일 읽기 스레드 수: {get_default_file_load_workers()}")
+
+    # 리뷰 캐시 설정
+    console.info(_format_cache_settings())
+
     # 기본 debug-mode 설정
     debug_status = "활성화" if get_default_debug_mode() else "비활성화"
     console.info(f"디버그 모드: {debug_status}")
@@ -254,10 +396,16 @@ def save_review_log(
     review_request: ReviewRequest,
     review_response: ReviewResponse | None,
     status: ReviewStatus,
-    error: Exception | None = None,
+    error: Exception | str | None = None,
     log_id: str | None = None,
+    estimated_cost: EstimatedCost | None = None,
 ) -> str:
-    """리뷰 로그를 저장하고 파일 경로를 반환합니다."""
+    """리뷰 로그를 저장하고 파일 경로를 반환합니다.
+
+    저장한 로그는 UI 목록과 필터링에 사용하는 리뷰 로그 인덱스에도 추가합니다.
+    """
+    from selvage.src.review_log import ReviewLogCodec, ReviewLogIndex
+
     model_info = get_model_info(review_request.model)
     log_dir = get_default_review_log_dir()
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -290,87 +438,358 @@ def save_review_log(
         "status": status.value,
         "error": str(error) if error else None,
         "prompt_version": "v2",
+        "estimated_cost": (
+            estimated_cost.model_dump(mode="json") if estimated_cost else None
+        ),
     }
 
-    # 파일 저장
+    # 파일 저장 (파일 내용 중복 제거 후 압축)
     formatted = now.strftime("%Y%m%d_%H%M%S")
     file_name = f"{formatted}_{model_name}_review_log"
-    file_path = log_dir / f"{file_name}.json"
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(review_log, f, ensure_ascii=False, indent=2)
+    file_path = ReviewLogCodec.write(log_dir / file_name, review_log)
+
+    try:
+        ReviewLogIndex(log_dir).record(review_log, file_path)
+    except Exception as e:
+        console.warning(f"리뷰 로그 인덱스 갱신 중 오류 발생: {str(e)}")
 
     return str(file_path)
 
 
 def _perform_new_review(
     review_request: ReviewRequest,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    llm_gateway: BaseGateway | None = None,
+    show_progress: bool = True,
 ) -> tuple[ReviewResponse, EstimatedCost]:
-    """새로운 리뷰를 수행하고 결과를 반환합니다."""
+    """새로운 리뷰를 수행하고 결과를 반환합니다.
+
+    shard가 True이면 컨텍스트 제한을 초과하는 리뷰를 여러 요청으로 나누어
+    최대 shard_concurrency개씩 병렬로 수행합니다. llm_gateway를 지정하면 새로
+    만들지 않고 재사용하며, show_progress가 False이면 진행 패널을 표시하지
+    않습니다 (여러 리뷰를 동시에 수행하는 경우).
+    """
+    from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+    from selvage.src.utils.prompts.prompt_generator import PromptGenerator
+    from selvage.src.utils.review_display import review_display
+
     # LLM 게이트웨이 가져오기
-    llm_gateway = GatewayFactory.create(model=review_request.model)
+    if llm_gateway is None:
+        llm_gateway = GatewayFactory.create(model=review_request.model)
 
     # 코드 리뷰 수행
-    with review_display.progress_review(review_request.model):
+    progress = (
+        review_display.progress_review(review_request.model)
+        if show_progress
+        else nullcontext()
+    )
+    with progress:
         review_prompt = PromptGenerator().create_code_review_prompt(review_request)
-        review_result = llm_gateway.review_code(review_prompt)
+        if shard:
+            review_result = llm_gateway.review_code_sharded(
+                review_prompt, max_concurrency=shard_concurrency
+            )
+        else:
+            review_result = llm_gateway.review_code(review_prompt)
 
         return review_result.review_response, review_result.estimated_cost
 
 
-def review_code(
+def _create_remote_cache_backend() -> HttpCacheBackend | None:
+    """원격 캐시 서버가 설정되어 있으면 백엔드를 생성합니다."""
+    from selvage.src.cache import HttpCacheBackend
+
+    remote_url = get_default_cache_remote_url()
+    if not remote_url:
+        return None
+    return HttpCacheBackend(remote_url, token=get_cache_remote_token())
+
+
+def _perform_incremental_review(
+    review_request: ReviewRequest,
+    cache_manager: CacheManager,
+    log_id: str,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    llm_gateway: BaseGateway | None = None,
+    show_progress: bool = True,
+) -> tuple[ReviewResponse, EstimatedCost, ReviewRequest | None]:
+    """변경된 파일만 새로 리뷰하고 파일별 캐시 결과와 병합합니다.
+
+    캐시에서는 파일별 이슈만 가져오고, 요약과 권장사항은 새로 리뷰한 결과를
+    사용합니다. 모든 파일이 캐시에 있으면 요약과 권장사항은 비어 있습니다.
+    llm_gateway와 show_progress는 _perform_new_review에 그대로 전달합니다.
+
+    Returns:
+        tuple[ReviewResponse, EstimatedCost, ReviewRequest | None]:
+            병합된 리뷰 응답, 새 리뷰 비용, 실제로 LLM에 보낸 리뷰 요청
+            (모든 파일이 캐시에 있으면 None)
+    """
+    from selvage.src.diff_parser import DiffResult
+    from selvage.src.utils.token.models import EstimatedCost, ReviewResponse
+
+    cached_file_reviews = cache_manager.get_cached_file_reviews(review_request)
+    if not cached_file_reviews:
+        review_response, estimated_cost = _perform_new_review(
+            review_request, shard, shard_concurrency, llm_gateway, show_progress
+        )
+        cache_manager.save_file_reviews_to_cache(
+            review_request, review_response, log_id=log_id
+        )
+        return review_response, estimated_cost, review_request
+
+    console.info(
+        f"[green]파일별 캐시 적중![/green] 파일 {len(cached_file_reviews)}개의 "
+        "리뷰 결과를 재사용합니다."
+    )
+    changed_files = [
+        file
+        for file in review_request.processed_diff.files
+        if file.filename not in cached_file_reviews
+    ]
+    # 이전 형식의 캐시 항목에 남아 있는 다른 파일에 대한 요약과 권장사항은
+    # 사용하지 않습니다.
+    cached_issues = [
+        issue for response in cached_file_reviews.values() for issue in response.issues
+    ]
+    if not any(not is_ignore_file(file.filename) for file in changed_files):
+        return (
+            ReviewResponse(issues=cached_issues, summary=""),
+            EstimatedCost.get_zero_cost(review_request.model),
+            None,
+        )
+
+    changed_request = review_request.model_copy(
+        update={
+            "processed_diff": DiffResult(files=changed_files),
+            "file_paths": [file.filename for file in changed_files],
+        }
+    )
+    review_response, estimated_cost = _perform_new_review(
+        changed_request, shard, shard_concurrency, llm_gateway, show_progress
+    )
+    cache_manager.save_file_reviews_to_cache(
+        changed_request, review_response, log_id=log_id
+    )
+    return (
+        review_response.model_copy(
+            update={"issues": [*review_response.issues, *cached_issues]}
+        ),
+        estimated_cost,
+        changed_request,
+    )
+
+
+def _review_status(review_response: ReviewResponse) -> ReviewStatus:
+    """리뷰 응답에 오류가 있으면 실패, 없으면 성공 상태를 반환합니다."""
+    return ReviewStatus.FAILED if review_response.error else ReviewStatus.SUCCESS
+
+
+def _execute_review(
+    review_request: ReviewRequest,
+    cache_manager: CacheManager,
+    skip_cache: bool = False,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    llm_gateway: BaseGateway | None = None,
+    show_progress: bool = True,
+) -> tuple[ReviewResponse, EstimatedCost, str]:
+    """리뷰 요청 하나를 캐시 조회부터 리뷰 로그 저장까지 처리합니다.
+
+    Args:
+        review_request: 리뷰 요청
+        cache_manager: 캐시 매니저
+        skip_cache: True이면 캐시를 사용하지 않고 새로 리뷰
+        shard: 컨텍스트 제한을 초과하면 파일 단위로 나누어 리뷰할지 여부
+        shard_concurrency: 분할 리뷰 시 동시에 수행할 최대 API 요청 수
+        llm_gateway: 재사용할 LLM 게이트웨이 (None이면 새로 생성)
+        show_progress: 리뷰 진행 패널 표시 여부
+
+    Returns:
+        tuple[ReviewResponse, EstimatedCost, str]: 리뷰 응답, 비용, 리뷰 로그 경로.
+            리뷰에 실패한 응답(`error`가 있는 응답)은 실패 상태로 로그에 기록합니다.
+
+    Raises:
+        Exception: 리뷰에 실패한 경우. 실패 로그를 저장한 뒤 다시 발생시킵니다.
+    """
+    from selvage.src.utils.prompts.prompt_generator import PromptGenerator
+    from selvage.src.utils.token.models import EstimatedCost
+
+    model = review_request.model
+    review_prompt = None
+    try:
+        if skip_cache:
+            # 캐시 사용하지 않고 직접 리뷰 수행
+            log_id = generate_log_id(model)
+            review_response, estimated_cost = _perform_new_review(
+                review_request, shard, shard_concurrency, llm_gateway, show_progress
+            )
+            review_prompt = PromptGenerator().create_code_review_prompt(review_request)
+            log_path = save_review_log(
+                review_prompt,
+                review_request,
+                review_response,
+                _review_status(review_response),
+                error=review_response.error,
+                log_id=log_id,
+                estimated_cost=estimated_cost,
+            )
+            return review_response, estimated_cost, log_path
+
+        # 캐시 확인 시도
+        cached_result = cache_manager.get_cached_review(review_request)
+
+        if cached_result:
+            # 캐시 적중: 저장된 결과 사용
+            review_response, cached_cost = cached_result
+
+            # 캐시 적중 비용 표시 (0 USD)
+            estimated_cost = EstimatedCost.get_zero_cost(model)
+
+            log_path = save_review_log(
+                None,
+                review_request,
+                review_response,
+                ReviewStatus.SUCCESS,
+                estimated_cost=estimated_cost,
+            )
+
+            console.success("캐시된 리뷰 결과를 사용했습니다! (API 비용 절약)")
+            return review_response, estimated_cost, log_path
+
+        # 캐시 미스: 변경된 파일만 새로 리뷰한 후 캐시에 저장
+        log_id = generate_log_id(model)
+        review_response, estimated_cost, reviewed_request = (
+            _perform_incremental_review(
+                review_request,
+                cache_manager,
+                log_id,
+                shard,
+                shard_concurrency,
+                llm_gateway,
+                show_progress,
+            )
+        )
+
+        # 리뷰 결과를 캐시에 저장
+        cache_manager.save_review_to_cache(
+            review_request, review_response, estimated_cost, log_id=log_id
+        )
+
+        if reviewed_request is not None:
+            review_prompt = PromptGenerator().create_code_review_prompt(
+                reviewed_request
+            )
+        log_path = save_review_log(
+            review_prompt,
+            review_request,
+            review_response,
+            _review_status(review_response),
+            error=review_response.error,
+            log_id=log_id,
+            estimated_cost=estimated_cost,
+        )
+        return review_response, estimated_cost, log_path
+    except Exception as e:
+        save_review_log(
+            review_prompt,
+            review_request,
+            None,
+            ReviewStatus.FAILED,
+            error=e,
+            log_id=generate_log_id(model),
+        )
+        raise
+
+
+def _check_api_key(provider: ModelProvider) -> bool:
+    """프로바이더의 API 키가 설정되어 있는지 확인하고, 없으면 설정 방법을 안내합니다.
+
+    Args:
+        provider: 확인할 프로바이더
+
+    Returns:
+        bool: API 키가 설정되어 있으면 True
+    """
+    if get_api_key(provider):
+        return True
+    console.error(f"{provider.get_display_name()} API 키가 설정되지 않았습니다.")
+    console.info("다음 명령어로 API 키를 설정하세요:")
+    console.print(
+        f"  1. 환경변수(권장): "
+        f"[green]export {provider.get_env_var_name()}=YOUR_API_KEY[/green]"
+    )
+    console.print(
+        f"  2. CLI 명령어: [green]selvage --set-{provider.value}-key[/green]"
+    )
+    return False
+
+
+def _create_cache_manager() -> CacheManager:
+    """설정값으로 캐시 매니저를 생성합니다."""
+    from selvage.src.cache import CacheManager
+
+    return CacheManager(
+        cache_ttl_hours=get_default_cache_ttl_hours(),
+        max_entries=get_default_cache_max_entries(),
+        max_bytes=get_default_cache_max_size_mb() * 1024 * 1024,
+        ignore_whitespace_context=get_default_cache_ignore_whitespace_context(),
+        cache_dir=get_default_cache_dir(),
+        remote_backend=_create_remote_cache_backend(),
+    )
+
+
+def _build_review_request(
     model: str,
     repo_path: str = ".",
     staged: bool = False,
     target_commit: str | None = None,
     target_branch: str | None = None,
     diff_only: bool = False,
-    open_ui: bool = False,
-    port: int = 8501,
-    skip_cache: bool = False,
-    clear_cache: bool = False,
-) -> None:
-    """코드 리뷰를 수행합니다."""
-    # API 키 확인
-    model_info = get_model_info(model)
-    provider = model_info.get("provider", "unknown")
-    api_key = get_api_key(provider)
-    if not api_key:
-        console.error(f"{provider.get_display_name()} API 키가 설정되지 않았습니다.")
-        console.info("다음 명령어로 API 키를 설정하세요:")
-        console.print(
-            f"  1. 환경변수(권장): "
-            f"[green]export {provider.get_env_var_name()}=YOUR_API_KEY[/green]"
-        )
-        console.print(
-            f"  2. CLI 명령어: [green]selvage --set-{provider.value}-key[/green]"
-        )
-        return
+    diff_content: str | None = None,
+) -> ReviewRequest | None:
+    """Git diff를 가져와 파싱하고 리뷰 요청을 만듭니다.
 
-    # 캐시 매니저 초기화
-    cache_manager = CacheManager()
-
-    # 캐시 삭제 요청시
-    if clear_cache:
-        cache_manager.clear_cache()
+    Args:
+        model: 리뷰에 사용할 모델 이름
+        repo_path: Git 저장소 경로
+        staged: Staged 변경사항만 리뷰할지 여부
+        target_commit: 이 커밋부터 HEAD까지의 변경사항을 리뷰
+        target_branch: 이 브랜치와 현재 브랜치 간의 변경사항을 리뷰
+        diff_only: 변경된 부분만 분석할지 여부
+        diff_content: 리뷰할 diff (None이면 저장소에서 가져옴)
 
-    # 만료된 캐시 정리
-    cache_manager.cleanup_expired_cache()
+    Returns:
+        ReviewRequest | None: 리뷰 요청. 변경 사항이 없으면 None
+    """
+    from selvage.src.diff_parser import parse_git_diff
+    from selvage.src.utils.token.models import ReviewRequest
 
     # Git diff 내용 가져오기
-    diff_content = get_diff_content(repo_path, staged, target_commit, target_branch)
+    if diff_content is None:
+        diff_content = get_diff_content(
+            repo_path, staged, target_commit, target_branch
+        )
     if not diff_content:
-        console.warning("변경 사항이 없거나 diff를 가져올 수 없습니다.")
-        return
+        return None
 
     # diff 파싱 및 메타데이터 추가
     use_full_context = not diff_only
 
     # repo_path 결정 - 사용자 입력 또는 프로젝트 루트
     repo_path = str(Path(repo_path)) if repo_path != "." else str(find_project_root())
-    diff_result = parse_git_diff(diff_content, use_full_context, repo_path)
-    review_prompt = None
+    # 커밋/브랜치 리뷰는 작업 트리 대신 HEAD의 파일 내용을 사용합니다.
+    revision = "HEAD" if target_commit or target_branch else None
+    diff_result = parse_git_diff(
+        diff_content,
+        use_full_context,
+        repo_path,
+        max_workers=get_default_file_load_workers(),
+        revision=revision,
+    )
     # 리뷰 요청 생성
-    review_request = ReviewRequest(
+    return ReviewRequest(
         diff_content=diff_content,
         processed_diff=diff_result,
         file_paths=[file.filename for file in diff_result.files],
@@ -378,47 +797,55 @@ def review_code(
         model=model,
         repo_path=repo_path,
     )
-    try:
-        if skip_cache:
-            # 캐시 사용하지 않고 직접 리뷰 수행
-            log_id = generate_log_id(model)
-            review_response, estimated_cost = _perform_new_review(review_request)
-            review_prompt = PromptGenerator().create_code_review_prompt(review_request)
-            log_path = save_review_log(
-                review_prompt, review_request, review_response, ReviewStatus.SUCCESS, log_id=log_id
-            )
-        else:
-            # 캐시 확인 시도
-            cached_result = cache_manager.get_cached_review(review_request)
 
-            if cached_result:
-                # 캐시 적중: 저장된 결과 사용
-                review_response, cached_cost = cached_result
 
-                log_path = save_review_log(
-                    None, review_request, review_response, ReviewStatus.SUCCESS
-                )
+def review_code(
+    model: str,
+    repo_path: str = ".",
+    staged: bool = False,
+    target_commit: str | None = None,
+    target_branch: str | None = None,
+    diff_only: bool = False,
+    open_ui: bool = False,
+    port: int = DEFAULT_UI_PORT,
+    skip_cache: bool = False,
+    clear_cache: bool = False,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+) -> None:
+    """코드 리뷰를 수행합니다."""
+    from selvage.src.utils.review_display import review_display
 
-                # 캐시 적중 비용 표시 (0 USD)
-                estimated_cost = EstimatedCost.get_zero_cost(model)
+    # API 키 확인
+    model_info = get_model_info(model)
+    if not _check_api_key(model_info["provider"]):
+        return
 
-                console.success("캐시된 리뷰 결과를 사용했습니다! (API 비용 절약)")
-            else:
-                # 캐시 미스: 새로운 리뷰 수행 후 캐시에 저장
-                log_id = generate_log_id(model)
-                review_response, estimated_cost = _perform_new_review(review_request)
+    # 캐시 매니저 초기화
+    cache_manager = _create_cache_manager()
 
-                # 리뷰 결과를 캐시에 저장
-                cache_manager.save_review_to_cache(
-                    review_request, review_response, estimated_cost, log_id=log_id
-                )
+    # 캐시 삭제 요청시
+    if clear_cache:
+        cache_manager.clear_cache()
 
-                review_prompt = PromptGenerator().create_code_review_prompt(
-                    review_request
-                )
-                log_path = save_review_log(
-                    review_prompt, review_request, review_response, ReviewStatus.SUCCESS, log_id=log_id
-                )
+    # 만료된 캐시 정리
+    cache_manager.cleanup_expired_cache()
+    # 이전 리뷰에서 계산한 구간별 토큰 수 불러오기
+    cache_manager.load_token_counts()
+
+    review_request = _build_review_request(
+        model, repo_path, staged, target_commit, target_branch, diff_only
+    )
+    if review_request is None:
+        console.warning("변경 사항이 없거나 diff를 가져올 수 없습니다.")
+        return
+
+    try:
+        review_response, estimated_cost, log_path = _execute_review(
+            review_request, cache_manager, skip_cache, shard, shard_concurrency
+        )
+
+        cache_manager.save_token_counts()
 
         # 리뷰 완료 정보 통합 출력
         review_display.review_complete(
@@ -427,18 +854,12 @@ def review_code(
             estimated_cost=estimated_cost,
         )
 
-        console.success("코드 리뷰가 완료되었습니다!")
+        if review_response.error:
+            console.error(f"코드 리뷰 중 오류가 발생했습니다: {review_response.error}")
+        else:
+            console.success("코드 리뷰가 완료되었습니다!")
     except Exception as e:
         console.error(f"코드 리뷰 중 오류가 발생했습니다: {str(e)}", exception=e)
-        error_log_id = generate_log_id(model)
-        log_path = save_review_log(
-            review_prompt,
-            review_request,
-            None,
-            ReviewStatus.FAILED,
-            error=e,
-            log_id=error_log_id,
-        )
         return
 
     # UI 자동 실행
@@ -447,48 +868,512 @@ def review_code(
         handle_view_command(port)
 
 
-def handle_view_command(port: int) -> None:
-    """UI 보기 명령을 처리합니다."""
-    try:
-        console.info(
-            f"Streamlit UI를 시작합니다. 브라우저에서 "
-            f"[blue]http://localhost:{port}[/blue]으로 접속하세요..."
-        )
-        # 포트 설정
-        os.environ["STREAMLIT_SERVER_PORT"] = str(port)
-        # UI 실행
-        run_app()
-    except ImportError as e:
-        console.error("Streamlit 라이브러리가 설치되어 있지 않습니다.", exception=e)
-        console.info("다음 명령어로 설치하세요: [green]pip install streamlit[/green]")
-        return
+def _parse_provider_limits(values: tuple[str, ...]) -> dict[ModelProvider, int]:
+    """`PROVIDER=N` 형식의 프로바이더별 동시 요청 수 옵션을 파싱합니다.
 
+    Raises:
+        click.BadParameter: 형식이 올바르지 않은 경우
+    """
+    limits: dict[ModelProvider, int] = {}
+    for value in values:
+        name, separator, limit = value.partition("=")
+        if not separator or not limit.strip().isdigit() or int(limit) < 1:
+            raise click.BadParameter(
+                f"'{value}' (예: openai=2)", param_hint="--provider-limit"
+            )
+        try:
+            provider = ModelProvider.from_string(name.strip())
+        except Exception as e:
+            raise click.BadParameter(str(e), param_hint="--provider-limit") from e
+        limits[provider] = int(limit)
+    return limits
 
-def _process_single_api_key(display_name: str, provider: ModelProvider) -> bool:
-    """단일 API 키 설정을 처리하는 공통 함수.
 
-    Args:
-        display_name: 사용자에게 표시할 프로바이더 이름 (예: "OpenAI")
-        provider: 내부 프로바이더 식별자 (예: "openai")
+def _build_batch_jobs(
+    targets: list[BatchTarget],
+    models: list[str],
+    repo_path: str,
+    diff_only: bool,
+) -> tuple[list[BatchJob], list[BatchTargetResult]]:
+    """리뷰 대상별로 diff를 한 번씩 파싱하여 모델별 배치 작업을 만듭니다.
 
     Returns:
-        bool: 항상 True (API 키 설정이 시도되었음을 의미)
+        tuple[list[BatchJob], list[BatchTargetResult]]:
+            배치 작업 목록과 diff를 가져오지 못한 대상의 실패 결과 목록
     """
-    try:
-        api_key = getpass.getpass(f"{display_name} API 키를 입력하세요: ")
-        api_key = api_key.strip()
-        if not api_key:
-            console.error("API 키가 입력되지 않았습니다.")
-            return True
-    except KeyboardInterrupt:
-        console.info("\n입력이 취소되었습니다.")
-        return True
+    from selvage.src.batch import BatchJob, BatchTargetResult
+    from selvage.src.diff_parser import parse_git_diff
+    from selvage.src.utils.git_utils import GitDiffMode, GitDiffUtility
+    from selvage.src.utils.token.models import ReviewRequest
 
-    if set_api_key(api_key, provider):
-        console.success(f"{display_name} API 키가 성공적으로 설정되었습니다.")
-    else:
-        console.error(f"{display_name} API 키 설정에 실패했습니다.")
-    return True
+    use_full_context = not diff_only
+    file_load_workers = get_default_file_load_workers()
+    jobs: list[BatchJob] = []
+    failures: list[BatchTargetResult] = []
+    for target in targets:
+        diff_content = GitDiffUtility(
+            repo_path, GitDiffMode.REVISION_RANGE, target.diff_range
+        ).get_diff()
+        if not diff_content:
+            failures.extend(
+                BatchTargetResult(
+                    target=target.spec,
+                    model=model,
+                    status=ReviewStatus.FAILED,
+                    error="변경 사항이 없거나 diff를 가져올 수 없습니다.",
+                )
+                for model in models
+            )
+            continue
+
+        diff_result = parse_git_diff(
+            diff_content,
+            use_full_context,
+            repo_path,
+            max_workers=file_load_workers,
+            revision=target.revision,
+        )
+        for model in models:
+            review_request = ReviewRequest(
+                diff_content=diff_content,
+                processed_diff=diff_result,
+                file_paths=[file.filename for file in diff_result.files],
+                use_full_context=use_full_context,
+                model=model,
+                repo_path=repo_path,
+            )
+            jobs.append(
+                BatchJob(
+                    target=target.spec,
+                    model=model,
+                    provider=get_model_info(model)["provider"],
+                    payload=review_request,
+                )
+            )
+    return jobs, failures
+
+
+def _save_batch_summary(summary: BatchSummary) -> Path:
+    """배치 리뷰 요약을 리뷰 로그 디렉토리 아래 별도 디렉토리에 저장합니다."""
+    from selvage.src.batch.batch_runner import BATCH_SUMMARY_DIR_NAME
+
+    summary_dir = get_default_review_log_dir() / BATCH_SUMMARY_DIR_NAME
+    summary_dir.mkdir(parents=True, exist_ok=True)
+    formatted = summary.started_at.strftime("%Y%m%d_%H%M%S")
+    summary_path = summary_dir / f"{formatted}_batch_summary.json"
+    summary_path.write_text(
+        summary.model_dump_json(indent=2) + "\n", encoding="utf-8"
+    )
+    return summary_path
+
+
+def batch_review_code(
+    targets: list[BatchTarget],
+    models: list[str],
+    repo_path: str = ".",
+    diff_only: bool = False,
+    skip_cache: bool = False,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    provider_limits: dict[ModelProvider, int] | None = None,
+) -> BatchSummary | None:
+    """여러 리뷰 대상을 한 프로세스에서 동시에 리뷰합니다.
+
+    모델 설정, 캐시 매니저, 모델별 LLM 게이트웨이를 한 번만 준비하여 모든 대상에
+    재사용합니다. 대상마다 리뷰 로그를 하나씩 저장하고, 전체 결과 요약을
+    `batch_summaries` 디렉토리에 저장합니다.
+
+    Args:
+        targets: 리뷰 대상 목록
+        models: 리뷰에 사용할 모델 목록 (대상마다 모든 모델로 리뷰)
+        repo_path: Git 저장소 경로
+        diff_only: 변경된 부분만 분석할지 여부
+        skip_cache: True이면 캐시를 사용하지 않고 새로 리뷰
+        shard: 컨텍스트 제한을 초과하면 파일 단위로 나누어 리뷰할지 여부
+        shard_concurrency: 분할 리뷰 시 동시에 수행할 최대 API 요청 수
+        concurrency: 동시에 수행할 최대 리뷰 작업 수
+        provider_limits: 프로바이더별 최대 동시 리뷰 작업 수
+
+    Returns:
+        BatchSummary | None: 배치 리뷰 요약. API 키가 없어 시작하지 못하면 None
+    """
+    from selvage.src.batch import (
+        BatchRunner,
+        BatchSummary,
+        BatchTargetResult,
+        ProviderConcurrencyLimiter,
+    )
+    from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+    from selvage.src.utils.review_display import review_display
+
+    model_infos = [get_model_info(model) for model in models]
+    providers = dict.fromkeys(info["provider"] for info in model_infos)
+    if not all(_check_api_key(provider) for provider in providers):
+        return None
+
+    cache_manager = _create_cache_manager()
+    cache_manager.cleanup_expired_cache()
+    cache_manager.load_token_counts()
+
+    repo_path = str(Path(repo_path)) if repo_path != "." else str(find_project_root())
+    started_at = datetime.now()
+    console.info(f"리뷰 대상 {len(targets)}개의 diff를 준비합니다...")
+    jobs, failures = _build_batch_jobs(targets, models, repo_path, diff_only)
+
+    # 게이트웨이는 스레드 간에 공유해도 안전하므로 모델마다 하나만 생성합니다.
+    gateways = {model: GatewayFactory.create(model) for model in models}
+
+    def review_job(job: BatchJob) -> BatchTargetResult:
+        review_response, estimated_cost, log_path = _execute_review(
+            job.payload,
+            cache_manager,
+            skip_cache,
+            shard,
+            shard_concurrency,
+            llm_gateway=gateways[job.model],
+            show_progress=False,
+        )
+        # 게이트웨이가 오류 응답을 반환한 작업도 실패로 집계합니다.
+        return BatchTargetResult(
+            target=job.target,
+            model=job.model,
+            status=_review_status(review_response),
+            error=review_response.error,
+            log_path=log_path,
+            issue_count=len(review_response.issues),
+            total_cost_usd=estimated_cost.total_cost_usd,
+        )
+
+    limiter = ProviderConcurrencyLimiter(
+        DEFAULT_PROVIDER_CONCURRENCY, provider_limits or {}
+    )
+    console.info(f"리뷰 작업 {len(jobs)}개를 동시에 최대 {concurrency}개씩 수행합니다.")
+    results = BatchRunner(review_job, limiter, concurrency).run(jobs)
+    cache_manager.save_token_counts()
+
+    # 결과는 사용자가 지정한 대상 순서대로 정렬합니다.
+    target_order = {target.spec: index for index, target in enumerate(targets)}
+    summary = BatchSummary(
+        started_at=started_at,
+        finished_at=datetime.now(),
+        results=sorted(failures + results, key=lambda r: target_order[r.target]),
+    )
+    summary_path = _save_batch_summary(summary)
+    review_display.batch_summary(summary, str(summary_path))
+    return summary
+
+
+def _review_via_daemon(
+    client: ReviewDaemonClient,
+    model: str,
+    repo_path: str = ".",
+    staged: bool = False,
+    target_commit: str | None = None,
+    target_branch: str | None = None,
+    diff_only: bool = False,
+    open_ui: bool = False,
+    port: int = DEFAULT_UI_PORT,
+    skip_cache: bool = False,
+    clear_cache: bool = False,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+) -> bool:
+    """실행 중인 리뷰 데몬에 리뷰를 맡기고 결과를 출력합니다.
+
+    Returns:
+        bool: 데몬이 요청을 처리했으면 True (리뷰 실패 포함).
+            데몬에 연결할 수 없으면 False를 반환하며, 호출자가 직접 리뷰합니다.
+    """
+    from selvage.src.daemon.models import DaemonReviewRequest, DaemonReviewResult
+    from selvage.src.utils.review_display import review_display
+
+    # 직접 리뷰할 때와 같은 저장소 루트를 데몬의 작업 디렉토리와 무관하도록
+    # 절대 경로로 전달합니다.
+    repo_root = Path(repo_path) if repo_path != "." else find_project_root()
+    review_request = DaemonReviewRequest(
+        model=model,
+        repo_path=str(repo_root.resolve()),
+        staged=staged,
+        target_commit=target_commit,
+        target_branch=target_branch,
+        diff_only=diff_only,
+        skip_cache=skip_cache,
+        clear_cache=clear_cache,
+        shard=shard,
+        shard_concurrency=shard_concurrency,
+    )
+    try:
+        data = client.review(review_request.model_dump(mode="json"))
+    except DaemonUnavailableError as e:
+        console.log_info(f"리뷰 데몬 없이 직접 리뷰합니다: {str(e)}")
+        return False
+    except DaemonReviewError as e:
+        console.error(f"코드 리뷰 중 오류가 발생했습니다: {str(e)}")
+        return True
+
+    result = DaemonReviewResult.model_validate(data)
+    if result.log_path is None or result.estimated_cost is None:
+        console.warning("변경 사항이 없거나 diff를 가져올 수 없습니다.")
+        return True
+
+    review_display.review_complete(
+        model_info=get_model_info(model),
+        log_path=result.log_path,
+        estimated_cost=result.estimated_cost,
+    )
+    if result.error:
+        console.error(f"코드 리뷰 중 오류가 발생했습니다: {result.error}")
+    else:
+        console.success("코드 리뷰가 완료되었습니다!")
+
+    if open_ui:
+        console.info("리뷰 결과 UI를 시작합니다...")
+        handle_view_command(port)
+    return True
+
+
+def _create_daemon_review_fn(
+    cache_manager: CacheManager, gateways: dict[str, BaseGateway]
+) -> Callable[[DaemonReviewRequest], DaemonReviewResult]:
+    """리뷰 데몬이 요청마다 호출할 리뷰 함수를 만듭니다.
+
+    캐시 매니저와 모델별 LLM 게이트웨이는 모든 요청이 공유하며, 처음 요청된
+    모델의 게이트웨이는 그때 만들어 이후 요청에 재사용합니다.
+
+    Args:
+        cache_manager: 공유할 캐시 매니저
+        gateways: 미리 만들어 둔 모델별 LLM 게이트웨이
+
+    Returns:
+        Callable[[DaemonReviewRequest], DaemonReviewResult]: 리뷰 함수
+    """
+    from selvage.src.daemon.models import DaemonReviewResult
+    from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+
+    gateway_lock = threading.Lock()
+
+    def get_gateway(model: str) -> BaseGateway:
+        with gateway_lock:
+            if model not in gateways:
+                gateways[model] = GatewayFactory.create(model)
+            return gateways[model]
+
+    def review_fn(request: DaemonReviewRequest) -> DaemonReviewResult:
+        if request.clear_cache:
+            cache_manager.clear_cache()
+        cache_manager.cleanup_expired_cache()
+
+        review_request = _build_review_request(
+            request.model,
+            request.repo_path,
+            request.staged,
+            request.target_commit,
+            request.target_branch,
+            request.diff_only,
+            diff_content=request.diff,
+        )
+        if review_request is None:
+            return DaemonReviewResult(model=request.model)
+
+        review_response, estimated_cost, log_path = _execute_review(
+            review_request,
+            cache_manager,
+            request.skip_cache,
+            request.shard,
+            request.shard_concurrency,
+            llm_gateway=get_gateway(request.model),
+            show_progress=False,
+        )
+        cache_manager.save_token_counts()
+        console.info(f"리뷰 완료: {request.repo_path} ({request.model})")
+        return DaemonReviewResult(
+            model=request.model,
+            log_path=log_path,
+            estimated_cost=estimated_cost,
+            issue_count=len(review_response.issues),
+            error=review_response.error,
+        )
+
+    return review_fn
+
+
+def _create_watch_review_fn(
+    cache_manager: CacheManager,
+    llm_gateway: BaseGateway,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+) -> Callable[[ReviewRequest], tuple[ReviewResponse, EstimatedCost]]:
+    """감시 모드가 저장할 때마다 호출할 리뷰 함수를 만듭니다.
+
+    일반 리뷰와 같은 경로로 캐시를 조회하고 리뷰 로그를 저장하므로, 이전에 같은
+    내용으로 리뷰한 파일은 파일별 캐시에서 결과를 재사용합니다.
+    """
+
+    def review_fn(
+        review_request: ReviewRequest,
+    ) -> tuple[ReviewResponse, EstimatedCost]:
+        review_response, estimated_cost, _ = _execute_review(
+            review_request,
+            cache_manager,
+            shard=shard,
+            shard_concurrency=shard_concurrency,
+            llm_gateway=llm_gateway,
+            show_progress=False,
+        )
+        return review_response, estimated_cost
+
+    return review_fn
+
+
+def watch_code(
+    model: str,
+    repo_path: str = ".",
+    diff_only: bool = False,
+    debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    shard: bool = False,
+    shard_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    use_polling: bool = False,
+) -> None:
+    """작업 트리를 감시하며 저장된 파일 중 바뀐 파일만 다시 리뷰합니다.
+
+    시작할 때 현재 변경사항을 한 번 리뷰한 뒤, 파일이 저장되면 변경이 잠잠해질
+    때까지(debounce_seconds) 기다렸다가 마지막 리뷰 이후 hunk가 달라진 파일만
+    리뷰합니다. Ctrl+C로 종료할 때까지 현재 이슈를 패널에 표시합니다.
+    """
+    # 감시 모드에서만 필요한 모듈이므로 런타임에 임포트합니다.
+    from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+    from selvage.src.utils.git_utils import GitDiffUtility
+    from selvage.src.utils.review_display import review_display
+    from selvage.src.watch import (
+        ChangeDebouncer,
+        FileWatcher,
+        WatchSession,
+        is_watchdog_available,
+    )
+
+    model_info = get_model_info(model)
+    if not _check_api_key(model_info["provider"]):
+        return
+
+    repo_root = str(Path(repo_path)) if repo_path != "." else str(find_project_root())
+    try:
+        GitDiffUtility(repo_path=repo_root)
+    except ValueError as e:
+        console.error(str(e), exception=e)
+        return
+
+    cache_manager = _create_cache_manager()
+    cache_manager.cleanup_expired_cache()
+    cache_manager.load_token_counts()
+
+    session = WatchSession(
+        repo_root,
+        model,
+        _create_watch_review_fn(
+            cache_manager,
+            GatewayFactory.create(model=model),
+            shard=shard,
+            shard_concurrency=shard_concurrency,
+        ),
+        diff_only=diff_only,
+        file_load_workers=get_default_file_load_workers(),
+    )
+    debouncer = ChangeDebouncer(debounce_seconds)
+    watcher = FileWatcher(Path(repo_root), debouncer.add, use_polling=use_polling)
+    if watcher.backend == "polling" and not is_watchdog_available():
+        console.info(
+            "watchdog 패키지가 없어 파일 수정 시각을 주기적으로 확인합니다. "
+            "(pip install selvage[watch])"
+        )
+
+    watcher.start()
+    try:
+        with review_display.watch_live(session, watcher.backend) as refresh:
+            session.review_all()
+            refresh()
+            while True:
+                # Ctrl+C에 바로 반응하도록 짧게 나누어 기다립니다.
+                changed_paths = debouncer.wait(timeout=1.0)
+                if not changed_paths:
+                    continue
+                try:
+                    session.review_paths(changed_paths)
+                except Exception as e:
+                    console.error(
+                        f"감시 모드 리뷰 중 오류가 발생했습니다: {str(e)}", exception=e
+                    )
+                refresh()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.stop()
+        cache_manager.save_token_counts()
+    console.info(
+        f"감시 모드를 종료합니다. (리뷰 {session.review_count}회, "
+        f"비용 {session.total_cost.total_cost_usd:.4f} USD)"
+    )
+
+
+def prune_review_log_blobs() -> None:
+    """어떤 리뷰 로그도 참조하지 않는 파일 내용 blob을 삭제합니다."""
+    from selvage.src.review_log import ReviewLogCodec
+
+    log_dir = get_default_review_log_dir()
+    try:
+        removed = ReviewLogCodec.prune_blobs(log_dir)
+    except Exception as e:
+        console.error(
+            f"리뷰 로그를 읽지 못해 blob을 정리하지 않았습니다: {str(e)}", exception=e
+        )
+        return
+    console.success(f"참조되지 않는 blob {removed}개를 삭제했습니다: {log_dir}")
+
+
+def handle_view_command(port: int) -> None:
+    """UI 보기 명령을 처리합니다."""
+    try:
+        console.info(
+            f"Streamlit UI를 시작합니다. 브라우저에서 "
+            f"[blue]http://localhost:{port}[/blue]으로 접속하세요..."
+        )
+        # 포트 설정
+        os.environ["STREAMLIT_SERVER_PORT"] = str(port)
+        # UI 실행 (streamlit은 UI를 실행할 때만 불러옵니다)
+        from selvage.src.ui import run_app
+
+        run_app()
+    except ImportError as e:
+        console.error("Streamlit 라이브러리가 설치되어 있지 않습니다.", exception=e)
+        console.info("다음 명령어로 설치하세요: [green]pip install streamlit[/green]")
+        return
+
+
+def _process_single_api_key(display_name: str, provider: ModelProvider) -> bool:
+    """단일 API 키 설정을 처리하는 공통 함수.
+
+    Args:
+        display_name: 사용자에게 표시할 프로바이더 이름 (예: "OpenAI")
+        provider: 내부 프로바이더 식별자 (예: "openai")
+
+    Returns:
+        bool: 항상 True (API 키 설정이 시도되었음을 의미)
+    """
+    try:
+        api_key = getpass.getpass(f"{display_name} API 키를 입력하세요: ")
+        api_key = api_key.strip()
+        if not api_key:
+            console.error("API 키가 입력되지 않았습니다.")
+            return True
+    except KeyboardInterrupt:
+        console.info("\n입력이 취소되었습니다.")
+        return True
+
+    if set_api_key(api_key, provider):
+        console.success(f"{display_name} API 키가 성공적으로 설정되었습니다.")
+    else:
+        console.error(f"{display_name} API 키 설정에 실패했습니다.")
+    return True
 
 
 @cli.command()
@@ -529,6 +1414,25 @@ def _process_single_api_key(display_name: str, provider: ModelProvider) -> bool:
 @click.option(
     "--clear-cache", is_flag=True, help="캐시를 삭제한 후 리뷰 수행", type=bool
 )
+@click.option(
+    "--shard",
+    is_flag=True,
+    help="컨텍스트 제한을 초과하면 파일 단위로 나누어 병렬 리뷰 수행",
+    type=bool,
+)
+@click.option(
+    "--shard-concurrency",
+    default=DEFAULT_SHARD_CONCURRENCY,
+    show_default=True,
+    help="분할 리뷰 시 동시에 수행할 최대 API 요청 수",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--no-daemon",
+    is_flag=True,
+    help="실행 중인 리뷰 데몬(selvage serve)을 사용하지 않고 직접 리뷰",
+    type=bool,
+)
 def review(
     repo_path: str,
     staged: bool,
@@ -539,6 +1443,9 @@ def review(
     diff_only: bool,
     skip_cache: bool,
     clear_cache: bool,
+    shard: bool,
+    shard_concurrency: int,
+    no_daemon: bool,
 ) -> None:
     """코드 리뷰 수행"""
     # 상호 배타적 옵션 검증
@@ -563,6 +1470,24 @@ def review(
         console.print(message)
         return
 
+    # 리뷰 데몬이 실행 중이면 데몬에 리뷰를 맡깁니다.
+    daemon_client = None if no_daemon else ReviewDaemonClient.discover()
+    if daemon_client is not None and _review_via_daemon(
+        daemon_client,
+        model=model,
+        repo_path=repo_path,
+        staged=staged,
+        target_commit=target_commit,
+        target_branch=target_branch,
+        diff_only=diff_only,
+        open_ui=open_ui,
+        skip_cache=skip_cache,
+        clear_cache=clear_cache,
+        shard=shard,
+        shard_concurrency=shard_concurrency,
+    ):
+        return
+
     review_code(
         model=model,
         repo_path=repo_path,
@@ -573,6 +1498,186 @@ def review(
         open_ui=open_ui,
         skip_cache=skip_cache,
         clear_cache=clear_cache,
+        shard=shard,
+        shard_concurrency=shard_concurrency,
+    )
+
+
+@cli.command()
+@click.argument("targets", nargs=-1)
+@click.option(
+    "--targets-file",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="한 줄에 하나씩 리뷰 대상을 적은 파일 (# 주석과 빈 줄은 무시)",
+)
+@click.option(
+    "--model",
+    "models",
+    type=ModelChoice(),
+    multiple=True,
+    help="리뷰에 사용할 모델 (여러 번 지정 가능, 기본값: 설정된 기본 모델)",
+)
+@click.option(
+    "--repo-path", default=".", help="Git 저장소 경로 (기본값: 현재 디렉토리)", type=str
+)
+@click.option(
+    "--diff-only",
+    is_flag=True,
+    default=get_default_diff_only(),
+    help="변경된 부분만 분석",
+    type=bool,
+)
+@click.option(
+    "--skip-cache",
+    is_flag=True,
+    help="캐시를 사용하지 않고 새로운 리뷰 수행",
+    type=bool,
+)
+@click.option(
+    "--concurrency",
+    default=DEFAULT_BATCH_CONCURRENCY,
+    show_default=True,
+    help="동시에 수행할 최대 리뷰 작업 수",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--provider-limit",
+    "provider_limit_values",
+    multiple=True,
+    help=(
+        "프로바이더별 최대 동시 리뷰 작업 수 (예: --provider-limit openai=4, "
+        f"기본값: {DEFAULT_PROVIDER_CONCURRENCY})"
+    ),
+)
+@click.option(
+    "--shard",
+    is_flag=True,
+    help="컨텍스트 제한을 초과하면 파일 단위로 나누어 병렬 리뷰 수행",
+    type=bool,
+)
+@click.option(
+    "--shard-concurrency",
+    default=DEFAULT_SHARD_CONCURRENCY,
+    show_default=True,
+    help="분할 리뷰 시 동시에 수행할 최대 API 요청 수",
+    type=click.IntRange(min=1),
+)
+def batch(
+    targets: tuple[str, ...],
+    targets_file: Path | None,
+    models: tuple[str, ...],
+    repo_path: str,
+    diff_only: bool,
+    skip_cache: bool,
+    concurrency: int,
+    provider_limit_values: tuple[str, ...],
+    shard: bool,
+    shard_concurrency: int,
+) -> None:
+    """여러 커밋/브랜치를 한 번에 리뷰
+
+    TARGETS는 커밋(해당 커밋의 변경사항) 또는 `main..feature` 같은 리비전 범위입니다.
+    """
+    from selvage.src.batch import BatchTarget
+
+    specs = list(targets)
+    if targets_file is not None:
+        specs.extend(BatchTarget.load_specs(targets_file))
+    if not specs:
+        raise click.UsageError("리뷰 대상을 인자나 --targets-file로 지정하세요.")
+    try:
+        batch_targets = [BatchTarget.parse(spec) for spec in specs]
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="TARGETS") from e
+
+    review_models = list(dict.fromkeys(models)) or [get_default_model()]
+    if not all(review_models):
+        console.warning("리뷰 모델을 지정하지 않았습니다.")
+        console.print("  selvage batch --model <모델명> <대상>...")
+        return
+
+    summary = batch_review_code(
+        targets=batch_targets,
+        models=review_models,
+        repo_path=repo_path,
+        diff_only=diff_only,
+        skip_cache=skip_cache,
+        shard=shard,
+        shard_concurrency=shard_concurrency,
+        concurrency=concurrency,
+        provider_limits=_parse_provider_limits(provider_limit_values),
+    )
+    if summary is None or summary.failed_count:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    "--repo-path", default=".", help="Git 저장소 경로 (기본값: 현재 디렉토리)", type=str
+)
+@click.option(
+    "--model",
+    type=ModelChoice(),
+    default=get_default_model(),
+    help=ModelChoice.build_help_text(),
+)
+@click.option(
+    "--diff-only",
+    is_flag=True,
+    default=get_default_diff_only(),
+    help="변경된 부분만 분석",
+    type=bool,
+)
+@click.option(
+    "--debounce",
+    "debounce_seconds",
+    default=DEFAULT_DEBOUNCE_SECONDS,
+    show_default=True,
+    help="마지막 저장 후 리뷰를 시작하기까지 기다릴 시간(초)",
+    type=click.FloatRange(min=0),
+)
+@click.option(
+    "--shard",
+    is_flag=True,
+    help="컨텍스트 제한을 초과하면 파일 단위로 나누어 병렬 리뷰 수행",
+    type=bool,
+)
+@click.option(
+    "--shard-concurrency",
+    default=DEFAULT_SHARD_CONCURRENCY,
+    show_default=True,
+    help="분할 리뷰 시 동시에 수행할 최대 API 요청 수",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--polling",
+    is_flag=True,
+    help="파일 시스템 알림 대신 주기적으로 파일 수정 시각을 확인",
+    type=bool,
+)
+def watch(
+    repo_path: str,
+    model: str | None,
+    diff_only: bool,
+    debounce_seconds: float,
+    shard: bool,
+    shard_concurrency: int,
+    polling: bool,
+) -> None:
+    """작업 트리를 감시하며 저장할 때마다 바뀐 파일만 다시 리뷰"""
+    if not model:
+        console.warning("리뷰 모델을 지정하지 않았습니다.")
+        console.print("  selvage watch --model <모델명>")
+        return
+
+    watch_code(
+        model=model,
+        repo_path=repo_path,
+        diff_only=diff_only,
+        debounce_seconds=debounce_seconds,
+        shard=shard,
+        shard_concurrency=shard_concurrency,
+        use_polling=polling,
     )
 
 
@@ -605,6 +1710,87 @@ def debug_mode(value: str | None) -> None:
     config_debug_mode(value)
 
 
+@config.command()
+@click.argument(
+    "value",
+    type=click.Choice([policy.value for policy in TokenCountPolicy]),
+    required=False,
+)
+def token_count(value: str | None) -> None:
+    """Claude/Gemini 토큰 계산 정책 설정 (auto / local / remote)"""
+    config_token_count(value)
+
+
+@config.command()
+@click.argument("value", type=click.IntRange(min=1), required=False)
+def file_load_workers(value: int | None) -> None:
+    """전체 파일 컨텍스트를 동시에 읽을 스레드 수 설정"""
+    config_file_load_workers(value)
+
+
+@config.command()
+@click.option(
+    "--ttl-hours",
+    type=click.IntRange(min=1),
+    default=None,
+    help="캐시 유효 기간(시간)",
+)
+@click.option(
+    "--max-entries",
+    type=click.IntRange(min=0),
+    default=None,
+    help="보관할 최대 캐시 항목 수 (0이면 제한 없음)",
+)
+@click.option(
+    "--max-size-mb",
+    type=click.IntRange(min=0),
+    default=None,
+    help="보관할 최대 캐시 크기(MB, 0이면 제한 없음)",
+)
+@click.option(
+    "--ignore-whitespace-context",
+    type=click.Choice(["true", "false"]),
+    default=None,
+    help="캐시 키 생성 시 공백뿐인 컨텍스트 줄 차이 무시 (true / false)",
+)
+@click.option(
+    "--dir",
+    "cache_dir",
+    type=str,
+    default=None,
+    help=(
+        "캐시 디렉토리 (여러 러너가 공유하는 NFS 경로 등, 빈 문자열이면 기본 위치). "
+        "환경변수 SELVAGE_CACHE_DIR가 우선합니다."
+    ),
+)
+@click.option(
+    "--remote-url",
+    type=str,
+    default=None,
+    help=(
+        "팀 공유 원격 캐시 서버 주소 (빈 문자열이면 사용 안 함). "
+        "환경변수 SELVAGE_CACHE_REMOTE_URL가 우선합니다."
+    ),
+)
+def cache(
+    ttl_hours: int | None,
+    max_entries: int | None,
+    max_size_mb: int | None,
+    ignore_whitespace_context: str | None,
+    cache_dir: str | None,
+    remote_url: str | None,
+) -> None:
+    """리뷰 캐시 설정 (유효 기간, 용량, 캐시 키 정규화, 위치, 원격 캐시)"""
+    config_cache(
+        ttl_hours,
+        max_entries,
+        max_size_mb,
+        ignore_whitespace_context,
+        cache_dir,
+        remote_url,
+    )
+
+
 @config.command(name="list")
 def show_config():
     """모든 설정 표시"""
@@ -613,16 +1799,170 @@ def show_config():
 
 @cli.command()
 @click.option(
-    "--port", default=8501, type=int, help="Streamlit 서버 포트 (기본값: 8501)"
+    "--port",
+    default=DEFAULT_UI_PORT,
+    type=int,
+    help=f"Streamlit 서버 포트 (기본값: {DEFAULT_UI_PORT})",
 )
 def view(port: int) -> None:
     """리뷰 결과를 UI로 보기"""
     handle_view_command(port)
 
 
+@cli.command(name="prune-blobs")
+def prune_blobs() -> None:
+    """리뷰 로그를 지운 뒤 남은 파일 내용 blob 정리"""
+    prune_review_log_blobs()
+
+
+@cli.command(name="cache-server")
+@click.option("--host", default="127.0.0.1", help="바인딩할 호스트 (기본값: 127.0.0.1)")
+@click.option("--port", default=8765, type=int, help="서버 포트 (기본값: 8765)")
+@click.option(
+    "--dir",
+    "cache_dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="캐시 데이터베이스 디렉토리 (기본값: 리뷰 캐시 디렉토리)",
+)
+@click.option(
+    "--ttl-hours",
+    type=click.IntRange(min=1),
+    default=168,
+    help="서버에 보관하는 최대 유효 기간(시간, 기본값: 168)",
+)
+@click.option(
+    "--max-size-mb",
+    type=click.IntRange(min=0),
+    default=2048,
+    help="보관할 최대 캐시 크기(MB, 0이면 제한 없음, 기본값: 2048)",
+)
+@click.option(
+    "--token",
+    envvar="SELVAGE_CACHE_REMOTE_TOKEN",
+    default=None,
+    help="요청에 요구할 Bearer 토큰 (환경변수 SELVAGE_CACHE_REMOTE_TOKEN)",
+)
+def cache_server(
+    host: str,
+    port: int,
+    cache_dir: Path | None,
+    ttl_hours: int,
+    max_size_mb: int,
+    token: str | None,
+) -> None:
+    """팀이 공유하는 리뷰 캐시 서버 실행"""
+    from selvage.src.cache.cache_server import CacheServer
+
+    server_dir = cache_dir or (get_default_cache_dir() or CONFIG_DIR / "cache")
+    server = CacheServer(
+        (host, port),
+        server_dir,
+        ttl_hours=ttl_hours,
+        max_bytes=max_size_mb * 1024 * 1024,
+        token=token,
+    )
+    server.cleanup()
+    console.info(f"리뷰 캐시 서버 실행 중: http://{host}:{port}")
+    console.info(f"저장 위치: {server_dir}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.info("리뷰 캐시 서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+@cli.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Unix 소켓 경로 (기본값: 설정 디렉토리의 daemon.sock)",
+)
+@click.option(
+    "--port",
+    type=click.IntRange(min=0, max=65535),
+    default=None,
+    help="Unix 소켓 대신 127.0.0.1의 TCP 포트에서 대기 (0이면 빈 포트 자동 선택)",
+)
+@click.option(
+    "--preload-model",
+    "preload_models",
+    type=ModelChoice(),
+    multiple=True,
+    help="시작할 때 미리 준비할 모델 (여러 번 지정 가능, 기본값: 설정된 기본 모델)",
+)
+def serve(
+    socket_path: Path | None,
+    port: int | None,
+    preload_models: tuple[str, ...],
+) -> None:
+    """리뷰 데몬 실행 (실행 중이면 review 명령이 데몬에 리뷰를 맡김)"""
+    from selvage.src.daemon.review_server import ReviewDaemon
+    from selvage.src.llm_gateway.gateway_factory import GatewayFactory
+    from selvage.src.utils.token import TokenUtils
+
+    if port is None and socket_path is None:
+        if hasattr(socket, "AF_UNIX"):
+            socket_path = CONFIG_DIR / DAEMON_SOCKET_FILENAME
+        else:
+            port = 0
+    if port is not None and socket_path is not None:
+        raise click.UsageError("--socket과 --port 옵션은 동시에 사용할 수 없습니다.")
+
+    cache_manager = _create_cache_manager()
+    cache_manager.cleanup_expired_cache()
+    cache_manager.load_token_counts()
+
+    # 모델 클라이언트와 토크나이저를 미리 불러와 첫 요청부터 빠르게 처리합니다.
+    gateways: dict[str, BaseGateway] = {}
+    for model in dict.fromkeys(preload_models or [get_default_model()]):
+        if not model:
+            continue
+        try:
+            gateways[model] = GatewayFactory.create(model)
+            TokenUtils.count_text_tokens_locally("", model)
+        except Exception as e:
+            console.warning(f"모델을 미리 준비하지 못했습니다: {model} ({str(e)})")
+
+    try:
+        daemon = ReviewDaemon(
+            _create_daemon_review_fn(cache_manager, gateways),
+            token=secrets.token_urlsafe(32),
+            socket_path=socket_path,
+            port=port or 0,
+        )
+    except (OSError, RuntimeError) as e:
+        console.error(f"리뷰 데몬을 시작할 수 없습니다: {str(e)}", exception=e)
+        sys.exit(1)
+
+    info_path = ReviewDaemonClient.info_path(CONFIG_DIR)
+    daemon.write_info(info_path)
+
+    def stop(_signum: int, _frame: object) -> None:
+        # serve_forever를 실행 중인 스레드에서는 shutdown을 호출할 수 없습니다.
+        threading.Thread(target=daemon.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, stop)
+    console.info(f"리뷰 데몬 실행 중: {daemon.url}")
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.remove_info(info_path)
+        daemon.server_close()
+        cache_manager.save_token_counts()
+        console.info("리뷰 데몬을 종료합니다.")
+
+
 @cli.command()
 def models() -> None:
     """사용 가능한 AI 모델 목록 보기"""
+    from selvage.src.utils.review_display import review_display
+
     review_display.show_available_models()
 
 
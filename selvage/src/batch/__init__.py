@@ -0,0 +1,14 @@
+"""여러 리뷰 대상을 한 프로세스에서 리뷰하는 배치 리뷰 모듈"""
+
+from .batch_runner import BatchJob, BatchRunner
+from .models import BatchSummary, BatchTarget, BatchTargetResult
+from .provider_limiter import ProviderConcurrencyLimiter
+
+__all__ = [
+    "BatchJob",
+    "BatchRunner",
+    "BatchSummary",
+    "BatchTarget",
+    "BatchTargetResult",
+    "ProviderConcurrencyLimiter",
+]
@@ -0,0 +1,130 @@
+"""BatchRunner: 여러 리뷰 작업을 스레드 풀로 동시에 수행하는 모듈."""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import zip_longest
+
+from selvage.src.config import DEFAULT_BATCH_CONCURRENCY
+from selvage.src.models.model_provider import ModelProvider
+from selvage.src.models.review_status import ReviewStatus
+from selvage.src.utils.base_console import console
+
+from .models import BatchTargetResult
+from .provider_limiter import ProviderConcurrencyLimiter
+
+# 리뷰 로그 디렉토리 아래 배치 리뷰 요약을 저장하는 디렉토리 이름
+BATCH_SUMMARY_DIR_NAME = "batch_summaries"
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """배치 리뷰 작업 하나 (리뷰 대상과 모델의 조합)
+
+    Attributes:
+        target: 사용자가 지정한 리뷰 대상 문자열
+        model: 리뷰에 사용할 모델 이름
+        provider: 모델의 프로바이더 (동시 요청 수 제한 단위)
+        payload: 리뷰 함수에 전달할 값 (예: ReviewRequest)
+    """
+
+    target: str
+    model: str
+    provider: ModelProvider
+    payload: object
+
+
+class BatchRunner:
+    """배치 리뷰 작업을 스레드 풀에서 수행하고 결과를 모으는 클래스.
+
+    실제 리뷰는 생성자로 받은 `review_fn`이 수행하며, BatchRunner는 작업 순서,
+    전체/프로바이더별 동시 실행 수 제한, 실패 격리만 담당합니다. 한 작업이
+    실패해도 나머지 작업은 계속 진행합니다.
+    """
+
+    def __init__(
+        self,
+        review_fn: Callable[[BatchJob], BatchTargetResult],
+        limiter: ProviderConcurrencyLimiter,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """BatchRunner 초기화
+
+        Args:
+            review_fn: 작업 하나를 리뷰하고 결과를 반환하는 함수
+            limiter: 프로바이더별 동시 요청 수 제한기
+            concurrency: 동시에 수행할 최대 작업 수
+        """
+        self.review_fn = review_fn
+        self.limiter = limiter
+        self.concurrency = max(1, concurrency)
+
+    def run(self, jobs: list[BatchJob]) -> list[BatchTargetResult]:
+        """모든 작업을 수행하고 입력 순서대로 결과를 반환합니다.
+
+        Args:
+            jobs: 수행할 작업 목록
+
+        Returns:
+            list[BatchTargetResult]: 작업별 결과 (jobs와 같은 순서)
+        """
+        results: dict[int, BatchTargetResult] = {}
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self._run_job, jobs[index]): index
+                for index in self._interleave_by_provider(jobs)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                result = future.result()
+                results[index] = result
+                self._report_progress(len(results), len(jobs), result)
+        return [results[index] for index in range(len(jobs))]
+
+    def _run_job(self, job: BatchJob) -> BatchTargetResult:
+        """프로바이더 슬롯을 얻어 작업을 수행합니다. 예외는 실패 결과로 바꿉니다."""
+        with self.limiter.acquire(job.provider):
+            started = time.monotonic()
+            try:
+                result = self.review_fn(job)
+            except Exception as e:
+                console.error(
+                    f"배치 리뷰 실패: {job.target} ({job.model}): {str(e)}",
+                    exception=e,
+                )
+                result = BatchTargetResult(
+                    target=job.target,
+                    model=job.model,
+                    status=ReviewStatus.FAILED,
+                    error=str(e),
+                )
+            result.elapsed_seconds = time.monotonic() - started
+            return result
+
+    @staticmethod
+    def _interleave_by_provider(jobs: list[BatchJob]) -> list[int]:
+        """프로바이더별 작업을 번갈아 배치한 작업 인덱스 순서를 반환합니다.
+
+        한 프로바이더의 작업이 앞쪽에 몰려 있으면 워커가 해당 프로바이더의
+        슬롯을 기다리느라 다른 프로바이더 작업을 시작하지 못합니다.
+        """
+        by_provider: dict[ModelProvider, list[int]] = {}
+        for index, job in enumerate(jobs):
+            by_provider.setdefault(job.provider, []).append(index)
+        return [
+            index
+            for group in zip_longest(*by_provider.values())
+            for index in group
+            if index is not None
+        ]
+
+    @staticmethod
+    def _report_progress(done: int, total: int, result: BatchTargetResult) -> None:
+        """작업 하나가 끝날 때마다 진행 상황을 출력합니다."""
+        message = f"[{done}/{total}] {result.target} ({result.model}): "
+        if result.status == ReviewStatus.FAILED:
+            error = f": {result.error}" if result.error else ""
+            console.warning(message + f"실패{error}")
+        else:
+            console.info(message + f"이슈 {result.issue_count}개")
@@ -0,0 +1,99 @@
+"""배치 리뷰 관련 데이터 모델"""
+
+from datetime import datetime
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from selvage.src.models.review_status import ReviewStatus
+
+# 대상 파일에서 주석으로 취급하는 줄 시작 문자
+TARGET_FILE_COMMENT_PREFIX = "#"
+
+
+class BatchTarget(BaseModel):
+    """배치 리뷰 대상 하나를 나타내는 모델
+
+    대상은 `A..B` 또는 `A...B` 형식의 리비전 범위이거나 단일 리비전입니다.
+    단일 리비전(커밋 해시 등)은 해당 커밋이 부모 커밋 대비 변경한 내용을
+    리뷰합니다. 브랜치 전체를 리뷰하려면 `main..feature`처럼 범위로 지정합니다.
+    """
+
+    spec: str
+    diff_range: str
+    revision: str
+
+    @staticmethod
+    def parse(spec: str) -> "BatchTarget":
+        """대상 문자열을 파싱합니다.
+
+        Args:
+            spec: 리비전 범위(`A..B`, `A...B`) 또는 단일 리비전
+
+        Returns:
+            BatchTarget: 파싱된 리뷰 대상
+
+        Raises:
+            ValueError: 대상이 비어 있거나 git 옵션처럼 보이는 경우
+        """
+        spec = spec.strip()
+        if not spec or spec.startswith("-") or any(c.isspace() for c in spec):
+            raise ValueError(f"올바르지 않은 리뷰 대상입니다: {spec!r}")
+
+        separator = "..." if "..." in spec else ".." if ".." in spec else None
+        if separator is None:
+            # 단일 리비전: 부모 커밋과의 차이를 리뷰하고 해당 커밋의 파일 내용을 사용
+            return BatchTarget(spec=spec, diff_range=f"{spec}^..{spec}", revision=spec)
+
+        _, head = spec.split(separator, 1)
+        return BatchTarget(spec=spec, diff_range=spec, revision=head or "HEAD")
+
+    @staticmethod
+    def load_specs(file_path: Path) -> list[str]:
+        """대상 파일에서 한 줄에 하나씩 적힌 대상 문자열을 읽습니다.
+
+        빈 줄과 `#`으로 시작하는 줄은 무시합니다.
+
+        Args:
+            file_path: 대상 파일 경로
+
+        Returns:
+            list[str]: 대상 문자열 목록
+        """
+        specs = []
+        for line in file_path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith(TARGET_FILE_COMMENT_PREFIX):
+                specs.append(line)
+        return specs
+
+
+class BatchTargetResult(BaseModel):
+    """배치 리뷰 대상 하나의 결과 모델"""
+
+    target: str
+    model: str
+    status: ReviewStatus
+    log_path: str | None = None
+    issue_count: int = 0
+    total_cost_usd: float = 0.0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+
+class BatchSummary(BaseModel):
+    """배치 리뷰 전체 결과 요약 모델"""
+
+    started_at: datetime
+    finished_at: datetime
+    results: list[BatchTargetResult]
+
+    @property
+    def failed_count(self) -> int:
+        """실패한 대상 수를 반환합니다."""
+        return sum(1 for r in self.results if r.status == ReviewStatus.FAILED)
+
+    @property
+    def total_cost_usd(self) -> float:
+        """전체 리뷰 비용 합계를 반환합니다."""
+        return sum(r.total_cost_usd for r in self.results)
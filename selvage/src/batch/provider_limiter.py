@@ -0,0 +1,50 @@
+"""ProviderConcurrencyLimiter: 프로바이더별 동시 요청 수를 제한하는 모듈."""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from selvage.src.models.model_provider import ModelProvider
+
+
+class ProviderConcurrencyLimiter:
+    """프로바이더마다 세마포어를 두어 동시에 진행하는 리뷰 수를 제한하는 클래스.
+
+    여러 스레드가 같은 프로바이더 API를 동시에 호출하여 요청 한도(rate limit)를
+    넘지 않도록 합니다. 프로바이더마다 한도를 따로 지정할 수 있습니다.
+    """
+
+    def __init__(
+        self, default_limit: int, limits: dict[ModelProvider, int] | None = None
+    ) -> None:
+        """ProviderConcurrencyLimiter 초기화
+
+        Args:
+            default_limit: 한도를 따로 지정하지 않은 프로바이더의 최대 동시 요청 수
+            limits: 프로바이더별 최대 동시 요청 수
+
+        Raises:
+            ValueError: 한도가 1보다 작은 경우
+        """
+        limits = limits or {}
+        if default_limit < 1 or any(limit < 1 for limit in limits.values()):
+            raise ValueError("동시 요청 수 한도는 1 이상이어야 합니다.")
+        self.default_limit = default_limit
+        self.limits = dict(limits)
+        self._semaphores: dict[ModelProvider, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def limit_for(self, provider: ModelProvider) -> int:
+        """프로바이더의 최대 동시 요청 수를 반환합니다."""
+        return self.limits.get(provider, self.default_limit)
+
+    @contextmanager
+    def acquire(self, provider: ModelProvider) -> Iterator[None]:
+        """프로바이더의 실행 슬롯을 얻을 때까지 기다린 뒤 블록을 실행합니다."""
+        with self._lock:
+            semaphore = self._semaphores.get(provider)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.limit_for(provider))
+                self._semaphores[provider] = semaphore
+        with semaphore:
+            yield
@@ -1,12 +1,19 @@
 """캐시 모듈"""
 
+from .cache_backend import CacheBackend
 from .cache_manager import CacheManager
 from .cache_key_generator import CacheKeyGenerator
-from .models import CacheEntry, CacheKeyInfo
+from .http_cache_backend import HttpCacheBackend
+from .models import CacheEntry, CacheKeyInfo, FileCacheKeyInfo
+from .sqlite_cache_store import SQLiteCacheStore
 
 __all__ = [
+    "CacheBackend",
     "CacheManager",
     "CacheKeyGenerator", 
     "CacheEntry",
     "CacheKeyInfo",
+    "FileCacheKeyInfo",
+    "HttpCacheBackend",
+    "SQLiteCacheStore",
 ]
\ No newline at end of file
@@ -0,0 +1,36 @@
+"""CacheBackend: 리뷰 캐시 원격 저장소 인터페이스 모듈."""
+
+import abc
+
+
+class CacheBackend(abc.ABC):
+    """캐시 키로 리뷰 캐시 항목을 읽고 쓰는 원격 저장소 인터페이스.
+
+    CacheManager는 로컬 SQLite 캐시를 L1으로 사용하고, 로컬에 없는 항목만
+    백엔드에서 읽어 로컬에 채웁니다. 새 항목은 로컬과 백엔드에 함께 저장합니다.
+    백엔드 오류는 리뷰를 중단시키지 않아야 하므로 구현체는 실패 시 예외 대신
+    None을 반환하거나 저장을 건너뜁니다.
+    """
+
+    @abc.abstractmethod
+    def get(self, cache_key: str) -> bytes | None:
+        """캐시 항목을 조회합니다.
+
+        Args:
+            cache_key: 캐시 키 (SHA-256 16진수 문자열)
+
+        Returns:
+            bytes | None: 직렬화된 캐시 항목 (없거나 조회에 실패하면 None)
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def put(self, cache_key: str, payload: bytes, expires_at: float) -> None:
+        """캐시 항목을 저장합니다.
+
+        Args:
+            cache_key: 캐시 키 (SHA-256 16진수 문자열)
+            payload: 직렬화된 캐시 항목
+            expires_at: 만료 시각 (유닉스 타임스탬프)
+        """
+        raise NotImplementedError
@@ -2,8 +2,15 @@
 
 import hashlib
 import json
+import re
 
-from .models import CacheKeyInfo
+from .models import CacheKeyInfo, FileCacheKeyInfo
+
+# 캐시 키 형식 버전. 키 구성 방식이 바뀌면 올려서 이전 키와 겹치지 않게 합니다.
+# (버전 1: 원본 diff 해시, 버전 2: 정규화된 diff 해시)
+CACHE_KEY_VERSION = 2
+
+_HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
 
 
 class CacheKeyGenerator:
@@ -21,9 +28,13 @@ class CacheKeyGenerator:
         """
         # 캐시 키 생성에 영향을 주는 요소들을 정렬된 딕셔너리로 구성
         key_data = {
-            "diff_content": cache_info.diff_content,
+            "version": CACHE_KEY_VERSION,
+            "diff_content": CacheKeyGenerator.canonicalize_diff(
+                cache_info.diff_content, cache_info.ignore_whitespace_context
+            ),
             "model": cache_info.model,
             "use_full_context": cache_info.use_full_context,
+            "ignore_whitespace_context": cache_info.ignore_whitespace_context,
         }
 
         # JSON 직렬화 (키 정렬 보장)
@@ -31,3 +42,65 @@ class CacheKeyGenerator:
 
         # SHA256 해시 생성
         return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def generate_file_cache_key(file_cache_info: FileCacheKeyInfo) -> str:
+        """파일 단위 리뷰 결과의 캐시 키를 생성합니다.
+
+        전체 diff 캐시 키와 겹치지 않도록 범위 구분자를 함께 해시합니다.
+
+        Args:
+            file_cache_info: 파일별 캐시 키 생성에 필요한 정보
+
+        Returns:
+            str: SHA256 해시로 생성된 캐시 키
+        """
+        key_data = {
+            "scope": "file",
+            "version": CACHE_KEY_VERSION,
+            **file_cache_info.model_dump(),
+        }
+        key_string = json.dumps(key_data, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(key_string.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def canonicalize_diff(
+        diff_content: str, ignore_whitespace_context: bool = False
+    ) -> str:
+        """의미가 같은 diff가 같은 문자열이 되도록 정규화합니다.
+
+        - `index <blob>..<blob>` 줄을 제거합니다.
+        - hunk 헤더의 시작 줄 번호를 파일의 첫 hunk 기준 상대 위치로 바꾸고,
+          헤더 뒤의 함수 이름 등은 제거합니다. 리베이스로 파일 전체가 밀린
+          경우에도 같은 키가 됩니다.
+        - ignore_whitespace_context가 True이면 공백뿐인 컨텍스트 줄을 제거하고
+          컨텍스트 줄 끝의 공백을 무시합니다.
+
+        Args:
+            diff_content: 원본 git diff 문자열
+            ignore_whitespace_context: 공백 컨텍스트 차이를 무시할지 여부
+
+        Returns:
+            str: 정규화된 diff 문자열
+        """
+        canonical_lines: list[str] = []
+        file_origin: tuple[int, int] | None = None
+        for line in diff_content.splitlines():
+            if line.startswith("diff --git "):
+                file_origin = None
+            elif line.startswith("index "):
+                continue
+            elif match := _HUNK_HEADER_PATTERN.match(line):
+                old_start, new_start = int(match.group(1)), int(match.group(3))
+                if file_origin is None:
+                    file_origin = (old_start, new_start)
+                line = (
+                    f"@@ -{old_start - file_origin[0]},{match.group(2) or '1'} "
+                    f"+{new_start - file_origin[1]},{match.group(4) or '1'} @@"
+                )
+            elif ignore_whitespace_context and line.startswith(" "):
+                if not line.strip():
+                    continue
+                line = line.rstrip()
+            canonical_lines.append(line)
+        return "\n".join(canonical_lines)
@@ -1,38 +1,117 @@
 """캐시 관리 메인 클래스"""
 
-import json
+import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from selvage.src.config import (
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_MAX_SIZE_MB,
+    DEFAULT_CACHE_TTL_HOURS,
+)
+from selvage.src.diff_parser.models.file_diff import FileDiff
 from selvage.src.utils.base_console import console
+from selvage.src.utils.file_lock import FileLock
 from selvage.src.utils.platform_utils import get_platform_config_dir
-from selvage.src.utils.token.models import ReviewRequest, ReviewResponse, EstimatedCost
+from selvage.src.utils.prompts.prompt_generator import PromptGenerator
+from selvage.src.utils.token.models import (
+    EstimatedCost,
+    ReviewIssue,
+    ReviewRequest,
+    ReviewResponse,
+)
+from selvage.src.utils.token.token_count_cache import token_count_cache
 
+from .cache_backend import CacheBackend
 from .cache_key_generator import CacheKeyGenerator
-from .models import CacheEntry, CacheKeyInfo
+from .models import CacheEntry, CacheKeyInfo, FileCacheKeyInfo
+from .sqlite_cache_store import SQLiteCacheStore
+
+# 리뷰 캐시 SQLite 데이터베이스 파일 이름
+CACHE_DB_FILENAME = "review_cache.sqlite3"
+# 만료 정리, 전체 삭제, 토큰 수 파일 갱신을 프로세스 간에 조율하는 잠금 파일 이름
+CACHE_LOCK_FILENAME = ".cache.lock"
 
 
 class CacheManager:
-    """리뷰 결과 캐싱을 관리하는 클래스"""
+    """리뷰 결과 캐싱을 관리하는 클래스
+
+    여러 프로세스가 같은 캐시 디렉토리를 공유할 수 있습니다. 항목 저장과 삭제는
+    SQLite 트랜잭션으로 원자적으로 처리되고, 만료 정리와 전체 삭제는 잠금 파일로
+    한 프로세스만 수행합니다.
+    """
     
-    def __init__(self, cache_ttl_hours: int = 1):
+    def __init__(
+        self,
+        cache_ttl_hours: int = DEFAULT_CACHE_TTL_HOURS,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_SIZE_MB * 1024 * 1024,
+        ignore_whitespace_context: bool = False,
+        cache_dir: Path | None = None,
+        remote_backend: CacheBackend | None = None,
+    ) -> None:
         """캐시 매니저 초기화
         
         Args:
             cache_ttl_hours: 캐시 유효 기간 (hours)
+            max_entries: 보관할 최대 캐시 항목 수 (0이면 제한 없음)
+            max_bytes: 보관할 최대 캐시 크기(바이트, 0이면 제한 없음)
+            ignore_whitespace_context: 캐시 키 생성 시 공백 컨텍스트 차이 무시 여부
+            cache_dir: 캐시 디렉토리 (None이면 플랫폼별 설정 디렉토리 사용).
+                지정한 디렉토리는 NFS 등 여러 머신이 공유하는 경로일 수 있으므로
+                WAL 대신 네트워크 파일 시스템에서도 동작하는 롤백 저널을 사용합니다.
+            remote_backend: 팀이 공유하는 원격 캐시 백엔드 (None이면 로컬만 사용).
+                로컬 캐시는 원격 캐시 앞의 L1 캐시로 동작합니다.
         """
-        self.cache_dir = get_platform_config_dir() / "cache"
+        self.cache_dir = cache_dir or get_platform_config_dir() / "cache"
         self.cache_ttl_hours = cache_ttl_hours
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ignore_whitespace_context = ignore_whitespace_context
         self._ensure_cache_dir()
+        self._store = SQLiteCacheStore(
+            self.cache_dir / CACHE_DB_FILENAME, use_wal=cache_dir is None
+        )
+        self._lock = FileLock(self.cache_dir / CACHE_LOCK_FILENAME)
+        self._remote_backend = remote_backend
     
     def _ensure_cache_dir(self) -> None:
         """캐시 디렉토리 생성"""
         self.cache_dir.mkdir(exist_ok=True, parents=True)
-    
-    def _get_cache_file_path(self, cache_key: str) -> Path:
-        """캐시 파일 경로 생성"""
-        return self.cache_dir / f"{cache_key}.json"
+
+    def _remove_legacy_cache_files(self) -> int:
+        """이전 버전이 항목마다 남긴 JSON 캐시 파일을 삭제합니다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        legacy_files = list(self.cache_dir.glob("*.json"))
+        for legacy_file in legacy_files:
+            legacy_file.unlink(missing_ok=True)
+        return len(legacy_files)
+
+    @property
+    def token_count_file(self) -> Path:
+        """프롬프트 구간별 토큰 수 캐시 파일 경로"""
+        return self.cache_dir / "token_counts" / "token_counts.json"
+
+    def load_token_counts(self) -> None:
+        """저장된 구간별 토큰 수를 프로세스 전역 토큰 수 캐시로 불러옵니다."""
+        token_count_cache.load(self.token_count_file)
+
+    def save_token_counts(self) -> None:
+        """프로세스 전역 토큰 수 캐시를 리뷰 캐시 옆에 저장합니다.
+
+        다른 프로세스가 그 사이 저장한 토큰 수를 잃지 않도록 잠금을 잡고 파일의
+        내용을 병합한 뒤 저장합니다.
+        """
+        try:
+            with self._lock:
+                token_count_cache.load(self.token_count_file)
+                token_count_cache.save(self.token_count_file)
+        except OSError as e:
+            console.warning(f"토큰 수 캐시를 저장할 수 없습니다: {str(e)}")
     
     def get_cached_review(self, review_request: ReviewRequest) -> Optional[tuple[ReviewResponse, EstimatedCost | None]]:
         """캐시된 리뷰 결과를 조회합니다.
@@ -49,24 +128,13 @@ class CacheManager:
                 diff_content=review_request.diff_content,
                 model=review_request.model,
                 use_full_context=review_request.use_full_context,
+                ignore_whitespace_context=self.ignore_whitespace_context,
             )
             cache_key = CacheKeyGenerator.generate_cache_key(cache_info)
             
-            # 캐시 파일 확인
-            cache_file = self._get_cache_file_path(cache_key)
-            if not cache_file.exists():
-                return None
-            
-            # 캐시 데이터 로드
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-            
-            cache_entry = CacheEntry.model_validate(cache_data)
-            
-            # 만료 확인
-            if datetime.now() > cache_entry.expires_at:
-                # 만료된 캐시 삭제
-                cache_file.unlink(missing_ok=True)
+            # 만료되지 않은 캐시 조회 (만료된 항목은 cleanup_expired_cache에서 삭제)
+            cache_entry = self._load_entry(cache_key, datetime.now().timestamp())
+            if cache_entry is None:
                 return None
             
             console.info(f"[green]캐시 적중![/green] 저장된 리뷰 결과를 사용합니다.")
@@ -91,12 +159,16 @@ class CacheManager:
             estimated_cost: 비용 정보
             log_id: 원본 리뷰 로그 ID (추적용)
         """
+        if review_response.error:
+            console.log_info("리뷰에 실패한 결과는 캐시에 저장하지 않습니다.")
+            return
         try:
             # 캐시 키 생성
             cache_info = CacheKeyInfo(
                 diff_content=review_request.diff_content,
                 model=review_request.model,
                 use_full_context=review_request.use_full_context,
+                ignore_whitespace_context=self.ignore_whitespace_context,
             )
             cache_key = CacheKeyGenerator.generate_cache_key(cache_info)
             
@@ -115,15 +187,8 @@ class CacheManager:
                 log_id=log_id,
             )
             
-            # 캐시 파일에 저장
-            cache_file = self._get_cache_file_path(cache_key)
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    cache_entry.model_dump(mode='json'), 
-                    f, 
-                    ensure_ascii=False, 
-                    indent=2
-                )
+            # 캐시 데이터베이스에 저장
+            self._store_entries([cache_entry])
             
             console.info(
                 f"리뷰 결과를 캐시에 저장했습니다. "
@@ -133,6 +198,197 @@ class CacheManager:
         except Exception as e:
             console.warning(f"캐시 저장 중 오류 발생: {str(e)}")
     
+    def get_cached_file_reviews(
+        self, review_request: ReviewRequest
+    ) -> dict[str, ReviewResponse]:
+        """파일별 캐시에서 재사용할 수 있는 리뷰 결과를 조회합니다.
+
+        파일의 hunk 내용, 파일 내용, 모델, 프롬프트 버전이 모두 같은 경우에만
+        적중하므로 변경되지 않은 파일의 이슈만 재사용됩니다.
+
+        Args:
+            review_request: 리뷰 요청 정보
+
+        Returns:
+            dict[str, ReviewResponse]: 파일 이름별 캐시된 리뷰 결과 (적중한 파일만)
+        """
+        try:
+            prompt_version = PromptGenerator.get_prompt_version()
+            now = datetime.now().timestamp()
+            cached_reviews: dict[str, ReviewResponse] = {}
+            for file_diff in review_request.processed_diff.files:
+                cache_key = self._generate_file_cache_key(
+                    review_request, file_diff, prompt_version
+                )
+                cache_entry = self._load_entry(cache_key, now)
+                if cache_entry is not None:
+                    cached_reviews[file_diff.filename] = cache_entry.review_response
+            return cached_reviews
+
+        except Exception as e:
+            console.warning(f"파일별 캐시 조회 중 오류 발생: {str(e)}")
+            return {}
+
+    def save_file_reviews_to_cache(
+        self,
+        review_request: ReviewRequest,
+        review_response: ReviewResponse,
+        log_id: str | None = None,
+    ) -> None:
+        """리뷰 결과를 파일별로 나누어 캐시에 저장합니다.
+
+        각 파일 항목에는 해당 파일의 이슈만 저장합니다. 리뷰 전체의 요약과 권장사항은
+        함께 리뷰한 다른 파일에 대한 내용일 수 있으므로 저장하지 않습니다.
+        어느 파일의 이슈인지 알 수 없는 이슈가 있거나 리뷰에 실패한 결과(일부 분할
+        리뷰 실패 포함)는 이슈가 없는 것으로 재사용될 수 있으므로 저장하지 않습니다.
+
+        Args:
+            review_request: 리뷰 요청 정보 (리뷰한 파일만 포함)
+            review_response: 리뷰 응답 결과
+            log_id: 원본 리뷰 로그 ID (추적용)
+        """
+        if review_response.error:
+            console.log_info("리뷰에 실패한 결과는 파일별 캐시에 저장하지 않습니다.")
+            return
+        try:
+            filenames = [file.filename for file in review_request.processed_diff.files]
+            issues_by_file = self._group_issues_by_file(
+                filenames, review_response.issues
+            )
+            if issues_by_file is None:
+                console.log_info(
+                    "파일을 특정할 수 없는 이슈가 있어 파일별 캐시를 저장하지 않습니다."
+                )
+                return
+
+            prompt_version = PromptGenerator.get_prompt_version()
+            now = datetime.now()
+            cache_entries = [
+                CacheEntry(
+                    cache_key=self._generate_file_cache_key(
+                        review_request, file_diff, prompt_version
+                    ),
+                    created_at=now,
+                    expires_at=now + timedelta(hours=self.cache_ttl_hours),
+                    request_info={
+                        "model": review_request.model,
+                        "use_full_context": review_request.use_full_context,
+                        "file": file_diff.filename,
+                    },
+                    review_response=ReviewResponse(
+                        issues=issues_by_file[file_diff.filename], summary=""
+                    ),
+                    log_id=log_id,
+                )
+                for file_diff in review_request.processed_diff.files
+            ]
+            self._store_entries(cache_entries)
+
+        except Exception as e:
+            console.warning(f"파일별 캐시 저장 중 오류 발생: {str(e)}")
+
+    def _load_entry(self, cache_key: str, now: float) -> CacheEntry | None:
+        """로컬 캐시에서 항목을 조회하고, 없으면 원격 캐시에서 읽어 채웁니다."""
+        payload = self._store.get(cache_key, now)
+        if payload is not None:
+            return CacheEntry.model_validate_json(payload)
+        if self._remote_backend is None:
+            return None
+
+        payload = self._remote_backend.get(cache_key)
+        if payload is None:
+            return None
+        cache_entry = CacheEntry.model_validate_json(payload)
+        if cache_entry.expires_at.timestamp() < now:
+            return None
+        console.log_info(f"원격 캐시 적중: {cache_key}")
+        self._store_entries([cache_entry], replicate=False)
+        return cache_entry
+
+    def _store_entries(
+        self, cache_entries: list[CacheEntry], replicate: bool = True
+    ) -> None:
+        """캐시 항목을 로컬에 저장하고 용량 제한을 적용합니다.
+
+        Args:
+            cache_entries: 저장할 캐시 항목 목록
+            replicate: 원격 백엔드에도 저장할지 여부
+        """
+        for cache_entry in cache_entries:
+            payload = cache_entry.model_dump_json().encode("utf-8")
+            expires_at = cache_entry.expires_at.timestamp()
+            self._store.put(
+                cache_entry.cache_key,
+                payload,
+                created_at=cache_entry.created_at.timestamp(),
+                expires_at=expires_at,
+            )
+            if replicate and self._remote_backend is not None:
+                self._remote_backend.put(cache_entry.cache_key, payload, expires_at)
+
+        # 용량 제한을 넘으면 가장 오래 사용하지 않은 항목부터 제거
+        evicted_count = self._store.evict(self.max_entries, self.max_bytes)
+        if evicted_count > 0:
+            console.log_info(f"용량 제한으로 캐시 {evicted_count}개 제거")
+
+    @staticmethod
+    def _generate_file_cache_key(
+        review_request: ReviewRequest, file_diff: FileDiff, prompt_version: str
+    ) -> str:
+        """파일 하나의 리뷰 결과를 구분하는 캐시 키를 생성합니다."""
+        file_content_hash = (
+            hashlib.sha256(file_diff.file_content.encode("utf-8")).hexdigest()
+            if file_diff.file_content is not None
+            else None
+        )
+        file_cache_info = FileCacheKeyInfo(
+            filename=file_diff.filename,
+            hunk_contents=[
+                f"{hunk.start_line_modified}\n{hunk.content}"
+                for hunk in file_diff.hunks
+            ],
+            file_content_hash=file_content_hash,
+            model=review_request.model,
+            use_full_context=review_request.use_full_context,
+            prompt_version=prompt_version,
+        )
+        return CacheKeyGenerator.generate_file_cache_key(file_cache_info)
+
+    @staticmethod
+    def _group_issues_by_file(
+        filenames: list[str], issues: list[ReviewIssue]
+    ) -> dict[str, list[ReviewIssue]] | None:
+        """이슈를 파일별로 나눕니다.
+
+        LLM이 경로를 줄여 쓰는 경우가 있으므로 정확히 일치하는 파일이 없으면
+        경로 끝부분이 일치하는 파일이 하나뿐일 때 그 파일로 분류합니다.
+
+        Returns:
+            dict[str, list[ReviewIssue]] | None: 파일 이름별 이슈 목록.
+                파일을 특정할 수 없는 이슈가 있으면 None
+        """
+        issues_by_file: dict[str, list[ReviewIssue]] = {
+            filename: [] for filename in filenames
+        }
+        for issue in issues:
+            issue_file = (issue.file or "").strip().removeprefix("./")
+            if issue_file in issues_by_file:
+                issues_by_file[issue_file].append(issue)
+                continue
+            candidates = [
+                filename
+                for filename in filenames
+                if issue_file
+                and (
+                    filename.endswith(f"/{issue_file}")
+                    or issue_file.endswith(f"/{filename}")
+                )
+            ]
+            if len(candidates) != 1:
+                return None
+            issues_by_file[candidates[0]].append(issue)
+        return issues_by_file
+
     def clear_cache(self) -> None:
         """모든 캐시를 삭제합니다."""
         try:
@@ -140,11 +396,14 @@ class CacheManager:
                 console.info("삭제할 캐시가 없습니다.")
                 return
             
-            cache_files = list(self.cache_dir.glob("*.json"))
-            for cache_file in cache_files:
-                cache_file.unlink(missing_ok=True)
+            with self._lock:
+                deleted_count = (
+                    self._store.clear() + self._remove_legacy_cache_files()
+                )
+                self.token_count_file.unlink(missing_ok=True)
+            token_count_cache.clear()
             
-            console.success(f"캐시 {len(cache_files)}개를 삭제했습니다.")
+            console.success(f"캐시 {deleted_count}개를 삭제했습니다.")
             
         except Exception as e:
             console.error(f"캐시 삭제 중 오류 발생: {str(e)}")
@@ -155,24 +414,19 @@ class CacheManager:
             if not self.cache_dir.exists():
                 return
             
-            cache_files = list(self.cache_dir.glob("*.json"))
-            expired_count = 0
-            
-            for cache_file in cache_files:
-                try:
-                    with open(cache_file, encoding='utf-8') as f:
-                        cache_data = json.load(f)
-                    
-                    cache_entry = CacheEntry.model_validate(cache_data)
-                    
-                    if datetime.now() > cache_entry.expires_at:
-                        cache_file.unlink(missing_ok=True)
-                        expired_count += 1
-                        
-                except Exception:
-                    # 잘못된 캐시 파일도 삭제
-                    cache_file.unlink(missing_ok=True)
-                    expired_count += 1
+            # 다른 프로세스가 정리 중이면 기다리지 않고 건너뜁니다.
+            if not self._lock.acquire(blocking=False):
+                console.log_info("다른 프로세스가 캐시를 정리 중이어서 건너뜁니다.")
+                return
+
+            try:
+                # 만료 시각 인덱스로 한 번에 삭제 (이전 버전의 JSON 캐시 파일도 정리)
+                expired_count = self._store.delete_expired(
+                    datetime.now().timestamp()
+                )
+                expired_count += self._remove_legacy_cache_files()
+            finally:
+                self._lock.release()
             
             if expired_count > 0:
                 console.info(f"만료된 캐시 {expired_count}개를 정리했습니다.")
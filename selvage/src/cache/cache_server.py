@@ -0,0 +1,158 @@
+"""CacheServer: 팀이 함께 쓰는 리뷰 캐시를 제공하는 참조 HTTP 서버 모듈."""
+
+import hmac
+import re
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from selvage.src.utils.base_console import console
+
+from .http_cache_backend import EXPIRES_AT_HEADER
+from .models import CacheEntry
+from .sqlite_cache_store import SQLiteCacheStore
+
+# 서버 캐시 데이터베이스 파일 이름
+CACHE_SERVER_DB_FILENAME = "remote_review_cache.sqlite3"
+# 저장을 허용하는 최대 요청 본문 크기
+MAX_PAYLOAD_BYTES = 32 * 1024 * 1024
+
+_CACHE_PATH_PATTERN = re.compile(r"^/v1/cache/([0-9a-f]{64})$")
+
+
+class CacheServer(ThreadingHTTPServer):
+    """`HttpCacheBackend`와 짝을 이루는 캐시 서버.
+
+    `GET /v1/cache/{cache_key}`는 저장된 항목을, `PUT /v1/cache/{cache_key}`는
+    요청 본문을 저장합니다. 본문은 경로의 키와 같은 `cache_key`를 가진 CacheEntry
+    JSON이어야 합니다. 항목은 SQLite 캐시 저장소에 압축 저장되며 서버의
+    유효 기간과 용량 제한이 적용됩니다. LAN 안에서 사용하는 것을 전제로 하며,
+    토큰을 지정하면 Bearer 인증을 요구합니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        cache_dir: Path,
+        ttl_hours: int,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        token: str | None = None,
+    ) -> None:
+        """CacheServer 초기화
+
+        Args:
+            address: 바인딩할 (호스트, 포트)
+            cache_dir: 캐시 데이터베이스를 저장할 디렉토리
+            ttl_hours: 서버에 보관하는 최대 유효 기간(시간)
+            max_entries: 보관할 최대 항목 수 (0이면 제한 없음)
+            max_bytes: 보관할 최대 압축 페이로드 크기 합계 (0이면 제한 없음)
+            token: 요청에 요구할 Bearer 토큰 (None이면 인증 없음)
+        """
+        super().__init__(address, _CacheRequestHandler)
+        self.store = SQLiteCacheStore(cache_dir / CACHE_SERVER_DB_FILENAME)
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.token = token
+
+    def cleanup(self) -> int:
+        """만료된 항목을 삭제합니다.
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        return self.store.delete_expired(time.time())
+
+
+class _CacheRequestHandler(BaseHTTPRequestHandler):
+    """캐시 서버의 요청 처리기."""
+
+    server: CacheServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        cache_key = self._authorize_and_parse_key()
+        if cache_key is None:
+            return
+
+        payload = self.server.store.get(cache_key, time.time())
+        if payload is None:
+            self._send_status(HTTPStatus.NOT_FOUND)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_PUT(self) -> None:  # noqa: N802
+        cache_key = self._authorize_and_parse_key()
+        if cache_key is None:
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_status(HTTPStatus.LENGTH_REQUIRED)
+            return
+        if content_length < 0:
+            # 음수 길이로 read(-1)을 호출하면 연결이 닫힐 때까지 읽습니다.
+            self._send_status(HTTPStatus.BAD_REQUEST)
+            return
+        if content_length > MAX_PAYLOAD_BYTES:
+            self._send_status(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
+        payload = self.rfile.read(content_length)
+
+        # 다른 키의 항목이나 캐시 항목이 아닌 데이터는 저장하지 않습니다.
+        try:
+            cache_entry = CacheEntry.model_validate_json(payload)
+        except ValidationError:
+            self._send_status(HTTPStatus.BAD_REQUEST)
+            return
+        if cache_entry.cache_key != cache_key:
+            self._send_status(HTTPStatus.BAD_REQUEST)
+            return
+
+        now = time.time()
+        expires_at = now + self.server.ttl_seconds
+        try:
+            expires_at = min(expires_at, float(self.headers[EXPIRES_AT_HEADER]))
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        self.server.store.put(cache_key, payload, created_at=now, expires_at=expires_at)
+        self.server.store.evict(self.server.max_entries, self.server.max_bytes)
+        self._send_status(HTTPStatus.NO_CONTENT)
+
+    def _authorize_and_parse_key(self) -> str | None:
+        """인증을 확인하고 요청 경로에서 캐시 키를 꺼냅니다.
+
+        실패하면 오류 응답을 보내고 None을 반환합니다.
+        """
+        if self.server.token is not None:
+            expected = f"Bearer {self.server.token}"
+            received = self.headers.get("Authorization", "")
+            if not hmac.compare_digest(received.encode(), expected.encode()):
+                self._send_status(HTTPStatus.UNAUTHORIZED)
+                return None
+
+        match = _CACHE_PATH_PATTERN.match(self.path)
+        if match is None:
+            self._send_status(HTTPStatus.NOT_FOUND)
+            return None
+        return match.group(1)
+
+    def _send_status(self, status: HTTPStatus) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        console.log_info(f"cache-server {self.address_string()} {format % args}")
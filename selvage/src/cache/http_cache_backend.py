@@ -0,0 +1,125 @@
+"""HttpCacheBackend: HTTP 캐시 서버를 사용하는 원격 캐시 백엔드 모듈."""
+
+from pydantic import ValidationError
+
+from selvage.src.utils.base_console import console
+
+from .cache_backend import CacheBackend
+from .models import CacheEntry
+
+# 원격 캐시 요청 타임아웃(초). 캐시 때문에 리뷰가 느려지지 않도록 짧게 둡니다.
+DEFAULT_REMOTE_CACHE_TIMEOUT_SECONDS = 3.0
+# 저장 요청에 만료 시각을 함께 전달하는 헤더 이름
+EXPIRES_AT_HEADER = "X-Selvage-Expires-At"
+
+
+class HttpCacheBackend(CacheBackend):
+    """`GET/PUT {base_url}/v1/cache/{cache_key}`로 캐시 항목을 주고받는 백엔드.
+
+    `selvage cache-server`로 실행하는 참조 서버와 같은 규약을 따르는 어떤 HTTP
+    저장소와도 함께 사용할 수 있습니다. 요청이 한 번 실패하면 같은 프로세스에서는
+    더 이상 원격 캐시를 사용하지 않아 타임아웃이 반복되지 않습니다.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: float = DEFAULT_REMOTE_CACHE_TIMEOUT_SECONDS,
+    ) -> None:
+        """HttpCacheBackend 초기화
+
+        Args:
+            base_url: 캐시 서버 주소 (예: http://cache.internal:8765)
+            token: Bearer 인증 토큰 (서버가 요구하는 경우)
+            timeout: 요청 타임아웃(초)
+        """
+        # requests는 원격 캐시를 사용할 때만 불러옵니다.
+        import requests
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._session = requests.Session()
+        if token:
+            self._session.headers["Authorization"] = f"Bearer {token}"
+        self._available = True
+
+    def _url(self, cache_key: str) -> str:
+        return f"{self.base_url}/v1/cache/{cache_key}"
+
+    def _disable(self, error: Exception) -> None:
+        """요청 실패 후 이 프로세스에서 원격 캐시 사용을 중단합니다."""
+        self._available = False
+        console.warning(
+            f"원격 캐시({self.base_url})에 연결할 수 없어 로컬 캐시만 사용합니다: "
+            f"{str(error)}"
+        )
+
+    def get(self, cache_key: str) -> bytes | None:
+        """캐시 서버에서 캐시 항목을 조회합니다.
+
+        Args:
+            cache_key: 캐시 키
+
+        Returns:
+            bytes | None: 직렬화된 캐시 항목. 없거나 조회에 실패한 경우, 또는 응답이
+                요청한 키의 캐시 항목이 아닌 경우 None
+        """
+        if not self._available:
+            return None
+        import requests
+
+        try:
+            response = self._session.get(self._url(cache_key), timeout=self.timeout)
+        except requests.RequestException as e:
+            self._disable(e)
+            return None
+
+        if response.status_code == 404:
+            return None
+        if response.status_code != 200:
+            console.warning(f"원격 캐시 조회 실패 (HTTP {response.status_code})")
+            return None
+
+        # 다른 키의 항목을 돌려주는 저장소 때문에 다른 변경사항의 리뷰 결과를
+        # 사용하지 않도록 응답의 캐시 키를 확인합니다.
+        try:
+            cache_entry = CacheEntry.model_validate_json(response.content)
+        except ValidationError:
+            console.warning(f"원격 캐시 항목을 읽을 수 없어 무시합니다: {cache_key}")
+            return None
+        if cache_entry.cache_key != cache_key:
+            console.warning(
+                f"원격 캐시 항목의 키가 요청한 키와 달라 무시합니다: {cache_key}"
+            )
+            return None
+        return response.content
+
+    def put(self, cache_key: str, payload: bytes, expires_at: float) -> None:
+        """캐시 서버에 캐시 항목을 저장합니다.
+
+        Args:
+            cache_key: 캐시 키
+            payload: 직렬화된 캐시 항목
+            expires_at: 만료 시각 (유닉스 타임스탬프)
+        """
+        if not self._available:
+            return
+        import requests
+
+        try:
+            response = self._session.put(
+                self._url(cache_key),
+                data=payload,
+                headers={
+                    "Content-Type": "application/json",
+                    EXPIRES_AT_HEADER: str(expires_at),
+                },
+                timeout=self.timeout,
+            )
+        except requests.RequestException as e:
+            self._disable(e)
+            return
+
+        if response.status_code not in (200, 201, 204):
+            console.warning(f"원격 캐시 저장 실패 (HTTP {response.status_code})")
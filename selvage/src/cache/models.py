@@ -31,3 +31,15 @@ class CacheKeyInfo(BaseModel):
     diff_content: str
     model: str
     use_full_context: bool
+    ignore_whitespace_context: bool = False
+
+
+class FileCacheKeyInfo(BaseModel):
+    """파일별 캐시 키 생성에 사용되는 정보"""
+
+    filename: str
+    hunk_contents: list[str]
+    file_content_hash: str | None
+    model: str
+    use_full_context: bool
+    prompt_version: str
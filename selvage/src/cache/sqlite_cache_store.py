@@ -0,0 +1,224 @@
+"""SQLiteCacheStore: 리뷰 캐시를 단일 SQLite 데이터베이스에 저장하는 모듈."""
+
+import sqlite3
+import sys
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from selvage.src.utils.compression import compress, decompress
+
+# 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 최대 시간(초)
+SQLITE_BUSY_TIMEOUT_SECONDS = 10.0
+# 테이블 구조 버전 (PRAGMA user_version). 다르면 캐시 테이블을 다시 만듭니다.
+SCHEMA_VERSION = 2
+
+
+class SQLiteCacheStore:
+    """캐시 키별 압축 페이로드를 SQLite(WAL 모드)에 저장하는 클래스.
+
+    만료 시각과 캐시 키에 인덱스가 있으므로 조회는 인덱스 탐색 한 번, 만료 정리는
+    `DELETE` 한 번으로 끝납니다. 항목을 하나씩 열어 검증할 필요가 없습니다.
+    항목별 마지막 접근 시각과 압축 크기를 기록하여 용량 기준 LRU 제거를 지원합니다.
+    시각은 모두 유닉스 타임스탬프(초)로 다룹니다.
+    """
+
+    def __init__(self, db_path: Path, use_wal: bool = True) -> None:
+        """SQLiteCacheStore 초기화
+
+        Args:
+            db_path: SQLite 데이터베이스 파일 경로
+            use_wal: WAL 모드 사용 여부. WAL은 공유 메모리 파일을 사용하므로
+                NFS 등 네트워크 파일 시스템에서는 False로 지정하여 롤백 저널을
+                사용해야 합니다.
+        """
+        self.db_path = db_path
+        self.use_wal = use_wal
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션이 적용된 연결을 열고, 사용이 끝나면 닫습니다."""
+        self._ensure_schema()
+        conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self) -> None:
+        """데이터베이스 파일과 테이블, 인덱스를 한 번만 생성합니다."""
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+            try:
+                # WAL 모드에서는 읽기와 쓰기가 서로를 막지 않습니다.
+                journal_mode = "WAL" if self.use_wal else "DELETE"
+                conn.execute(f"PRAGMA journal_mode={journal_mode}")
+                with conn:
+                    schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    if schema_version != SCHEMA_VERSION:
+                        # 캐시는 다시 만들 수 있으므로 이전 구조의 테이블은 버립니다.
+                        conn.execute("DROP TABLE IF EXISTS review_cache")
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS review_cache (
+                            cache_key TEXT PRIMARY KEY,
+                            created_at REAL NOT NULL,
+                            expires_at REAL NOT NULL,
+                            last_accessed_at REAL NOT NULL,
+                            size_bytes INTEGER NOT NULL,
+                            payload BLOB NOT NULL
+                        )
+                        """
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_review_cache_expires_at "
+                        "ON review_cache (expires_at)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_review_cache_last_accessed_at "
+                        "ON review_cache (last_accessed_at)"
+                    )
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            finally:
+                conn.close()
+            self._schema_ready = True
+
+    def get(self, cache_key: str, now: float) -> bytes | None:
+        """만료되지 않은 캐시 페이로드를 반환하고 마지막 접근 시각을 갱신합니다.
+
+        Args:
+            cache_key: 캐시 키
+            now: 현재 시각 (유닉스 타임스탬프)
+
+        Returns:
+            bytes | None: 압축을 해제한 페이로드 (없거나 만료되었으면 None)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM review_cache "
+                "WHERE cache_key = ? AND expires_at >= ?",
+                (cache_key, now),
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE review_cache SET last_accessed_at = ? WHERE cache_key = ?",
+                    (now, cache_key),
+                )
+        if row is None:
+            return None
+        return decompress(row[0])
+
+    def put(
+        self, cache_key: str, payload: bytes, created_at: float, expires_at: float
+    ) -> None:
+        """페이로드를 압축하여 저장합니다. 같은 키가 있으면 덮어씁니다.
+
+        zstd(설치된 경우) 또는 gzip으로 압축하며, 조회 시 형식을 판별하므로
+        이전 버전이 zlib으로 압축한 항목도 계속 읽을 수 있습니다.
+
+        Args:
+            cache_key: 캐시 키
+            payload: 저장할 페이로드
+            created_at: 생성 시각 (유닉스 타임스탬프)
+            expires_at: 만료 시각 (유닉스 타임스탬프)
+        """
+        compressed = compress(payload)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO review_cache (cache_key, created_at, "
+                "expires_at, last_accessed_at, size_bytes, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key,
+                    created_at,
+                    expires_at,
+                    created_at,
+                    len(compressed),
+                    sqlite3.Binary(compressed),
+                ),
+            )
+
+    def evict(self, max_entries: int = 0, max_bytes: int = 0) -> int:
+        """용량 제한을 넘는 항목을 가장 오래 사용하지 않은 순서로 삭제합니다.
+
+        Args:
+            max_entries: 보관할 최대 항목 수 (0이면 제한 없음)
+            max_bytes: 보관할 최대 압축 페이로드 크기 합계 (0이면 제한 없음)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        if max_entries <= 0 and max_bytes <= 0:
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                DELETE FROM review_cache WHERE cache_key IN (
+                    SELECT cache_key FROM (
+                        SELECT
+                            cache_key,
+                            ROW_NUMBER() OVER recent AS position,
+                            SUM(size_bytes) OVER recent AS cumulative_bytes
+                        FROM review_cache
+                        WINDOW recent AS (
+                            ORDER BY last_accessed_at DESC, created_at DESC
+                            ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+                        )
+                    )
+                    WHERE position > ? OR cumulative_bytes > ?
+                )
+                """,
+                (
+                    max_entries if max_entries > 0 else sys.maxsize,
+                    max_bytes if max_bytes > 0 else sys.maxsize,
+                ),
+            )
+            return cursor.rowcount
+
+    def delete_expired(self, now: float) -> int:
+        """만료된 항목을 삭제합니다.
+
+        Args:
+            now: 현재 시각 (유닉스 타임스탬프)
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM review_cache WHERE expires_at < ?", (now,)
+            )
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """모든 항목을 삭제합니다.
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        if not self.db_path.exists():
+            return 0
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM review_cache").rowcount
+
+    def total_bytes(self) -> int:
+        """저장된 압축 페이로드 크기의 합계를 반환합니다."""
+        if not self.db_path.exists():
+            return 0
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM review_cache"
+            ).fetchone()[0]
+
+    def __len__(self) -> int:
+        if not self.db_path.exists():
+            return 0
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM review_cache").fetchone()[0]
@@ -13,6 +13,7 @@ from pathlib import Path
 from selvage.src.exceptions.api_key_not_found_error import APIKeyNotFoundError
 from selvage.src.exceptions.invalid_api_key_error import InvalidAPIKeyError
 from selvage.src.models.model_provider import ModelProvider
+from selvage.src.models.token_count_policy import TokenCountPolicy
 from selvage.src.utils.base_console import console
 from selvage.src.utils.platform_utils import get_platform_config_dir
 
@@ -20,6 +21,30 @@ from selvage.src.utils.platform_utils import get_platform_config_dir
 CONFIG_DIR = get_platform_config_dir()
 CONFIG_FILE = CONFIG_DIR / "config.ini"
 
+# 리뷰 캐시 디렉토리를 지정하는 환경변수 (여러 러너가 공유하는 경로 지정용)
+CACHE_DIR_ENV_VAR = "SELVAGE_CACHE_DIR"
+# 팀 공유 원격 캐시 서버 주소와 인증 토큰을 지정하는 환경변수
+CACHE_REMOTE_URL_ENV_VAR = "SELVAGE_CACHE_REMOTE_URL"
+CACHE_REMOTE_TOKEN_ENV_VAR = "SELVAGE_CACHE_REMOTE_TOKEN"  # noqa: S105
+
+# 리뷰 캐시 기본 설정 (항목 수와 크기는 0이면 제한 없음)
+DEFAULT_CACHE_TTL_HOURS = 1
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_CACHE_MAX_SIZE_MB = 200
+
+# 리뷰 결과 UI(Streamlit) 기본 포트
+DEFAULT_UI_PORT = 8501
+# 분할 리뷰 시 동시에 수행할 기본 API 요청 수
+DEFAULT_SHARD_CONCURRENCY = 4
+# 배치 리뷰에서 동시에 수행할 기본 리뷰 작업 수
+DEFAULT_BATCH_CONCURRENCY = 4
+# 배치 리뷰에서 프로바이더별 기본 최대 동시 요청 수
+DEFAULT_PROVIDER_CONCURRENCY = 2
+# 감시 모드에서 마지막 변경 이후 이 시간(초) 동안 새 변경이 없으면 리뷰를 시작합니다.
+DEFAULT_DEBOUNCE_SECONDS = 1.0
+# 전체 파일 컨텍스트를 읽을 때 동시에 실행할 기본 스레드 수
+DEFAULT_FILE_LOAD_WORKERS = 8
+
 
 def ensure_config_dir() -> None:
     """설정 디렉토리가 존재하는지 확인하고, 없으면 생성합니다."""
@@ -221,6 +246,180 @@ def set_default_diff_only(diff_only: bool) -> bool:
         return False
 
 
+def get_default_token_count_policy() -> TokenCountPolicy:
+    """토큰 계산 정책 기본 설정값을 반환합니다."""
+    try:
+        config = load_config()
+        return TokenCountPolicy(
+            config["review"].get("token_count_policy", TokenCountPolicy.AUTO.value)
+        )
+    except (KeyError, ValueError):
+        return TokenCountPolicy.AUTO
+
+
+def set_default_token_count_policy(policy: TokenCountPolicy) -> bool:
+    """토큰 계산 정책 기본 설정값을 설정합니다."""
+    try:
+        config = load_config()
+        if "review" not in config:
+            config["review"] = {}
+        config["review"]["token_count_policy"] = policy.value
+        save_config(config)
+        return True
+    except Exception as e:
+        console.error(f"토큰 계산 정책 설정 중 오류 발생: {str(e)}", exception=e)
+        return False
+
+
+def get_default_file_load_workers() -> int:
+    """전체 파일 컨텍스트를 동시에 읽을 스레드 수 설정값을 반환합니다."""
+    try:
+        config = load_config()
+        workers = config["review"].getint(
+            "file_load_workers", fallback=DEFAULT_FILE_LOAD_WORKERS
+        )
+    except (KeyError, ValueError):
+        return DEFAULT_FILE_LOAD_WORKERS
+    return workers if workers >= 1 else DEFAULT_FILE_LOAD_WORKERS
+
+
+def set_default_file_load_workers(workers: int) -> bool:
+    """전체 파일 컨텍스트를 동시에 읽을 스레드 수를 설정합니다."""
+    try:
+        if workers < 1:
+            raise ValueError(f"스레드 수는 1 이상이어야 합니다: {workers}")
+        config = load_config()
+        if "review" not in config:
+            config["review"] = {}
+        config["review"]["file_load_workers"] = str(workers)
+        save_config(config)
+        return True
+    except Exception as e:
+        console.error(f"파일 읽기 스레드 수 설정 중 오류 발생: {str(e)}", exception=e)
+        return False
+
+
+def get_default_cache_dir() -> Path | None:
+    """설정된 리뷰 캐시 디렉토리를 반환합니다.
+
+    환경변수 SELVAGE_CACHE_DIR를 우선 사용하고, 없으면 설정 파일의 값을 사용합니다.
+    둘 다 없으면 None을 반환하며, 이 경우 플랫폼별 설정 디렉토리를 사용합니다.
+    """
+    env_value = os.getenv(CACHE_DIR_ENV_VAR)
+    if env_value:
+        return Path(os.path.expanduser(env_value))
+
+    try:
+        config = load_config()
+        path = config["cache"].get("dir")
+    except KeyError:
+        return None
+    return Path(os.path.expanduser(path)) if path else None
+
+
+def get_default_cache_remote_url() -> str | None:
+    """원격 캐시 서버 주소를 반환합니다.
+
+    환경변수 SELVAGE_CACHE_REMOTE_URL를 우선 사용하고, 없으면 설정 파일의 값을
+    사용합니다. 둘 다 없으면 None을 반환합니다.
+    """
+    env_value = os.getenv(CACHE_REMOTE_URL_ENV_VAR)
+    if env_value:
+        return env_value
+
+    try:
+        config = load_config()
+        return config["cache"].get("remote_url") or None
+    except KeyError:
+        return None
+
+
+def get_cache_remote_token() -> str | None:
+    """원격 캐시 서버 인증 토큰을 환경변수 SELVAGE_CACHE_REMOTE_TOKEN에서 읽습니다."""
+    return os.getenv(CACHE_REMOTE_TOKEN_ENV_VAR) or None
+
+
+def get_default_cache_ttl_hours() -> int:
+    """리뷰 캐시 유효 기간(시간) 설정값을 반환합니다."""
+    try:
+        config = load_config()
+        return config["cache"].getint("ttl_hours", fallback=DEFAULT_CACHE_TTL_HOURS)
+    except (KeyError, ValueError):
+        return DEFAULT_CACHE_TTL_HOURS
+
+
+def get_default_cache_max_entries() -> int:
+    """리뷰 캐시 최대 항목 수 설정값을 반환합니다. 0이면 제한이 없습니다."""
+    try:
+        config = load_config()
+        return config["cache"].getint(
+            "max_entries", fallback=DEFAULT_CACHE_MAX_ENTRIES
+        )
+    except (KeyError, ValueError):
+        return DEFAULT_CACHE_MAX_ENTRIES
+
+
+def get_default_cache_max_size_mb() -> int:
+    """리뷰 캐시 최대 크기(MB) 설정값을 반환합니다. 0이면 제한이 없습니다."""
+    try:
+        config = load_config()
+        return config["cache"].getint(
+            "max_size_mb", fallback=DEFAULT_CACHE_MAX_SIZE_MB
+        )
+    except (KeyError, ValueError):
+        return DEFAULT_CACHE_MAX_SIZE_MB
+
+
+def get_default_cache_ignore_whitespace_context() -> bool:
+    """캐시 키 생성 시 공백 컨텍스트 차이를 무시할지 여부를 반환합니다."""
+    try:
+        config = load_config()
+        return config["cache"].getboolean("ignore_whitespace_context", fallback=False)
+    except (KeyError, ValueError):
+        return False
+
+
+def set_default_cache_settings(
+    ttl_hours: int | None = None,
+    max_entries: int | None = None,
+    max_size_mb: int | None = None,
+    ignore_whitespace_context: bool | None = None,
+    cache_dir: str | None = None,
+    remote_url: str | None = None,
+) -> bool:
+    """리뷰 캐시 설정값을 설정합니다. None인 항목은 변경하지 않습니다.
+
+    cache_dir이나 remote_url에 빈 문자열을 주면 해당 설정을 제거합니다.
+    """
+    try:
+        config = load_config()
+        if "cache" not in config:
+            config["cache"] = {}
+        if ttl_hours is not None:
+            config["cache"]["ttl_hours"] = str(ttl_hours)
+        if max_entries is not None:
+            config["cache"]["max_entries"] = str(max_entries)
+        if max_size_mb is not None:
+            config["cache"]["max_size_mb"] = str(max_size_mb)
+        if ignore_whitespace_context is not None:
+            config["cache"]["ignore_whitespace_context"] = str(
+                ignore_whitespace_context
+            ).lower()
+        if cache_dir == "":
+            config.remove_option("cache", "dir")
+        elif cache_dir is not None:
+            config["cache"]["dir"] = cache_dir
+        if remote_url == "":
+            config.remove_option("cache", "remote_url")
+        elif remote_url is not None:
+            config["cache"]["remote_url"] = remote_url
+        save_config(config)
+        return True
+    except Exception as e:
+        console.error(f"캐시 설정 중 오류 발생: {str(e)}", exception=e)
+        return False
+
+
 def get_default_debug_mode() -> bool:
     """debug_mode 기본 설정값을 반환합니다."""
     try:
@@ -0,0 +1,32 @@
+"""모델, 클라이언트, 캐시를 메모리에 유지하며 리뷰 요청을 처리하는 데몬 모듈
+
+CLI가 데몬에 리뷰를 전달할 때는 클라이언트만 필요하므로, 서버와 API 모델은
+처음 사용할 때 불러옵니다.
+"""
+
+from typing import TYPE_CHECKING
+
+from .daemon_client import ReviewDaemonClient
+
+if TYPE_CHECKING:
+    from .models import DaemonReviewRequest, DaemonReviewResult
+    from .review_server import ReviewDaemon
+
+__all__ = [
+    "DaemonReviewRequest",
+    "DaemonReviewResult",
+    "ReviewDaemon",
+    "ReviewDaemonClient",
+]
+
+
+def __getattr__(name: str) -> object:
+    if name in ("DaemonReviewRequest", "DaemonReviewResult"):
+        from . import models
+
+        return getattr(models, name)
+    if name == "ReviewDaemon":
+        from .review_server import ReviewDaemon
+
+        return ReviewDaemon
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,186 @@
+"""ReviewDaemonClient: 실행 중인 리뷰 데몬에 요청을 보내는 클라이언트 모듈.
+
+CLI 시작 시간에 영향을 주지 않도록 표준 라이브러리만 사용합니다.
+"""
+
+import http.client
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any
+
+from selvage.__version__ import __version__
+from selvage.src.exceptions.daemon_review_error import DaemonReviewError
+from selvage.src.exceptions.daemon_unavailable_error import DaemonUnavailableError
+from selvage.src.utils.platform_utils import get_platform_config_dir
+
+# 설정 디렉토리 아래 실행 중인 데몬의 주소와 토큰을 기록하는 파일 이름
+DAEMON_INFO_FILENAME = "daemon.json"
+# 설정 디렉토리 아래 기본 Unix 소켓 파일 이름
+DAEMON_SOCKET_FILENAME = "daemon.sock"
+# 데몬 주소를 직접 지정하는 환경변수 (예: unix:/tmp/selvage.sock)
+DAEMON_URL_ENV_VAR = "SELVAGE_DAEMON_URL"
+# 클라이언트 버전을 전달하는 헤더. 데몬과 버전이 다르면 요청을 거절합니다.
+VERSION_HEADER = "X-Selvage-Version"
+# 데몬 연결 타임아웃(초). 데몬이 없을 때 CLI가 지체 없이 직접 리뷰하도록 짧게 둡니다.
+DEFAULT_CONNECT_TIMEOUT_SECONDS = 0.5
+# Unix 소켓 주소의 접두사
+UNIX_URL_PREFIX = "unix:"
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """Unix 소켓으로 연결하는 HTTPConnection"""
+
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+class ReviewDaemonClient:
+    """`selvage serve`로 실행한 리뷰 데몬의 HTTP API 클라이언트.
+
+    데몬은 시작할 때 설정 디렉토리에 주소와 인증 토큰을 기록하며(`daemon.json`),
+    클라이언트는 이 파일로 데몬을 찾습니다. 연결 단계에서 실패하면
+    DaemonUnavailableError를 발생시켜 호출자가 직접 리뷰하도록 합니다.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: str | None = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT_SECONDS,
+    ) -> None:
+        """ReviewDaemonClient 초기화
+
+        Args:
+            url: 데몬 주소 (`unix:/path/to/daemon.sock` 또는 `http://127.0.0.1:8766`)
+            token: Bearer 인증 토큰
+            connect_timeout: 연결 타임아웃(초)
+        """
+        self.url = url
+        self.token = token
+        self.connect_timeout = connect_timeout
+
+    @staticmethod
+    def info_path(config_dir: Path | None = None) -> Path:
+        """데몬 정보 파일 경로를 반환합니다."""
+        return (config_dir or get_platform_config_dir()) / DAEMON_INFO_FILENAME
+
+    @classmethod
+    def discover(cls, config_dir: Path | None = None) -> "ReviewDaemonClient | None":
+        """실행 중인 데몬의 클라이언트를 만듭니다.
+
+        `SELVAGE_DAEMON_URL` 환경변수가 있으면 그 주소를, 없으면 데몬 정보 파일을
+        사용합니다. 데몬이 실제로 응답하는지는 요청을 보낼 때 확인합니다.
+
+        Args:
+            config_dir: 데몬 정보 파일이 있는 디렉토리 (None이면 설정 디렉토리)
+
+        Returns:
+            ReviewDaemonClient | None: 데몬 정보가 없으면 None
+        """
+        env_url = os.getenv(DAEMON_URL_ENV_VAR)
+        info_path = cls.info_path(config_dir)
+        try:
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            info = {}
+
+        if env_url:
+            # 같은 데몬이면 정보 파일의 토큰을 사용합니다.
+            token = info.get("token") if info.get("url") == env_url else None
+            return cls(env_url, token)
+        if not isinstance(info, dict) or not info.get("url"):
+            return None
+        return cls(info["url"], info.get("token"))
+
+    def health(self) -> dict[str, Any]:
+        """데몬 상태(버전, 프로세스 ID)를 조회합니다.
+
+        Raises:
+            DaemonUnavailableError: 데몬에 연결할 수 없는 경우
+            DaemonReviewError: 데몬이 오류를 응답한 경우
+        """
+        return self._request("GET", "/v1/health", read_timeout=self.connect_timeout)
+
+    def review(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """리뷰를 요청하고 완료될 때까지 기다립니다.
+
+        Args:
+            payload: DaemonReviewRequest 형식의 요청 본문
+
+        Returns:
+            dict[str, Any]: DaemonReviewResult 형식의 응답 본문
+
+        Raises:
+            DaemonUnavailableError: 데몬에 연결할 수 없거나 버전이 다른 경우
+            DaemonReviewError: 데몬이 리뷰에 실패한 경우
+        """
+        return self._request("POST", "/v1/review", payload, read_timeout=None)
+
+    def _connection(self) -> http.client.HTTPConnection:
+        """데몬 주소에 맞는 HTTP 연결 객체를 만듭니다."""
+        if self.url.startswith(UNIX_URL_PREFIX):
+            socket_path = self.url[len(UNIX_URL_PREFIX) :]
+            return _UnixHTTPConnection(socket_path, timeout=self.connect_timeout)
+        if self.url.startswith("http://"):
+            host = self.url[len("http://") :].rstrip("/")
+            return http.client.HTTPConnection(host, timeout=self.connect_timeout)
+        raise DaemonUnavailableError(f"지원하지 않는 데몬 주소입니다: {self.url}")
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, Any] | None = None,
+        read_timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """요청을 보내고 JSON 응답 본문을 반환합니다."""
+        conn = self._connection()
+        try:
+            try:
+                conn.connect()
+            except OSError as e:
+                raise DaemonUnavailableError(
+                    f"리뷰 데몬({self.url})에 연결할 수 없습니다: {str(e)}"
+                ) from e
+            # 연결된 뒤에는 리뷰가 끝날 때까지 기다립니다.
+            conn.sock.settimeout(read_timeout)
+
+            headers = {VERSION_HEADER: __version__}
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            body = None
+            if payload is not None:
+                body = json.dumps(payload).encode("utf-8")
+                headers["Content-Type"] = "application/json"
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                status = response.status
+                data = json.loads(response.read() or b"{}")
+            except (OSError, http.client.HTTPException, ValueError) as e:
+                raise DaemonReviewError(
+                    f"리뷰 데몬 응답을 받지 못했습니다: {str(e)}", status=0
+                ) from e
+        finally:
+            conn.close()
+
+        if status == 200:
+            return data
+        message = data.get("error", f"HTTP {status}")
+        if status in (401, 409):
+            # 토큰이 다르거나(데몬 재시작) 버전이 다르면 데몬을 사용하지 않습니다.
+            raise DaemonUnavailableError(message)
+        raise DaemonReviewError(message, status=status)
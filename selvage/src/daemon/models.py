@@ -0,0 +1,42 @@
+"""리뷰 데몬 API의 요청/응답 모델"""
+
+from pydantic import BaseModel, Field
+
+from selvage.src.config import DEFAULT_SHARD_CONCURRENCY
+from selvage.src.utils.token.models import EstimatedCost
+
+
+class DaemonReviewRequest(BaseModel):
+    """`POST /v1/review` 요청 본문
+
+    `diff`를 지정하면 해당 diff를 그대로 리뷰합니다(에디터 연동 등). 지정하지 않으면
+    데몬이 `repo_path` 저장소에서 `staged`/`target_commit`/`target_branch`에 따라
+    diff를 직접 가져옵니다. `repo_path`는 데몬의 작업 디렉토리와 무관하도록 절대
+    경로로 지정해야 합니다.
+    """
+
+    model: str
+    repo_path: str
+    diff: str | None = None
+    staged: bool = False
+    target_commit: str | None = None
+    target_branch: str | None = None
+    diff_only: bool = False
+    skip_cache: bool = False
+    clear_cache: bool = False
+    shard: bool = False
+    shard_concurrency: int = Field(default=DEFAULT_SHARD_CONCURRENCY, ge=1)
+
+
+class DaemonReviewResult(BaseModel):
+    """`POST /v1/review` 응답 본문
+
+    변경 사항이 없으면 `log_path`와 `estimated_cost`가 None입니다.
+    리뷰에 실패한 경우(일부 분할 리뷰 실패 포함) `error`에 오류가 기록됩니다.
+    """
+
+    model: str
+    log_path: str | None = None
+    estimated_cost: EstimatedCost | None = None
+    issue_count: int = 0
+    error: str | None = None
@@ -0,0 +1,227 @@
+"""ReviewDaemon: 리뷰 요청을 받아 처리하는 상주 HTTP 서버 모듈."""
+
+import hmac
+import json
+import os
+import socket
+import socketserver
+from collections.abc import Callable
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from selvage.__version__ import __version__
+from selvage.src.utils.base_console import console
+
+from .daemon_client import UNIX_URL_PREFIX, VERSION_HEADER
+from .models import DaemonReviewRequest, DaemonReviewResult
+
+# 허용하는 최대 요청 본문 크기 (diff를 직접 보내는 경우 포함)
+MAX_REQUEST_BYTES = 64 * 1024 * 1024
+
+ReviewFunction = Callable[[DaemonReviewRequest], DaemonReviewResult]
+
+
+class _TCPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    review_daemon: "ReviewDaemon"
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        review_daemon: "ReviewDaemon"
+
+
+class ReviewDaemon:
+    """모델 설정, LLM 클라이언트, 토크나이저, 캐시를 메모리에 유지하는 리뷰 데몬.
+
+    `GET /v1/health`는 버전과 프로세스 ID를, `POST /v1/review`는
+    DaemonReviewRequest를 받아 리뷰를 수행한 뒤 DaemonReviewResult를 반환합니다.
+    Unix 소켓(기본) 또는 localhost TCP 포트에서 대기하며, 시작할 때 만든 토큰으로
+    Bearer 인증을 요구합니다. 실제 리뷰는 생성자로 받은 `review_fn`이 수행합니다.
+    """
+
+    def __init__(
+        self,
+        review_fn: ReviewFunction,
+        token: str,
+        socket_path: Path | None = None,
+        port: int = 0,
+    ) -> None:
+        """ReviewDaemon 초기화
+
+        Args:
+            review_fn: 리뷰 요청 하나를 처리하는 함수
+            token: 요청에 요구할 Bearer 토큰
+            socket_path: Unix 소켓 경로 (None이면 127.0.0.1의 TCP 포트 사용)
+            port: TCP 포트 (0이면 빈 포트 자동 선택)
+
+        Raises:
+            RuntimeError: 같은 소켓에서 다른 데몬이 이미 실행 중인 경우
+        """
+        self.review_fn = review_fn
+        self.token = token
+        self.socket_path = socket_path
+        if socket_path is not None:
+            self._remove_stale_socket(socket_path)
+            socket_path.parent.mkdir(parents=True, exist_ok=True)
+            old_umask = os.umask(0o177)
+            try:
+                self._server = _UnixServer(str(socket_path), _ReviewRequestHandler)
+            finally:
+                os.umask(old_umask)
+            self.url = f"{UNIX_URL_PREFIX}{socket_path}"
+        else:
+            self._server = _TCPServer(("127.0.0.1", port), _ReviewRequestHandler)
+            self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._server.review_daemon = self
+
+    @staticmethod
+    def _remove_stale_socket(socket_path: Path) -> None:
+        """남은 소켓 파일을 지웁니다. 데몬이 실행 중이면 오류가 발생합니다."""
+        if not socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink(missing_ok=True)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"리뷰 데몬이 이미 실행 중입니다: {socket_path}")
+
+    def write_info(self, info_path: Path) -> None:
+        """클라이언트가 데몬을 찾을 수 있도록 주소와 토큰을 기록합니다.
+
+        토큰이 포함되므로 소유자만 읽을 수 있는 권한으로 저장합니다.
+        """
+        info_path.parent.mkdir(parents=True, exist_ok=True)
+        info = {
+            "url": self.url,
+            "token": self.token,
+            "pid": os.getpid(),
+            "version": __version__,
+        }
+        tmp_path = info_path.with_name(f".{info_path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(tmp_path, info_path)
+
+    def remove_info(self, info_path: Path) -> None:
+        """이 데몬이 기록한 데몬 정보 파일을 지웁니다."""
+        try:
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        # 그 사이 다른 데몬이 덮어쓴 정보는 지우지 않습니다.
+        if info.get("pid") == os.getpid():
+            info_path.unlink(missing_ok=True)
+
+    def serve_forever(self) -> None:
+        """shutdown이 호출될 때까지 요청을 처리합니다."""
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """serve_forever 루프를 멈춥니다. 다른 스레드에서 호출해야 합니다."""
+        self._server.shutdown()
+
+    def server_close(self) -> None:
+        """서버 소켓을 닫고 Unix 소켓 파일을 지웁니다."""
+        self._server.server_close()
+        if self.socket_path is not None:
+            self.socket_path.unlink(missing_ok=True)
+
+
+class _ReviewRequestHandler(BaseHTTPRequestHandler):
+    """리뷰 데몬의 요청 처리기."""
+
+    server: "_TCPServer"
+
+    def do_GET(self) -> None:  # noqa: N802
+        if not self._authorize():
+            return
+        if self.path != "/v1/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not Found"})
+            return
+        self._send_json(HTTPStatus.OK, {"version": __version__, "pid": os.getpid()})
+
+    def do_POST(self) -> None:  # noqa: N802
+        if not self._authorize():
+            return
+        if self.path != "/v1/review":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not Found"})
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_json(HTTPStatus.LENGTH_REQUIRED, {"error": "Length Required"})
+            return
+        if content_length < 0:
+            # 음수 길이로 read(-1)을 호출하면 연결이 닫힐 때까지 읽습니다.
+            self._send_json(
+                HTTPStatus.BAD_REQUEST, {"error": "Content-Length가 음수입니다."}
+            )
+            return
+        if content_length > MAX_REQUEST_BYTES:
+            self._send_json(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "요청이 너무 큽니다."}
+            )
+            return
+
+        try:
+            review_request = DaemonReviewRequest.model_validate_json(
+                self.rfile.read(content_length)
+            )
+        except ValidationError as e:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(e)})
+            return
+
+        try:
+            result = self.server.review_daemon.review_fn(review_request)
+        except Exception as e:
+            console.error(f"데몬 리뷰 중 오류가 발생했습니다: {str(e)}", exception=e)
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(e)})
+            return
+        self._send_json(HTTPStatus.OK, result.model_dump(mode="json"))
+
+    def _authorize(self) -> bool:
+        """토큰과 클라이언트 버전을 확인합니다. 실패하면 오류 응답을 보냅니다."""
+        expected = f"Bearer {self.server.review_daemon.token}"
+        received = self.headers.get("Authorization", "")
+        if not hmac.compare_digest(received.encode(), expected.encode()):
+            self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "Unauthorized"})
+            return False
+
+        client_version = self.headers.get(VERSION_HEADER)
+        if client_version is not None and client_version != __version__:
+            self._send_json(
+                HTTPStatus.CONFLICT,
+                {
+                    "error": f"리뷰 데몬 버전({__version__})이 "
+                    f"CLI 버전({client_version})과 다릅니다."
+                },
+            )
+            return False
+        return True
+
+    def _send_json(self, status: HTTPStatus, data: dict) -> None:
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def address_string(self) -> str:
+        # Unix 소켓 연결에는 클라이언트 주소가 없습니다.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        console.log_info(f"review-daemon {self.address_string()} {format % args}")
@@ -2,12 +2,14 @@
 Git diff 파싱 모듈
 """
 
-from .models import DiffResult, FileDiff, Hunk
-from .parser import parse_git_diff
+from .models import CompactHunk, DiffResult, FileDiff, Hunk
+from .parser import parse_git_diff, parse_git_diff_stream
 
 __all__ = [
     "parse_git_diff",
+    "parse_git_diff_stream",
     "Hunk",
+    "CompactHunk",
     "FileDiff",
     "DiffResult",
 ]
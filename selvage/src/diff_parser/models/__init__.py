@@ -2,11 +2,13 @@
 diff_parser 모델 정의 패키지
 """
 
+from .compact_hunk import CompactHunk
 from .diff_result import DiffResult
 from .file_diff import FileDiff
 from .hunk import Hunk
 
 __all__ = [
+    "CompactHunk",
     "DiffResult",
     "FileDiff",
     "Hunk",
@@ -0,0 +1,216 @@
+"""CompactHunk: 원본 라인을 한 번만 저장하는 메모리 절약형 hunk 모델 모듈."""
+
+from typing import Any
+
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+from .hunk import Hunk, escape_code_block
+
+# 라인 종류 플래그 (라인마다 1바이트)
+LINE_KIND_CONTEXT = 0
+LINE_KIND_REMOVED = 1
+LINE_KIND_ADDED = 2
+
+
+def classify_line(code_line: str) -> int:
+    """diff 라인의 접두사로 라인 종류를 판별합니다.
+
+    Args:
+        code_line: 줄바꿈 문자를 제외한 diff 라인
+
+    Returns:
+        int: LINE_KIND_REMOVED, LINE_KIND_ADDED 또는 LINE_KIND_CONTEXT
+    """
+    prefix = code_line[:1]
+    if prefix == "-":
+        return LINE_KIND_REMOVED
+    if prefix == "+":
+        return LINE_KIND_ADDED
+    # 컨텍스트 라인과 표준 diff 형식이 아닌 라인은 변경 전/후 모두에 포함됩니다.
+    return LINE_KIND_CONTEXT
+
+
+class CompactHunk:
+    """원본 hunk 라인을 한 번만 저장하는 `__slots__` 기반 hunk 클래스.
+
+    `Hunk`는 content, before_code, after_code를 각각 전체 문자열로 보관하여
+    컨텍스트 라인이 세 번 저장됩니다. CompactHunk는 content 문자열과 라인별 종류
+    플래그만 저장하고, before_code/after_code는 접근할 때마다 계산합니다.
+    `Hunk`와 동일한 속성과 메서드를 제공하며, pydantic 직렬화 결과도 같습니다.
+    """
+
+    __slots__ = (
+        "header",
+        "content",
+        "line_kinds",
+        "start_line_original",
+        "line_count_original",
+        "start_line_modified",
+        "line_count_modified",
+    )
+
+    def __init__(
+        self,
+        header: str,
+        content: str,
+        line_kinds: bytes,
+        start_line_original: int,
+        line_count_original: int,
+        start_line_modified: int,
+        line_count_modified: int,
+    ) -> None:
+        """CompactHunk 객체를 초기화합니다.
+
+        Args:
+            header: hunk 헤더 문자열 (예: "@@ -3,6 +40,7 @@")
+            content: 헤더를 제외한 원본 hunk 내용
+            line_kinds: content의 라인별 종류 플래그
+            start_line_original: 변경 전 시작 줄 번호
+            line_count_original: 변경 전 줄 수
+            start_line_modified: 변경 후 시작 줄 번호
+            line_count_modified: 변경 후 줄 수
+        """
+        self.header = header
+        self.content = content
+        self.line_kinds = line_kinds
+        self.start_line_original = start_line_original
+        self.line_count_original = line_count_original
+        self.start_line_modified = start_line_modified
+        self.line_count_modified = line_count_modified
+
+    @property
+    def before_code(self) -> str:
+        """변경 전 코드 (삭제 라인과 컨텍스트 라인)를 반환합니다."""
+        return self._join_lines(excluded_kind=LINE_KIND_ADDED)
+
+    @property
+    def after_code(self) -> str:
+        """변경 후 코드 (추가 라인과 컨텍스트 라인)를 반환합니다."""
+        return self._join_lines(excluded_kind=LINE_KIND_REMOVED)
+
+    def get_safe_before_code(self) -> str:
+        """이스케이프 처리된 원본 코드를 반환합니다.
+
+        Returns:
+            str: 이스케이프 처리된 원본 코드
+        """
+        return escape_code_block(self.before_code)
+
+    def get_safe_after_code(self) -> str:
+        """이스케이프 처리된 수정 코드를 반환합니다.
+
+        Returns:
+            str: 이스케이프 처리된 수정 코드
+        """
+        return escape_code_block(self.after_code)
+
+    def to_dict(self) -> dict[str, Any]:
+        """`Hunk`의 asdict 결과와 같은 형태의 딕셔너리로 변환합니다."""
+        return {
+            "header": self.header,
+            "content": self.content,
+            "before_code": self.before_code,
+            "after_code": self.after_code,
+            "start_line_original": self.start_line_original,
+            "line_count_original": self.line_count_original,
+            "start_line_modified": self.start_line_modified,
+            "line_count_modified": self.line_count_modified,
+        }
+
+    def to_hunk(self) -> Hunk:
+        """before_code/after_code를 모두 계산한 `Hunk` 객체로 변환합니다."""
+        return Hunk(**self.to_dict())
+
+    @classmethod
+    def from_content(
+        cls,
+        header: str,
+        content: str,
+        start_line_original: int,
+        line_count_original: int,
+        start_line_modified: int,
+        line_count_modified: int,
+    ) -> "CompactHunk":
+        """hunk 내용 문자열로부터 라인 종류를 계산하여 CompactHunk를 생성합니다.
+
+        Args:
+            header: hunk 헤더 문자열
+            content: 헤더를 제외한 원본 hunk 내용
+            start_line_original: 변경 전 시작 줄 번호
+            line_count_original: 변경 전 줄 수
+            start_line_modified: 변경 후 시작 줄 번호
+            line_count_modified: 변경 후 줄 수
+
+        Returns:
+            CompactHunk: 생성된 CompactHunk 객체
+        """
+        lines = content.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        line_kinds = bytes(classify_line(line) for line in lines)
+        return cls(
+            header=header,
+            content=content,
+            line_kinds=line_kinds,
+            start_line_original=start_line_original,
+            line_count_original=line_count_original,
+            start_line_modified=start_line_modified,
+            line_count_modified=line_count_modified,
+        )
+
+    def _join_lines(self, excluded_kind: int) -> str:
+        """지정된 종류를 제외한 라인들을 줄바꿈으로 연결합니다."""
+        # content가 줄바꿈으로 끝나면 split 결과의 마지막 빈 문자열은 버려집니다.
+        lines = self.content.split("\n")
+        return "\n".join(
+            line.rstrip("\r")
+            for line, kind in zip(lines, self.line_kinds, strict=False)
+            if kind != excluded_kind
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactHunk):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot) for slot in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactHunk(header={self.header!r}, "
+            f"lines={len(self.line_kinds)}, "
+            f"start_line_modified={self.start_line_modified})"
+        )
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: type[Any], handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """pydantic 모델(ReviewRequest 등)에 포함될 때의 검증/직렬화 스키마."""
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda hunk: hunk.to_dict()
+            ),
+        )
+
+    @classmethod
+    def _validate(cls, value: object) -> "CompactHunk":
+        """CompactHunk 인스턴스 또는 직렬화된 딕셔너리를 CompactHunk로 변환합니다.
+
+        Raises:
+            ValueError: 변환할 수 없는 값인 경우
+        """
+        if isinstance(value, CompactHunk):
+            return value
+        if isinstance(value, dict):
+            return cls.from_content(
+                header=value["header"],
+                content=value["content"],
+                start_line_original=value["start_line_original"],
+                line_count_original=value["line_count_original"],
+                start_line_modified=value["start_line_modified"],
+                line_count_modified=value["line_count_modified"],
+            )
+        raise ValueError(f"CompactHunk로 변환할 수 없는 값입니다: {type(value)}")
@@ -1,5 +1,5 @@
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 from typing import Any
 
 from .file_diff import FileDiff
@@ -14,7 +14,7 @@ class DiffResult:
     def to_dict(self) -> dict[str, Any]:
         """DiffResult를 딕셔너리로 변환합니다."""
         return {
-            "files": [asdict(file) for file in self.files],
+            "files": [file.to_dict() for file in self.files],
             "total_additions": sum(file.additions for file in self.files),
             "total_deletions": sum(file.deletions for file in self.files),
             "language_stats": self._get_language_stats(),
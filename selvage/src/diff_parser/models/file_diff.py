@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
+from typing import Any
 
 from selvage.src.utils.language_detector import detect_language_from_filename
 
+from .compact_hunk import CompactHunk
 from .hunk import Hunk
 
 
@@ -11,7 +13,7 @@ class FileDiff:
 
     filename: str
     file_content: str | None = None
-    hunks: list[Hunk] = field(default_factory=list)
+    hunks: list[Hunk | CompactHunk] = field(default_factory=list)
     language: str = ""
     additions: int = 0
     deletions: int = 0
@@ -31,3 +33,14 @@ class FileDiff:
     def detect_language(self) -> None:
         """파일 확장자를 기반으로 언어를 감지합니다."""
         self.language = detect_language_from_filename(self.filename)
+
+    def to_dict(self) -> dict[str, Any]:
+        """FileDiff를 딕셔너리로 변환합니다."""
+        return {
+            "filename": self.filename,
+            "file_content": self.file_content,
+            "hunks": [hunk.to_dict() for hunk in self.hunks],
+            "language": self.language,
+            "additions": self.additions,
+            "deletions": self.deletions,
+        }
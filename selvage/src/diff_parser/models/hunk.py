@@ -1,5 +1,6 @@
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+from typing import Any
 
 
 def escape_code_block(text: str) -> str:
@@ -48,6 +49,10 @@ class Hunk:
         """
         return escape_code_block(self.after_code)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Hunk를 딕셔너리로 변환합니다."""
+        return asdict(self)
+
     @staticmethod
     def from_hunk_text(hunk_text: str) -> "Hunk":
         """hunk 텍스트로부터 Hunk 객체를 생성합니다.
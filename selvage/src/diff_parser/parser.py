@@ -1,105 +1,316 @@
+import io
 import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
+from selvage.src.config import DEFAULT_FILE_LOAD_WORKERS
 from selvage.src.exceptions.diff_parsing_error import DiffParsingError
 from selvage.src.utils import load_file_content
+from selvage.src.utils.base_console import console
+from selvage.src.utils.git_blob_loader import GitBlobLoader
 
-from .models import DiffResult, FileDiff, Hunk
+from .models import CompactHunk, DiffResult, FileDiff, Hunk
+from .models.compact_hunk import (
+    LINE_KIND_ADDED,
+    LINE_KIND_REMOVED,
+    classify_line,
+)
 
-_PATTERN_DIFF_SPLIT = re.compile(r"(?=^diff --git)", flags=re.MULTILINE)
-_PATTERN_HUNK_SPLIT = re.compile(r"(?=^@@ )", flags=re.MULTILINE)
-_PATTERN_FILE_HEADER = re.compile(r"^diff --git a/(\S+) b/(\S+)", flags=re.MULTILINE)
+_PATTERN_FILE_HEADER = re.compile(r"^diff --git a/(\S+) b/(\S+)")
+_DIFF_HEADER_PREFIX = "diff --git"
+_HUNK_HEADER_PREFIX = "@@ "
 _DELETED_FILE_PLACEHOLDER = "삭제된 파일"
-_DELETED_FILE_PATTERN = re.compile(r"^--- a/.*\n^\+\+\+ /dev/null$", flags=re.MULTILINE)
 
 
-def _parse_single_file_diff(
-    raw_diff: str, use_full_context: bool, repo_path: str
-) -> FileDiff | None:
-    """단일 파일 diff 텍스트를 파싱하여 FileDiff 객체를 반환합니다.
+class _FileDiffBuilder:
+    """스트리밍 파싱 중인 단일 파일 diff의 상태를 누적하는 보조 클래스.
+
+    각 라인을 한 번만 검사하면서 hunk 내용, 라인 종류 플래그,
+    추가/삭제 라인 수를 동시에 계산합니다.
+    """
+
+    def __init__(self, header_line: str) -> None:
+        header_match = _PATTERN_FILE_HEADER.match(header_line)
+        self.filename: str | None = header_match.group(2) if header_match else None
+        self.is_deleted = False
+        self.hunks: list[Hunk | CompactHunk] = []
+        self.additions = 0
+        self.deletions = 0
+        self._prev_header_line = ""
+        self._hunk_header: str | None = None
+        self._content_lines: list[str] = []
+        self._line_kinds = bytearray()
+
+    def feed(self, line: str) -> None:
+        """diff 라인 하나를 처리합니다.
+
+        Args:
+            line: 줄바꿈 문자를 포함한 diff 라인
+        """
+        if line.startswith(_HUNK_HEADER_PREFIX):
+            self._flush_hunk()
+            self._hunk_header = line.rstrip("\n")
+            return
+
+        if self._hunk_header is None:
+            # 첫 hunk 이전의 파일 헤더 영역 (index, ---, +++ 등)
+            # 삭제된 파일은 '--- a/...' 다음 줄에 '+++ /dev/null'이 옵니다.
+            if (
+                self._prev_header_line.startswith("--- a/")
+                and line.rstrip("\n") == "+++ /dev/null"
+            ):
+                self.is_deleted = True
+            self._prev_header_line = line
+            return
+
+        self._content_lines.append(line)
+        code_part = line.rstrip("\r\n")
+        line_kind = classify_line(code_part)
+        self._line_kinds.append(line_kind)
+        if line_kind == LINE_KIND_REMOVED and not code_part.startswith("---"):
+            self.deletions += 1
+        elif line_kind == LINE_KIND_ADDED and not code_part.startswith("+++"):
+            self.additions += 1
+
+    def build(self, use_full_context: bool, repo_path: str) -> FileDiff | None:
+        """누적된 상태로 FileDiff 객체를 생성합니다.
+
+        Args:
+            use_full_context: 전체 파일 컨텍스트를 사용할지 여부
+            repo_path: Git 저장소 경로
+
+        Returns:
+            FileDiff | None: 생성된 FileDiff 객체 또는 헤더가 유효하지 않은 경우 None
+        """
+        self._flush_hunk()
+        if self.filename is None:
+            return None
+
+        file_content: str | None
+        if self.is_deleted:
+            file_content = _DELETED_FILE_PLACEHOLDER
+        elif use_full_context:
+            file_content = _load_file_content_or_placeholder(self.filename, repo_path)
+        else:
+            file_content = None
+
+        file_diff = FileDiff(
+            filename=self.filename,
+            file_content=file_content,
+            hunks=self.hunks,
+            additions=self.additions,
+            deletions=self.deletions,
+        )
+        file_diff.detect_language()
+        return file_diff
+
+    def _flush_hunk(self) -> None:
+        """진행 중인 hunk가 있으면 CompactHunk 객체로 변환하여 저장합니다."""
+        if self._hunk_header is None:
+            return
+
+        (
+            start_line_original,
+            line_count_original,
+            start_line_modified,
+            line_count_modified,
+        ) = Hunk._parse_header(self._hunk_header)
+        self.hunks.append(
+            CompactHunk(
+                header=self._hunk_header,
+                content="".join(self._content_lines),
+                line_kinds=bytes(self._line_kinds),
+                start_line_original=start_line_original,
+                line_count_original=line_count_original,
+                start_line_modified=start_line_modified,
+                line_count_modified=line_count_modified,
+            )
+        )
+        self._hunk_header = None
+        self._content_lines = []
+        self._line_kinds = bytearray()
+
+
+def _load_file_content_or_placeholder(filename: str, repo_path: str) -> str:
+    """파일 전체 내용을 읽고, 실패하면 오류 메시지를 내용으로 반환합니다.
 
     Args:
-        raw_diff (str): 단일 파일에 대한 git diff 텍스트.
-        use_full_context (bool): 전체 파일 컨텍스트를 사용할지 여부.
-        repo_path (str): Git 저장소 경로.
+        filename (str): 읽을 파일 경로
+        repo_path (str): Git 저장소 경로
 
     Returns:
-        FileDiff | None: 파싱된 FileDiff 객체 또는 파싱할 수 없는 경우 None.
+        str: 파일 내용 또는 오류 메시지
     """
-    if not raw_diff.strip():
-        return None
-
-    header_match = _PATTERN_FILE_HEADER.search(raw_diff)
-    if not header_match:
-        return None
-    filename = header_match.group(2)
-
-    hunks_text = _PATTERN_HUNK_SPLIT.split(raw_diff)
-    hunk_list = [
-        Hunk.from_hunk_text(h) for h in hunks_text if h.lstrip().startswith("@@")
-    ]
-
-    file_content: str | None
-    if _is_deleted_file(raw_diff):
-        file_content = _DELETED_FILE_PLACEHOLDER
-    elif use_full_context:
-        try:
-            file_content = load_file_content(filename, repo_path)
-        except (FileNotFoundError, PermissionError) as e:
-            # 파일 읽기 실패 시, 오류 메시지를 content로 사용하고 파싱은 계속 진행
-            file_content = f"[파일 읽기 오류: {filename} ({e.__class__.__name__})]"
-        except Exception as e:
-            # 기타 예외 발생 시에도 오류 메시지를 content로 사용
-            file_content = (
-                f"[파일 처리 중 예기치 않은 오류: {filename} ({e.__class__.__name__})]"
-            )
+    try:
+        return load_file_content(filename, repo_path)
+    except (FileNotFoundError, PermissionError) as e:
+        # 파일 읽기 실패 시, 오류 메시지를 content로 사용하고 파싱은 계속 진행
+        return f"[파일 읽기 오류: {filename} ({e.__class__.__name__})]"
+    except Exception as e:
+        # 기타 예외 발생 시에도 오류 메시지를 content로 사용
+        return f"[파일 처리 중 예기치 않은 오류: {filename} ({e.__class__.__name__})]"
+
+
+def parse_git_diff_stream(
+    diff_lines: Iterable[str], use_full_context: bool, repo_path: str
+) -> Iterator[FileDiff]:
+    """Git diff 라인 스트림을 한 번만 순회하며 파일 단위 FileDiff를 생성합니다.
+
+    전체 diff를 하나의 문자열로 메모리에 올리지 않으므로, 파일 객체나
+    `git diff` 파이프처럼 수백 MB에 달하는 출력도 파일 하나 분량의 메모리로
+    파싱할 수 있습니다.
+
+    Args:
+        diff_lines (Iterable[str]): 줄바꿈 문자를 포함한 diff 라인 이터러블
+            (예: 파일 객체, `GitDiffUtility.iter_diff_lines()`)
+        use_full_context (bool): 전체 파일 컨텍스트를 사용할지 여부
+        repo_path (str): Git 저장소 경로
+
+    Yields:
+        FileDiff: 파싱이 끝난 파일 단위 diff 객체
+    """
+    builder: _FileDiffBuilder | None = None
+    for line in diff_lines:
+        if line.startswith(_DIFF_HEADER_PREFIX):
+            if builder is not None:
+                file_diff = builder.build(use_full_context, repo_path)
+                if file_diff:
+                    yield file_diff
+            builder = _FileDiffBuilder(line)
+        elif builder is not None:
+            builder.feed(line)
+
+    if builder is not None:
+        file_diff = builder.build(use_full_context, repo_path)
+        if file_diff:
+            yield file_diff
+
+
+def _load_file_contents(
+    file_diffs: list[FileDiff], repo_path: str, max_workers: int
+) -> None:
+    """파일 내용이 비어있는 FileDiff들의 전체 내용을 스레드 풀로 동시에 읽어옵니다.
+
+    네트워크 마운트된 저장소처럼 파일 I/O 지연이 큰 환경에서 파일을 하나씩
+    읽는 대신 최대 `max_workers`개를 동시에 읽습니다. 결과는 입력 순서대로
+    채워지며, 읽기 실패 시에는 기존과 동일한 오류 메시지를 내용으로 사용합니다.
+
+    Args:
+        file_diffs (list[FileDiff]): 내용을 채울 FileDiff 목록
+        repo_path (str): Git 저장소 경로
+        max_workers (int): 동시에 파일을 읽을 최대 스레드 수
+    """
+    targets = [file_diff for file_diff in file_diffs if file_diff.file_content is None]
+    if not targets:
+        return
+
+    filenames = [file_diff.filename for file_diff in targets]
+    workers = min(max_workers, len(targets))
+    if workers == 1:
+        contents = [
+            _load_file_content_or_placeholder(filename, repo_path)
+            for filename in filenames
+        ]
     else:
-        file_content = None
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="selvage-file-loader"
+        ) as executor:
+            contents = list(
+                executor.map(
+                    _load_file_content_or_placeholder,
+                    filenames,
+                    [repo_path] * len(filenames),
+                )
+            )
 
-    parsed_diff = FileDiff(
-        filename=filename, file_content=file_content, hunks=hunk_list
-    )
-    parsed_diff.detect_language()
-    parsed_diff.calculate_changes()
-    return parsed_diff
+    for file_diff, content in zip(targets, contents, strict=True):
+        file_diff.file_content = content
+
+
+def _load_file_contents_from_revision(
+    file_diffs: list[FileDiff], repo_path: str, revision: str
+) -> None:
+    """파일 내용이 비어있는 FileDiff들의 내용을 git 오브젝트 저장소에서 읽어옵니다.
+
+    하나의 `git cat-file --batch` 프로세스로 모든 파일을 스트리밍하여 읽으므로
+    파일마다 open을 호출하지 않고, 작업 트리 상태와 무관한 내용을 얻습니다.
+    리비전에 없는 파일은 내용을 비워 두어 작업 트리에서 읽도록 합니다.
+
+    Args:
+        file_diffs (list[FileDiff]): 내용을 채울 FileDiff 목록
+        repo_path (str): Git 저장소 경로
+        revision (str): 파일 내용을 읽을 리비전
+
+    Raises:
+        OSError: git 프로세스를 실행할 수 없거나 예기치 않게 종료된 경우
+    """
+    targets = [file_diff for file_diff in file_diffs if file_diff.file_content is None]
+    if not targets:
+        return
+
+    loader = GitBlobLoader(repo_path, revision)
+    blobs = loader.iter_file_contents([file_diff.filename for file_diff in targets])
+    for file_diff, (_, content) in zip(targets, blobs, strict=True):
+        file_diff.file_content = content
 
 
 def parse_git_diff(
-    diff_text: str, use_full_context: bool, repo_path: str
+    diff_text: str,
+    use_full_context: bool,
+    repo_path: str,
+    max_workers: int = DEFAULT_FILE_LOAD_WORKERS,
+    revision: str | None = None,
 ) -> DiffResult:
     """Git diff 텍스트를 파싱하여 구조화된 DiffResult 객체를 반환합니다.
 
+    모든 파일의 diff를 먼저 파싱한 뒤, 전체 파일 컨텍스트가 필요한 경우
+    파일 내용을 한꺼번에 읽어옵니다. `revision`이 주어지면 git 오브젝트 저장소에서,
+    그렇지 않으면 작업 트리에서 스레드 풀로 동시에 읽습니다. 리비전에 없는 파일이나
+    git 프로세스를 실행할 수 없어 읽지 못한 파일은 작업 트리에서 읽습니다.
+
     Args:
         diff_text (str): git diff 명령어의 출력 텍스트
         use_full_context (bool): 전체 파일 컨텍스트를 사용할지 여부
         repo_path (str): Git 저장소 경로
+        max_workers (int): 파일 내용을 동시에 읽을 최대 스레드 수
+        revision (str | None): 전체 파일 내용을 읽을 git 리비전
+            (예: 커밋/브랜치 리뷰 시 "HEAD"). None이면 작업 트리에서 읽습니다.
 
     Returns:
         DiffResult: Git diff 결과를 나타내는 객체
 
     Raises:
         DiffParsingError: diff가 비어있거나 유효하지 않은 형식인 경우
+        ValueError: max_workers가 1보다 작은 경우
     """
     if not diff_text:
         raise DiffParsingError("빈 diff가 제공되었습니다.")
+    if max_workers < 1:
+        raise ValueError(f"max_workers는 1 이상이어야 합니다: {max_workers}")
 
-    file_diffs = _PATTERN_DIFF_SPLIT.split(diff_text)
-    result = DiffResult()
-
-    for raw_diff in file_diffs:
-        file_diff = _parse_single_file_diff(raw_diff, use_full_context, repo_path)
-        if file_diff:
-            result.files.append(file_diff)
+    # 헤더와 hunk만 먼저 파싱하고 파일 내용은 아래에서 한꺼번에 읽습니다.
+    result = DiffResult(
+        files=list(
+            parse_git_diff_stream(
+                io.StringIO(diff_text, newline="\n"),
+                use_full_context=False,
+                repo_path=repo_path,
+            )
+        )
+    )
 
     if not result.files:
         raise DiffParsingError("유효하지 않은 diff 형식입니다.")
 
-    return result
-
+    if use_full_context:
+        if revision is not None:
+            try:
+                _load_file_contents_from_revision(result.files, repo_path, revision)
+            except OSError as e:
+                console.warning(
+                    f"git 오브젝트 저장소에서 파일을 읽지 못해 작업 트리에서 읽습니다: "
+                    f"{str(e)}"
+                )
+        _load_file_contents(result.files, repo_path, max_workers)
 
-def _is_deleted_file(raw_diff: str) -> bool:
-    """파일이 삭제된 경우 True를 반환합니다.
-
-    Git diff에서 삭제된 파일은 diff 헤더에 '+++ /dev/null' 패턴이 있습니다.
-    단순 문자열 포함 여부가 아닌 정규표현식으로 헤더 패턴을 확인합니다.
-    """
-    return bool(_DELETED_FILE_PATTERN.search(raw_diff))
+    return result
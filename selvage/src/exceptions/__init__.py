@@ -6,6 +6,8 @@ from selvage.src.exceptions.api_key_not_found_error import APIKeyNotFoundError
 from selvage.src.exceptions.context_limit_exceeded_error import (
     ContextLimitExceededError,
 )
+from selvage.src.exceptions.daemon_review_error import DaemonReviewError
+from selvage.src.exceptions.daemon_unavailable_error import DaemonUnavailableError
 from selvage.src.exceptions.diff_parsing_error import DiffParsingError
 from selvage.src.exceptions.invalid_api_key_error import InvalidAPIKeyError
 from selvage.src.exceptions.invalid_model_provider_error import (
@@ -24,4 +26,6 @@ __all__ = [
     "DiffParsingError",
     "ContextLimitExceededError",
     "InvalidAPIKeyError",
+    "DaemonUnavailableError",
+    "DaemonReviewError",
 ]
@@ -0,0 +1,11 @@
+"""
+리뷰 데몬이 리뷰 요청 처리에 실패했을 때 발생하는 예외 클래스 정의 모듈입니다.
+"""
+
+
+class DaemonReviewError(Exception):
+    """리뷰 데몬이 요청을 받았지만 리뷰에 실패했을 때 발생하는 예외"""
+
+    def __init__(self, message: str, status: int) -> None:
+        self.status = status
+        super().__init__(message)
@@ -0,0 +1,12 @@
+"""
+리뷰 데몬에 요청을 전달할 수 없을 때 발생하는 예외 클래스 정의 모듈입니다.
+"""
+
+
+class DaemonUnavailableError(Exception):
+    """리뷰 데몬이 실행 중이 아니거나 요청을 받을 수 없을 때 발생하는 예외
+
+    CLI는 이 예외가 발생하면 데몬 없이 직접 리뷰를 수행합니다.
+    """
+
+    pass
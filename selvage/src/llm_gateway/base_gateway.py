@@ -5,15 +5,13 @@
 from __future__ import annotations
 
 import abc
+import asyncio
+import sys
 from collections.abc import Callable
-from typing import Any
-
-import anthropic
-import google.genai.types as genai_types
-import instructor
-import openai
-from google import genai
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
+from selvage.src.config import DEFAULT_SHARD_CONCURRENCY
 from selvage.src.exceptions.context_limit_exceeded_error import (
     ContextLimitExceededError,
 )
@@ -22,8 +20,9 @@ from selvage.src.models.model_provider import ModelProvider
 from selvage.src.models.review_result import ReviewResult
 from selvage.src.utils.base_console import console
 from selvage.src.utils.json_extractor import JSONExtractor
-from selvage.src.utils.llm_client_factory import LLMClientFactory
+from selvage.src.utils.llm_client_registry import LLMClientRegistry
 from selvage.src.utils.prompts.models import ReviewPrompt, ReviewPromptWithFileContent
+from selvage.src.utils.prompts.review_prompt_sharder import ReviewPromptSharder
 from selvage.src.utils.token import CostEstimator
 from selvage.src.utils.token.models import (
     EstimatedCost,
@@ -32,6 +31,38 @@ from selvage.src.utils.token.models import (
 )
 from selvage.src.utils.token.token_utils import TokenUtils
 
+if TYPE_CHECKING:
+    # 프로바이더 SDK는 클라이언트를 만들 때 LLMClientFactory가 불러옵니다.
+    import anthropic
+    import google.genai.types as genai_types
+    import instructor
+    import openai
+    from google import genai
+    from google.genai.client import AsyncClient as AsyncGenaiClient
+
+# 분할 묶음 하나가 사용할 컨텍스트 제한 대비 토큰 비율 (추정 오차 여유분)
+SHARD_TOKEN_BUDGET_RATIO = 0.9
+
+
+def _is_sdk_instance(obj: object, module_name: str, class_name: str) -> bool:
+    """SDK 모듈을 새로 불러오지 않고 isinstance 검사를 수행합니다.
+
+    아직 불러오지 않은 SDK의 클래스 인스턴스는 존재할 수 없으므로 False를
+    반환합니다. 사용하지 않는 프로바이더의 SDK를 불러오는 비용을 피합니다.
+
+    Args:
+        obj: 검사할 객체
+        module_name: 클래스가 정의된 모듈 이름 (예: "anthropic.types")
+        class_name: 클래스 이름 (예: "Message")
+
+    Returns:
+        bool: 객체가 해당 클래스의 인스턴스이면 True
+    """
+    module = sys.modules.get(module_name)
+    if module is None:
+        return False
+    return isinstance(obj, getattr(module, class_name))
+
 
 class BaseGateway(abc.ABC):
     """LLM 게이트웨이의 추상 기본 클래스"""
@@ -39,7 +70,7 @@ class BaseGateway(abc.ABC):
     @staticmethod
     def _handle_openai_cost_estimation(resp: Any, model: str) -> EstimatedCost | None:
         if (
-            isinstance(resp, openai.types.Completion)
+            _is_sdk_instance(resp, "openai.types", "Completion")
             and hasattr(resp, "usage")
             and resp.usage
         ):
@@ -49,7 +80,7 @@ class BaseGateway(abc.ABC):
     @staticmethod
     def _handle_claude_cost_estimation(resp: Any, model: str) -> EstimatedCost | None:
         if (
-            isinstance(resp, anthropic.types.Message)
+            _is_sdk_instance(resp, "anthropic.types", "Message")
             and hasattr(resp, "usage")
             and resp.usage
         ):
@@ -59,7 +90,7 @@ class BaseGateway(abc.ABC):
     @staticmethod
     def _handle_google_cost_estimation(resp: Any, model: str) -> EstimatedCost | None:
         if (
-            isinstance(resp, genai_types.GenerateContentResponse)
+            _is_sdk_instance(resp, "google.genai.types", "GenerateContentResponse")
             and hasattr(resp, "usage_metadata")
             and resp.usage_metadata
         ):
@@ -120,12 +151,28 @@ class BaseGateway(abc.ABC):
     def _create_client(
         self,
     ) -> instructor.Instructor | genai.Client | anthropic.Anthropic:
-        """현재 프로바이더에 맞는 LLM 클라이언트를 생성합니다.
+        """현재 프로바이더에 맞는 LLM 클라이언트를 가져옵니다.
+
+        클라이언트는 프로세스 전역 레지스트리에서 재사용되므로 호출마다
+        커넥션 풀을 새로 만들지 않습니다.
 
         Returns:
             instructor.Instructor | genai.Client | anthropic.Anthropic: 구조화된 응답을 지원하는 LLM 클라이언트
         """
-        return LLMClientFactory.create_client(
+        return LLMClientRegistry.get_client(
+            self.get_provider(), self.api_key, self.model
+        )
+
+    def _create_async_client(
+        self,
+    ) -> instructor.AsyncInstructor | AsyncGenaiClient | anthropic.AsyncAnthropic:
+        """현재 이벤트 루프에서 사용할 비동기 LLM 클라이언트를 가져옵니다.
+
+        Returns:
+            instructor.AsyncInstructor | AsyncGenaiClient | anthropic.AsyncAnthropic:
+                구조화된 응답을 지원하는 비동기 LLM 클라이언트
+        """
+        return LLMClientRegistry.get_async_client(
             self.get_provider(), self.api_key, self.model
         )
 
@@ -202,6 +249,111 @@ class BaseGateway(abc.ABC):
         except ContextLimitExceededError as e:
             console.error(f"컨텍스트 제한 초과: {str(e)}", exception=e)
             return ReviewResult.get_error_result(e, self.get_model_name())
+        return self._request_review(review_prompt)
+
+    def review_code_sharded(
+        self,
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent,
+        max_concurrency: int = DEFAULT_SHARD_CONCURRENCY,
+    ) -> ReviewResult:
+        """컨텍스트 제한을 초과하는 리뷰를 여러 요청으로 나누어 병렬로 수행합니다.
+
+        프롬프트가 컨텍스트 제한 안에 들어가면 `review_code`와 동일하게 한 번만
+        요청합니다. 초과하는 경우 사용자 메시지(파일) 단위로 토큰 예산에 맞게
+        분할하고, 각 묶음을 최대 `max_concurrency`개까지 동시에 요청한 뒤
+        결과를 하나로 병합합니다.
+
+        Args:
+            review_prompt: 리뷰용 프롬프트 객체
+            max_concurrency: 동시에 수행할 최대 API 요청 수
+
+        Returns:
+            ReviewResult: 병합된 리뷰 결과. 실패한 묶음이 있으면
+                `review_response.error`에 오류가 기록됩니다.
+
+        Raises:
+            ValueError: max_concurrency가 1보다 작은 경우
+        """
+        if max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}"
+            )
+
+        try:
+            self.validate_review_request(review_prompt)
+        except ContextLimitExceededError as e:
+            if len(review_prompt.user_prompts) < 2:
+                console.error(f"컨텍스트 제한 초과: {str(e)}", exception=e)
+                return ReviewResult.get_error_result(e, self.get_model_name())
+        else:
+            return self._request_review(review_prompt)
+
+        context_limit = TokenUtils.get_model_context_limit(self.get_model_name())
+        token_budget = int(context_limit * SHARD_TOKEN_BUDGET_RATIO)
+        shards = ReviewPromptSharder(self.get_model_name(), token_budget).shard(
+            review_prompt
+        )
+        if len(shards) < 2:
+            shards = ReviewPromptSharder.split_in_half(review_prompt)
+        console.info(
+            f"컨텍스트 제한을 초과하여 리뷰를 {len(shards)}개 요청으로 "
+            "나누어 수행합니다."
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(shards)),
+            thread_name_prefix="selvage-review-shard",
+        ) as executor:
+            results = list(executor.map(self._review_shard, shards))
+
+        failed_count = sum(1 for result in results if result.review_response.error)
+        if failed_count:
+            console.warning(
+                f"분할 리뷰 {len(results)}개 중 {failed_count}개가 실패하여 "
+                "일부 파일은 리뷰되지 않았습니다."
+            )
+        return ReviewResult.merge(results, self.get_model_name())
+
+    def _review_shard(
+        self, review_prompt: ReviewPrompt | ReviewPromptWithFileContent
+    ) -> ReviewResult:
+        """분할된 프롬프트 하나를 리뷰합니다.
+
+        토큰 추정치와 달리 실제로 컨텍스트 제한을 초과하면 사용자 메시지를
+        절반으로 나누어 다시 시도합니다.
+
+        Args:
+            review_prompt: 분할된 리뷰 프롬프트 객체
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
+        try:
+            self.validate_review_request(review_prompt)
+        except ContextLimitExceededError as e:
+            if len(review_prompt.user_prompts) < 2:
+                console.error(f"컨텍스트 제한 초과: {str(e)}", exception=e)
+                return ReviewResult.get_error_result(e, self.get_model_name())
+            return ReviewResult.merge(
+                [
+                    self._review_shard(half)
+                    for half in ReviewPromptSharder.split_in_half(review_prompt)
+                ],
+                self.get_model_name(),
+            )
+        return self._request_review(review_prompt)
+
+    def _request_review(
+        self, review_prompt: ReviewPrompt | ReviewPromptWithFileContent
+    ) -> ReviewResult:
+        """유효성 검사를 마친 프롬프트로 LLM API를 호출하여 리뷰 결과를 생성합니다.
+
+        Args:
+            review_prompt: 리뷰용 프롬프트 객체
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
         messages = review_prompt.to_messages()
 
         try:
@@ -212,66 +364,162 @@ class BaseGateway(abc.ABC):
             params = self._create_request_params(messages)
 
             # API 요청 송신
-            if isinstance(client, instructor.Instructor):
+            if _is_sdk_instance(client, "instructor", "Instructor"):
                 structured_response, raw_api_response = (
                     client.chat.completions.create_with_completion(
                         response_model=StructuredReviewResponse, max_retries=2, **params
                     )
                 )
-            elif isinstance(client, genai.Client):
+            elif _is_sdk_instance(client, "google.genai", "Client"):
                 try:
                     raw_api_response = client.models.generate_content(**params)
-                    response_text = raw_api_response.text
-                    if response_text is None:
-                        return ReviewResult.get_empty_result(self.get_model_name())
-
-                    structured_response = StructuredReviewResponse.model_validate_json(
-                        response_text
-                    )
+                    structured_response = self._parse_genai_response(raw_api_response)
                 except Exception as parse_error:
-                    console.error(
-                        f"응답 파싱 오류: {str(parse_error)}", exception=parse_error
-                    )
-                    return ReviewResult.get_error_result(
-                        parse_error, self.get_model_name()
-                    )
-            elif isinstance(client, anthropic.Anthropic):
+                    return self._get_parse_error_result(parse_error)
+            elif _is_sdk_instance(client, "anthropic", "Anthropic"):
                 try:
                     raw_api_response = client.messages.create(**params)
-                    response_text = None
-                    for block in raw_api_response.content:
-                        if block.type == "text":
-                            response_text = block.text
+                    structured_response = self._parse_anthropic_response(
+                        raw_api_response
+                    )
+                except Exception as parse_error:
+                    return self._get_parse_error_result(parse_error)
 
-                    if response_text is None:
-                        return ReviewResult.get_empty_result(self.get_model_name())
+            return self._build_review_result(structured_response, raw_api_response)
 
-                    structured_response = JSONExtractor.validate_and_parse_json(
-                        response_text, StructuredReviewResponse
-                    )
+        except Exception as e:
+            console.error(f"리뷰 요청 중 오류 발생: {str(e)}", exception=e)
+            return ReviewResult.get_error_result(e, self.get_model_name())
 
-                    if structured_response is None:
-                        return ReviewResult.get_empty_result(self.get_model_name())
+    async def areview_code(
+        self, review_prompt: ReviewPrompt | ReviewPromptWithFileContent
+    ) -> ReviewResult:
+        """비동기 클라이언트로 코드를 리뷰합니다.
 
-                except Exception as parse_error:
-                    console.error(
-                        f"응답 파싱 오류: {str(parse_error)}", exception=parse_error
+        `review_code`와 동일한 유효성 검사와 구조화된 응답 처리를 수행하지만,
+        API 응답을 기다리는 동안 스레드를 점유하지 않으므로 하나의 이벤트 루프에서
+        여러 리뷰를 동시에 진행할 수 있습니다.
+
+        Args:
+            review_prompt: 리뷰용 프롬프트 객체
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
+        # 토큰 계산은 동기 API를 사용하므로 별도 스레드에서 수행합니다.
+        try:
+            await asyncio.to_thread(self.validate_review_request, review_prompt)
+        except ContextLimitExceededError as e:
+            console.error(f"컨텍스트 제한 초과: {str(e)}", exception=e)
+            return ReviewResult.get_error_result(e, self.get_model_name())
+        return await self._arequest_review(review_prompt)
+
+    async def _arequest_review(
+        self, review_prompt: ReviewPrompt | ReviewPromptWithFileContent
+    ) -> ReviewResult:
+        """유효성 검사를 마친 프롬프트로 비동기 LLM API를 호출합니다.
+
+        Args:
+            review_prompt: 리뷰용 프롬프트 객체
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
+        messages = review_prompt.to_messages()
+
+        try:
+            client = self._create_async_client()
+            params = self._create_request_params(messages)
+
+            if _is_sdk_instance(client, "instructor", "AsyncInstructor"):
+                structured_response, raw_api_response = (
+                    await client.chat.completions.create_with_completion(
+                        response_model=StructuredReviewResponse, max_retries=2, **params
                     )
-                    return ReviewResult.get_error_result(
-                        parse_error, self.get_model_name()
+                )
+            elif _is_sdk_instance(client, "google.genai.client", "AsyncClient"):
+                try:
+                    raw_api_response = await client.models.generate_content(**params)
+                    structured_response = self._parse_genai_response(raw_api_response)
+                except Exception as parse_error:
+                    return self._get_parse_error_result(parse_error)
+            elif _is_sdk_instance(client, "anthropic", "AsyncAnthropic"):
+                try:
+                    raw_api_response = await client.messages.create(**params)
+                    structured_response = self._parse_anthropic_response(
+                        raw_api_response
                     )
+                except Exception as parse_error:
+                    return self._get_parse_error_result(parse_error)
 
-            # 응답 처리
-            if not structured_response:
-                return ReviewResult.get_empty_result(self.get_model_name())
-
-            return ReviewResult(
-                review_response=ReviewResponse.from_structured_response(
-                    structured_response
-                ),
-                estimated_cost=self.estimate_cost(raw_api_response),
-            )
+            return self._build_review_result(structured_response, raw_api_response)
 
         except Exception as e:
             console.error(f"리뷰 요청 중 오류 발생: {str(e)}", exception=e)
             return ReviewResult.get_error_result(e, self.get_model_name())
+
+    @staticmethod
+    def _parse_genai_response(
+        raw_api_response: genai_types.GenerateContentResponse,
+    ) -> StructuredReviewResponse | None:
+        """Gemini 응답 텍스트를 구조화된 리뷰 응답으로 변환합니다.
+
+        Returns:
+            StructuredReviewResponse | None: 응답 텍스트가 없으면 None
+        """
+        response_text = raw_api_response.text
+        if response_text is None:
+            return None
+        return StructuredReviewResponse.model_validate_json(response_text)
+
+    @staticmethod
+    def _parse_anthropic_response(
+        raw_api_response: anthropic.types.Message,
+    ) -> StructuredReviewResponse | None:
+        """Claude 응답의 텍스트 블록을 구조화된 리뷰 응답으로 변환합니다.
+
+        Returns:
+            StructuredReviewResponse | None: 텍스트 블록이 없거나 JSON을 추출하지
+                못하면 None
+        """
+        response_text = None
+        for block in raw_api_response.content:
+            if block.type == "text":
+                response_text = block.text
+
+        if response_text is None:
+            return None
+        return JSONExtractor.validate_and_parse_json(
+            response_text, StructuredReviewResponse
+        )
+
+    def _get_parse_error_result(self, parse_error: Exception) -> ReviewResult:
+        """응답 파싱 오류를 기록하고 오류 결과를 반환합니다."""
+        console.error(f"응답 파싱 오류: {str(parse_error)}", exception=parse_error)
+        return ReviewResult.get_error_result(parse_error, self.get_model_name())
+
+    def _build_review_result(
+        self,
+        structured_response: StructuredReviewResponse | None,
+        raw_api_response: openai.types.Completion
+        | anthropic.types.Message
+        | genai_types.GenerateContentResponse,
+    ) -> ReviewResult:
+        """구조화된 응답과 원본 응답으로 리뷰 결과를 생성합니다.
+
+        Args:
+            structured_response: 구조화된 리뷰 응답 (없으면 빈 결과 반환)
+            raw_api_response: 비용 계산에 사용할 원본 API 응답
+
+        Returns:
+            ReviewResult: 리뷰 결과
+        """
+        if not structured_response:
+            return ReviewResult.get_empty_result(self.get_model_name())
+
+        return ReviewResult(
+            review_response=ReviewResponse.from_structured_response(
+                structured_response
+            ),
+            estimated_cost=self.estimate_cost(raw_api_response),
+        )
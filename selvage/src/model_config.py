@@ -4,11 +4,11 @@ LLM 모델 설정 정보를 로드하고 제공하는 모듈입니다.
 
 import importlib.resources
 import threading
+from pathlib import Path
 from typing import Any, TypedDict
 
-import yaml
-
 from selvage.src.exceptions.unsupported_model_error import UnsupportedModelError
+from selvage.src.model_registry_cache import ModelRegistryCache
 from selvage.src.models.model_provider import ModelProvider
 from selvage.src.utils.base_console import console
 
@@ -47,9 +47,14 @@ class ModelConfig:
     """
     LLM 모델 설정 정보를 로드하고 제공하는 유틸리티 클래스입니다.
     YAML 파일에서 설정을 읽어와 관리합니다.
+
+    검증한 설정은 ModelRegistryCache에 저장해 두고, YAML 파일이 바뀌지 않았으면
+    다음 실행부터 YAML을 파싱하지 않고 사용합니다. 정식 이름과 별칭을 모두 담은
+    색인으로 모델 정보를 조회합니다.
     """
 
     _config: dict[str, ModelInfoDict] | None = None
+    _index: dict[str, ModelInfoDict] = {}
     _lock = threading.Lock()
 
     def __init__(self) -> None:
@@ -61,23 +66,31 @@ class ModelConfig:
 
     @classmethod
     def _load_config_from_yaml(cls) -> None:
-        """YAML 파일에서 모델 정보를 로드하여 클래스 변수에 저장합니다."""
+        """모델 정보를 로드하여 클래스 변수에 저장합니다.
+
+        YAML 파일과 일치하는 캐시가 있으면 캐시를 사용하고, 없으면 YAML을 파싱해
+        검증한 뒤 캐시에 저장합니다.
+        """
         try:
             file_ref = importlib.resources.files("selvage.resources").joinpath(
                 "models.yml"
             )
             with importlib.resources.as_file(file_ref) as file_path:
-                data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
-
-            # YAML 데이터 유효성 검증
-            cls._validate_yaml_data(data)
+                registry_cache = ModelRegistryCache()
+                models = registry_cache.load(file_path)
+                if models is None:
+                    models = cls._parse_yaml(file_path)
+                    registry_cache.save(file_path, models)
+                else:
+                    # 캐시 파일이 손상되었거나 수정된 경우에 대비해 다시 검증합니다.
+                    cls._validate_yaml_data({"models": models})
 
             # provider 문자열을 enum으로 변환
-            models = data["models"]
             for _model_name, model_info in models.items():
                 provider_str = model_info["provider"]
                 model_info["provider"] = ModelProvider.from_string(provider_str)
 
+            cls._index = cls._build_index(models)
             cls._config = models
 
         except Exception as e:
@@ -86,6 +99,46 @@ class ModelConfig:
                 f"모델 설정 파일을 찾을 수 없습니다: {file_ref}"
             ) from e
 
+    @classmethod
+    def _parse_yaml(cls, file_path: Path) -> dict[str, Any]:
+        """YAML 파일을 파싱하고 검증한 모델 설정을 반환합니다.
+
+        Args:
+            file_path: 모델 설정 YAML 파일 경로
+
+        Returns:
+            dict[str, Any]: 모델 이름별 설정 (provider는 문자열)
+
+        Raises:
+            ValueError: YAML 구조가 올바르지 않은 경우
+        """
+        # 캐시가 있으면 필요 없으므로 런타임에 임포트합니다.
+        import yaml
+
+        data = yaml.safe_load(file_path.read_text(encoding="utf-8"))
+        cls._validate_yaml_data(data)
+        return data["models"]
+
+    @staticmethod
+    def _build_index(models: dict[str, Any]) -> dict[str, Any]:
+        """정식 이름과 별칭을 모델 정보에 대응시킨 색인을 만듭니다.
+
+        정식 이름이 별칭보다 우선하며, 같은 별칭이 여러 모델에 있으면 먼저 정의된
+        모델을 사용합니다.
+
+        Args:
+            models: 모델 이름별 설정
+
+        Returns:
+            dict[str, Any]: 이름 또는 별칭별 모델 정보
+        """
+        index: dict[str, Any] = {}
+        for model_info in models.values():
+            for alias in model_info["aliases"]:
+                index.setdefault(alias, model_info)
+        index.update(models)
+        return index
+
     @classmethod
     def _validate_yaml_data(cls, data: Any) -> None:
         """YAML 데이터의 구조와 내용을 검증합니다.
@@ -164,16 +217,11 @@ class ModelConfig:
         if self._config is None:
             raise RuntimeError("모델 설정이 초기화되지 않았습니다")
 
-        # 정식 이름으로 시도
-        if model_name in self._config:
-            return self._config[model_name]
-
-        # 축약형으로 시도
-        for model_info in self._config.values():
-            if model_name in model_info["aliases"]:
-                return model_info
-
-        raise UnsupportedModelError(model_name)
+        # 정식 이름과 축약형을 모두 담은 색인에서 조회
+        model_info = self._index.get(model_name)
+        if model_info is None:
+            raise UnsupportedModelError(model_name)
+        return model_info
 
     def get_supported_models(self) -> list[str]:
         """지원하는 모든 모델 이름 목록을 반환합니다.
@@ -185,13 +233,7 @@ class ModelConfig:
         if self._config is None:
             raise RuntimeError("모델 설정이 초기화되지 않았습니다")
 
-        alias_names = [
-            alias
-            for model_info in self._config.values()
-            for alias in model_info["aliases"]
-        ]
-        all_names = list(self._config.keys()) + alias_names
-        return list(set(all_names))
+        return list(self._index)
 
     def get_model_pricing(self, model_name: str) -> PricingDict:
         """모델의 가격 정보를 반환합니다.
@@ -0,0 +1,130 @@
+"""ModelRegistryCache: 검증을 마친 모델 설정을 JSON으로 저장해 재사용하는 모듈.
+
+`models.yml`을 매 실행마다 YAML로 파싱하지 않도록, 처음 로드할 때 검증한 결과를
+설정 디렉토리에 기록하고 원본 파일이 바뀌지 않은 동안 그대로 사용합니다.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from selvage.__version__ import __version__
+from selvage.src.utils.base_console import console
+from selvage.src.utils.platform_utils import get_platform_config_dir
+
+# 설정 디렉토리 아래 컴파일된 모델 설정 파일 이름
+MODEL_REGISTRY_CACHE_FILENAME = "models_registry.json"
+# 저장 형식 버전. 저장하는 구조가 바뀌면 올려서 이전 파일을 무효화합니다.
+MODEL_REGISTRY_CACHE_FORMAT = 1
+
+
+class ModelRegistryCache:
+    """원본 파일의 수정 시각, 크기, 해시로 무효화하는 모델 설정 캐시.
+
+    수정 시각과 크기가 같으면 원본을 읽지 않고 캐시를 사용합니다. 둘 중 하나가
+    달라도 내용의 sha256이 같으면(재설치, checkout 등) 캐시를 그대로 사용하고
+    기록된 수정 시각만 갱신합니다. 캐시를 읽거나 쓰지 못하면 None을 반환하거나
+    저장을 건너뛰며, 호출자는 원본을 직접 파싱합니다.
+    """
+
+    def __init__(self, cache_path: Path | None = None) -> None:
+        """ModelRegistryCache 초기화
+
+        Args:
+            cache_path: 캐시 파일 경로 (None이면 플랫폼별 설정 디렉토리 사용)
+        """
+        self.cache_path = cache_path or (
+            get_platform_config_dir() / MODEL_REGISTRY_CACHE_FILENAME
+        )
+
+    def load(self, source_path: Path) -> dict[str, Any] | None:
+        """원본 파일과 일치하는 캐시된 모델 설정을 반환합니다.
+
+        Args:
+            source_path: 원본 `models.yml` 경로
+
+        Returns:
+            dict[str, Any] | None: 모델 이름별 설정 (provider는 문자열).
+                캐시가 없거나 원본과 다르면 None
+        """
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            stat = source_path.stat()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cached, dict) or not self._is_compatible(cached):
+            return None
+
+        source = cached.get("source", {})
+        if (
+            source.get("mtime_ns") == stat.st_mtime_ns
+            and source.get("size") == stat.st_size
+        ):
+            return cached["models"]
+
+        try:
+            sha256 = self._hash_file(source_path)
+        except OSError:
+            return None
+        if source.get("sha256") != sha256:
+            return None
+        # 내용은 같고 수정 시각만 바뀐 경우 다음 실행에서 해시를 다시 계산하지 않도록
+        # 수정 시각을 갱신합니다.
+        self._write(source_path, cached["models"], sha256)
+        return cached["models"]
+
+    def save(self, source_path: Path, models: dict[str, Any]) -> None:
+        """검증한 모델 설정을 원본 파일 정보와 함께 저장합니다.
+
+        Args:
+            source_path: 원본 `models.yml` 경로
+            models: 모델 이름별 설정 (provider는 문자열, JSON으로 직렬화 가능해야 함)
+        """
+        try:
+            sha256 = self._hash_file(source_path)
+        except OSError:
+            return
+        self._write(source_path, models, sha256)
+
+    @staticmethod
+    def _is_compatible(cached: dict[str, Any]) -> bool:
+        """저장 형식과 패키지 버전이 현재와 같은지 확인합니다."""
+        return (
+            cached.get("format") == MODEL_REGISTRY_CACHE_FORMAT
+            and cached.get("version") == __version__
+            and isinstance(cached.get("models"), dict)
+        )
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """파일 내용의 sha256 해시를 반환합니다."""
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def _write(self, source_path: Path, models: dict[str, Any], sha256: str) -> None:
+        """캐시 파일을 원자적으로 기록합니다. 실패하면 기록을 건너뜁니다."""
+        tmp_path = self.cache_path.with_name(
+            f".{self.cache_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            stat = source_path.stat()
+            data = {
+                "format": MODEL_REGISTRY_CACHE_FORMAT,
+                "version": __version__,
+                "source": {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "sha256": sha256,
+                },
+                "models": models,
+            }
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            # 설정 디렉토리 경로가 파일인 경우 등에는 임시 파일 정리도 실패합니다.
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            console.log_info(f"모델 설정 캐시를 저장하지 못했습니다: {str(e)}")
@@ -3,5 +3,6 @@
 from selvage.src.models.model_choice import ModelChoice
 from selvage.src.models.model_provider import ModelProvider
 from selvage.src.models.review_status import ReviewStatus
+from selvage.src.models.token_count_policy import TokenCountPolicy
 
-__all__ = ["ModelChoice", "ModelProvider", "ReviewStatus"]
+__all__ = ["ModelChoice", "ModelProvider", "ReviewStatus", "TokenCountPolicy"]
@@ -20,3 +20,29 @@ class ReviewResult(BaseModel):
             review_response=ReviewResponse.get_empty_response(),
             estimated_cost=EstimatedCost.get_zero_cost(model),
         )
+
+    @staticmethod
+    def merge(results: list["ReviewResult"], model: str = "unknown") -> "ReviewResult":
+        """분할 리뷰 결과들을 하나의 결과로 병합합니다.
+
+        실패한 결과가 하나라도 있으면 병합된 응답의 `error`에 오류가 남으므로
+        일부만 리뷰된 결과를 성공으로 취급하지 않습니다.
+
+        Args:
+            results: 병합할 리뷰 결과 목록
+            model: 모델 이름
+
+        Returns:
+            ReviewResult: 병합된 리뷰 결과
+        """
+        if len(results) == 1:
+            return results[0]
+
+        return ReviewResult(
+            review_response=ReviewResponse.merge(
+                [result.review_response for result in results]
+            ),
+            estimated_cost=EstimatedCost.merge(
+                [result.estimated_cost for result in results], model
+            ),
+        )
@@ -0,0 +1,16 @@
+"""TokenCountPolicy: 토큰 계산 방식을 나타내는 열거형 클래스를 포함한 모듈."""
+
+from enum import Enum
+
+
+class TokenCountPolicy(Enum):
+    """Claude/Gemini 모델의 입력 토큰 계산 방식을 나타내는 열거형 클래스.
+
+    - AUTO: 로컬 추정치가 컨텍스트 제한에 가까울 때만 원격 API로 정확히 계산
+    - LOCAL: 항상 로컬 추정치 사용 (네트워크 호출 없음)
+    - REMOTE: 항상 프로바이더의 토큰 계산 API 사용
+    """
+
+    AUTO = "auto"
+    LOCAL = "local"
+    REMOTE = "remote"
@@ -0,0 +1,13 @@
+"""리뷰 로그 저장 모듈"""
+
+from .blob_store import BlobStore
+from .models import ReviewLogIndexEntry
+from .review_log_codec import ReviewLogCodec
+from .review_log_index import ReviewLogIndex
+
+__all__ = [
+    "BlobStore",
+    "ReviewLogCodec",
+    "ReviewLogIndex",
+    "ReviewLogIndexEntry",
+]
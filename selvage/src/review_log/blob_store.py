@@ -0,0 +1,128 @@
+"""BlobStore: 리뷰 로그가 참조하는 파일 내용을 해시별로 보관하는 모듈."""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from selvage.src.utils.compression import compress, decompress
+
+# 리뷰 로그 디렉토리 아래 blob 저장 디렉토리 이름
+BLOB_DIR_NAME = "blobs"
+# 한 디렉토리에 파일이 몰리지 않도록 해시 앞 두 글자로 하위 디렉토리를 나눕니다.
+BLOB_FANOUT_LENGTH = 2
+# 저장 중인 로그가 참조할 blob을 지우지 않도록, 이 시간(초) 안에 저장하거나
+# 재사용한 blob은 정리하지 않습니다.
+BLOB_PRUNE_GRACE_SECONDS = 60 * 60
+
+
+class BlobStore:
+    """파일 내용을 SHA-256 해시를 이름으로 하는 압축 파일로 저장하는 클래스.
+
+    같은 내용은 같은 경로에 저장되므로 여러 리뷰 로그가 하나의 blob을 공유하고,
+    이미 있는 blob은 다시 쓰지 않습니다. blob은 임시 파일에 쓴 뒤 이름을 바꿔
+    저장하므로 여러 프로세스가 동시에 같은 blob을 저장해도 안전합니다.
+
+    blob은 로그를 지워도 남아 있으므로, 로그를 정리한 뒤 `prune`으로 더 이상
+    참조되지 않는 blob을 지웁니다 (`selvage prune-blobs`).
+    """
+
+    def __init__(self, root: Path) -> None:
+        """BlobStore 초기화
+
+        Args:
+            root: blob 저장 디렉토리
+        """
+        self.root = root
+
+    @staticmethod
+    def digest(content: str) -> str:
+        """파일 내용의 SHA-256 해시를 반환합니다."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def path_for(self, digest: str) -> Path:
+        """해시에 해당하는 blob 파일 경로를 반환합니다."""
+        return self.root / digest[:BLOB_FANOUT_LENGTH] / digest
+
+    def put(self, content: str) -> str:
+        """파일 내용을 저장하고 해시를 반환합니다. 이미 있으면 쓰지 않습니다.
+
+        Args:
+            content: 저장할 파일 내용
+
+        Returns:
+            str: 파일 내용의 SHA-256 해시
+        """
+        digest = self.digest(content)
+        blob_path = self.path_for(digest)
+        if blob_path.exists():
+            # 재사용한 blob이 정리 유예 기간 안에 들도록 수정 시각을 갱신합니다.
+            try:
+                os.utime(blob_path)
+            except OSError:
+                pass
+            return digest
+
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=blob_path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(compress(content.encode("utf-8")))
+            os.replace(temp_name, blob_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def get(self, digest: str) -> str:
+        """해시에 해당하는 파일 내용을 반환합니다.
+
+        Args:
+            digest: 파일 내용의 SHA-256 해시
+
+        Returns:
+            str: 파일 내용
+
+        Raises:
+            FileNotFoundError: 해당 blob이 없는 경우
+        """
+        return decompress(self.path_for(digest).read_bytes()).decode("utf-8")
+
+    def __contains__(self, digest: str) -> bool:
+        return self.path_for(digest).exists()
+
+    def prune(
+        self,
+        referenced: Iterable[str],
+        grace_seconds: float = BLOB_PRUNE_GRACE_SECONDS,
+    ) -> int:
+        """참조되지 않는 blob을 삭제하고 삭제한 개수를 반환합니다.
+
+        최근 `grace_seconds` 안에 저장하거나 재사용한 blob은 아직 저장 중인 로그가
+        참조할 수 있으므로 남겨 둡니다.
+
+        Args:
+            referenced: 남겨 둘 blob의 해시
+            grace_seconds: 삭제하지 않을 최근 blob의 기준 시간(초)
+
+        Returns:
+            int: 삭제한 blob 수
+        """
+        if not self.root.is_dir():
+            return 0
+        keep = set(referenced)
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for blob_path in self.root.glob("*/*"):
+            if blob_path.name.startswith(".tmp-") or blob_path.name in keep:
+                continue
+            try:
+                if blob_path.stat().st_mtime > cutoff:
+                    continue
+                blob_path.unlink()
+            except OSError:
+                continue
+            removed += 1
+        return removed
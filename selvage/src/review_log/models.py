@@ -0,0 +1,61 @@
+"""리뷰 로그 관련 데이터 모델"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class ReviewLogIndexEntry(BaseModel):
+    """리뷰 로그 인덱스 항목 모델
+
+    UI가 로그 파일을 열지 않고 목록을 보여주고 필터링하는 데 필요한 요약 정보입니다.
+    """
+
+    log_id: str
+    created_at: datetime
+    provider: str
+    model: str
+    status: str
+    total_cost_usd: float | None = None
+    file_count: int = 0
+    issue_count: int = 0
+    file_name: str
+    size_bytes: int = 0
+
+    @staticmethod
+    def from_review_log(
+        review_log: dict[str, Any], file_path: Path
+    ) -> "ReviewLogIndexEntry":
+        """리뷰 로그 내용으로 인덱스 항목을 만듭니다.
+
+        Args:
+            review_log: save_review_log가 저장하는 형식의 리뷰 로그
+            file_path: 리뷰 로그 파일 경로
+
+        Returns:
+            ReviewLogIndexEntry: 인덱스 항목
+        """
+        model_info = review_log.get("model") or {}
+        review_request = review_log.get("review_request") or {}
+        review_response = review_log.get("review_response") or {}
+        estimated_cost = review_log.get("estimated_cost") or {}
+        created_at = review_log.get("created_at")
+
+        return ReviewLogIndexEntry(
+            log_id=review_log.get("id") or file_path.name,
+            created_at=(
+                datetime.fromisoformat(created_at)
+                if created_at
+                else datetime.fromtimestamp(file_path.stat().st_mtime)
+            ),
+            provider=model_info.get("provider", "unknown"),
+            model=model_info.get("name", ""),
+            status=review_log.get("status", ""),
+            total_cost_usd=estimated_cost.get("total_cost_usd"),
+            file_count=len(review_request.get("file_paths") or []),
+            issue_count=len(review_response.get("issues") or []),
+            file_name=file_path.name,
+            size_bytes=file_path.stat().st_size,
+        )
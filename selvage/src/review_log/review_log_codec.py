@@ -0,0 +1,306 @@
+"""리뷰 로그를 압축 파일로 저장하고 읽는 로직"""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from selvage.src.utils.compression import compress, compressed_suffix, decompress
+
+from .blob_store import BLOB_DIR_NAME, BLOB_PRUNE_GRACE_SECONDS, BlobStore
+
+# 압축 리뷰 로그 형식 버전. 파일 내용을 해시 참조로 분리한 로그에 기록됩니다.
+# (버전 2: 로그 안의 blobs 표에 보관, 버전 3: 로그 디렉토리의 BlobStore에 보관)
+LOG_FORMAT_VERSION = 3
+# 해시 참조 객체의 키. 파일 내용 자리에 {"$blob": "<sha256>"}가 들어갑니다.
+BLOB_REF_KEY = "$blob"
+# 리뷰 로그 파일 확장자 (압축하지 않은 이전 로그 포함)
+REVIEW_LOG_SUFFIXES = (".json", ".json.gz", ".json.zst")
+
+
+class ReviewLogCodec:
+    """리뷰 로그의 직렬화, 압축, 파일 내용 중복 제거를 담당하는 클래스
+
+    전체 컨텍스트 리뷰 로그에는 같은 파일 내용이 `prompt`의 사용자 메시지와
+    `review_request.processed_diff`에 각각 들어가고, 같은 브랜치를 반복해서
+    리뷰하면 이전 로그와도 대부분 겹칩니다. 저장 시 파일 내용은 로그 디렉토리의
+    BlobStore에 해시별로 한 번만 보관하고 로그에는 해시 참조만 남기며, 읽을 때
+    필요한 경우에만 원래 내용으로 되돌립니다.
+    """
+
+    @staticmethod
+    def write(
+        path: Path, review_log: dict[str, Any], blob_store: BlobStore | None = None
+    ) -> Path:
+        """리뷰 로그를 압축하여 저장합니다.
+
+        Args:
+            path: 확장자를 제외한 저장 경로 (예: `log_dir / "..._review_log"`)
+            review_log: 저장할 리뷰 로그
+            blob_store: 파일 내용을 보관할 BlobStore
+                (None이면 로그 디렉토리 아래 `blobs` 디렉토리 사용)
+
+        같은 이름의 로그가 이미 있으면 덮어쓰지 않고 `_1`, `_2` 등 번호를 붙여
+        저장합니다. 배치 리뷰처럼 같은 초에 여러 로그를 저장하는 경우에 해당합니다.
+
+        Returns:
+            Path: 실제로 저장한 파일 경로 (압축 방식에 맞는 확장자 포함)
+        """
+        if blob_store is None:
+            blob_store = BlobStore(path.parent / BLOB_DIR_NAME)
+        deduplicated = ReviewLogCodec.deduplicate_file_contents(
+            review_log, blob_store.put
+        )
+        deduplicated["log_format"] = LOG_FORMAT_VERSION
+
+        payload = compress(
+            json.dumps(deduplicated, ensure_ascii=False).encode("utf-8")
+        )
+        suffix = f".json{compressed_suffix()}"
+        sequence = 0
+        while True:
+            name = f"{path.name}_{sequence}" if sequence else path.name
+            file_path = path.with_name(f"{name}{suffix}")
+            try:
+                # 배타적 생성으로 동시에 저장하는 다른 로그와 이름이 겹치지 않게 함
+                with file_path.open("xb") as f:
+                    f.write(payload)
+                return file_path
+            except FileExistsError:
+                sequence += 1
+
+    @staticmethod
+    def read(file_path: Path, rehydrate: bool = True) -> dict[str, Any]:
+        """리뷰 로그 파일을 읽습니다. 압축 여부와 형식은 자동으로 판별합니다.
+
+        Args:
+            file_path: 리뷰 로그 파일 경로
+            rehydrate: False이면 파일 내용을 해시 참조로 둔 채 반환합니다.
+                리뷰 결과만 필요한 경우 blob을 읽지 않아도 됩니다.
+
+        Returns:
+            dict[str, Any]: 리뷰 로그
+
+        Raises:
+            json.JSONDecodeError: 파일 내용이 올바른 JSON이 아닌 경우
+            FileNotFoundError: 참조하는 blob이 없는 경우
+        """
+        review_log = json.loads(decompress(file_path.read_bytes()).decode("utf-8"))
+        if rehydrate:
+            return ReviewLogCodec.rehydrate(file_path, review_log)
+        return review_log
+
+    @staticmethod
+    def rehydrate(file_path: Path, review_log: dict[str, Any]) -> dict[str, Any]:
+        """`read(rehydrate=False)`로 읽은 리뷰 로그의 파일 내용을 복원합니다.
+
+        원본 리뷰 로그는 변경하지 않습니다.
+
+        Args:
+            file_path: 리뷰 로그 파일 경로 (BlobStore 위치를 찾는 데 사용)
+            review_log: 해시 참조가 들어 있는 리뷰 로그
+
+        Returns:
+            dict[str, Any]: 파일 내용이 복원된 리뷰 로그
+
+        Raises:
+            FileNotFoundError: 참조하는 blob이 없는 경우
+        """
+        if not isinstance(review_log, dict) or "log_format" not in review_log:
+            return review_log
+
+        restored = ReviewLogCodec.restore_file_contents(
+            review_log, ReviewLogCodec._blob_resolver(file_path, review_log)
+        )
+        restored.pop("log_format")
+        restored.pop("blobs", None)
+        return restored
+
+    @staticmethod
+    def referenced_blobs(review_log: dict[str, Any]) -> set[str]:
+        """`read(rehydrate=False)`로 읽은 리뷰 로그가 참조하는 blob 해시를 반환합니다.
+
+        Args:
+            review_log: 해시 참조가 들어 있는 리뷰 로그
+
+        Returns:
+            set[str]: 참조하는 blob의 SHA-256 해시
+        """
+        digests: set[str] = set()
+
+        def collect(ref: object) -> object:
+            if isinstance(ref, dict) and isinstance(ref.get(BLOB_REF_KEY), str):
+                digests.add(ref[BLOB_REF_KEY])
+            return ref
+
+        ReviewLogCodec._map_file_contents(review_log, collect)
+        return digests
+
+    @staticmethod
+    def prune_blobs(
+        log_dir: Path, grace_seconds: float = BLOB_PRUNE_GRACE_SECONDS
+    ) -> int:
+        """로그 디렉토리의 어떤 리뷰 로그도 참조하지 않는 blob을 삭제합니다.
+
+        읽지 못하는 로그가 있으면 그 로그가 참조하는 blob을 알 수 없으므로
+        아무것도 삭제하지 않고 예외를 전달합니다.
+
+        Args:
+            log_dir: 리뷰 로그 디렉토리
+            grace_seconds: 삭제하지 않을 최근 blob의 기준 시간(초)
+
+        Returns:
+            int: 삭제한 blob 수
+
+        Raises:
+            OSError: 리뷰 로그를 읽을 수 없는 경우
+            ValueError: 리뷰 로그 내용이 올바른 JSON이 아닌 경우
+            RuntimeError: zstd 로그를 읽는 데 필요한 패키지가 없는 경우
+        """
+        blob_store = BlobStore(log_dir / BLOB_DIR_NAME)
+        if not blob_store.root.is_dir():
+            return 0
+
+        referenced: set[str] = set()
+        for file_path in log_dir.iterdir():
+            if file_path.is_file() and ReviewLogCodec.is_review_log_file(file_path):
+                review_log = ReviewLogCodec.read(file_path, rehydrate=False)
+                if isinstance(review_log, dict):
+                    referenced |= ReviewLogCodec.referenced_blobs(review_log)
+        return blob_store.prune(referenced, grace_seconds)
+
+    @staticmethod
+    def is_review_log_file(file_path: Path) -> bool:
+        """리뷰 로그 파일 확장자인지 확인합니다."""
+        return file_path.name.endswith(REVIEW_LOG_SUFFIXES)
+
+    @staticmethod
+    def strip_suffix(file_name: str) -> str:
+        """파일명에서 리뷰 로그 확장자(`.json`, `.json.gz` 등)를 제거합니다."""
+        for suffix in sorted(REVIEW_LOG_SUFFIXES, key=len, reverse=True):
+            if file_name.endswith(suffix):
+                return file_name[: -len(suffix)]
+        return file_name
+
+    @staticmethod
+    def deduplicate_file_contents(
+        review_log: dict[str, Any], store_blob: Callable[[str], str]
+    ) -> dict[str, Any]:
+        """파일 내용을 저장하고 해시 참조로 바꾼 리뷰 로그를 반환합니다.
+
+        원본 리뷰 로그는 변경하지 않습니다.
+
+        Args:
+            review_log: 리뷰 로그
+            store_blob: 파일 내용을 저장하고 SHA-256 해시를 반환하는 함수
+                (같은 내용은 한 번만 호출됩니다)
+
+        Returns:
+            dict[str, Any]: 파일 내용이 해시 참조로 바뀐 리뷰 로그
+        """
+        digests: dict[str, str] = {}
+
+        def to_ref(content: str) -> dict[str, str]:
+            if content not in digests:
+                digests[content] = store_blob(content)
+            return {BLOB_REF_KEY: digests[content]}
+
+        return ReviewLogCodec._map_file_contents(review_log, to_ref)
+
+    @staticmethod
+    def restore_file_contents(
+        review_log: dict[str, Any], resolve_blob: Callable[[str], str]
+    ) -> dict[str, Any]:
+        """해시 참조를 파일 내용으로 되돌린 리뷰 로그를 반환합니다.
+
+        Args:
+            review_log: 해시 참조가 들어 있는 리뷰 로그
+            resolve_blob: SHA-256 해시로 파일 내용을 찾는 함수
+
+        Returns:
+            dict[str, Any]: 파일 내용이 복원된 리뷰 로그
+        """
+
+        def from_ref(ref: object) -> object:
+            if isinstance(ref, dict) and BLOB_REF_KEY in ref:
+                return resolve_blob(ref[BLOB_REF_KEY])
+            return ref
+
+        return ReviewLogCodec._map_file_contents(review_log, from_ref)
+
+    @staticmethod
+    def _blob_resolver(
+        file_path: Path, review_log: dict[str, Any]
+    ) -> Callable[[str], str]:
+        """리뷰 로그의 해시 참조를 파일 내용으로 바꾸는 함수를 반환합니다.
+
+        형식 버전 2 로그는 로그 안의 blobs 표를, 이후 버전은 로그 파일과 같은
+        디렉토리의 BlobStore를 사용합니다.
+        """
+        inline_blobs = review_log.get("blobs")
+        if isinstance(inline_blobs, dict):
+            return inline_blobs.__getitem__
+        return BlobStore(file_path.parent / BLOB_DIR_NAME).get
+
+    @staticmethod
+    def _map_file_contents(
+        review_log: dict[str, Any], transform: Callable[[Any], Any]
+    ) -> dict[str, Any]:
+        """`prompt`와 `processed_diff`의 파일 내용에 transform을 적용합니다.
+
+        변경되는 경로의 객체만 새로 만들고 나머지는 원본 객체를 공유합니다.
+        """
+        result = dict(review_log)
+
+        prompt = review_log.get("prompt")
+        if isinstance(prompt, list):
+            result["prompt"] = [
+                ReviewLogCodec._map_message_file_content(message, transform)
+                for message in prompt
+            ]
+
+        review_request = review_log.get("review_request")
+        processed_diff = (
+            review_request.get("processed_diff")
+            if isinstance(review_request, dict)
+            else None
+        )
+        if isinstance(processed_diff, dict) and isinstance(
+            processed_diff.get("files"), list
+        ):
+            files = [
+                {**file, "file_content": transform(file["file_content"])}
+                if isinstance(file, dict) and file.get("file_content")
+                else file
+                for file in processed_diff["files"]
+            ]
+            result["review_request"] = {
+                **review_request,
+                "processed_diff": {**processed_diff, "files": files},
+            }
+
+        return result
+
+    @staticmethod
+    def _map_message_file_content(
+        message: object, transform: Callable[[Any], Any]
+    ) -> object:
+        """사용자 메시지 본문(JSON 문자열)의 `file_content`에 transform을 적용합니다.
+
+        메시지 본문은 `json.dumps(..., ensure_ascii=False)`로 만들어지므로 같은
+        방식으로 다시 직렬화하면 원래 문자열과 동일하게 복원됩니다.
+        """
+        if not isinstance(message, dict) or message.get("role") != "user":
+            return message
+        content = message.get("content")
+        if not isinstance(content, str) or '"file_content"' not in content:
+            return message
+        try:
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            return message
+        if not isinstance(parsed, dict) or not parsed.get("file_content"):
+            return message
+
+        parsed["file_content"] = transform(parsed["file_content"])
+        return {**message, "content": json.dumps(parsed, ensure_ascii=False)}
@@ -0,0 +1,281 @@
+"""ReviewLogIndex: 리뷰 로그 요약 정보를 SQLite에 보관하는 인덱스 모듈."""
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from selvage.src.utils.base_console import console
+
+from .models import ReviewLogIndexEntry
+from .review_log_codec import ReviewLogCodec
+
+# 리뷰 로그 디렉토리 아래 인덱스 데이터베이스 파일 이름
+INDEX_DB_FILENAME = "review_log_index.sqlite3"
+# 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 최대 시간(초)
+SQLITE_BUSY_TIMEOUT_SECONDS = 10.0
+# 테이블 구조 버전 (PRAGMA user_version). 다르면 인덱스 테이블을 다시 만듭니다.
+SCHEMA_VERSION = 1
+
+_COLUMNS = (
+    "log_id",
+    "created_at",
+    "provider",
+    "model",
+    "status",
+    "total_cost_usd",
+    "file_count",
+    "issue_count",
+    "file_name",
+    "size_bytes",
+)
+
+
+class ReviewLogIndex:
+    """리뷰 로그마다 한 행씩 요약 정보를 기록하는 인덱스 클래스.
+
+    `save_review_log`가 로그를 저장할 때 항목을 추가하며, UI는 로그 파일을 열거나
+    디렉토리를 탐색하지 않고 인덱스만으로 목록 정렬, 페이지 나누기, 모델/상태/날짜
+    필터링을 수행합니다. 파일명은 로그 디렉토리 기준 상대 경로로 저장합니다.
+    """
+
+    def __init__(self, log_dir: Path) -> None:
+        """ReviewLogIndex 초기화
+
+        Args:
+            log_dir: 리뷰 로그 디렉토리 (인덱스 파일도 이 디렉토리에 저장)
+        """
+        self.log_dir = log_dir
+        self.db_path = log_dir / INDEX_DB_FILENAME
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션이 적용된 연결을 열고, 사용이 끝나면 닫습니다."""
+        self._ensure_schema()
+        conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _ensure_schema(self) -> None:
+        """데이터베이스 파일과 테이블, 인덱스를 한 번만 생성합니다."""
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT_SECONDS)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                with conn:
+                    schema_version = conn.execute("PRAGMA user_version").fetchone()[0]
+                    if schema_version != SCHEMA_VERSION:
+                        # 인덱스는 로그 파일에서 다시 만들 수 있으므로 버립니다.
+                        conn.execute("DROP TABLE IF EXISTS review_log_index")
+                    conn.execute(
+                        """
+                        CREATE TABLE IF NOT EXISTS review_log_index (
+                            file_name TEXT PRIMARY KEY,
+                            log_id TEXT NOT NULL,
+                            created_at REAL NOT NULL,
+                            provider TEXT NOT NULL,
+                            model TEXT NOT NULL,
+                            status TEXT NOT NULL,
+                            total_cost_usd REAL,
+                            file_count INTEGER NOT NULL,
+                            issue_count INTEGER NOT NULL,
+                            size_bytes INTEGER NOT NULL
+                        )
+                        """
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_review_log_index_created_at "
+                        "ON review_log_index (created_at)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_review_log_index_model "
+                        "ON review_log_index (model, created_at)"
+                    )
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS idx_review_log_index_status "
+                        "ON review_log_index (status, created_at)"
+                    )
+                    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            finally:
+                conn.close()
+            self._schema_ready = True
+
+    def exists(self) -> bool:
+        """인덱스 데이터베이스 파일이 있는지 반환합니다."""
+        return self.db_path.exists()
+
+    def add(self, entries: list[ReviewLogIndexEntry]) -> None:
+        """인덱스 항목을 추가합니다. 같은 파일의 항목이 있으면 덮어씁니다.
+
+        Args:
+            entries: 추가할 인덱스 항목 목록
+        """
+        with self._connect() as conn:
+            self._insert(conn, entries)
+
+    def record(self, review_log: dict[str, Any], file_path: Path) -> None:
+        """새로 저장한 리뷰 로그를 인덱스에 추가합니다.
+
+        인덱스가 아직 없으면 이전에 저장된 로그까지 함께 색인합니다.
+
+        Args:
+            review_log: 저장한 리뷰 로그
+            file_path: 리뷰 로그 파일 경로
+        """
+        if not self.exists():
+            self.rebuild()
+            return
+        self.add([ReviewLogIndexEntry.from_review_log(review_log, file_path)])
+
+    def query(
+        self,
+        model: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        newest_first: bool = True,
+        limit: int = 0,
+        offset: int = 0,
+    ) -> list[ReviewLogIndexEntry]:
+        """조건에 맞는 인덱스 항목을 생성 시각 순으로 반환합니다.
+
+        Args:
+            model: 모델 이름 필터 (None이면 전체)
+            status: 리뷰 상태 필터 (None이면 전체)
+            since: 이 시각 이후에 생성된 로그만 포함 (None이면 제한 없음)
+            until: 이 시각 이전에 생성된 로그만 포함 (None이면 제한 없음)
+            newest_first: True이면 최신순, False이면 오래된순
+            limit: 최대 항목 수 (0이면 제한 없음)
+            offset: 건너뛸 항목 수 (페이지 나누기용)
+
+        Returns:
+            list[ReviewLogIndexEntry]: 인덱스 항목 목록
+        """
+        where, params = self._build_filter(model, status, since, until)
+        order = "DESC" if newest_first else "ASC"
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM review_log_index{where} "  # noqa: S608
+                f"ORDER BY created_at {order} LIMIT ? OFFSET ?",
+                (*params, limit if limit > 0 else -1, offset),
+            ).fetchall()
+
+        entries = []
+        for row in rows:
+            values = dict(zip(_COLUMNS, row, strict=True))
+            values["created_at"] = datetime.fromtimestamp(values["created_at"])
+            entries.append(ReviewLogIndexEntry(**values))
+        return entries
+
+    def count(
+        self,
+        model: str | None = None,
+        status: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> int:
+        """조건에 맞는 인덱스 항목 수를 반환합니다. 인자는 query와 같습니다."""
+        where, params = self._build_filter(model, status, since, until)
+        with self._connect() as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM review_log_index{where}",  # noqa: S608
+                params,
+            ).fetchone()[0]
+
+    def distinct_values(self, column: str) -> list[str]:
+        """필터 선택지로 사용할 열(model, status, provider)의 값 목록을 반환합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 열 이름인 경우
+        """
+        if column not in ("model", "status", "provider"):
+            raise ValueError(f"필터링할 수 없는 열입니다: {column}")
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT {column} FROM review_log_index ORDER BY {column}"  # noqa: S608
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def path_for(self, entry: ReviewLogIndexEntry) -> Path:
+        """인덱스 항목이 가리키는 리뷰 로그 파일 경로를 반환합니다."""
+        return self.log_dir / entry.file_name
+
+    def rebuild(self) -> int:
+        """로그 디렉토리의 리뷰 로그를 모두 읽어 인덱스를 다시 만듭니다.
+
+        인덱스 도입 이전에 저장된 로그를 색인하거나, 로그 파일을 직접 삭제하여
+        인덱스와 맞지 않을 때 사용합니다. 파일 내용(blob)은 읽지 않습니다.
+
+        Returns:
+            int: 색인한 리뷰 로그 수
+        """
+        entries = []
+        if self.log_dir.exists():
+            for file_path in self.log_dir.iterdir():
+                if not ReviewLogCodec.is_review_log_file(file_path):
+                    continue
+                try:
+                    review_log = ReviewLogCodec.read(file_path, rehydrate=False)
+                    entries.append(
+                        ReviewLogIndexEntry.from_review_log(review_log, file_path)
+                    )
+                except Exception as e:
+                    console.warning(
+                        f"리뷰 로그를 색인할 수 없습니다: {file_path} ({str(e)})"
+                    )
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM review_log_index")
+            self._insert(conn, entries)
+        return len(entries)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, entries: list[ReviewLogIndexEntry]) -> None:
+        """인덱스 항목을 현재 트랜잭션에서 저장합니다."""
+        rows = []
+        for entry in entries:
+            values = entry.model_dump()
+            values["created_at"] = entry.created_at.timestamp()
+            rows.append(tuple(values[column] for column in _COLUMNS))
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        conn.executemany(
+            f"INSERT OR REPLACE INTO review_log_index ({', '.join(_COLUMNS)}) "  # noqa: S608
+            f"VALUES ({placeholders})",
+            rows,
+        )
+
+    @staticmethod
+    def _build_filter(
+        model: str | None,
+        status: str | None,
+        since: datetime | None,
+        until: datetime | None,
+    ) -> tuple[str, tuple[str | float, ...]]:
+        """필터 조건으로 WHERE 절과 바인딩 값을 만듭니다."""
+        conditions: list[str] = []
+        params: list[str | float] = []
+        if model:
+            conditions.append("model = ?")
+            params.append(model)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since.timestamp())
+        if until is not None:
+            conditions.append("created_at <= ?")
+            params.append(until.timestamp())
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, tuple(params)
@@ -4,21 +4,36 @@
 이 모듈은 저장된 리뷰 결과를 Streamlit을 사용하여 웹 브라우저에 표시합니다.
 """
 
-import copy
 import json
+import math
 import os
 import sys
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
 from selvage.src.config import get_default_review_log_dir
+from selvage.src.review_log import (
+    ReviewLogCodec,
+    ReviewLogIndex,
+    ReviewLogIndexEntry,
+)
 from selvage.src.utils.base_console import console
 from selvage.src.utils.review_formatter import ReviewFormatter
 from selvage.src.utils.token.models import ReviewResponse
 
+# 사이드바 리뷰 로그 목록 한 페이지에 표시하는 항목 수
+REVIEW_LOG_PAGE_SIZE = 50
+# 필터를 적용하지 않는 선택지
+ALL_FILTER_OPTION = "전체"
+# 기간 필터의 기본 범위(일)
+DEFAULT_DATE_FILTER_DAYS = 30
+# 메모리에 보관하는 파일 로드 결과 수 (경로와 수정 시각 기준)
+FILE_CACHE_MAX_ENTRIES = 8
+
 
 def get_default_llm_eval_data_dir() -> Path:
     """llm_eval 데이터가 저장된 data 디렉토리 경로를 반환합니다."""
@@ -37,15 +52,40 @@ def get_llm_eval_data_files() -> list[Path]:
     return llm_eval_files
 
 
-def get_review_log_files() -> list[Path]:
-    """리뷰 로그 디렉토리에서 모든 리뷰 로그 파일을 가져옵니다."""
-    log_dir = get_default_review_log_dir()
-    if not log_dir.exists():
-        return []
+def get_review_log_index() -> ReviewLogIndex:
+    """리뷰 로그 인덱스를 반환합니다. 인덱스가 없으면 기존 로그로 만듭니다."""
+    index = ReviewLogIndex(get_default_review_log_dir())
+    if not index.exists():
+        index.rebuild()
+    return index
+
+
+def format_file_size(size: int) -> str:
+    """파일 크기를 KB 또는 B 단위 문자열로 변환합니다."""
+    return f"{size / 1024:.1f}KB" if size >= 1024 else f"{size}B"
+
 
-    log_files = list(log_dir.glob("*.json"))
-    log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-    return log_files
+def get_index_entry_info(
+    index: ReviewLogIndex, entry: ReviewLogIndexEntry
+) -> dict[str, Any]:
+    """인덱스 항목으로 get_file_info와 같은 형식의 파일 정보를 만듭니다.
+
+    로그 파일을 열거나 stat하지 않습니다.
+    """
+    return {
+        "path": index.path_for(entry),
+        "name": entry.file_name,
+        "model": entry.model,
+        "date": entry.created_at,
+        "mtime": entry.created_at,
+        "size": entry.size_bytes,
+        "size_str": format_file_size(entry.size_bytes),
+        "format": "json",
+        "status": entry.status,
+        "issue_count": entry.issue_count,
+        "file_count": entry.file_count,
+        "total_cost_usd": entry.total_cost_usd,
+    }
 
 
 def parse_date_from_filename(filename: str) -> datetime | None:
@@ -112,6 +152,10 @@ def extract_model_name_from_filename(filename: str, date_parts_count: int = 0) -
 
 def determine_file_format(file_path: Path) -> str:
     """파일의 형식을 결정합니다."""
+    if ReviewLogCodec.is_review_log_file(file_path):
+        # 압축된 리뷰 로그(.json.gz, .json.zst) 포함
+        return "json"
+
     file_suffix = file_path.suffix.lstrip(".").lower()
 
     if not file_suffix:
@@ -147,10 +191,15 @@ def get_file_info(file: Path) -> dict[str, Any]:
     """파일 정보를 가져옵니다."""
     mtime = datetime.fromtimestamp(file.stat().st_mtime)
     size = file.stat().st_size
-    size_str = f"{size / 1024:.1f}KB" if size >= 1024 else f"{size}B"
+    size_str = format_file_size(size)
 
-    # 날짜 추출
-    date_candidate = parse_date_from_filename(file.stem)
+    # 날짜 추출 (압축 리뷰 로그는 .json.gz처럼 확장자가 두 개입니다)
+    file_stem = (
+        ReviewLogCodec.strip_suffix(file.name)
+        if ReviewLogCodec.is_review_log_file(file)
+        else file.stem
+    )
+    date_candidate = parse_date_from_filename(file_stem)
     if date_candidate is None:
         date_candidate = mtime
         date_parts_count = 0
@@ -158,7 +207,7 @@ def get_file_info(file: Path) -> dict[str, Any]:
         date_parts_count = 2
 
     # 모델명 추출
-    model_name_candidate = extract_model_name_from_filename(file.stem, date_parts_count)
+    model_name_candidate = extract_model_name_from_filename(file_stem, date_parts_count)
 
     # 파일 형식 결정
     file_format = determine_file_format(file)
@@ -194,63 +243,129 @@ def parse_json_content(content: str) -> dict[str, Any]:
         return {}
 
 
+# mtime_ns는 파일이 바뀌면 Streamlit 캐시를 무효화하는 키로만 사용합니다.
+@st.cache_resource(max_entries=FILE_CACHE_MAX_ENTRIES, show_spinner=False)
+def read_text_file(file_path: str, mtime_ns: int) -> str:  # noqa: ARG001
+    """파일 내용을 문자열로 읽습니다. 경로와 수정 시각이 같으면 다시 읽지 않습니다."""
+    return Path(file_path).read_text(encoding="utf-8", errors="replace")
+
+
+@st.cache_resource(max_entries=FILE_CACHE_MAX_ENTRIES, show_spinner=False)
+def load_json_file(file_path: str, mtime_ns: int) -> dict[str, Any]:
+    """JSON 파일을 읽습니다. 경로와 수정 시각이 같으면 다시 읽지 않습니다.
+
+    리뷰 로그는 압축을 해제하되 파일 내용(blob)은 복원하지 않습니다. 반환값은
+    Streamlit 재실행 사이에 공유되므로 변경하지 않아야 합니다.
+
+    Args:
+        file_path: 파일 경로
+        mtime_ns: 파일 수정 시각 (캐시 키, 파일이 바뀌면 다시 읽기 위해 사용)
+
+    Returns:
+        dict[str, Any]: 파싱된 JSON 데이터 (올바른 JSON이 아니면 빈 딕셔너리)
+    """
+    path = Path(file_path)
+    if not ReviewLogCodec.is_review_log_file(path):
+        return parse_json_content(read_text_file(file_path, mtime_ns))
+    try:
+        return ReviewLogCodec.read(path, rehydrate=False)
+    except json.JSONDecodeError:
+        return {}
+
+
+@st.cache_resource(max_entries=FILE_CACHE_MAX_ENTRIES, show_spinner="불러오는 중...")
+def load_review_log_section(file_path: str, mtime_ns: int, key: str) -> Any:  # noqa: ANN401
+    """리뷰 로그의 한 필드를 파일 내용(blob)까지 복원하여 반환합니다.
+
+    prompt 필드는 메시지 본문의 JSON 문자열도 파싱합니다. 결과는 캐시되므로
+    필드를 처음 펼칠 때 한 번만 계산합니다.
+
+    Args:
+        file_path: 리뷰 로그 파일 경로
+        mtime_ns: 파일 수정 시각 (캐시 키)
+        key: 필드 이름 (prompt, review_request 등)
+
+    Returns:
+        Any: 복원된 필드 값
+    """
+    json_data = load_json_file(file_path, mtime_ns)
+    section = {
+        name: value
+        for name, value in json_data.items()
+        if name in (key, "log_format", "blobs")
+    }
+    value = ReviewLogCodec.rehydrate(Path(file_path), section).get(key)
+    if key == "prompt" and isinstance(value, list):
+        return parse_prompt_content(value)
+    return value
+
+
 def parse_prompt_content(prompt_list: list) -> list:
-    """프롬프트 데이터의 content 필드를 파싱합니다."""
+    """프롬프트 데이터의 content 필드를 파싱합니다. 원본 목록은 변경하지 않습니다."""
     if not isinstance(prompt_list, list):
         return prompt_list
 
     parsed_list = []
     for item in prompt_list:
-        item_copy = copy.deepcopy(item)
         if (
-            isinstance(item_copy, dict)
-            and "content" in item_copy
-            and isinstance(item_copy["content"], str)
+            isinstance(item, dict)
+            and "content" in item
+            and isinstance(item["content"], str)
         ):
             try:
-                item_copy["content"] = json.loads(item_copy["content"])
+                item = {**item, "content": json.loads(item["content"])}
             except json.JSONDecodeError:
                 pass
-        parsed_list.append(item_copy)
+        parsed_list.append(item)
 
     return parsed_list
 
 
-def display_json_field_in_expander(key: str, value: Any) -> None:
-    """JSON 필드를 접을 수 있는 expander로 표시합니다."""
-    if not value:  # None이거나 빈 값
-        with st.expander(f"{key} 내용 보기", expanded=False):
-            st.write("내용 없음")
+def display_json_field_lazily(key: str, load_value: Callable[[], Any]) -> None:
+    """JSON 필드를 토글을 켰을 때만 불러와 표시합니다.
+
+    st.expander는 접혀 있어도 내부 코드를 실행하므로, 큰 필드는 토글로
+    불러오기와 렌더링을 모두 미룹니다.
+    """
+    if not st.toggle(f"{key} 내용 보기", key=f"show_raw_json_{key}"):
         return
 
-    with st.expander(f"{key} 내용 보기", expanded=False):
-        if key == "prompt" and isinstance(value, list):
-            parsed_value = parse_prompt_content(value)
-            st.json(parsed_value, expanded=True)
-        else:
-            st.json(value, expanded=True)
+    value = load_value()
+    if not value:  # None이거나 빈 값
+        st.write("내용 없음")
+        return
+    st.json(value, expanded=True)
 
 
-def display_review_result_raw_json(json_data: dict[str, Any]) -> None:
+def display_review_result_raw_json(
+    file_path: Path, mtime_ns: int, json_data: dict[str, Any]
+) -> None:
     """리뷰 결과의 원본 JSON을 표시합니다."""
     st.markdown("## 원본 JSON 데이터")
-    data_to_display = copy.deepcopy(json_data)
 
-    # 주요 필드를 expander로 표시
+    # 주요 필드는 펼칠 때만 불러옵니다 (prompt, review_request는 파일 내용 포함)
     target_keys = ["prompt", "review_request", "review_response"]
     for key in target_keys:
-        if key in data_to_display:
-            display_json_field_in_expander(key, data_to_display.pop(key))
+        if key in json_data:
+            display_json_field_lazily(
+                key,
+                lambda key=key: load_review_log_section(str(file_path), mtime_ns, key),
+            )
 
     # 나머지 데이터 표시
-    if data_to_display:
+    remaining_data = {
+        key: value
+        for key, value in json_data.items()
+        if key not in target_keys and key != "blobs"
+    }
+    if remaining_data:
         st.markdown("---")
         st.markdown("### 원본 데이터")
-        st.json(json_data, expanded=False)
+        st.json(remaining_data, expanded=False)
 
 
 def filter_failed_test_cases(test_cases: list) -> tuple[list, int]:
-    """실패한 테스트 케이스만 필터링합니다."""
+    """실패한 테스트 케이스만 필터링합니다. 원본 목록은 변경하지 않습니다."""
     if not isinstance(test_cases, list):
         return [], 0
 
@@ -260,55 +375,61 @@ def filter_failed_test_cases(test_cases: list) -> tuple[list, int]:
         if not isinstance(tc, dict) or tc.get("success") is not False:
             continue
 
-        tc_copy = copy.deepcopy(tc)
-
         # metricsData 내부에서 실패한 항목만 필터링
-        if "metricsData" in tc_copy and isinstance(tc_copy["metricsData"], list):
+        if "metricsData" in tc and isinstance(tc["metricsData"], list):
             filtered_metrics = [
                 m
-                for m in tc_copy["metricsData"]
+                for m in tc["metricsData"]
                 if isinstance(m, dict) and m.get("success") is False
             ]
-            tc_copy["metricsData"] = filtered_metrics or []
+            tc = {**tc, "metricsData": filtered_metrics}
 
-        filtered_cases.append(tc_copy)
+        filtered_cases.append(tc)
 
     return filtered_cases, len(filtered_cases)
 
 
-def parse_test_case_inputs(test_cases: list) -> None:
-    """테스트 케이스의 입력 필드를 파싱합니다."""
+def parse_test_case_inputs(test_cases: list) -> list:
+    """테스트 케이스의 입력 필드를 파싱한 새 목록을 반환합니다."""
     if not isinstance(test_cases, list):
-        return
+        return test_cases
 
+    parsed_cases = []
     for test_case in test_cases:
         if not isinstance(test_case, dict):
+            parsed_cases.append(test_case)
             continue
 
+        parsed_case = dict(test_case)
+
         # input 필드 처리
         if "input" in test_case and isinstance(test_case["input"], str):
             try:
                 parsed_input = json.loads(test_case["input"])
                 if isinstance(parsed_input, list):
                     parsed_input = parse_prompt_content(parsed_input)
-                test_case["input"] = parsed_input
+                parsed_case["input"] = parsed_input
             except json.JSONDecodeError:
                 pass
 
         # actualOutput 필드 처리
         if "actualOutput" in test_case and isinstance(test_case["actualOutput"], str):
             try:
-                test_case["actualOutput"] = json.loads(test_case["actualOutput"])
+                parsed_case["actualOutput"] = json.loads(test_case["actualOutput"])
             except json.JSONDecodeError:
                 pass
 
+        parsed_cases.append(parsed_case)
+
+    return parsed_cases
+
 
 def display_llm_eval_results(json_data: dict[str, Any]) -> None:
     """llm_eval 결과를 표시합니다."""
     st.markdown("## llm_eval 결과 내용")
 
-    # 데이터 복사
-    display_data = copy.deepcopy(json_data)
+    # 캐시된 원본을 변경하지 않도록 최상위만 복사합니다.
+    display_data = dict(json_data) if isinstance(json_data, dict) else json_data
 
     # 테스트 케이스 수 계산
     test_cases = (
@@ -346,7 +467,7 @@ def display_llm_eval_results(json_data: dict[str, Any]) -> None:
 
     # 입력 필드 파싱
     if isinstance(display_data, dict) and "testCases" in display_data:
-        parse_test_case_inputs(display_data["testCases"])
+        display_data["testCases"] = parse_test_case_inputs(display_data["testCases"])
 
     # 결과 표시
     st.json(display_data, expanded=False)
@@ -369,40 +490,41 @@ def display_review_result(json_data: dict[str, Any]) -> None:
 
 
 def load_and_display_file_content(file_path: Path) -> None:
-    """파일 내용을 로드하고 표시합니다."""
-    try:
-        with open(file_path, encoding="utf-8") as f:
-            content = f.read()
+    """파일 내용을 로드하고 표시합니다.
 
+    파일은 경로와 수정 시각 기준으로 캐시하므로 위젯 조작으로 앱이 다시 실행되어도
+    파일을 다시 읽거나 파싱하지 않습니다.
+    """
+    try:
         file_format = determine_file_format(file_path)
+        mtime_ns = file_path.stat().st_mtime_ns
 
-        if file_format == "json":
-            json_data = parse_json_content(content)
-            if not json_data:
-                st.error("유효하지 않은 JSON 형식입니다.")
-                st.text(content)
-                return
+        if file_format != "json":
+            # 텍스트 파일은 그대로 표시
+            st.text(read_text_file(str(file_path), mtime_ns))
+            return
 
-            view_type = st.session_state.get("view_type")
+        json_data = load_json_file(str(file_path), mtime_ns)
+        if not json_data:
+            st.error("유효하지 않은 JSON 형식입니다.")
+            st.text(read_text_file(str(file_path), mtime_ns))
+            return
 
-            if view_type == "리뷰 결과":
-                if "show_raw_json" not in st.session_state:
-                    st.session_state.show_raw_json = False
+        view_type = st.session_state.get("view_type")
 
-                show_raw_json = st.checkbox(
-                    "원본 JSON 데이터 보기", key="show_raw_json"
-                )
+        if view_type == "리뷰 결과":
+            if "show_raw_json" not in st.session_state:
+                st.session_state.show_raw_json = False
 
-                if show_raw_json:
-                    display_review_result_raw_json(json_data)
-                else:
-                    display_review_result(json_data)
+            show_raw_json = st.checkbox("원본 JSON 데이터 보기", key="show_raw_json")
 
-            elif view_type == "llm_eval 결과":
-                display_llm_eval_results(json_data)
-        else:
-            # 텍스트 파일은 그대로 표시
-            st.text(content)
+            if show_raw_json:
+                display_review_result_raw_json(file_path, mtime_ns, json_data)
+            else:
+                display_review_result(json_data)
+
+        elif view_type == "llm_eval 결과":
+            display_llm_eval_results(json_data)
 
     except Exception as e:
         st.error(f"파일을 읽는 중 오류가 발생했습니다: {str(e)}")
@@ -450,33 +572,120 @@ def app():
     # 뷰 타입 세션 저장
     st.session_state.view_type = view_type
 
-    # 파일 목록 가져오기
     if view_type == "리뷰 결과":
-        files = get_review_log_files()
-        if not files:
-            st.info("저장된 리뷰 로그가 없습니다.")
-            st.markdown("""
-            ### 리뷰 생성 방법
-            
-            터미널에서 다음 명령어를 실행하여 코드 리뷰를 생성하세요:
-            ```bash
-                            selvage review
-            ```
-            
-            자세한 사용법은 README.md 파일을 참조하세요.
-            """)
-            return
+        selected_file_info = select_review_log_from_index()
     else:  # llm_eval 결과
-        files = get_llm_eval_data_files()
-        if not files:
-            st.info("저장된 llm_eval 결과가 없습니다.")
-            return
+        selected_file_info = select_llm_eval_file()
+    if selected_file_info is None:
+        return
+
+    # 선택된 파일 정보와 내용 표시
+    display_file_info(selected_file_info)
+    load_and_display_file_content(selected_file_info["path"])
+
+
+def select_review_log_from_index() -> dict[str, Any] | None:
+    """인덱스로 사이드바에 리뷰 로그 목록을 표시하고 선택된 로그 정보를 반환합니다.
+
+    모델, 상태, 기간 필터와 정렬, 페이지 나누기를 모두 인덱스 조회로 처리하므로
+    로그 파일 수가 많아도 목록 표시 속도가 일정합니다.
+    """
+    index = get_review_log_index()
+    if index.count() == 0:
+        st.info("저장된 리뷰 로그가 없습니다.")
+        st.markdown("""
+        ### 리뷰 생성 방법
+        
+        터미널에서 다음 명령어를 실행하여 코드 리뷰를 생성하세요:
+        ```bash
+                        selvage review
+        ```
+        
+        자세한 사용법은 README.md 파일을 참조하세요.
+        """)
+        return None
+
+    st.sidebar.markdown("## 리뷰 결과 목록")
+
+    # 로그 파일을 직접 추가하거나 삭제한 경우 인덱스를 다시 만듭니다.
+    if st.sidebar.button("인덱스 다시 만들기"):
+        indexed_count = index.rebuild()
+        st.sidebar.success(f"리뷰 로그 {indexed_count}개를 다시 색인했습니다.")
+
+    # 필터 옵션
+    model = st.sidebar.selectbox(
+        "모델:", [ALL_FILTER_OPTION, *index.distinct_values("model")], index=0
+    )
+    status = st.sidebar.selectbox(
+        "상태:", [ALL_FILTER_OPTION, *index.distinct_values("status")], index=0
+    )
+    since = until = None
+    if st.sidebar.checkbox("기간 필터"):
+        today = datetime.now().date()
+        date_range = st.sidebar.date_input(
+            "기간:",
+            value=(today - timedelta(days=DEFAULT_DATE_FILTER_DAYS), today),
+        )
+        if isinstance(date_range, tuple) and len(date_range) == 2:
+            since = datetime.combine(date_range[0], time.min)
+            until = datetime.combine(date_range[1], time.max)
+
+    filters = {
+        "model": None if model == ALL_FILTER_OPTION else model,
+        "status": None if status == ALL_FILTER_OPTION else status,
+        "since": since,
+        "until": until,
+    }
+
+    # 정렬 옵션
+    sort_option = st.sidebar.selectbox("정렬 기준:", ["최신순", "오래된순"], index=0)
+
+    # 페이지 나누기
+    total_count = index.count(**filters)
+    if total_count == 0:
+        st.sidebar.info("조건에 맞는 리뷰 로그가 없습니다.")
+        return None
+    page_count = math.ceil(total_count / REVIEW_LOG_PAGE_SIZE)
+    page = st.sidebar.number_input(
+        f"페이지 (총 {page_count}쪽, {total_count}건):",
+        min_value=1,
+        max_value=page_count,
+        value=1,
+        step=1,
+    )
+
+    entries = index.query(
+        **filters,
+        newest_first=sort_option == "최신순",
+        limit=REVIEW_LOG_PAGE_SIZE,
+        offset=(int(page) - 1) * REVIEW_LOG_PAGE_SIZE,
+    )
+    file_options = {
+        f"{entry.file_name} ({entry.created_at.strftime('%Y-%m-%d %H:%M')}, "
+        f"{entry.status}, 이슈 {entry.issue_count}건)": entry
+        for entry in entries
+    }
+
+    # 파일 선택 위젯
+    selected_file_name = st.sidebar.selectbox(
+        "파일 선택:", list(file_options.keys()), index=0
+    )
+
+    return get_index_entry_info(index, file_options[selected_file_name])
+
+
+def select_llm_eval_file() -> dict[str, Any] | None:
+    """사이드바에 llm_eval 결과 파일 목록을 표시하고 선택된 파일 정보를 반환합니다."""
+    files = get_llm_eval_data_files()
+    if not files:
+        st.info("저장된 llm_eval 결과가 없습니다.")
+        return None
 
     # 파일 목록 정보 생성
     file_infos = [get_file_info(f) for f in files]
 
     # 사이드바에 파일 목록 표시
-    st.sidebar.markdown(f"## {view_type} 목록")
+    st.sidebar.markdown("## llm_eval 결과 목록")
 
     # 정렬 옵션
     sort_option = st.sidebar.selectbox("정렬 기준:", ["최신순", "오래된순"], index=0)
@@ -495,10 +704,7 @@ def app():
         "파일 선택:", list(file_options.keys()), index=0
     )
 
-    # 선택된 파일 정보와 내용 표시
-    selected_file_info = file_options[selected_file_name]
-    display_file_info(selected_file_info)
-    load_and_display_file_content(selected_file_info["path"])
+    return file_options[selected_file_name]
 
 
 def run_app() -> None:
@@ -1,12 +1,14 @@
-"""유틸리티 패키지"""
+"""유틸리티 패키지
+
+review_display는 rich 위젯을 불러오므로 CLI 시작 시간에 영향을 주지 않도록
+여기서 내보내지 않습니다. `selvage.src.utils.review_display`에서 직접 가져오세요.
+"""
 
 from .base_console import console
 from .file_utils import is_ignore_file, load_file_content
-from .review_display import review_display
 
 __all__ = [
     "console",
     "is_ignore_file",
     "load_file_content",
-    "review_display",
 ]
@@ -2,22 +2,30 @@
 
 from collections.abc import Generator
 from contextlib import contextmanager
-from typing import Any
-
-from rich.console import Console
-from rich.status import Status
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from selvage.src.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.status import Status
+
 
 class BaseConsole:
     """기본 콘솔 출력 및 로깅을 관리하는 클래스."""
 
     def __init__(self) -> None:
         """콘솔 인스턴스를 초기화합니다."""
-        self.console = Console()
         self.logger = get_logger(__name__)
 
+    @cached_property
+    def console(self) -> "Console":
+        """Rich 콘솔. CLI 시작 시간을 줄이기 위해 처음 출력할 때 생성합니다."""
+        from rich.console import Console
+
+        return Console()
+
     def success(self, message: str) -> None:
         """성공 메시지를 출력합니다."""
         self.console.print(message, style="bold green")
@@ -55,7 +63,7 @@ class BaseConsole:
         self.console.print(*args, **kwargs)
 
     @contextmanager
-    def status(self, message: str) -> Generator[Status, None, None]:
+    def status(self, message: str) -> Generator["Status", None, None]:
         """진행 상황을 스피너와 함께 표시합니다."""
         with self.console.status(message, spinner="dots") as status:
             yield status
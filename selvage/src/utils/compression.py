@@ -0,0 +1,92 @@
+"""캐시와 리뷰 로그 페이로드를 압축하고, 형식을 판별하여 해제하는 모듈.
+
+`zstandard` 패키지가 설치되어 있으면 zstd를, 없으면 표준 라이브러리 gzip을
+사용합니다. 압축 해제는 매직 바이트로 형식을 판별하므로 압축 방식이 바뀌어도
+이전에 저장한 데이터(zlib, 비압축 JSON 포함)를 그대로 읽을 수 있습니다.
+"""
+
+import gzip
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    # zstd는 선택 의존성입니다 (pip install selvage[zstd])
+    zstandard = None
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_MAGIC = b"\x1f\x8b"
+# zlib 헤더 첫 바이트 (deflate, 32K 윈도우)
+ZLIB_HEADER_BYTE = 0x78
+# zstd 압축 레벨 (속도와 압축률의 균형)
+ZSTD_COMPRESSION_LEVEL = 6
+# gzip 압축 레벨
+GZIP_COMPRESSION_LEVEL = 6
+# 압축 방식별 파일 확장자
+ZSTD_SUFFIX = ".zst"
+GZIP_SUFFIX = ".gz"
+
+
+def is_zstd_available() -> bool:
+    """zstd 압축을 사용할 수 있는지 반환합니다."""
+    return zstandard is not None
+
+
+def compressed_suffix() -> str:
+    """`compress`가 만드는 데이터에 맞는 파일 확장자를 반환합니다."""
+    return ZSTD_SUFFIX if is_zstd_available() else GZIP_SUFFIX
+
+
+def compress(data: bytes) -> bytes:
+    """데이터를 zstd(사용 가능한 경우) 또는 gzip으로 압축합니다.
+
+    Args:
+        data: 압축할 데이터
+
+    Returns:
+        bytes: 압축된 데이터
+    """
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(data)
+    # mtime을 고정하여 같은 입력이 항상 같은 출력이 되도록 합니다.
+    return gzip.compress(data, compresslevel=GZIP_COMPRESSION_LEVEL, mtime=0)
+
+
+def decompress(data: bytes) -> bytes:
+    """매직 바이트로 압축 형식을 판별하여 해제합니다.
+
+    zstd, gzip, zlib 형식을 지원하며, 압축되지 않은 데이터는 그대로 반환합니다.
+
+    Args:
+        data: 압축된(또는 압축되지 않은) 데이터
+
+    Returns:
+        bytes: 압축을 해제한 데이터
+
+    Raises:
+        RuntimeError: zstd 데이터인데 zstandard 패키지가 설치되지 않은 경우
+    """
+    if data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError(
+                "zstd로 압축된 데이터입니다. "
+                "'pip install selvage[zstd]'로 zstandard를 설치하세요."
+            )
+        # 스트리밍 압축 결과처럼 원본 크기가 헤더에 없어도 해제할 수 있도록
+        # 스트림 리더를 사용합니다.
+        with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+            return reader.read()
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if _looks_like_zlib(data):
+        return zlib.decompress(data)
+    return data
+
+
+def _looks_like_zlib(data: bytes) -> bool:
+    """zlib 헤더(CMF/FLG 체크섬 포함)로 시작하는지 확인합니다."""
+    return (
+        len(data) >= 2
+        and data[0] == ZLIB_HEADER_BYTE
+        and (data[0] << 8 | data[1]) % 31 == 0
+    )
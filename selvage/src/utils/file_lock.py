@@ -0,0 +1,87 @@
+"""FileLock: 여러 프로세스가 공유하는 디렉토리에서 작업을 조율하는 파일 잠금 모듈."""
+
+import sys
+from pathlib import Path
+from types import TracebackType
+from typing import IO
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """잠금 파일에 대한 프로세스 간 배타적 잠금 클래스.
+
+    POSIX에서는 `flock`, Windows에서는 `msvcrt.locking`을 사용합니다.
+    잠금은 운영체제가 관리하므로 프로세스가 비정상 종료되어도 자동으로 풀립니다.
+    `with` 문으로 사용하면 잠금을 얻을 때까지 기다립니다.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """FileLock 초기화
+
+        Args:
+            path: 잠금 파일 경로 (없으면 생성합니다)
+        """
+        self.path = path
+        self._file: IO[str] | None = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """잠금을 얻습니다.
+
+        Args:
+            blocking: False이면 다른 프로세스가 잠금을 잡고 있을 때 기다리지 않습니다.
+
+        Returns:
+            bool: 잠금을 얻었으면 True, blocking이 False이고 이미 잠겨 있으면 False
+        """
+        if self._file is not None:
+            raise RuntimeError(f"이미 잠금을 획득했습니다: {self.path}")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self.path, "a+", encoding="utf-8")  # noqa: SIM115
+        try:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                mode = msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK
+                msvcrt.locking(lock_file.fileno(), mode, 1)
+            else:
+                flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+                fcntl.flock(lock_file.fileno(), flags)
+        except OSError:
+            lock_file.close()
+            if blocking:
+                raise
+            return False
+
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        """잠금을 해제합니다. 잠금을 얻지 않았다면 아무것도 하지 않습니다."""
+        if self._file is None:
+            return
+        try:
+            if sys.platform == "win32":
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.release()
+
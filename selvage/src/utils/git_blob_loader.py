@@ -0,0 +1,137 @@
+"""GitBlobLoader: git 오브젝트 저장소에서 특정 리비전의 파일 내용을 읽어오는 모듈."""
+
+import subprocess
+import threading
+from collections.abc import Iterator, Sequence
+from typing import IO
+
+from selvage.src.utils.file_utils import is_ignore_file
+
+
+class GitBlobLoader:
+    """`git cat-file --batch` 프로세스 하나로 여러 파일의 blob을 읽어오는 클래스.
+
+    작업 트리 대신 git 오브젝트 저장소에서 내용을 읽으므로, 커밋/브랜치 리뷰에서
+    체크아웃 상태와 무관하게 재현 가능한 파일 내용을 얻을 수 있습니다.
+    """
+
+    def __init__(self, repo_path: str, revision: str = "HEAD") -> None:
+        """GitBlobLoader 초기화
+
+        Args:
+            repo_path (str): Git 저장소 경로
+            revision (str): 파일 내용을 읽을 리비전 (commit hash, branch 이름 등)
+        """
+        self.repo_path = repo_path
+        self.revision = revision
+
+    def iter_file_contents(
+        self, filenames: Sequence[str]
+    ) -> Iterator[tuple[str, str | None]]:
+        """주어진 파일들의 내용을 요청 순서대로 스트리밍하여 반환합니다.
+
+        모든 요청은 하나의 `git cat-file --batch` 프로세스로 전달되며, 요청 쓰기와
+        결과 읽기를 별도 스레드에서 동시에 수행하여 파이프 버퍼 교착을 방지합니다.
+
+        Args:
+            filenames (Sequence[str]): 저장소 루트 기준 파일 경로 목록
+
+        Yields:
+            tuple[str, str | None]: (파일 경로, 파일 내용). 해당 리비전에 파일이
+                없으면 내용은 None입니다.
+
+        Raises:
+            OSError: git 프로세스를 실행할 수 없거나 예기치 않게 종료된 경우
+        """
+        # 무시 대상 파일은 git에 요청하지 않습니다.
+        requested = [name for name in filenames if not is_ignore_file(name)]
+
+        process: subprocess.Popen[bytes] | None = None
+        if requested:
+            process = subprocess.Popen(  # noqa: S603
+                ["git", "-C", self.repo_path, "cat-file", "--batch"],  # noqa: S607
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+
+        try:
+            writer: threading.Thread | None = None
+            if process is not None and process.stdin is not None:
+                writer = threading.Thread(
+                    target=self._write_requests,
+                    args=(process.stdin, requested),
+                    daemon=True,
+                )
+                writer.start()
+
+            for filename in filenames:
+                if is_ignore_file(filename):
+                    yield filename, f"[제외 파일: {filename}]"
+                    continue
+                if process is None or process.stdout is None:
+                    raise OSError("git cat-file 프로세스가 실행되지 않았습니다.")
+                yield filename, self._read_blob(process.stdout, filename)
+
+            if writer is not None:
+                writer.join()
+        finally:
+            if process is not None:
+                if process.stdout is not None:
+                    process.stdout.close()
+                if process.poll() is None:
+                    process.kill()
+                process.wait()
+
+    def _write_requests(self, stdin: IO[bytes], filenames: Sequence[str]) -> None:
+        """cat-file 프로세스에 `<revision>:<path>` 요청을 순서대로 기록합니다.
+
+        Args:
+            stdin: cat-file 프로세스의 표준 입력
+            filenames: 요청할 파일 경로 목록
+        """
+        try:
+            for filename in filenames:
+                stdin.write(f"{self.revision}:{filename}\n".encode())
+            stdin.flush()
+        except (BrokenPipeError, ValueError):
+            # 읽는 쪽이 먼저 종료된 경우 (프로세스 종료 또는 파이프 닫힘)
+            pass
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
+    @staticmethod
+    def _read_blob(stdout: IO[bytes], filename: str) -> str | None:
+        """cat-file 출력에서 오브젝트 하나를 읽어 문자열로 반환합니다.
+
+        Args:
+            stdout: cat-file 프로세스의 표준 출력
+            filename: 요청한 파일 경로 (오류 메시지용)
+
+        Returns:
+            str | None: 파일 내용. 해당 리비전에 파일이 없으면 None
+
+        Raises:
+            OSError: 출력이 예기치 않게 끝난 경우
+        """
+        header = stdout.readline()
+        if not header:
+            raise OSError(
+                f"git cat-file 프로세스가 예기치 않게 종료되었습니다: {filename}"
+            )
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+
+        _object_id, object_type, size = header.split()
+        data = stdout.read(int(size))
+        stdout.read(1)  # 오브젝트 뒤의 LF 구분자
+
+        if object_type != b"blob":
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            return f"[인코딩 오류로 읽을 수 없는 파일: {filename}]"
@@ -1,4 +1,6 @@
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from enum import Enum
 from pathlib import Path
 
@@ -11,6 +13,7 @@ class GitDiffMode(str, Enum):
     STAGED = "staged"
     TARGET_COMMIT = "target_commit"
     TARGET_BRANCH = "target_branch"
+    REVISION_RANGE = "revision_range"
     UNSTAGED = "unstaged"
 
 
@@ -22,13 +25,17 @@ class GitDiffUtility:
         repo_path: str,
         mode: GitDiffMode = GitDiffMode.UNSTAGED,
         target: str | None = None,
+        paths: list[str] | None = None,
     ) -> None:
         """GitDiffUtility 초기화
 
         Args:
             repo_path (str): Git 저장소 경로
             mode (GitDiffMode): diff 동작 모드
-            target (str | None): mode에 따른 대상 (commit hash 또는 branch 이름)
+            target (str | None): mode에 따른 대상 (commit hash, branch 이름 또는
+                REVISION_RANGE 모드의 `A..B` 형식 범위)
+            paths (list[str] | None): diff를 가져올 파일 경로 (저장소 루트 기준).
+                None이면 전체 변경사항
 
         Raises:
             ValueError: 저장소 경로가 유효하지 않은 경우
@@ -36,6 +43,7 @@ class GitDiffUtility:
         self.repo_path = repo_path
         self.mode = mode
         self.target = target
+        self.paths = paths
 
         # 경로 유효성 검증
         path = Path(repo_path)
@@ -69,11 +77,11 @@ class GitDiffUtility:
 
         return cls(repo_path=str(Path(args.repo_path)), mode=mode, target=target)
 
-    def get_diff(self) -> str:
-        """Git diff 명령을 실행하고 결과를 반환합니다.
+    def _build_diff_command(self) -> list[str] | None:
+        """현재 모드에 맞는 git diff 명령어를 구성합니다.
 
         Returns:
-            str: git diff 명령의 출력
+            list[str] | None: git diff 명령어 인자 목록. 대상 값이 비어있으면 None
         """
         cmd = ["git", "-C", self.repo_path, "diff", "--unified=5"]
 
@@ -82,17 +90,42 @@ class GitDiffUtility:
         elif self.mode == GitDiffMode.TARGET_COMMIT:
             if not self.target or not self.target.strip():
                 console.error("오류: commit 값이 비어있습니다.")
-                return ""
+                return None
             cmd.append(f"{self.target}..HEAD")
         elif self.mode == GitDiffMode.TARGET_BRANCH:
             if not self.target or not self.target.strip():
                 console.error("오류: branch 값이 비어있습니다.")
-                return ""
+                return None
             cmd.append(f"{self.target}..HEAD")
+        elif self.mode == GitDiffMode.REVISION_RANGE:
+            if not self.target or not self.target.strip():
+                console.error("오류: 리비전 범위 값이 비어있습니다.")
+                return None
+            cmd.append(self.target)
+
+        if self.paths is not None:
+            cmd.extend(["--", *self.paths])
+
+        return cmd
+
+    def get_diff(self) -> str:
+        """Git diff 명령을 실행하고 결과를 반환합니다.
+
+        Returns:
+            str: git diff 명령의 출력
+        """
+        cmd = self._build_diff_command()
+        if cmd is None:
+            return ""
 
         try:
             process_result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True, encoding="utf-8"
+                cmd,
+                capture_output=True,
+                text=True,
+                check=True,
+                encoding="utf-8",
+                errors="replace",
             )
             return process_result.stdout
         except subprocess.CalledProcessError as e:
@@ -107,3 +140,56 @@ class GitDiffUtility:
                 exception=e,
             )
             return ""
+
+    def iter_diff_lines(self) -> Iterator[str]:
+        """Git diff 출력을 파이프에서 한 줄씩 읽어 반환합니다.
+
+        전체 출력을 하나의 문자열로 모으지 않으므로 `parse_git_diff_stream`과 함께
+        사용하면 대용량 diff도 일정한 메모리로 처리할 수 있습니다.
+        stderr는 파이프 버퍼가 가득 차 git이 멈추지 않도록 임시 파일로 받고,
+        UTF-8이 아닌 바이트는 대체 문자로 바꿉니다.
+
+        Yields:
+            str: 줄바꿈 문자를 포함한 git diff 출력 라인
+        """
+        cmd = self._build_diff_command()
+        if cmd is None:
+            return
+
+        with tempfile.TemporaryFile() as stderr_file:
+            try:
+                process = subprocess.Popen(  # noqa: S603
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                )
+            except OSError as e:
+                console.error(
+                    f"Git diff 처리 중 예상치 못한 오류 발생: {e}\n"
+                    f"실행된 명령어: {' '.join(cmd)}",
+                    exception=e,
+                )
+                return
+
+            completed = False
+            try:
+                if process.stdout is not None:
+                    yield from process.stdout
+                completed = True
+            finally:
+                if process.stdout is not None:
+                    process.stdout.close()
+                if not completed:
+                    # 소비자가 중간에 순회를 멈춘 경우 git 프로세스를 정리합니다.
+                    process.kill()
+                return_code = process.wait()
+                if completed and return_code != 0:
+                    stderr_file.seek(0)
+                    stderr = stderr_file.read().decode("utf-8", errors="replace")
+                    console.error(
+                        f"Git diff 명령 실행 중 오류 발생: {stderr.strip()}\n"
+                        f"실행된 명령어: {' '.join(cmd)}"
+                    )
@@ -2,22 +2,100 @@
 LLM 클라이언트 팩토리 모듈입니다.
 """
 
-import instructor
-from anthropic import Anthropic
-from google import genai
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
 
 from selvage.src.model_config import ModelInfoDict
 from selvage.src.models.model_provider import ModelProvider
 
+if TYPE_CHECKING:
+    # 프로바이더 SDK는 해당 프로바이더의 클라이언트를 만들 때 불러옵니다.
+    import instructor
+    from anthropic import Anthropic, AsyncAnthropic
+    from google import genai
+    from google.genai.client import AsyncClient as AsyncGenaiClient
+    from openai import AsyncOpenAI, OpenAI
+
 ANTHROPIC_THINKING_MODE_TIMEOUT_SECONDS = 600.0
 
 
 class LLMClientFactory:
     """LLM 클라이언트 팩토리 클래스"""
 
+    @staticmethod
+    def get_timeout(provider: ModelProvider, model_info: ModelInfoDict) -> float | None:
+        """모델에 맞는 클라이언트 요청 타임아웃을 반환합니다.
+
+        Args:
+            provider: LLM 프로바이더
+            model_info: 모델 정보 객체
+
+        Returns:
+            float | None: 타임아웃(초). None이면 SDK 기본값을 사용합니다.
+        """
+        # thinking 모드는 일반 호출보다 오래 걸릴 수 있으므로 10분 타임아웃 적용
+        if provider == ModelProvider.ANTHROPIC and model_info.get(
+            "thinking_mode", False
+        ):
+            return ANTHROPIC_THINKING_MODE_TIMEOUT_SECONDS
+        return None
+
+    @staticmethod
+    def create_sdk_client(
+        provider: ModelProvider,
+        api_key: str,
+        timeout: float | None = None,
+        use_async: bool = False,
+    ) -> (
+        OpenAI
+        | Anthropic
+        | genai.Client
+        | AsyncOpenAI
+        | AsyncAnthropic
+        | AsyncGenaiClient
+    ):
+        """instructor로 래핑하지 않은 프로바이더 SDK 클라이언트를 생성합니다.
+
+        Args:
+            provider: LLM 프로바이더 (openai, anthropic, google)
+            api_key: API 키
+            timeout: 요청 타임아웃(초). None이면 SDK 기본값 사용
+            use_async: 비동기 클라이언트를 생성할지 여부
+
+        Returns:
+            OpenAI | Anthropic | genai.Client: 동기 SDK 클라이언트
+            AsyncOpenAI | AsyncAnthropic | AsyncGenaiClient: 비동기 SDK 클라이언트
+
+        Raises:
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        kwargs: dict[str, Any] = {"api_key": api_key}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        if provider == ModelProvider.OPENAI:
+            from openai import AsyncOpenAI, OpenAI
+
+            return AsyncOpenAI(**kwargs) if use_async else OpenAI(**kwargs)
+        elif provider == ModelProvider.ANTHROPIC:
+            from anthropic import Anthropic, AsyncAnthropic
+
+            return AsyncAnthropic(**kwargs) if use_async else Anthropic(**kwargs)
+        elif provider == ModelProvider.GOOGLE:
+            from google import genai
+
+            client = genai.Client(api_key=api_key)
+            return client.aio if use_async else client
+        else:
+            raise ValueError(f"지원하지 않는 LLM 프로바이더입니다: {provider}")
+
     @staticmethod
     def create_client(
-        provider: ModelProvider, api_key: str, model_info: ModelInfoDict
+        provider: ModelProvider,
+        api_key: str,
+        model_info: ModelInfoDict,
+        sdk_client: OpenAI | Anthropic | genai.Client | None = None,
     ) -> instructor.Instructor | genai.Client | Anthropic:
         """프로바이더에 맞는, 구조화된 응답을 지원하는 클라이언트를 생성합니다.
 
@@ -25,27 +103,90 @@ class LLMClientFactory:
             provider: LLM 프로바이더 (openai, anthropic, google)
             api_key: API 키
             model_info: 모델 정보 객체
+            sdk_client: 래핑할 기존 SDK 클라이언트. None이면 새로 생성합니다.
 
         Returns:
             instructor.Instructor: instructor 래핑된 LLM 클라이언트
             genai.Client: Google Gemini 클라이언트
             Anthropic: Claude thinking 모드용 직접 클라이언트
+        Raises:
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        if sdk_client is None:
+            sdk_client = LLMClientFactory.create_sdk_client(
+                provider, api_key, LLMClientFactory.get_timeout(provider, model_info)
+            )
+        return LLMClientFactory._wrap_structured_client(
+            provider, model_info, sdk_client
+        )
+
+    @staticmethod
+    def create_async_client(
+        provider: ModelProvider,
+        api_key: str,
+        model_info: ModelInfoDict,
+        sdk_client: AsyncOpenAI | AsyncAnthropic | AsyncGenaiClient | None = None,
+    ) -> instructor.AsyncInstructor | AsyncGenaiClient | AsyncAnthropic:
+        """프로바이더에 맞는, 구조화된 응답을 지원하는 비동기 클라이언트를 생성합니다.
+
+        Args:
+            provider: LLM 프로바이더 (openai, anthropic, google)
+            api_key: API 키
+            model_info: 모델 정보 객체
+            sdk_client: 래핑할 기존 비동기 SDK 클라이언트. None이면 새로 생성합니다.
+
+        Returns:
+            instructor.AsyncInstructor: instructor 래핑된 비동기 LLM 클라이언트
+            AsyncGenaiClient: Google Gemini 비동기(aio) 클라이언트
+            AsyncAnthropic: Claude thinking 모드용 직접 비동기 클라이언트
+        Raises:
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        if sdk_client is None:
+            sdk_client = LLMClientFactory.create_sdk_client(
+                provider,
+                api_key,
+                LLMClientFactory.get_timeout(provider, model_info),
+                use_async=True,
+            )
+        return LLMClientFactory._wrap_structured_client(
+            provider, model_info, sdk_client
+        )
+
+    @staticmethod
+    def _wrap_structured_client(
+        provider: ModelProvider,
+        model_info: ModelInfoDict,
+        sdk_client: OpenAI
+        | Anthropic
+        | genai.Client
+        | AsyncOpenAI
+        | AsyncAnthropic
+        | AsyncGenaiClient,
+    ) -> (
+        instructor.Instructor
+        | genai.Client
+        | Anthropic
+        | AsyncGenaiClient
+        | AsyncAnthropic
+    ):
+        """SDK 클라이언트를 프로바이더에 맞게 instructor로 래핑합니다.
+
         Raises:
             ValueError: 지원하지 않는 프로바이더인 경우
         """
         if provider == ModelProvider.OPENAI:
-            from openai import OpenAI
+            import instructor
 
-            return instructor.from_openai(OpenAI(api_key=api_key))
+            return instructor.from_openai(sdk_client)
         elif provider == ModelProvider.ANTHROPIC:
             # thinking 모드인 경우 instructor 사용 안 함
             if model_info.get("thinking_mode", False):
-                return Anthropic(
-                    api_key=api_key, timeout=ANTHROPIC_THINKING_MODE_TIMEOUT_SECONDS
-                )  # 10분 타임아웃 (thinking 모드는 일반 호출보다 오래 걸릴 수 있음을 고려)
-            else:
-                return instructor.from_anthropic(Anthropic(api_key=api_key))
+                return sdk_client
+            import instructor
+
+            return instructor.from_anthropic(sdk_client)
         elif provider == ModelProvider.GOOGLE:
-            return genai.Client(api_key=api_key)
+            return sdk_client
         else:
             raise ValueError(f"지원하지 않는 LLM 프로바이더입니다: {provider}")
@@ -0,0 +1,206 @@
+"""LLMClientRegistry: 프로세스 전역에서 LLM 클라이언트를 재사용하는 레지스트리 모듈."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from selvage.src.model_config import ModelInfoDict
+from selvage.src.models.model_provider import ModelProvider
+from selvage.src.utils.base_console import console
+from selvage.src.utils.llm_client_factory import LLMClientFactory
+
+if TYPE_CHECKING:
+    import instructor
+    from anthropic import Anthropic, AsyncAnthropic
+    from google import genai
+    from google.genai.client import AsyncClient as AsyncGenaiClient
+    from openai import OpenAI
+
+
+class _ClientKey(NamedTuple):
+    """SDK 클라이언트를 구분하는 키 (프로바이더, API 키, 타임아웃)."""
+
+    provider: ModelProvider
+    api_key: str
+    timeout: float | None
+
+
+class LLMClientRegistry:
+    """LLM 클라이언트를 프로바이더, API 키, 타임아웃별로 한 번만 생성해 공유하는 클래스.
+
+    SDK 클라이언트는 내부 HTTP 커넥션 풀을 keep-alive로 유지하므로, 게이트웨이
+    인스턴스와 리뷰 호출 사이에서 클라이언트를 재사용하면 TLS 핸드셰이크와
+    instructor 패칭 비용을 한 번만 지불합니다. 비동기 클라이언트는 이벤트 루프에
+    묶여 있으므로 실행 중인 이벤트 루프별로 따로 보관합니다.
+
+    프로세스 종료 시 `shutdown()`이 자동으로 호출되며, 필요하면 직접 호출하여
+    커넥션 풀을 정리할 수 있습니다.
+    """
+
+    _lock = threading.Lock()
+    _sdk_clients: dict[_ClientKey, Any] = {}
+    _clients: dict[tuple[_ClientKey, bool], Any] = {}
+    _async_sdk_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[_ClientKey, Any]
+    ] = weakref.WeakKeyDictionary()
+    _async_clients: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[tuple[_ClientKey, bool], Any]
+    ] = weakref.WeakKeyDictionary()
+    _shutdown_hook_registered = False
+
+    @classmethod
+    def get_sdk_client(
+        cls, provider: ModelProvider, api_key: str, timeout: float | None = None
+    ) -> OpenAI | Anthropic | genai.Client:
+        """공유 SDK 클라이언트를 반환합니다. 없으면 생성하여 등록합니다.
+
+        토큰 계산처럼 instructor 래핑이 필요 없는 호출에 사용합니다.
+
+        Args:
+            provider: LLM 프로바이더
+            api_key: API 키
+            timeout: 요청 타임아웃(초). None이면 SDK 기본값 사용
+
+        Returns:
+            OpenAI | Anthropic | genai.Client: 공유 SDK 클라이언트
+
+        Raises:
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        key = _ClientKey(provider, api_key, timeout)
+        with cls._lock:
+            return cls._get_or_create_sdk_client(key)
+
+    @classmethod
+    def get_client(
+        cls, provider: ModelProvider, api_key: str, model_info: ModelInfoDict
+    ) -> instructor.Instructor | genai.Client | Anthropic:
+        """구조화된 응답을 지원하는 공유 클라이언트를 반환합니다.
+
+        Args:
+            provider: LLM 프로바이더
+            api_key: API 키
+            model_info: 모델 정보 객체
+
+        Returns:
+            instructor.Instructor | genai.Client | Anthropic: 공유 LLM 클라이언트
+
+        Raises:
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        key = _ClientKey(
+            provider, api_key, LLMClientFactory.get_timeout(provider, model_info)
+        )
+        client_key = (key, bool(model_info.get("thinking_mode", False)))
+        with cls._lock:
+            client = cls._clients.get(client_key)
+            if client is None:
+                client = LLMClientFactory.create_client(
+                    provider,
+                    api_key,
+                    model_info,
+                    sdk_client=cls._get_or_create_sdk_client(key),
+                )
+                cls._clients[client_key] = client
+            return client
+
+    @classmethod
+    def get_async_client(
+        cls, provider: ModelProvider, api_key: str, model_info: ModelInfoDict
+    ) -> instructor.AsyncInstructor | AsyncGenaiClient | AsyncAnthropic:
+        """실행 중인 이벤트 루프에서 사용할 공유 비동기 클라이언트를 반환합니다.
+
+        Args:
+            provider: LLM 프로바이더
+            api_key: API 키
+            model_info: 모델 정보 객체
+
+        Returns:
+            instructor.AsyncInstructor | AsyncGenaiClient | AsyncAnthropic:
+                현재 이벤트 루프에 묶인 공유 비동기 LLM 클라이언트
+
+        Raises:
+            RuntimeError: 실행 중인 이벤트 루프가 없는 경우
+            ValueError: 지원하지 않는 프로바이더인 경우
+        """
+        loop = asyncio.get_running_loop()
+        key = _ClientKey(
+            provider, api_key, LLMClientFactory.get_timeout(provider, model_info)
+        )
+        client_key = (key, bool(model_info.get("thinking_mode", False)))
+        with cls._lock:
+            clients = cls._async_clients.setdefault(loop, {})
+            client = clients.get(client_key)
+            if client is None:
+                sdk_clients = cls._async_sdk_clients.setdefault(loop, {})
+                sdk_client = sdk_clients.get(key)
+                if sdk_client is None:
+                    sdk_client = LLMClientFactory.create_sdk_client(
+                        provider, api_key, key.timeout, use_async=True
+                    )
+                    sdk_clients[key] = sdk_client
+                client = LLMClientFactory.create_async_client(
+                    provider, api_key, model_info, sdk_client=sdk_client
+                )
+                clients[client_key] = client
+            return client
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """등록된 동기 클라이언트의 커넥션 풀을 닫고 레지스트리를 비웁니다.
+
+        비동기 클라이언트는 이벤트 루프 안에서만 닫을 수 있으므로 참조만
+        제거합니다. 닫아야 한다면 이벤트 루프 종료 전에 `ashutdown()`을 호출하세요.
+        """
+        with cls._lock:
+            sdk_clients = list(cls._sdk_clients.values())
+            cls._sdk_clients.clear()
+            cls._clients.clear()
+            cls._async_sdk_clients.clear()
+            cls._async_clients.clear()
+
+        for sdk_client in sdk_clients:
+            close = getattr(sdk_client, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                console.log_info(f"LLM 클라이언트 종료 중 오류 무시: {str(e)}")
+
+    @classmethod
+    async def ashutdown(cls) -> None:
+        """실행 중인 이벤트 루프에 등록된 비동기 클라이언트를 닫습니다."""
+        loop = asyncio.get_running_loop()
+        with cls._lock:
+            sdk_clients = list(cls._async_sdk_clients.pop(loop, {}).values())
+            cls._async_clients.pop(loop, None)
+
+        for sdk_client in sdk_clients:
+            close = getattr(sdk_client, "close", None)
+            if close is None:
+                continue
+            try:
+                await close()
+            except Exception as e:
+                console.log_info(f"LLM 클라이언트 종료 중 오류 무시: {str(e)}")
+
+    @classmethod
+    def _get_or_create_sdk_client(
+        cls, key: _ClientKey
+    ) -> OpenAI | Anthropic | genai.Client:
+        """잠금을 획득한 상태에서 SDK 클라이언트를 조회하거나 생성합니다."""
+        sdk_client = cls._sdk_clients.get(key)
+        if sdk_client is None:
+            sdk_client = LLMClientFactory.create_sdk_client(
+                key.provider, key.api_key, key.timeout
+            )
+            cls._sdk_clients[key] = sdk_client
+            if not cls._shutdown_hook_registered:
+                atexit.register(cls.shutdown)
+                cls._shutdown_hook_registered = True
+        return sdk_client
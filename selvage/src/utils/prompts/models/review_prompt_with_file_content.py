@@ -1,6 +1,9 @@
 """파일 내용을 포함한 리뷰 프롬프트 데이터 클래스 모듈"""
 
+import io
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import TextIO
 
 from .system_prompt import SystemPrompt
 from .user_prompt_with_file_content import UserPromptWithFileContent
@@ -26,14 +29,34 @@ class ReviewPromptWithFileContent:
             messages.append(user_prompt.to_message())
         return messages
 
+    def iter_text_segments(self) -> Iterator[str]:
+        """결합 텍스트를 구성하는 구간을 순서대로 반환합니다.
+
+        시스템 프롬프트와 각 사용자 메시지가 하나의 구간이며, 토큰 계산과
+        로그 기록이 같은 구간 단위를 공유합니다.
+
+        Yields:
+            str: 줄바꿈 구분자를 포함한 구간 텍스트
+        """
+        yield self.system_prompt.content + "\n\n"
+        for user_prompt in self.user_prompts:
+            yield user_prompt.message_content + "\n\n"
+
+    def write_combined_text(self, stream: TextIO) -> None:
+        """결합 텍스트를 전체 문자열로 만들지 않고 스트림에 기록합니다.
+
+        Args:
+            stream: 텍스트를 기록할 스트림 (파일, io.StringIO 등)
+        """
+        for segment in self.iter_text_segments():
+            stream.write(segment)
+
     def to_combined_text(self) -> str:
         """ReviewPromptWithFileContent를 문자열로 변환합니다.
 
         Returns:
             str: 문자열로 변환된 ReviewPromptWithFileContent
         """
-        combined_text = ""
-        combined_text += self.system_prompt.content + "\n\n"
-        for user_prompt in self.user_prompts:
-            combined_text += user_prompt.to_message()["content"] + "\n\n"
-        return combined_text
+        buffer = io.StringIO()
+        self.write_combined_text(buffer)
+        return buffer.getvalue()
@@ -2,6 +2,7 @@
 
 import json
 from dataclasses import asdict, dataclass
+from functools import cached_property
 
 from selvage.src.diff_parser.models import Hunk
 
@@ -38,16 +39,22 @@ class UserPromptWithFileContent:
             FormattedHunk(hunk, idx, language) for idx, hunk in enumerate(hunks)
         ]
 
+    @cached_property
+    def message_content(self) -> str:
+        """UserPromptWithFileContent를 직렬화한 메시지 본문을 반환합니다.
+
+        직렬화는 처음 접근할 때 한 번만 수행되므로, 생성 후에는 필드를
+        변경하지 않아야 합니다.
+
+        Returns:
+            str: JSON 문자열로 직렬화된 메시지 본문
+        """
+        return json.dumps(obj=asdict(self), ensure_ascii=False)
+
     def to_message(self) -> dict[str, str]:
         """UserPromptWithFileContent를 LLM API 메시지 형식으로 변환합니다.
 
         Returns:
             dict[str, str]: LLM API 메시지 형식
         """
-        return {
-            "role": "user",
-            "content": json.dumps(
-                obj=asdict(self),
-                ensure_ascii=False,
-            ),
-        }
+        return {"role": "user", "content": self.message_content}
@@ -1,5 +1,6 @@
 """프롬프트 생성기"""
 
+import hashlib
 import importlib.resources
 from functools import lru_cache
 
@@ -38,6 +39,18 @@ class PromptGenerator:
             console.error(error_message, exception=e)
             raise FileNotFoundError(error_message) from e
 
+    @classmethod
+    def get_prompt_version(cls) -> str:
+        """현재 시스템 프롬프트 내용으로 만든 프롬프트 버전 식별자를 반환합니다.
+
+        프롬프트가 바뀌면 값이 달라지므로 캐시된 리뷰 결과를 구분하는 데 사용합니다.
+
+        Returns:
+            str: 시스템 프롬프트 SHA-256 해시의 앞 16자리
+        """
+        system_prompt = cls._get_code_review_system_prompt()
+        return hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()[:16]
+
     def create_code_review_prompt(
         self, review_request: ReviewRequest
     ) -> ReviewPrompt | ReviewPromptWithFileContent:
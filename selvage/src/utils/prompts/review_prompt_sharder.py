@@ -0,0 +1,97 @@
+"""ReviewPromptSharder: 토큰 예산에 맞게 리뷰 프롬프트를 분할하는 모듈."""
+
+from selvage.src.utils.token.token_utils import TokenUtils
+
+from .models import ReviewPrompt, ReviewPromptWithFileContent
+
+
+class ReviewPromptSharder:
+    """리뷰 프롬프트의 사용자 메시지를 토큰 예산 안에 들어가는 묶음으로 나누는 클래스.
+
+    각 묶음은 원본과 같은 시스템 프롬프트를 공유하며, 사용자 메시지의 순서는
+    유지됩니다. 메시지 크기는 네트워크 호출 없이 로컬에서 추정하므로, 실제 컨텍스트
+    검증은 각 묶음을 리뷰할 때 다시 수행해야 합니다.
+    """
+
+    def __init__(self, model: str, token_budget: int) -> None:
+        """ReviewPromptSharder 초기화
+
+        Args:
+            model: 토큰 수를 추정할 모델 이름
+            token_budget: 묶음 하나가 사용할 수 있는 최대 입력 토큰 수
+
+        Raises:
+            ValueError: token_budget이 1보다 작은 경우
+        """
+        if token_budget < 1:
+            raise ValueError(f"token_budget은 1 이상이어야 합니다: {token_budget}")
+        self.model = model
+        self.token_budget = token_budget
+
+    def shard(
+        self, review_prompt: ReviewPrompt | ReviewPromptWithFileContent
+    ) -> list[ReviewPrompt | ReviewPromptWithFileContent]:
+        """리뷰 프롬프트를 토큰 예산에 맞는 여러 프롬프트로 분할합니다.
+
+        사용자 메시지를 순서대로 채워 넣다가 예산을 넘기면 새 묶음을 시작합니다.
+        메시지 하나가 단독으로 예산을 넘으면 해당 메시지만 담은 묶음이 됩니다.
+
+        Args:
+            review_prompt: 분할할 리뷰 프롬프트
+
+        Returns:
+            list[ReviewPrompt | ReviewPromptWithFileContent]: 분할된 프롬프트 목록
+        """
+        system_tokens = TokenUtils.estimate_segment_tokens(
+            review_prompt.system_prompt.content + "\n\n", self.model
+        )
+
+        groups: list[list] = []
+        current: list = []
+        current_tokens = system_tokens
+        for user_prompt in review_prompt.user_prompts:
+            user_tokens = TokenUtils.estimate_segment_tokens(
+                user_prompt.message_content + "\n\n", self.model
+            )
+            if current and current_tokens + user_tokens > self.token_budget:
+                groups.append(current)
+                current = []
+                current_tokens = system_tokens
+            current.append(user_prompt)
+            current_tokens += user_tokens
+
+        if current:
+            groups.append(current)
+
+        return [self._with_user_prompts(review_prompt, group) for group in groups]
+
+    @staticmethod
+    def split_in_half(
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent,
+    ) -> list[ReviewPrompt | ReviewPromptWithFileContent]:
+        """사용자 메시지를 절반으로 나눈 두 프롬프트를 반환합니다.
+
+        Args:
+            review_prompt: 분할할 리뷰 프롬프트 (사용자 메시지 2개 이상)
+
+        Returns:
+            list[ReviewPrompt | ReviewPromptWithFileContent]: 분할된 두 프롬프트
+        """
+        middle = len(review_prompt.user_prompts) // 2
+        return [
+            ReviewPromptSharder._with_user_prompts(
+                review_prompt, review_prompt.user_prompts[:middle]
+            ),
+            ReviewPromptSharder._with_user_prompts(
+                review_prompt, review_prompt.user_prompts[middle:]
+            ),
+        ]
+
+    @staticmethod
+    def _with_user_prompts(
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent, user_prompts: list
+    ) -> ReviewPrompt | ReviewPromptWithFileContent:
+        """같은 시스템 프롬프트와 주어진 사용자 메시지로 새 프롬프트를 만듭니다."""
+        return type(review_prompt)(
+            system_prompt=review_prompt.system_prompt, user_prompts=user_prompts
+        )
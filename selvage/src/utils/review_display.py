@@ -2,7 +2,7 @@
 
 import threading
 import time
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
@@ -17,8 +17,16 @@ from rich.text import Text
 from selvage.src.utils.base_console import console
 
 if TYPE_CHECKING:
+    from selvage.src.batch import BatchSummary
     from selvage.src.model_config import ModelInfoDict
     from selvage.src.utils.token.models import EstimatedCost
+    from selvage.src.watch import WatchSession
+
+# 감시 모드 패널에 표시할 최대 이슈 수
+MAX_WATCH_PANEL_ISSUES = 20
+# 이슈 심각도별 표시 순서와 스타일
+SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2}
+SEVERITY_STYLES = {"error": "bold red", "warning": "yellow", "info": "cyan"}
 
 
 def _format_token_count(count: int) -> str:
@@ -117,6 +125,107 @@ class ReviewDisplay:
 
         self.console.print(panel)
 
+    def batch_summary(self, summary: "BatchSummary", summary_path: str) -> None:
+        """배치 리뷰 결과를 대상별 테이블로 출력합니다."""
+        table = Table(
+            title="[bold]배치 리뷰 결과[/bold]",
+            show_header=True,
+            header_style="bold magenta",
+            border_style="blue",
+        )
+        table.add_column("대상", style="cyan", no_wrap=True)
+        table.add_column("모델", style="green")
+        table.add_column("상태")
+        table.add_column("이슈", justify="right")
+        table.add_column("비용(USD)", style="yellow", justify="right")
+        table.add_column("소요(초)", justify="right")
+
+        for result in summary.results:
+            failed = result.status.value == "FAILED"
+            table.add_row(
+                result.target,
+                result.model,
+                "[red]실패[/red]" if failed else "[green]완료[/green]",
+                "-" if failed else str(result.issue_count),
+                f"{result.total_cost_usd:.4f}",
+                f"{result.elapsed_seconds:.1f}",
+            )
+
+        self.console.print(table)
+        self.console.print(
+            f"[bold]총 {len(summary.results)}건[/bold] "
+            f"(실패 {summary.failed_count}건), "
+            f"비용 [yellow]{summary.total_cost_usd:.4f} USD[/yellow]"
+        )
+        self.console.print(f"[dim]요약 저장: {_shorten_path(summary_path)}[/dim]")
+
+    def watch_panel(self, session: "WatchSession", backend: str) -> Panel:
+        """감시 모드의 현재 이슈와 상태를 Panel로 구성합니다."""
+        status = Text()
+        if session.reviewing_files:
+            status.append("리뷰 중: ", style="bold yellow")
+            status.append(", ".join(session.reviewing_files))
+        else:
+            status.append("대기 중", style="bold green")
+            status.append(" - 파일을 저장하면 바뀐 파일만 다시 리뷰합니다.", "dim")
+
+        issues = sorted(
+            session.issues,
+            key=lambda item: SEVERITY_ORDER.get(item[1].severity, len(SEVERITY_ORDER)),
+        )
+        table = Table(show_header=True, header_style="bold magenta", expand=True)
+        table.add_column("심각도", no_wrap=True)
+        table.add_column("위치", style="cyan", no_wrap=True)
+        table.add_column("설명", ratio=1)
+        for filename, issue in issues[:MAX_WATCH_PANEL_ISSUES]:
+            location = (
+                f"{filename}:{issue.line_number}" if issue.line_number else filename
+            )
+            table.add_row(
+                Text(issue.severity, style=SEVERITY_STYLES.get(issue.severity, "")),
+                location,
+                issue.description,
+            )
+        if len(issues) > MAX_WATCH_PANEL_ISSUES:
+            hidden_count = len(issues) - MAX_WATCH_PANEL_ISSUES
+            table.add_row("", "", f"[dim]외 {hidden_count}건[/dim]")
+
+        last_reviewed = (
+            session.last_reviewed_at.strftime("%H:%M:%S")
+            if session.last_reviewed_at
+            else "-"
+        )
+        footer = Text.from_markup(
+            f"[dim]리뷰 {session.review_count}회 · "
+            f"비용 [yellow]{session.total_cost.total_cost_usd:.4f} USD[/yellow] · "
+            f"마지막 리뷰 {last_reviewed} · Ctrl+C로 종료[/dim]"
+        )
+        parts = [status, Text("")]
+        if session.last_error:
+            parts.append(Text(f"리뷰 실패: {session.last_error}", style="bold red"))
+        parts.append(table if issues else Text("현재 이슈가 없습니다.", style="green"))
+        parts.extend([Text(""), footer])
+
+        return Panel(
+            Group(*parts),
+            title=f"[bold]Selvage 감시 모드[/bold] [dim]({session.model})[/dim]",
+            subtitle=f"[dim]{_shorten_path(session.repo_path)} · {backend}[/dim]",
+            border_style="blue",
+            padding=(1, 2),
+        )
+
+    @contextmanager
+    def watch_live(
+        self, session: "WatchSession", backend: str
+    ) -> Generator[Callable[[], None], None, None]:
+        """감시 모드 패널을 실시간으로 표시하고, 즉시 갱신하는 함수를 반환합니다."""
+        with Live(
+            get_renderable=lambda: self.watch_panel(session, backend),
+            refresh_per_second=4,
+            console=self.console,
+        ) as live:
+            yield live.refresh
+
     @contextmanager
     def progress_review(self, model: str) -> Generator[None, None, None]:
         """코드 리뷰 진행 상황을 통합된 Panel로 표시합니다."""
@@ -1,6 +1,17 @@
-from .cost_estimator import CostEstimator
+"""토큰 계산, 비용 추정, 리뷰 요청/응답 모델 패키지
+
+CostEstimator와 TokenUtils는 모델 설정과 토크나이저 관련 모듈을 불러오므로,
+리뷰 모델만 필요한 경우(CLI 시작, 리뷰 데몬 요청 전달 등)에 비용이 들지 않도록
+처음 사용할 때 불러옵니다.
+"""
+
+from typing import TYPE_CHECKING
+
 from .models import EstimatedCost, ReviewIssue, ReviewRequest, ReviewResponse
-from .token_utils import TokenUtils
+
+if TYPE_CHECKING:
+    from .cost_estimator import CostEstimator
+    from .token_utils import TokenUtils
 
 __all__ = [
     "TokenUtils",
@@ -10,3 +21,15 @@ __all__ = [
     "ReviewResponse",
     "EstimatedCost",
 ]
+
+
+def __getattr__(name: str) -> object:
+    if name == "CostEstimator":
+        from .cost_estimator import CostEstimator
+
+        return CostEstimator
+    if name == "TokenUtils":
+        from .token_utils import TokenUtils
+
+        return TokenUtils
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
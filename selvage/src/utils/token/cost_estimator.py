@@ -2,17 +2,21 @@
 LLM API 응답의 usage 정보를 기반으로 비용을 계산하는 모듈입니다.
 """
 
-from typing import TypedDict
+from __future__ import annotations
 
-import anthropic
-import openai
-from google.genai import types as genai_types
+from typing import TYPE_CHECKING, TypedDict
 
 from selvage.src.exceptions.unsupported_model_error import UnsupportedModelError
 from selvage.src.model_config import get_model_pricing
 from selvage.src.utils.base_console import console
 from selvage.src.utils.token.models import EstimatedCost
 
+if TYPE_CHECKING:
+    # SDK는 타입 검사에만 사용합니다 (CLI 시작 시 SDK를 불러오지 않도록).
+    import anthropic
+    import openai
+    from google.genai import types as genai_types
+
 
 # 모델 가격 정보 타입 정의
 class ModelPricing(TypedDict):
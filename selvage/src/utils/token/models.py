@@ -96,12 +96,18 @@ class ReviewIssue(BaseModel):
 
 
 class ReviewResponse(BaseModel):
-    """코드 리뷰 응답 모델"""
+    """코드 리뷰 응답 모델
+
+    `error`가 있으면 리뷰에 실패했거나(API 오류, 응답 파싱 실패, 빈 응답) 일부
+    파일만 리뷰된(분할 리뷰 중 일부 실패) 응답이므로, 캐시에 저장하거나 성공으로
+    기록하지 않습니다.
+    """
 
     issues: list[ReviewIssue] = Field(default_factory=list)
     summary: str
     score: float | None = None
     recommendations: list[str] = Field(default_factory=list)
+    error: str | None = None
 
     @staticmethod
     def from_structured_response(
@@ -133,6 +139,54 @@ class ReviewResponse(BaseModel):
             recommendations=structured_response.recommendations,
         )
 
+    @staticmethod
+    def merge(responses: list["ReviewResponse"]) -> "ReviewResponse":
+        """분할 리뷰의 응답들을 하나의 응답으로 병합합니다.
+
+        이슈와 권장사항은 순서대로 이어 붙이고(중복 권장사항 제거),
+        요약은 중복을 제거하여 줄바꿈으로 연결하며,
+        점수는 점수가 있는 응답들의 평균을 사용합니다.
+        실패한 응답이 하나라도 있으면 오류 메시지를 모아 `error`에 기록합니다.
+
+        Args:
+            responses: 병합할 응답 목록
+
+        Returns:
+            ReviewResponse: 병합된 응답 객체
+        """
+        if len(responses) == 1:
+            return responses[0]
+
+        issues = [issue for response in responses for issue in response.issues]
+        summary = "\n\n".join(
+            dict.fromkeys(
+                response.summary for response in responses if response.summary
+            )
+        )
+        scores = [
+            response.score for response in responses if response.score is not None
+        ]
+        score = round(sum(scores) / len(scores), 2) if scores else None
+        recommendations = list(
+            dict.fromkeys(
+                recommendation
+                for response in responses
+                for recommendation in response.recommendations
+            )
+        )
+
+        errors = list(
+            dict.fromkeys(response.error for response in responses if response.error)
+        )
+
+        return ReviewResponse(
+            issues=issues,
+            summary=summary,
+            score=score,
+            recommendations=recommendations,
+            error="\n".join(errors) if errors else None,
+        )
+
     @staticmethod
     def get_empty_response() -> "ReviewResponse":
         """비어있는 응답 객체를 생성합니다.
@@ -145,6 +199,7 @@ class ReviewResponse(BaseModel):
             issues=[],
             summary="LLM 응답이 비어있거나 불완전합니다.",
             recommendations=["다른 프롬프트나 모델을 사용해보세요."],
+            error="LLM 응답이 비어있거나 불완전합니다.",
         )
 
     @staticmethod
@@ -174,6 +229,7 @@ class ReviewResponse(BaseModel):
             issues=[],
             summary=f"LLM API 처리 중 오류 발생: {str(error)}",
             recommendations=["요청 내용을 줄이거나 다른 모델을 사용해보세요."],
+            error=str(error),
         )
 
 
@@ -190,6 +246,27 @@ class EstimatedCost(BaseModel):
         True  # API 응답이 성공했다면 컨텍스트 제한 내에서 처리된 것으로 간주
     )
 
+    @staticmethod
+    def merge(costs: list["EstimatedCost"], model: str) -> "EstimatedCost":
+        """여러 API 호출의 비용 정보를 합산합니다.
+
+        Args:
+            costs: 합산할 비용 정보 목록
+            model: 모델 이름
+
+        Returns:
+            EstimatedCost: 합산된 비용 정보
+        """
+        return EstimatedCost(
+            model=model,
+            input_tokens=sum(cost.input_tokens for cost in costs),
+            input_cost_usd=round(sum(cost.input_cost_usd for cost in costs), 6),
+            output_tokens=sum(cost.output_tokens for cost in costs),
+            output_cost_usd=round(sum(cost.output_cost_usd for cost in costs), 6),
+            total_cost_usd=round(sum(cost.total_cost_usd for cost in costs), 6),
+            within_context_limit=all(cost.within_context_limit for cost in costs),
+        )
+
     @staticmethod
     def get_zero_cost(model: str) -> "EstimatedCost":
         return EstimatedCost(
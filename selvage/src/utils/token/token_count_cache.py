@@ -0,0 +1,165 @@
+"""TokenCountCache: 프롬프트 구간별 토큰 수를 해시로 기억하는 캐시 모듈."""
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from selvage.src.utils.base_console import console
+
+# 메모리에 보관할 최대 구간 수 (초과 시 오래된 항목부터 제거)
+DEFAULT_MAX_ENTRIES = 20000
+TOKEN_COUNT_CACHE_VERSION = 1
+
+
+class TokenCountCache:
+    """프롬프트 구간(시스템 프롬프트, 사용자 메시지)별 토큰 수를 기억하는 클래스.
+
+    구간 텍스트의 SHA-256 해시와 모델, 계산 방식을 키로 사용하므로 재리뷰나
+    분할 판단 시 내용이 바뀐 구간만 다시 인코딩합니다. 키에 내용 해시만 저장하므로
+    파일로 저장해도 소스 코드가 남지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """TokenCountCache 초기화
+
+        Args:
+            max_entries: 보관할 최대 구간 수
+        """
+        self.max_entries = max_entries
+        self._counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(segment: str, model: str, method: str) -> str:
+        """구간 텍스트, 모델, 계산 방식으로 캐시 키를 생성합니다.
+
+        Args:
+            segment: 토큰 수를 계산할 구간 텍스트
+            model: 모델 이름
+            method: 토큰 계산 방식 이름 (예: "tiktoken", "estimate")
+
+        Returns:
+            str: SHA-256 해시 캐시 키
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{method}\0{model}\0".encode())
+        digest.update(segment.encode("utf-8"))
+        return digest.hexdigest()
+
+    def count(
+        self,
+        segment: str,
+        model: str,
+        method: str,
+        counter: Callable[[str, str], int],
+    ) -> int:
+        """구간의 토큰 수를 반환합니다. 캐시에 없으면 계산하여 저장합니다.
+
+        Args:
+            segment: 토큰 수를 계산할 구간 텍스트
+            model: 모델 이름
+            method: 토큰 계산 방식 이름 (캐시 키에 포함)
+            counter: (텍스트, 모델)을 받아 토큰 수를 반환하는 함수
+
+        Returns:
+            int: 구간의 토큰 수
+        """
+        key = self.make_key(segment, model, method)
+        with self._lock:
+            cached = self._counts.get(key)
+        if cached is not None:
+            return cached
+
+        token_count = counter(segment, model)
+        with self._lock:
+            self._counts[key] = token_count
+            while len(self._counts) > self.max_entries:
+                # dict는 삽입 순서를 유지하므로 첫 항목이 가장 오래된 항목입니다.
+                del self._counts[next(iter(self._counts))]
+        return token_count
+
+    def count_segments(
+        self,
+        segments: Iterable[str],
+        model: str,
+        method: str,
+        counter: Callable[[str, str], int],
+    ) -> int:
+        """여러 구간의 토큰 수 합계를 반환합니다.
+
+        Args:
+            segments: 토큰 수를 계산할 구간 텍스트들
+            model: 모델 이름
+            method: 토큰 계산 방식 이름 (캐시 키에 포함)
+            counter: (텍스트, 모델)을 받아 토큰 수를 반환하는 함수
+
+        Returns:
+            int: 구간별 토큰 수의 합계
+        """
+        return sum(
+            self.count(segment, model, method, counter) for segment in segments
+        )
+
+    def clear(self) -> None:
+        """캐시된 모든 토큰 수를 삭제합니다."""
+        with self._lock:
+            self._counts.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._counts)
+
+    def load(self, path: Path) -> None:
+        """파일에 저장된 토큰 수를 읽어 현재 캐시에 병합합니다.
+
+        파일이 없거나 형식이 맞지 않으면 무시합니다.
+
+        Args:
+            path: 토큰 수 캐시 파일 경로
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as e:
+            console.warning(f"토큰 수 캐시를 읽을 수 없습니다: {str(e)}")
+            return
+
+        if data.get("version") != TOKEN_COUNT_CACHE_VERSION:
+            return
+        counts = data.get("counts", {})
+        with self._lock:
+            for key, token_count in counts.items():
+                self._counts.setdefault(key, token_count)
+
+    def save(self, path: Path) -> None:
+        """현재 캐시를 파일에 저장합니다.
+
+        임시 파일에 기록한 뒤 교체하므로, 저장 도중 중단되어도 기존 파일이
+        손상되지 않습니다.
+
+        Args:
+            path: 토큰 수 캐시 파일 경로
+        """
+        with self._lock:
+            data = {
+                "version": TOKEN_COUNT_CACHE_VERSION,
+                "counts": dict(self._counts),
+            }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        except OSError as e:
+            console.warning(f"토큰 수 캐시를 저장할 수 없습니다: {str(e)}")
+
+
+# 프로세스 전역에서 공유하는 토큰 수 캐시
+token_count_cache = TokenCountCache()
@@ -1,17 +1,29 @@
+import math
 import typing
 from typing import TypedDict
 
-import tiktoken
-from google import genai
-
 from selvage.src.exceptions.token_count_error import TokenCountError
 from selvage.src.model_config import get_model_context_limit
 from selvage.src.models.model_provider import ModelProvider
+from selvage.src.models.token_count_policy import TokenCountPolicy
 from selvage.src.utils.base_console import console
+from selvage.src.utils.llm_client_registry import LLMClientRegistry
 from selvage.src.utils.prompts.models.review_prompt import ReviewPrompt
 from selvage.src.utils.prompts.models.review_prompt_with_file_content import (
     ReviewPromptWithFileContent,
 )
+from selvage.src.utils.token.token_count_cache import token_count_cache
+
+# Claude/Gemini 로컬 추정에 사용하는 토큰당 평균 ASCII 문자 수 (소스 코드 기준).
+# 비 ASCII 문자(한글 등)는 문자당 1토큰으로 계산합니다.
+LOCAL_ESTIMATE_CHARS_PER_TOKEN: dict[str, float] = {
+    "claude": 3.2,
+    "gemini": 3.6,
+}
+# 로컬 추정치에 곱하는 안전 여유 비율
+LOCAL_ESTIMATE_SAFETY_MARGIN = 1.1
+# AUTO 정책에서 추정치가 컨텍스트 제한의 이 비율 이상이면 원격으로 정확히 계산
+REMOTE_COUNT_THRESHOLD_RATIO = 0.8
 
 
 # 모델 가격 정보 타입 정의
@@ -25,110 +37,256 @@ class TokenUtils:
 
     @staticmethod
     def count_tokens(
-        review_prompt: ReviewPrompt | ReviewPromptWithFileContent, model: str = "gpt-4o"
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent,
+        model: str = "gpt-4o",
+        policy: TokenCountPolicy | None = None,
     ) -> int:
-        """텍스트의 토큰 수를 계산합니다.
+        """프롬프트의 입력 토큰 수를 계산합니다.
+
+        OpenAI 모델은 tiktoken으로 정확히 계산합니다. Claude/Gemini 모델은 정책에
+        따라 로컬 추정치 또는 프로바이더의 토큰 계산 API를 사용합니다.
 
         Args:
-            text: 토큰 수를 계산할 텍스트
+            review_prompt: 토큰 수를 계산할 리뷰 프롬프트
             model: 사용할 모델 이름
+            policy: 토큰 계산 정책. None이면 설정 파일의 기본값을 사용합니다.
 
         Returns:
             int: 토큰 수
         """
-        # Claude 모델인 경우 공식 API 사용
         if "claude" in model.lower():
-            try:
-                import anthropic
-
-                from selvage.src.config import get_api_key
-
-                api_key = get_api_key(ModelProvider.ANTHROPIC)
-                client = anthropic.Anthropic(api_key=api_key)
-
-                # 메시지 목록에서 시스템 메시지 분리
-                messages = review_prompt.to_messages()
-                system_message = None
-                user_messages = []
-
-                for msg in messages:
-                    if msg.get("role") == "system":
-                        system_message = msg.get("content", "")
-                    else:
-                        user_messages.append(msg)
-
-                # Anthropic API 호출 시 시스템 메시지는 별도 파라미터로 전달
-                kwargs = {
-                    "model": model,
-                    "messages": typing.cast(
-                        typing.Iterable[anthropic.types.MessageParam],
-                        user_messages,
-                    ),
-                }
-
-                # system 파라미터가 None이 아닌 경우에만 추가
-                if system_message is not None:
-                    kwargs["system"] = system_message
-
-                response = client.messages.count_tokens(**kwargs)
-
-                # 응답 처리 - 예상 응답 형식:
-                # {"content_tokens": 토큰수} 또는 유사한 구조
-                response_dict = (
-                    response.model_dump()
-                    if hasattr(response, "model_dump")
-                    else vars(response)
-                )
-
-                # 토큰 수를 포함할 수 있는 필드명들
-                token_field_names = [
-                    "token_count",
-                    "content_tokens",
-                    "input_tokens",
-                    "num_tokens",
-                    "tokens",
-                ]
-
-                # 응답에서 토큰 수를 추출
-                for field in token_field_names:
-                    if field in response_dict:
-                        return response_dict[field]
-
-                # 로그 기록 및 예외 처리
-                console.warning(f"응답에서 토큰 수를 찾을 수 없습니다: {response_dict}")
-                return 0
-            except Exception as e:
-                console.error(f"Claude 토큰 계산 중 오류 발생: {e}", exception=e)
-                raise TokenCountError(model, str(e), e) from e
+            count_remotely = TokenUtils._count_claude_tokens_remotely
+        elif "gemini" in model.lower():
+            count_remotely = TokenUtils._count_gemini_tokens_remotely
+        else:
+            # OpenAI 모델인 경우 tiktoken 사용 (구간별 계산 결과 재사용)
+            return token_count_cache.count_segments(
+                review_prompt.iter_text_segments(),
+                model,
+                "tiktoken",
+                TokenUtils.count_text_tokens_locally,
+            )
 
-        if "gemini" in model.lower():
-            try:
-                # API 키 가져오기 (기존 메커니즘 사용) - 지연 임포트
-                from selvage.src.config import get_api_key
-
-                api_key = get_api_key(ModelProvider.GOOGLE)
-
-                # Client 객체 생성
-                client = genai.Client(api_key=api_key)
-
-                # 사용 가능한 모델명으로 매핑
-                model_name = model.lower()
-                # 토큰 수 계산 (최신 API 사용)
-                text = review_prompt.to_combined_text()
-                response = client.models.count_tokens(model=model_name, contents=text)
-                # total_tokens가 None일 경우를 대비해 기본값 0을 제공
-                return (
-                    response.total_tokens
-                    if response
-                    and hasattr(response, "total_tokens")
-                    and response.total_tokens is not None
-                    else 0
-                )
-            except Exception as e:
-                console.error(f"Gemini 토큰 계산 중 오류 발생: {e}", exception=e)
-                raise TokenCountError(model, str(e), e) from e
+        if policy is None:
+            from selvage.src.config import get_default_token_count_policy
+
+            policy = get_default_token_count_policy()
+
+        if policy == TokenCountPolicy.REMOTE:
+            return count_remotely(review_prompt, model)
+
+        estimated_tokens = TokenUtils.estimate_tokens_locally(review_prompt, model)
+        if policy == TokenCountPolicy.LOCAL:
+            return estimated_tokens
+
+        # AUTO: 추정치가 컨텍스트 제한에 가까운 경우에만 원격으로 정확히 계산
+        context_limit = get_model_context_limit(model)
+        if estimated_tokens < context_limit * REMOTE_COUNT_THRESHOLD_RATIO:
+            return estimated_tokens
+        try:
+            return count_remotely(review_prompt, model)
+        except TokenCountError as e:
+            console.warning(
+                f"원격 토큰 계산에 실패하여 로컬 추정치를 사용합니다: {str(e)}"
+            )
+            return estimated_tokens
+
+    @staticmethod
+    def estimate_tokens_locally(
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent, model: str
+    ) -> int:
+        """네트워크 호출 없이 프롬프트의 토큰 수를 추정합니다.
+
+        Args:
+            review_prompt: 토큰 수를 추정할 리뷰 프롬프트
+            model: 사용할 모델 이름
+
+        Returns:
+            int: 추정 토큰 수
+        """
+        return token_count_cache.count_segments(
+            review_prompt.iter_text_segments(),
+            model,
+            "estimate",
+            TokenUtils.estimate_text_tokens,
+        )
+
+    @staticmethod
+    def estimate_segment_tokens(text: str, model: str) -> int:
+        """프롬프트 구간 하나의 토큰 수를 추정합니다. 같은 구간은 재계산하지 않습니다.
+
+        Args:
+            text: 토큰 수를 추정할 구간 텍스트 (시스템 프롬프트 또는 사용자 메시지)
+            model: 사용할 모델 이름
+
+        Returns:
+            int: 추정 토큰 수
+        """
+        return token_count_cache.count(
+            text, model, "estimate", TokenUtils.estimate_text_tokens
+        )
+
+    @staticmethod
+    def estimate_text_tokens(text: str, model: str) -> int:
+        """네트워크 호출 없이 텍스트의 토큰 수를 추정합니다.
+
+        Claude/Gemini 모델은 모델별로 보정한 문자-토큰 비율에 안전 여유분을 곱해
+        실제보다 약간 크게 추정합니다. 그 외 모델은 tiktoken으로 계산합니다.
+
+        Args:
+            text: 토큰 수를 추정할 텍스트
+            model: 사용할 모델 이름
+
+        Returns:
+            int: 추정 토큰 수
+        """
+        model_lower = model.lower()
+        chars_per_token = next(
+            (
+                ratio
+                for keyword, ratio in LOCAL_ESTIMATE_CHARS_PER_TOKEN.items()
+                if keyword in model_lower
+            ),
+            None,
+        )
+        if chars_per_token is None:
+            return TokenUtils.count_text_tokens_locally(text, model)
+
+        # UTF-8 추가 바이트 수로 비 ASCII 문자 수를 근사합니다 (한글은 3바이트).
+        non_ascii_chars = min(
+            (len(text.encode("utf-8")) - len(text) + 1) // 2, len(text)
+        )
+        ascii_chars = len(text) - non_ascii_chars
+        estimated = ascii_chars / chars_per_token + non_ascii_chars
+        return math.ceil(round(estimated * LOCAL_ESTIMATE_SAFETY_MARGIN, 6))
+
+    @staticmethod
+    def _count_claude_tokens_remotely(
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent, model: str
+    ) -> int:
+        """Anthropic 토큰 계산 API로 프롬프트의 토큰 수를 계산합니다.
+
+        Raises:
+            TokenCountError: API 호출 또는 응답 처리에 실패한 경우
+        """
+        try:
+            import anthropic
+
+            from selvage.src.config import get_api_key
+
+            api_key = get_api_key(ModelProvider.ANTHROPIC)
+            client = LLMClientRegistry.get_sdk_client(
+                ModelProvider.ANTHROPIC, api_key
+            )
+
+            # 메시지 목록에서 시스템 메시지 분리
+            messages = review_prompt.to_messages()
+            system_message = None
+            user_messages = []
+
+            for msg in messages:
+                if msg.get("role") == "system":
+                    system_message = msg.get("content", "")
+                else:
+                    user_messages.append(msg)
+
+            # Anthropic API 호출 시 시스템 메시지는 별도 파라미터로 전달
+            kwargs = {
+                "model": model,
+                "messages": typing.cast(
+                    typing.Iterable[anthropic.types.MessageParam],
+                    user_messages,
+                ),
+            }
+
+            # system 파라미터가 None이 아닌 경우에만 추가
+            if system_message is not None:
+                kwargs["system"] = system_message
+
+            response = client.messages.count_tokens(**kwargs)
+
+            # 응답 처리 - 예상 응답 형식:
+            # {"content_tokens": 토큰수} 또는 유사한 구조
+            response_dict = (
+                response.model_dump()
+                if hasattr(response, "model_dump")
+                else vars(response)
+            )
+
+            # 토큰 수를 포함할 수 있는 필드명들
+            token_field_names = [
+                "token_count",
+                "content_tokens",
+                "input_tokens",
+                "num_tokens",
+                "tokens",
+            ]
+
+            # 응답에서 토큰 수를 추출
+            for field in token_field_names:
+                if field in response_dict:
+                    return response_dict[field]
+
+            # 로그 기록 및 예외 처리
+            console.warning(f"응답에서 토큰 수를 찾을 수 없습니다: {response_dict}")
+            return 0
+        except Exception as e:
+            console.error(f"Claude 토큰 계산 중 오류 발생: {e}", exception=e)
+            raise TokenCountError(model, str(e), e) from e
+
+    @staticmethod
+    def _count_gemini_tokens_remotely(
+        review_prompt: ReviewPrompt | ReviewPromptWithFileContent, model: str
+    ) -> int:
+        """Gemini 토큰 계산 API로 프롬프트의 토큰 수를 계산합니다.
+
+        Raises:
+            TokenCountError: API 호출 또는 응답 처리에 실패한 경우
+        """
+        try:
+            # API 키 가져오기 (기존 메커니즘 사용) - 지연 임포트
+            from selvage.src.config import get_api_key
+
+            api_key = get_api_key(ModelProvider.GOOGLE)
+
+            # 공유 Client 객체 사용
+            client = LLMClientRegistry.get_sdk_client(ModelProvider.GOOGLE, api_key)
+
+            # 사용 가능한 모델명으로 매핑
+            model_name = model.lower()
+            # 토큰 수 계산 (최신 API 사용)
+            text = review_prompt.to_combined_text()
+            response = client.models.count_tokens(model=model_name, contents=text)
+            # total_tokens가 None일 경우를 대비해 기본값 0을 제공
+            return (
+                response.total_tokens
+                if response
+                and hasattr(response, "total_tokens")
+                and response.total_tokens is not None
+                else 0
+            )
+        except Exception as e:
+            console.error(f"Gemini 토큰 계산 중 오류 발생: {e}", exception=e)
+            raise TokenCountError(model, str(e), e) from e
+
+    @staticmethod
+    def count_text_tokens_locally(text: str, model: str = "gpt-4o") -> int:
+        """tiktoken으로 텍스트의 토큰 수를 로컬에서 계산합니다.
+
+        OpenAI 모델은 정확한 값이며, 그 외 모델에서는 근사치로 사용할 수 있습니다.
+
+        Args:
+            text: 토큰 수를 계산할 텍스트
+            model: 사용할 모델 이름 (tiktoken에 없으면 cl100k_base 인코딩 사용)
+
+        Returns:
+            int: 토큰 수
+
+        Raises:
+            TokenCountError: 인코딩을 불러오거나 텍스트를 인코딩할 수 없는 경우
+        """
+        import tiktoken
 
-        # OpenAI 모델인 경우 tiktoken 사용
         try:
             encoding = tiktoken.encoding_for_model(model)
         except KeyError:
@@ -139,7 +297,6 @@ class TokenUtils:
                 console.error(f"OpenAI 토큰 계산 중 오류 발생: {e}", exception=e)
                 raise TokenCountError(model, f"Tiktoken 인코딩 오류: {e}", e) from e
 
-        text = review_prompt.to_combined_text()
         try:
             return len(encoding.encode(text))
         except Exception as e:
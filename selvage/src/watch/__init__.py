@@ -0,0 +1,12 @@
+"""작업 트리를 감시하며 저장할 때마다 바뀐 파일만 다시 리뷰하는 감시 모드 모듈"""
+
+from .change_debouncer import ChangeDebouncer
+from .file_watcher import FileWatcher, is_watchdog_available
+from .watch_session import WatchSession
+
+__all__ = [
+    "ChangeDebouncer",
+    "FileWatcher",
+    "WatchSession",
+    "is_watchdog_available",
+]
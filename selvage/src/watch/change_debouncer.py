@@ -0,0 +1,60 @@
+"""ChangeDebouncer: 연달아 발생하는 파일 변경 이벤트를 묶어 주는 모듈."""
+
+import threading
+import time
+
+from selvage.src.config import DEFAULT_DEBOUNCE_SECONDS
+
+
+class ChangeDebouncer:
+    """파일 변경 이벤트를 모아 변경이 잠잠해지면 한 번에 넘겨주는 클래스.
+
+    에디터는 저장 한 번에 여러 이벤트(임시 파일 기록, 이름 변경 등)를 발생시키고,
+    여러 파일을 연달아 저장하기도 합니다. `add`는 감시 스레드에서, `wait`은 리뷰를
+    수행하는 스레드에서 호출합니다.
+    """
+
+    def __init__(self, quiet_seconds: float = DEFAULT_DEBOUNCE_SECONDS) -> None:
+        """ChangeDebouncer 초기화
+
+        Args:
+            quiet_seconds: 마지막 변경 이후 기다릴 시간(초)
+
+        Raises:
+            ValueError: quiet_seconds가 음수인 경우
+        """
+        if quiet_seconds < 0:
+            raise ValueError(f"quiet_seconds는 0 이상이어야 합니다: {quiet_seconds}")
+        self.quiet_seconds = quiet_seconds
+        self._paths: set[str] = set()
+        self._last_change = 0.0
+        self._condition = threading.Condition()
+
+    def add(self, path: str) -> None:
+        """변경된 파일 경로를 추가합니다."""
+        with self._condition:
+            self._paths.add(path)
+            self._last_change = time.monotonic()
+            self._condition.notify_all()
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """변경이 잠잠해질 때까지 기다린 뒤 모인 경로를 반환하고 비웁니다.
+
+        Args:
+            timeout: 첫 변경을 기다릴 최대 시간(초). None이면 변경이 생길 때까지
+                기다립니다.
+
+        Returns:
+            set[str]: 변경된 파일 경로. timeout 동안 변경이 없으면 빈 집합
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._paths, timeout):
+                return set()
+            while True:
+                remaining = self._last_change + self.quiet_seconds - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            paths = self._paths
+            self._paths = set()
+            return paths
@@ -0,0 +1,169 @@
+"""FileWatcher: 작업 트리의 파일 변경을 감지하는 모듈.
+
+`watchdog` 패키지가 설치되어 있으면 운영체제의 파일 시스템 알림(Linux inotify,
+macOS FSEvents 등)을 사용하고, 없으면 Git이 추적하는 파일의 수정 시각을 주기적으로
+확인합니다.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import subprocess
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from selvage.src.utils.base_console import console
+
+if TYPE_CHECKING:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers.api import BaseObserver
+
+# watchdog이 없을 때 파일 수정 시각을 확인하는 주기(초)
+DEFAULT_POLL_INTERVAL_SECONDS = 1.0
+
+ChangeCallback = Callable[[str], None]
+
+
+def is_watchdog_available() -> bool:
+    """운영체제 파일 시스템 알림을 사용할 수 있는지 반환합니다.
+
+    watchdog은 선택 의존성입니다 (pip install selvage[watch]).
+    """
+    return importlib.util.find_spec("watchdog") is not None
+
+
+class FileWatcher:
+    """저장소 작업 트리의 파일 변경을 감지해 콜백을 호출하는 클래스.
+
+    콜백은 변경된 파일의 절대 경로를 받으며 감시 스레드에서 호출됩니다.
+    `.git` 디렉토리 안의 변경과 디렉토리 이벤트는 전달하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        on_change: ChangeCallback,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        use_polling: bool = False,
+    ) -> None:
+        """FileWatcher 초기화
+
+        Args:
+            root: 감시할 저장소 루트
+            on_change: 변경된 파일의 절대 경로를 받는 콜백
+            poll_interval: 폴링 방식의 확인 주기(초)
+            use_polling: True이면 watchdog이 있어도 폴링 방식 사용
+        """
+        self.root = root.resolve()
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.backend = (
+            "watchdog" if is_watchdog_available() and not use_polling else "polling"
+        )
+        self._observer: BaseObserver | None = None
+        self._poll_thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        """감시를 시작합니다."""
+        if self.backend == "watchdog":
+            # 감시를 시작할 때만 필요하므로 런타임에 임포트합니다.
+            from watchdog.observers import Observer
+
+            self._observer = Observer()
+            self._observer.schedule(
+                _create_watchdog_handler(self._notify), str(self.root), recursive=True
+            )
+            self._observer.start()
+            return
+
+        # 시작 시점의 상태를 기준으로 이후 변경만 알립니다.
+        snapshot = self._snapshot()
+        self._poll_thread = threading.Thread(
+            target=self._poll, args=(snapshot,), daemon=True
+        )
+        self._poll_thread.start()
+
+    def stop(self) -> None:
+        """감시를 멈추고 감시 스레드가 끝날 때까지 기다립니다."""
+        self._stop_event.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        if self._poll_thread is not None:
+            self._poll_thread.join()
+            self._poll_thread = None
+
+    def _notify(self, path: str) -> None:
+        """감시 대상 파일이면 콜백을 호출합니다."""
+        try:
+            relative = Path(path).resolve().relative_to(self.root)
+        except ValueError:
+            return
+        if ".git" in relative.parts:
+            return
+        self.on_change(str(self.root / relative))
+
+    def _poll(self, snapshot: dict[str, tuple[int, int]]) -> None:
+        """주기적으로 파일 상태를 비교해 바뀐 파일을 알립니다."""
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._snapshot()
+            for path in snapshot.keys() | current.keys():
+                if snapshot.get(path) != current.get(path):
+                    self._notify(path)
+            snapshot = current
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """Git이 추적하거나 무시하지 않는 파일의 수정 시각과 크기를 조회합니다."""
+        try:
+            result = subprocess.run(  # noqa: S603
+                [  # noqa: S607
+                    "git",
+                    "-C",
+                    str(self.root),
+                    "ls-files",
+                    "-z",
+                    "--cached",
+                    "--others",
+                    "--exclude-standard",
+                ],
+                capture_output=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            console.log_info(f"감시할 파일 목록을 가져오지 못했습니다: {str(e)}")
+            return {}
+
+        snapshot: dict[str, tuple[int, int]] = {}
+        for name in result.stdout.decode("utf-8", errors="replace").split("\0"):
+            if not name:
+                continue
+            path = os.path.join(self.root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def _create_watchdog_handler(notify: ChangeCallback) -> FileSystemEventHandler:
+    """watchdog 이벤트를 FileWatcher에 전달하는 처리기를 만듭니다."""
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+
+    class _WatchdogHandler(FileSystemEventHandler):
+        def on_any_event(self, event: FileSystemEvent) -> None:
+            if event.is_directory or event.event_type in ("opened", "closed_no_write"):
+                return
+            notify(event.src_path)
+            # 에디터가 임시 파일을 원래 이름으로 바꿔 저장하는 경우.
+            # watchdog 4 미만에서는 이동 이벤트에만 dest_path가 있습니다.
+            dest_path = getattr(event, "dest_path", "")
+            if dest_path:
+                notify(dest_path)
+
+    return _WatchdogHandler()
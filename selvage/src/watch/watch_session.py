@@ -0,0 +1,243 @@
+"""WatchSession: 저장할 때마다 바뀐 파일만 다시 리뷰하는 감시 세션 모듈."""
+
+import hashlib
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+
+from selvage.src.config import DEFAULT_FILE_LOAD_WORKERS
+from selvage.src.diff_parser import DiffResult, parse_git_diff
+from selvage.src.diff_parser.models.file_diff import FileDiff
+from selvage.src.utils.base_console import console
+from selvage.src.utils.file_utils import is_ignore_file
+from selvage.src.utils.git_utils import GitDiffMode, GitDiffUtility
+from selvage.src.utils.token.models import (
+    EstimatedCost,
+    ReviewIssue,
+    ReviewRequest,
+    ReviewResponse,
+)
+
+WatchReviewFunction = Callable[[ReviewRequest], tuple[ReviewResponse, EstimatedCost]]
+
+
+class WatchSession:
+    """작업 트리 변경사항의 현재 리뷰 이슈를 파일별로 유지하는 세션.
+
+    파일마다 마지막으로 리뷰한 hunk의 서명을 기억해 두고, 저장된 파일 중 hunk가
+    달라진 파일만 모아 `review_fn`으로 리뷰합니다. 변경이 모두 되돌려진 파일은
+    이슈 목록에서 제외합니다. 실제 리뷰(파일별 캐시 재사용 포함)는 생성자로 받은
+    `review_fn`이 수행합니다.
+    """
+
+    def __init__(
+        self,
+        repo_path: str,
+        model: str,
+        review_fn: WatchReviewFunction,
+        diff_only: bool = False,
+        file_load_workers: int = DEFAULT_FILE_LOAD_WORKERS,
+    ) -> None:
+        """WatchSession 초기화
+
+        Args:
+            repo_path: Git 저장소 루트 경로
+            model: 리뷰에 사용할 모델 이름
+            review_fn: 리뷰 요청 하나를 처리하고 응답과 비용을 반환하는 함수
+            diff_only: 변경된 부분만 분석할지 여부
+            file_load_workers: 전체 파일 내용을 동시에 읽을 최대 스레드 수
+        """
+        self.repo_path = str(Path(repo_path).resolve())
+        self.model = model
+        self.review_fn = review_fn
+        self.diff_only = diff_only
+        self.file_load_workers = file_load_workers
+        self.issues_by_file: dict[str, list[ReviewIssue]] = {}
+        self.reviewing_files: list[str] = []
+        self.review_count = 0
+        self.total_cost = EstimatedCost.get_zero_cost(model)
+        self.last_reviewed_at: datetime | None = None
+        self.last_error: str | None = None
+        self._signatures: dict[str, str] = {}
+
+    @property
+    def issues(self) -> list[tuple[str, ReviewIssue]]:
+        """현재 남아 있는 모든 이슈를 (파일 이름, 이슈) 목록으로 반환합니다.
+
+        패널 갱신 스레드에서도 호출하므로 파일별 목록을 한 번에 복사해 사용합니다.
+        """
+        return [
+            (filename, issue)
+            for filename, file_issues in sorted(self.issues_by_file.items())
+            for issue in file_issues
+        ]
+
+    def review_all(self) -> None:
+        """작업 트리의 모든 변경사항을 기준으로 상태를 맞추고 리뷰합니다."""
+        diff_content = self._get_diff(None)
+        diff_result = self._parse_diff(diff_content)
+        current = {file.filename for file in diff_result.files}
+        for filename in set(self._signatures) - current:
+            self._forget(filename)
+        self._review_changed(diff_result, diff_content)
+
+    def review_paths(self, paths: Iterable[str]) -> None:
+        """저장된 파일 중 마지막 리뷰 이후 hunk가 달라진 파일만 리뷰합니다.
+
+        Args:
+            paths: 변경된 파일 경로 (절대 경로 또는 저장소 루트 기준 경로)
+        """
+        relative_paths = sorted(
+            {
+                relative
+                for path in paths
+                if (relative := self._relative_path(path)) is not None
+            }
+        )
+        if not relative_paths:
+            return
+        diff_content = self._get_diff(relative_paths)
+        diff_result = self._parse_diff(diff_content)
+        current = {file.filename for file in diff_result.files}
+        # 변경이 모두 되돌려진 파일은 더 이상 리뷰 대상이 아닙니다.
+        for filename in set(relative_paths) - current:
+            self._forget(filename)
+        self._review_changed(diff_result, diff_content)
+
+    def _review_changed(self, diff_result: DiffResult, diff_content: str) -> None:
+        """서명이 달라진 파일만 골라 리뷰하고 상태를 갱신합니다.
+
+        Args:
+            diff_result: 저장된 파일들의 파싱된 diff
+            diff_content: diff_result의 원본 diff
+        """
+        signatures = {
+            file.filename: self._signature(file) for file in diff_result.files
+        }
+        changed_files = [
+            file
+            for file in diff_result.files
+            if self._signatures.get(file.filename) != signatures[file.filename]
+        ]
+        # 무시 대상 파일만 바뀌었으면 리뷰하지 않고 서명만 기록합니다.
+        for file in changed_files:
+            if is_ignore_file(file.filename):
+                self._signatures[file.filename] = signatures[file.filename]
+                self.issues_by_file.pop(file.filename, None)
+        changed_files = [
+            file for file in changed_files if not is_ignore_file(file.filename)
+        ]
+        if not changed_files:
+            return
+
+        changed_names = [file.filename for file in changed_files]
+        if len(changed_files) != len(diff_result.files):
+            # 바뀐 파일만의 diff를 다시 가져와 리뷰 요청과 캐시 키를 맞춥니다.
+            diff_content = self._get_diff(changed_names)
+        review_request = ReviewRequest(
+            diff_content=diff_content,
+            processed_diff=DiffResult(files=changed_files),
+            file_paths=changed_names,
+            use_full_context=not self.diff_only,
+            model=self.model,
+            repo_path=self.repo_path,
+        )
+
+        self.reviewing_files = changed_names
+        try:
+            review_response, estimated_cost = self.review_fn(review_request)
+        except Exception as e:
+            # 서명을 갱신하지 않으므로 다음에 저장하면 다시 리뷰합니다.
+            self.last_error = str(e)
+            console.log_info(f"감시 모드 리뷰 실패: {str(e)}")
+            return
+        finally:
+            self.reviewing_files = []
+
+        self.total_cost = EstimatedCost.merge(
+            [self.total_cost, estimated_cost], self.model
+        )
+        if review_response.error:
+            # 실패하거나 비어 있는 응답도 예외와 같이 서명을 갱신하지 않습니다.
+            self.last_error = review_response.error
+            console.log_info(f"감시 모드 리뷰 실패: {review_response.error}")
+            return
+
+        issues_by_file = self._group_issues(changed_names, review_response.issues)
+        for filename in changed_names:
+            self._signatures[filename] = signatures[filename]
+            self.issues_by_file[filename] = issues_by_file[filename]
+        self.review_count += 1
+        self.last_reviewed_at = datetime.now()
+        self.last_error = None
+
+    def _forget(self, filename: str) -> None:
+        """파일의 서명과 이슈를 지웁니다."""
+        self._signatures.pop(filename, None)
+        self.issues_by_file.pop(filename, None)
+
+    def _relative_path(self, path: str) -> str | None:
+        """경로를 저장소 루트 기준 경로로 바꿉니다. 저장소 밖이면 None."""
+        candidate = Path(path)
+        if not candidate.is_absolute():
+            return candidate.as_posix()
+        try:
+            return candidate.resolve().relative_to(self.repo_path).as_posix()
+        except ValueError:
+            return None
+
+    def _get_diff(self, paths: list[str] | None) -> str:
+        """작업 트리의 diff를 가져옵니다. paths가 주어지면 해당 파일만 가져옵니다."""
+        git_diff = GitDiffUtility(
+            repo_path=self.repo_path, mode=GitDiffMode.UNSTAGED, paths=paths
+        )
+        return git_diff.get_diff()
+
+    def _parse_diff(self, diff_content: str) -> DiffResult:
+        """diff를 파싱합니다. 변경 사항이 없으면 빈 결과를 반환합니다."""
+        if not diff_content:
+            return DiffResult(files=[])
+        return parse_git_diff(
+            diff_content,
+            not self.diff_only,
+            self.repo_path,
+            max_workers=self.file_load_workers,
+        )
+
+    @staticmethod
+    def _signature(file_diff: FileDiff) -> str:
+        """파일 hunk의 위치와 내용으로 서명을 만듭니다."""
+        digest = hashlib.sha256()
+        for hunk in file_diff.hunks:
+            digest.update(f"{hunk.start_line_modified}\n{hunk.content}\0".encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def _group_issues(
+        filenames: list[str], issues: list[ReviewIssue]
+    ) -> dict[str, list[ReviewIssue]]:
+        """이슈를 파일별로 나눕니다.
+
+        경로가 정확히 일치하지 않으면 경로 끝부분이 일치하는 파일로 분류하고,
+        파일을 특정할 수 없는 이슈는 함께 리뷰한 첫 파일에 포함합니다.
+        """
+        issues_by_file: dict[str, list[ReviewIssue]] = {
+            filename: [] for filename in filenames
+        }
+        for issue in issues:
+            issue_file = (issue.file or "").strip().removeprefix("./")
+            if issue_file in issues_by_file:
+                issues_by_file[issue_file].append(issue)
+                continue
+            candidates = [
+                filename
+                for filename in filenames
+                if issue_file
+                and (
+                    filename.endswith(f"/{issue_file}")
+                    or issue_file.endswith(f"/{filename}")
+                )
+            ]
+            target = candidates[0] if len(candidates) == 1 else filenames[0]
+            issues_by_file[target].append(issue)
+        return issues_by_file
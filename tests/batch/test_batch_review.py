@@ -0,0 +1,155 @@
+"""배치 리뷰 대상 파싱, 동시 실행 제한, 작업 실행에 대한 테스트"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from selvage.cli import batch_review_code
+from selvage.src.batch import (
+    BatchJob,
+    BatchRunner,
+    BatchTarget,
+    BatchTargetResult,
+    ProviderConcurrencyLimiter,
+)
+from selvage.src.models import ReviewStatus
+from selvage.src.models.model_provider import ModelProvider
+from selvage.src.utils.token.models import EstimatedCost, ReviewResponse
+
+
+@pytest.mark.parametrize(
+    ("spec", "diff_range", "revision"),
+    [
+        ("abc1234", "abc1234^..abc1234", "abc1234"),
+        ("main..feature", "main..feature", "feature"),
+        ("main...feature", "main...feature", "feature"),
+        ("v1.0..", "v1.0..", "HEAD"),
+    ],
+)
+def test_parse_target(spec, diff_range, revision):
+    """단일 리비전과 리비전 범위를 diff 범위와 파일 내용 리비전으로 바꾸는지 테스트"""
+    target = BatchTarget.parse(spec)
+
+    assert (target.diff_range, target.revision) == (diff_range, revision)
+
+
+@pytest.mark.parametrize("spec", ["", "  ", "--output=/tmp/x", "main feature"])
+def test_parse_target_rejects_invalid_spec(spec):
+    """빈 대상이나 git 옵션처럼 보이는 대상을 거부하는지 테스트"""
+    with pytest.raises(ValueError):
+        BatchTarget.parse(spec)
+
+
+def test_load_specs_skips_comments_and_blank_lines(tmp_path):
+    """대상 파일의 주석과 빈 줄을 무시하는지 테스트"""
+    targets_file = tmp_path / "targets.txt"
+    targets_file.write_text("# 야간 점검\nabc1234\n\n  main..feature  \n")
+
+    assert BatchTarget.load_specs(targets_file) == ["abc1234", "main..feature"]
+
+
+def test_limiter_rejects_invalid_limit():
+    """1보다 작은 동시 요청 수 한도를 거부하는지 테스트"""
+    with pytest.raises(ValueError):
+        ProviderConcurrencyLimiter(0)
+    with pytest.raises(ValueError):
+        ProviderConcurrencyLimiter(2, {ModelProvider.OPENAI: 0})
+
+
+def make_jobs(count: int, provider: ModelProvider, model: str) -> list[BatchJob]:
+    return [
+        BatchJob(target=f"commit-{i}", model=model, provider=provider, payload=i)
+        for i in range(count)
+    ]
+
+
+def test_runner_respects_provider_limits():
+    """프로바이더별 동시 실행 수 한도를 지키는지 테스트"""
+    lock = threading.Lock()
+    running: dict[ModelProvider, int] = {}
+    peak: dict[ModelProvider, int] = {}
+
+    def review_fn(job: BatchJob) -> BatchTargetResult:
+        with lock:
+            running[job.provider] = running.get(job.provider, 0) + 1
+            peak[job.provider] = max(peak.get(job.provider, 0), running[job.provider])
+        time.sleep(0.02)
+        with lock:
+            running[job.provider] -= 1
+        return BatchTargetResult(
+            target=job.target, model=job.model, status=ReviewStatus.SUCCESS
+        )
+
+    jobs = make_jobs(6, ModelProvider.OPENAI, "gpt-4o") + make_jobs(
+        6, ModelProvider.ANTHROPIC, "claude-sonnet-4"
+    )
+    limiter = ProviderConcurrencyLimiter(1, {ModelProvider.ANTHROPIC: 2})
+
+    results = BatchRunner(review_fn, limiter, concurrency=8).run(jobs)
+
+    assert [(r.target, r.model) for r in results] == [
+        (job.target, job.model) for job in jobs
+    ]
+    assert peak == {ModelProvider.OPENAI: 1, ModelProvider.ANTHROPIC: 2}
+
+
+def test_runner_isolates_failures():
+    """한 작업이 실패해도 나머지 작업을 계속 수행하고 실패를 기록하는지 테스트"""
+
+    def review_fn(job: BatchJob) -> BatchTargetResult:
+        if job.payload == 1:
+            raise RuntimeError("API 오류")
+        return BatchTargetResult(
+            target=job.target,
+            model=job.model,
+            status=ReviewStatus.SUCCESS,
+            issue_count=job.payload,
+        )
+
+    jobs = make_jobs(3, ModelProvider.OPENAI, "gpt-4o")
+    results = BatchRunner(review_fn, ProviderConcurrencyLimiter(2)).run(jobs)
+
+    assert [r.status for r in results] == [
+        ReviewStatus.SUCCESS,
+        ReviewStatus.FAILED,
+        ReviewStatus.SUCCESS,
+    ]
+    assert results[1].error == "API 오류"
+    assert results[2].issue_count == 2
+    assert all(r.elapsed_seconds >= 0 for r in results)
+
+
+def test_batch_marks_error_result_as_failed(tmp_path):
+    """게이트웨이가 오류 응답을 반환한 작업을 실패로 집계하는지 테스트"""
+    target = BatchTarget.parse("abc1234")
+    job = BatchJob(
+        target=target.spec,
+        model="gpt-4o",
+        provider=ModelProvider.OPENAI,
+        payload=None,
+    )
+    error_response = ReviewResponse.get_error_response(ValueError("응답 파싱 실패"))
+
+    with (
+        patch("selvage.cli._check_api_key", return_value=True),
+        patch("selvage.cli._create_cache_manager", return_value=MagicMock()),
+        patch("selvage.cli._build_batch_jobs", return_value=([job], [])),
+        patch("selvage.src.llm_gateway.gateway_factory.GatewayFactory.create"),
+        patch(
+            "selvage.cli._execute_review",
+            return_value=(
+                error_response,
+                EstimatedCost.get_zero_cost("gpt-4o"),
+                str(tmp_path / "review_log.json"),
+            ),
+        ),
+        patch("selvage.cli._save_batch_summary", return_value=tmp_path),
+        patch("selvage.src.utils.review_display.review_display.batch_summary"),
+    ):
+        summary = batch_review_code([target], ["gpt-4o"], repo_path=str(tmp_path))
+
+    assert summary is not None
+    assert summary.failed_count == 1
+    assert summary.results[0].error == error_response.error
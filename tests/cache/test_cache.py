@@ -6,6 +6,8 @@ import pytest
 
 from selvage.src.cache import CacheKeyGenerator, CacheKeyInfo, CacheManager
 from selvage.src.diff_parser.models.diff_result import DiffResult
+from selvage.src.diff_parser.models.file_diff import FileDiff
+from selvage.src.diff_parser.models.hunk import Hunk
 from selvage.src.utils.token.models import EstimatedCost, ReviewRequest, ReviewResponse
 
 
@@ -119,3 +121,543 @@ def test_cache_key_different_for_different_inputs():
     cache_key_2 = CacheKeyGenerator.generate_cache_key(cache_info_2)
     
     assert cache_key_1 != cache_key_2
+
+
+def test_token_counts_persist_next_to_review_cache(
+    cache_manager_fixture: CacheManager,
+):
+    """구간별 토큰 수가 리뷰 캐시 옆에 저장되고 만료 정리 후에도 남는지 테스트합니다."""
+    from selvage.src.utils.token.token_count_cache import token_count_cache
+
+    token_count_cache.count("segment", "gpt-4o", "tiktoken", lambda *_: 3)
+    cache_manager_fixture.save_token_counts()
+    cache_manager_fixture.cleanup_expired_cache()
+
+    token_file = cache_manager_fixture.token_count_file
+    assert token_file.exists()
+    assert token_file.parent.parent == cache_manager_fixture.cache_dir
+
+    cache_manager_fixture.clear_cache()
+    assert not token_file.exists()
+    assert len(token_count_cache) == 0
+
+
+def test_sqlite_cache_store_expiry_and_compression(tmp_path):
+    """SQLite 캐시 저장소가 압축 저장하고 만료 항목을 일괄 삭제하는지 테스트합니다."""
+    import sqlite3
+
+    from selvage.src.cache import SQLiteCacheStore
+
+    store = SQLiteCacheStore(tmp_path / "review_cache.sqlite3")
+    payload = b'{"summary": "' + b"a" * 1000 + b'"}'
+    store.put("fresh", payload, created_at=0.0, expires_at=200.0)
+    store.put("stale", payload, created_at=0.0, expires_at=50.0)
+
+    assert store.get("fresh", now=100.0) == payload
+    assert store.get("stale", now=100.0) is None
+    assert store.delete_expired(now=100.0) == 1
+    assert len(store) == 1
+
+    with sqlite3.connect(tmp_path / "review_cache.sqlite3") as conn:
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        stored_size = conn.execute(
+            "SELECT length(payload) FROM review_cache"
+        ).fetchone()[0]
+    assert journal_mode == "wal"
+    assert stored_size < len(payload)
+
+    assert store.clear() == 1
+    assert store.get("fresh", now=100.0) is None
+
+
+def test_cleanup_removes_expired_and_legacy_entries(
+    cache_manager_fixture: CacheManager,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """만료 정리가 만료 항목과 이전 버전의 JSON 캐시 파일을 삭제하는지 테스트합니다."""
+    legacy_file = cache_manager_fixture.cache_dir / "legacy_cache_key.json"
+    legacy_file.write_text("{}", encoding="utf-8")
+    cache_manager_fixture.cache_ttl_hours = -1
+    cache_manager_fixture.save_review_to_cache(
+        review_request_fixture, review_response_fixture
+    )
+
+    cache_manager_fixture.cleanup_expired_cache()
+
+    assert not legacy_file.exists()
+    assert len(cache_manager_fixture._store) == 0
+    assert cache_manager_fixture.get_cached_review(review_request_fixture) is None
+
+
+def test_sqlite_cache_store_evicts_least_recently_used(tmp_path):
+    """용량 제한을 넘으면 가장 오래 사용하지 않은 항목부터 제거하는지 테스트합니다."""
+    from selvage.src.cache import SQLiteCacheStore
+
+    store = SQLiteCacheStore(tmp_path / "review_cache.sqlite3")
+    for index, cache_key in enumerate(["a", "b", "c"]):
+        store.put(cache_key, b"payload", created_at=float(index), expires_at=1000.0)
+    # "a"를 조회하여 최근 사용 항목으로 만듭니다.
+    assert store.get("a", now=10.0) == b"payload"
+
+    assert store.evict(max_entries=2) == 1
+    assert store.get("b", now=11.0) is None
+    assert store.get("a", now=12.0) == b"payload"
+    assert store.get("c", now=13.0) == b"payload"
+
+    entry_bytes = store.total_bytes() // 2
+    assert store.evict(max_bytes=entry_bytes) == 1
+    assert store.get("a", now=14.0) is None
+    assert store.get("c", now=15.0) == b"payload"
+    assert store.evict() == 0
+
+
+def test_save_review_applies_capacity_limit(
+    cache_manager_fixture: CacheManager,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """캐시 저장 시 최대 항목 수를 넘는 오래된 항목이 제거되는지 테스트합니다."""
+    cache_manager_fixture.max_entries = 1
+    other_request = review_request_fixture.model_copy(
+        update={"diff_content": "other diff content"}
+    )
+
+    cache_manager_fixture.save_review_to_cache(
+        review_request_fixture, review_response_fixture
+    )
+    cache_manager_fixture.save_review_to_cache(other_request, review_response_fixture)
+
+    assert len(cache_manager_fixture._store) == 1
+    assert cache_manager_fixture.get_cached_review(review_request_fixture) is None
+    assert cache_manager_fixture.get_cached_review(other_request) is not None
+
+
+def _file_diff(filename: str, content: str) -> FileDiff:
+    """파일별 캐시 테스트용 FileDiff를 생성합니다."""
+    return FileDiff(
+        filename=filename,
+        file_content=content,
+        hunks=[Hunk.from_hunk_text(f"@@ -1,1 +1,1 @@\n-old\n+{content}")],
+        language="python",
+    )
+
+
+@pytest.fixture
+def multi_file_request() -> ReviewRequest:
+    """두 파일을 변경한 리뷰 요청 픽스처"""
+    return ReviewRequest(
+        diff_content="two file diff",
+        processed_diff=DiffResult(
+            files=[_file_diff("src/a.py", "a = 1"), _file_diff("src/b.py", "b = 1")]
+        ),
+        file_paths=["src/a.py", "src/b.py"],
+        use_full_context=True,
+        model="gpt-4o",
+        repo_path="/test",
+    )
+
+
+def test_file_review_cache_reuses_unchanged_files(
+    cache_manager_fixture: CacheManager, multi_file_request: ReviewRequest
+):
+    """변경되지 않은 파일의 이슈만 파일별 캐시에서 재사용하는지 테스트합니다."""
+    from selvage.src.utils.token.models import ReviewIssue
+
+    review_response = ReviewResponse(
+        summary="요약",
+        issues=[
+            ReviewIssue(type="bug", file="src/a.py", description="a 이슈"),
+            ReviewIssue(type="bug", file="b.py", description="b 이슈"),
+        ],
+    )
+    cache_manager_fixture.save_file_reviews_to_cache(
+        multi_file_request, review_response
+    )
+
+    changed_request = multi_file_request.model_copy(deep=True)
+    changed_request.processed_diff.files[1] = _file_diff("src/b.py", "b = 2")
+    cached = cache_manager_fixture.get_cached_file_reviews(changed_request)
+
+    assert list(cached) == ["src/a.py"]
+    assert [issue.description for issue in cached["src/a.py"].issues] == ["a 이슈"]
+    # 다른 파일에 대한 내용일 수 있는 요약과 권장사항은 저장하지 않습니다.
+    assert cached["src/a.py"].summary == ""
+    assert cached["src/a.py"].recommendations == []
+
+
+def test_file_review_cache_skips_unattributed_issues(
+    cache_manager_fixture: CacheManager, multi_file_request: ReviewRequest
+):
+    """파일을 특정할 수 없는 이슈가 있으면 파일별 캐시를 건너뛰는지 테스트합니다."""
+    from selvage.src.utils.token.models import ReviewIssue
+
+    review_response = ReviewResponse(
+        summary="요약",
+        issues=[ReviewIssue(type="design", file=None, description="전체 이슈")],
+    )
+    cache_manager_fixture.save_file_reviews_to_cache(
+        multi_file_request, review_response
+    )
+
+    assert cache_manager_fixture.get_cached_file_reviews(multi_file_request) == {}
+
+
+def test_incremental_review_sends_only_changed_files(
+    cache_manager_fixture: CacheManager, multi_file_request: ReviewRequest
+):
+    """파일별 캐시에 없는 파일만 LLM에 보내고 결과를 병합하는지 테스트합니다."""
+    from unittest.mock import patch
+
+    from selvage.cli import _perform_incremental_review
+    from selvage.src.utils.token.models import ReviewIssue
+
+    cache_manager_fixture.save_file_reviews_to_cache(
+        multi_file_request,
+        ReviewResponse(
+            summary="이전 요약",
+            issues=[ReviewIssue(type="bug", file="src/a.py", description="a 이슈")],
+            recommendations=["b.py에 대한 이전 권장사항"],
+        ),
+    )
+    changed_request = multi_file_request.model_copy(deep=True)
+    changed_request.processed_diff.files[1] = _file_diff("src/b.py", "b = 2")
+    new_response = ReviewResponse(
+        summary="새 요약",
+        issues=[ReviewIssue(type="bug", file="src/b.py", description="b 이슈")],
+    )
+    new_cost = EstimatedCost.get_zero_cost("gpt-4o")
+
+    with patch(
+        "selvage.cli._perform_new_review", return_value=(new_response, new_cost)
+    ) as mock_review:
+        response, cost, reviewed_request = _perform_incremental_review(
+            changed_request, cache_manager_fixture, "log-id"
+        )
+
+    sent_request = mock_review.call_args.args[0]
+    assert [file.filename for file in sent_request.processed_diff.files] == [
+        "src/b.py"
+    ]
+    assert reviewed_request is sent_request
+    assert cost is new_cost
+    assert [issue.description for issue in response.issues] == ["b 이슈", "a 이슈"]
+    assert response.summary == "새 요약"
+    assert response.recommendations == []
+
+
+def test_failed_review_is_not_cached(
+    cache_manager_fixture: CacheManager, multi_file_request: ReviewRequest
+):
+    """게이트웨이가 오류 결과를 반환하면 캐시에 저장하지 않는지 테스트합니다."""
+    from unittest.mock import MagicMock, patch
+
+    from selvage.cli import _execute_review
+    from selvage.src.models import ReviewStatus
+    from selvage.src.models.review_result import ReviewResult
+
+    llm_gateway = MagicMock()
+    llm_gateway.review_code.return_value = ReviewResult.get_error_result(
+        ValueError("응답 파싱 실패"), "gpt-4o"
+    )
+
+    with patch("selvage.cli.save_review_log", return_value="log.json") as mock_log:
+        response, _, _ = _execute_review(
+            multi_file_request,
+            cache_manager_fixture,
+            llm_gateway=llm_gateway,
+            show_progress=False,
+        )
+
+    assert response.error == "응답 파싱 실패"
+    assert mock_log.call_args.args[3] == ReviewStatus.FAILED
+    assert cache_manager_fixture.get_cached_review(multi_file_request) is None
+    assert cache_manager_fixture.get_cached_file_reviews(multi_file_request) == {}
+
+
+REBASE_DIFF_BEFORE = """diff --git a/app.py b/app.py
+index 1a2b3c4..5d6e7f8 100644
+--- a/app.py
++++ b/app.py
+@@ -10,3 +10,4 @@ def main():
+ print('a')
++print('b')
+ 
+@@ -30,2 +31,3 @@ def other():
+ x = 1
++y = 2
+"""
+
+REBASE_DIFF_AFTER = """diff --git a/app.py b/app.py
+index 9f8e7d6..0a1b2c3 100644
+--- a/app.py
++++ b/app.py
+@@ -15,3 +15,4 @@ def main():
+ print('a')
++print('b')
+ 
+@@ -35,2 +36,3 @@ def other():
+ x = 1
++y = 2
+"""
+
+
+def test_cache_key_ignores_blob_ids_and_hunk_offsets():
+    """blob id와 파일 전체가 밀린 hunk 위치가 캐시 키에 영향이 없는지 테스트합니다."""
+    key_before = CacheKeyGenerator.generate_cache_key(
+        CacheKeyInfo(
+            diff_content=REBASE_DIFF_BEFORE, model="gpt-4o", use_full_context=True
+        )
+    )
+    key_after = CacheKeyGenerator.generate_cache_key(
+        CacheKeyInfo(
+            diff_content=REBASE_DIFF_AFTER, model="gpt-4o", use_full_context=True
+        )
+    )
+
+    assert key_before == key_after
+    canonical = CacheKeyGenerator.canonicalize_diff(REBASE_DIFF_BEFORE)
+    assert "index " not in canonical
+    assert "@@ -0,3 +0,4 @@\n" in canonical
+    assert "@@ -20,2 +21,3 @@\n" in canonical
+
+
+def test_cache_key_keeps_relative_hunk_distance():
+    """hunk 사이의 상대 위치가 바뀌면 다른 캐시 키가 생성되는지 테스트합니다."""
+    moved_diff = REBASE_DIFF_BEFORE.replace("@@ -30,2 +31,3 @@", "@@ -40,2 +41,3 @@")
+
+    assert CacheKeyGenerator.canonicalize_diff(
+        moved_diff
+    ) != CacheKeyGenerator.canonicalize_diff(REBASE_DIFF_BEFORE)
+
+
+def test_canonicalize_diff_ignores_whitespace_context_optionally():
+    """옵션을 켠 경우에만 공백 컨텍스트 차이를 무시하는지 테스트합니다."""
+    padded_diff = REBASE_DIFF_BEFORE.replace(" print('a')\n", " print('a')   \n")
+
+    assert CacheKeyGenerator.canonicalize_diff(
+        padded_diff
+    ) != CacheKeyGenerator.canonicalize_diff(REBASE_DIFF_BEFORE)
+    assert CacheKeyGenerator.canonicalize_diff(
+        padded_diff, ignore_whitespace_context=True
+    ) == CacheKeyGenerator.canonicalize_diff(
+        REBASE_DIFF_BEFORE, ignore_whitespace_context=True
+    )
+    assert "\n \n" not in CacheKeyGenerator.canonicalize_diff(
+        REBASE_DIFF_BEFORE, ignore_whitespace_context=True
+    )
+
+
+def test_shared_cache_dir_uses_rollback_journal(
+    tmp_path,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """지정한 공유 캐시 디렉토리에서는 WAL 대신 롤백 저널을 사용하는지 테스트합니다."""
+    import sqlite3
+
+    from selvage.src.cache.cache_manager import CACHE_DB_FILENAME
+
+    shared_dir = tmp_path / "shared-cache"
+    writer = CacheManager(cache_dir=shared_dir)
+    writer.save_review_to_cache(review_request_fixture, review_response_fixture)
+    reader = CacheManager(cache_dir=shared_dir)
+
+    assert reader.get_cached_review(review_request_fixture) is not None
+    with sqlite3.connect(shared_dir / CACHE_DB_FILENAME) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert not (shared_dir / f"{CACHE_DB_FILENAME}-wal").exists()
+
+
+def test_cleanup_skipped_while_another_process_holds_lock(
+    tmp_path,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """다른 프로세스가 잠금을 잡고 있으면 만료 정리를 건너뛰는지 테스트합니다."""
+    from selvage.src.cache.cache_manager import CACHE_LOCK_FILENAME
+    from selvage.src.utils.file_lock import FileLock
+
+    cache_manager = CacheManager(cache_ttl_hours=-1, cache_dir=tmp_path)
+    cache_manager.save_review_to_cache(review_request_fixture, review_response_fixture)
+
+    with FileLock(tmp_path / CACHE_LOCK_FILENAME):
+        cache_manager.cleanup_expired_cache()
+        assert len(cache_manager._store) == 1
+
+    cache_manager.cleanup_expired_cache()
+    assert len(cache_manager._store) == 0
+
+
+def test_cache_dir_env_var_takes_precedence(monkeypatch, tmp_path):
+    """SELVAGE_CACHE_DIR 환경변수가 설정 파일보다 우선하는지 테스트합니다."""
+    from selvage.src.config import CACHE_DIR_ENV_VAR, get_default_cache_dir
+
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path / "env-cache"))
+
+    assert get_default_cache_dir() == tmp_path / "env-cache"
+
+
+SERVER_TOKEN = "test-token"  # noqa: S105
+
+
+@pytest.fixture
+def cache_server(tmp_path):
+    """임시 디렉토리를 사용하는 캐시 서버를 별도 스레드에서 실행합니다."""
+    import threading
+
+    from selvage.src.cache.cache_server import CacheServer
+
+    server = CacheServer(
+        ("127.0.0.1", 0), tmp_path / "server", ttl_hours=1, token=SERVER_TOKEN
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _server_url(server) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def _cache_entry_payload(cache_key: str) -> bytes:
+    """캐시 서버에 저장할 수 있는 CacheEntry JSON을 만듭니다."""
+    from datetime import datetime, timedelta
+
+    from selvage.src.cache.models import CacheEntry
+
+    now = datetime.now()
+    return CacheEntry(
+        cache_key=cache_key,
+        created_at=now,
+        expires_at=now + timedelta(hours=1),
+        request_info={},
+        review_response=ReviewResponse(summary="cached"),
+    ).model_dump_json().encode("utf-8")
+
+
+def _put_raw(server, cache_key: str, body: bytes, content_length: str) -> int:
+    """Content-Length를 직접 지정해 PUT 요청을 보내고 상태 코드를 반환합니다."""
+    import http.client
+
+    host, port = server.server_address[:2]
+    conn = http.client.HTTPConnection(host, port, timeout=5)
+    try:
+        conn.putrequest("PUT", f"/v1/cache/{cache_key}")
+        conn.putheader("Authorization", f"Bearer {SERVER_TOKEN}")
+        conn.putheader("Content-Length", content_length)
+        conn.endheaders(body)
+        return conn.getresponse().status
+    finally:
+        conn.close()
+
+
+def test_cache_server_rejects_invalid_uploads(cache_server):
+    """음수 길이, 캐시 항목이 아닌 본문, 키가 다른 항목을 거부하는지 테스트합니다."""
+    cache_key = "b" * 64
+    other_payload = _cache_entry_payload("c" * 64)
+
+    assert _put_raw(cache_server, cache_key, b"", "-1") == 400
+    assert _put_raw(cache_server, cache_key, b'{"cached": true}', "16") == 400
+    assert (
+        _put_raw(cache_server, cache_key, other_payload, str(len(other_payload)))
+        == 400
+    )
+    assert cache_server.store.get(cache_key, 0) is None
+
+
+def test_http_cache_backend_round_trip(cache_server):
+    """HTTP 백엔드로 저장한 항목을 다시 조회할 수 있는지 테스트합니다."""
+    import time
+
+    from selvage.src.cache import HttpCacheBackend
+
+    backend = HttpCacheBackend(_server_url(cache_server), token=SERVER_TOKEN)
+    cache_key = "a" * 64
+    payload = _cache_entry_payload(cache_key)
+
+    assert backend.get(cache_key) is None
+    backend.put(cache_key, payload, expires_at=time.time() + 60)
+    assert backend.get(cache_key) == payload
+
+    unauthorized = HttpCacheBackend(
+        _server_url(cache_server), token=SERVER_TOKEN + "-wrong"
+    )
+    assert unauthorized.get(cache_key) is None
+
+
+def test_http_cache_backend_rejects_entry_for_other_key(cache_server):
+    """저장소가 다른 키의 항목이나 캐시 항목이 아닌 데이터를 주면 무시하는지 테스트"""
+    import time
+
+    from selvage.src.cache import HttpCacheBackend
+
+    backend = HttpCacheBackend(_server_url(cache_server), token=SERVER_TOKEN)
+    cache_key = "a" * 64
+    invalid_key = "d" * 64
+    # 참조 서버는 이런 항목을 받지 않으므로 저장소에 직접 넣습니다.
+    now = time.time()
+    cache_server.store.put(
+        cache_key, _cache_entry_payload("c" * 64), created_at=now, expires_at=now + 60
+    )
+    cache_server.store.put(
+        invalid_key, b'{"cached": true}', created_at=now, expires_at=now + 60
+    )
+
+    assert backend.get(cache_key) is None
+    assert backend.get(invalid_key) is None
+    assert backend._available is True
+
+
+def test_remote_cache_fills_local_l1(
+    tmp_path,
+    cache_server,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """다른 러너가 저장한 원격 캐시를 조회하고 로컬 캐시에 채우는지 테스트합니다."""
+    from selvage.src.cache import HttpCacheBackend
+
+    writer = CacheManager(
+        cache_dir=tmp_path / "runner-1",
+        remote_backend=HttpCacheBackend(_server_url(cache_server), token=SERVER_TOKEN),
+    )
+    writer.save_review_to_cache(review_request_fixture, review_response_fixture)
+
+    reader = CacheManager(
+        cache_dir=tmp_path / "runner-2",
+        remote_backend=HttpCacheBackend(_server_url(cache_server), token=SERVER_TOKEN),
+    )
+    assert len(reader._store) == 0
+
+    cached_result = reader.get_cached_review(review_request_fixture)
+
+    assert cached_result is not None
+    assert cached_result[0].summary == "Test review summary"
+    assert len(reader._store) == 1
+
+
+def test_unreachable_remote_cache_falls_back_to_local(
+    tmp_path,
+    review_request_fixture: ReviewRequest,
+    review_response_fixture: ReviewResponse,
+):
+    """원격 캐시 서버에 연결할 수 없으면 로컬 캐시만 사용하는지 테스트합니다."""
+    import socket
+
+    from selvage.src.cache import HttpCacheBackend
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        unused_port = sock.getsockname()[1]
+    backend = HttpCacheBackend(f"http://127.0.0.1:{unused_port}", timeout=0.5)
+    cache_manager = CacheManager(cache_dir=tmp_path, remote_backend=backend)
+
+    assert cache_manager.get_cached_review(review_request_fixture) is None
+    cache_manager.save_review_to_cache(review_request_fixture, review_response_fixture)
+
+    assert backend._available is False
+    assert cache_manager.get_cached_review(review_request_fixture) is not None
@@ -0,0 +1,177 @@
+"""리뷰 데몬 서버와 클라이언트에 대한 테스트"""
+
+import json
+import socket
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from selvage.__version__ import __version__
+from selvage.cli import _review_via_daemon
+from selvage.src.daemon import (
+    DaemonReviewRequest,
+    DaemonReviewResult,
+    ReviewDaemon,
+    ReviewDaemonClient,
+)
+from selvage.src.exceptions import DaemonReviewError, DaemonUnavailableError
+from selvage.src.utils.file_utils import find_project_root
+from selvage.src.utils.review_display import review_display
+from selvage.src.utils.token.models import EstimatedCost
+
+TOKEN = "test-token"  # noqa: S105
+
+
+def fake_review(request: DaemonReviewRequest) -> DaemonReviewResult:
+    if request.model == "broken":
+        raise RuntimeError("리뷰 실패")
+    if request.diff == "":
+        return DaemonReviewResult(model=request.model)
+    return DaemonReviewResult(
+        model=request.model,
+        log_path=f"{request.repo_path}/log.json.gz",
+        estimated_cost=EstimatedCost.get_zero_cost(request.model),
+        issue_count=3,
+    )
+
+
+@pytest.fixture(params=["unix", "tcp"])
+def daemon(request, tmp_path):
+    if request.param == "unix" and not hasattr(socket, "AF_UNIX"):
+        pytest.skip("Unix 소켓을 지원하지 않는 플랫폼")
+    socket_path = tmp_path / "daemon.sock" if request.param == "unix" else None
+    review_daemon = ReviewDaemon(fake_review, TOKEN, socket_path=socket_path)
+    thread = threading.Thread(target=review_daemon.serve_forever, daemon=True)
+    thread.start()
+    yield review_daemon
+    review_daemon.shutdown()
+    review_daemon.server_close()
+    thread.join()
+
+
+def test_review_roundtrip(daemon):
+    """데몬이 리뷰 요청을 처리하고 결과를 반환하는지 테스트"""
+    client = ReviewDaemonClient(daemon.url, TOKEN)
+
+    data = client.review({"model": "gpt-4o", "repo_path": "/repo", "diff": "d"})
+
+    result = DaemonReviewResult.model_validate(data)
+    assert result.log_path == "/repo/log.json.gz"
+    assert result.issue_count == 3
+    assert client.health()["version"] == __version__
+
+
+def test_review_errors(daemon):
+    """리뷰 실패와 잘못된 요청을 DaemonReviewError로 알리는지 테스트"""
+    client = ReviewDaemonClient(daemon.url, TOKEN)
+
+    with pytest.raises(DaemonReviewError, match="리뷰 실패") as exc_info:
+        client.review({"model": "broken", "repo_path": "/repo"})
+    assert exc_info.value.status == 500
+
+    with pytest.raises(DaemonReviewError) as exc_info:
+        client.review({"repo_path": "/repo"})
+    assert exc_info.value.status == 400
+
+
+def test_rejects_negative_content_length(daemon):
+    """음수 Content-Length 요청을 본문을 읽지 않고 거부하는지 테스트"""
+    conn = ReviewDaemonClient(daemon.url, TOKEN)._connection()
+    conn.timeout = 5
+    try:
+        conn.putrequest("POST", "/v1/review")
+        conn.putheader("Authorization", f"Bearer {TOKEN}")
+        conn.putheader("Content-Length", "-1")
+        conn.endheaders()
+        response = conn.getresponse()
+        assert response.status == 400
+    finally:
+        conn.close()
+
+
+def test_rejects_wrong_token_and_version(daemon):
+    """토큰이나 버전이 다르면 데몬을 사용할 수 없다고 알리는지 테스트"""
+    with pytest.raises(DaemonUnavailableError):
+        ReviewDaemonClient(daemon.url, "wrong-token").health()
+
+    with (
+        patch.dict(
+            "selvage.src.daemon.daemon_client.__dict__", {"__version__": "0.0.0"}
+        ),
+        pytest.raises(DaemonUnavailableError, match="버전"),
+    ):
+        ReviewDaemonClient(daemon.url, TOKEN).health()
+
+
+def test_unreachable_daemon_is_unavailable(tmp_path):
+    """데몬이 없으면 연결 단계에서 DaemonUnavailableError가 발생하는지 테스트"""
+    with pytest.raises(DaemonUnavailableError):
+        ReviewDaemonClient(f"unix:{tmp_path / 'missing.sock'}", TOKEN).health()
+
+
+def test_discover_reads_info_file(tmp_path, monkeypatch):
+    """데몬이 기록한 정보 파일로 클라이언트를 만드는지 테스트"""
+    monkeypatch.delenv("SELVAGE_DAEMON_URL", raising=False)
+    assert ReviewDaemonClient.discover(tmp_path) is None
+
+    review_daemon = ReviewDaemon(fake_review, TOKEN)
+    try:
+        info_path = ReviewDaemonClient.info_path(tmp_path)
+        review_daemon.write_info(info_path)
+
+        client = ReviewDaemonClient.discover(tmp_path)
+        assert (client.url, client.token) == (review_daemon.url, TOKEN)
+        assert info_path.stat().st_mode & 0o077 == 0
+        assert json.loads(info_path.read_text())["version"] == __version__
+
+        review_daemon.remove_info(info_path)
+        assert not info_path.exists()
+    finally:
+        review_daemon.server_close()
+
+
+def test_review_via_daemon_falls_back_when_unavailable(tmp_path):
+    """데몬에 연결할 수 없으면 직접 리뷰하도록 False를 반환하는지 테스트"""
+    client = ReviewDaemonClient(f"unix:{tmp_path / 'missing.sock'}", TOKEN)
+
+    assert _review_via_daemon(client, model="gpt-4o") is False
+
+
+@pytest.fixture
+def project_root_cache():
+    """현재 디렉토리를 바꾸는 테스트 전후로 프로젝트 루트 캐시를 비웁니다."""
+    find_project_root.cache_clear()
+    yield
+    find_project_root.cache_clear()
+
+
+@pytest.mark.usefixtures("project_root_cache")
+def test_review_via_daemon_sends_absolute_repo_path(daemon, tmp_path, monkeypatch):
+    """상대 저장소 경로를 절대 경로로 바꿔 데몬에 전달하는지 테스트"""
+    (tmp_path / ".git").mkdir()
+    monkeypatch.chdir(tmp_path)
+    client = ReviewDaemonClient(daemon.url, TOKEN)
+
+    with patch.object(review_display, "review_complete") as review_complete:
+        assert _review_via_daemon(client, model="gpt-4o", repo_path=".") is True
+
+    log_path = review_complete.call_args.kwargs["log_path"]
+    assert Path(log_path).parent == tmp_path.resolve()
+
+
+@pytest.mark.usefixtures("project_root_cache")
+def test_review_via_daemon_sends_project_root(daemon, tmp_path, monkeypatch):
+    """하위 디렉토리에서 실행해도 직접 리뷰와 같은 프로젝트 루트를 전달하는지 테스트"""
+    (tmp_path / ".git").mkdir()
+    subdir = tmp_path / "src" / "pkg"
+    subdir.mkdir(parents=True)
+    monkeypatch.chdir(subdir)
+    client = ReviewDaemonClient(daemon.url, TOKEN)
+
+    with patch.object(review_display, "review_complete") as review_complete:
+        assert _review_via_daemon(client, model="gpt-4o", repo_path=".") is True
+
+    log_path = review_complete.call_args.kwargs["log_path"]
+    assert Path(log_path).parent == tmp_path.resolve()
@@ -0,0 +1,189 @@
+"""ReviewLogCodec 압축 저장과 파일 내용 중복 제거에 대한 테스트"""
+
+import copy
+import gzip
+import json
+
+import pytest
+
+from selvage.src.diff_parser.models.diff_result import DiffResult
+from selvage.src.diff_parser.models.file_diff import FileDiff
+from selvage.src.diff_parser.models.hunk import Hunk
+from selvage.src.review_log import BlobStore, ReviewLogCodec
+from selvage.src.review_log.blob_store import BLOB_DIR_NAME
+from selvage.src.utils.prompts.models import SystemPrompt
+from selvage.src.utils.prompts.models.review_prompt_with_file_content import (
+    ReviewPromptWithFileContent,
+)
+from selvage.src.utils.prompts.models.user_prompt_with_file_content import (
+    UserPromptWithFileContent,
+)
+from selvage.src.utils.token.models import ReviewRequest
+
+FILE_CONTENT = "def hello():\n    return '안녕하세요'\n" * 200
+LOG_NAME = "20240101_120000_gpt-4o_review_log"
+HUNK_TEXT = "@@ -1,2 +1,2 @@\n def hello():\n-    return 'hi'\n+    return '안녕하세요'"
+
+
+@pytest.fixture
+def review_log() -> dict:
+    """save_review_log와 같은 구조의 전체 컨텍스트 리뷰 로그"""
+    hunk = Hunk.from_hunk_text(HUNK_TEXT)
+    prompt = ReviewPromptWithFileContent(
+        system_prompt=SystemPrompt(role="system", content="코드를 리뷰하세요."),
+        user_prompts=[
+            UserPromptWithFileContent(
+                file_name="hello.py",
+                file_content=FILE_CONTENT,
+                hunks=[hunk],
+                language="python",
+            )
+        ],
+    )
+    review_request = ReviewRequest(
+        diff_content=HUNK_TEXT,
+        processed_diff=DiffResult(
+            files=[
+                FileDiff(filename="hello.py", file_content=FILE_CONTENT, hunks=[hunk]),
+                FileDiff(filename="deleted.py", file_content=None),
+            ]
+        ),
+        model="gpt-4o",
+        repo_path="/repo",
+    )
+    return {
+        "id": "openai-gpt-4o-1700000000",
+        "model": {"provider": "openai", "name": "gpt-4o"},
+        "created_at": "2024-01-01T12:00:00",
+        "prompt": prompt.to_messages(),
+        "review_request": review_request.model_dump(mode="json"),
+        "review_response": None,
+        "status": "SUCCESS",
+        "error": None,
+        "prompt_version": "v2",
+    }
+
+
+def test_write_and_read_roundtrip(tmp_path, review_log):
+    """압축 저장한 리뷰 로그를 읽으면 원본과 같은지 테스트"""
+    file_path = ReviewLogCodec.write(tmp_path / LOG_NAME, review_log)
+
+    assert file_path.name.startswith(f"{LOG_NAME}.json.")
+    assert ReviewLogCodec.is_review_log_file(file_path)
+    assert ReviewLogCodec.read(file_path) == review_log
+
+
+def test_write_stores_file_content_once(tmp_path, review_log):
+    """prompt와 processed_diff에 중복된 파일 내용을 blob 하나로 저장하는지 테스트"""
+    stored: list[str] = []
+    deduplicated = ReviewLogCodec.deduplicate_file_contents(
+        review_log, lambda content: stored.append(content) or "digest"
+    )
+
+    assert stored == [FILE_CONTENT]
+    serialized = json.dumps(deduplicated, ensure_ascii=False)
+    assert FILE_CONTENT[:40] not in serialized
+    assert serialized.count("digest") == 2
+    # 원본 리뷰 로그는 변경되지 않아야 합니다.
+    assert (
+        review_log["review_request"]["processed_diff"]["files"][0]["file_content"]
+        == FILE_CONTENT
+    )
+
+    file_path = ReviewLogCodec.write(tmp_path / "review_log", review_log)
+    uncompressed_size = len(json.dumps(review_log, ensure_ascii=False, indent=2))
+    assert file_path.stat().st_size < uncompressed_size / 10
+    assert len(list((tmp_path / BLOB_DIR_NAME).rglob("*"))) == 2  # 하위 디렉토리 + blob
+
+
+def test_logs_share_blobs_across_runs(tmp_path, review_log):
+    """같은 파일 내용을 가진 여러 리뷰 로그가 blob을 공유하는지 테스트"""
+    blob_store = BlobStore(tmp_path / BLOB_DIR_NAME)
+    first = ReviewLogCodec.write(tmp_path / "first_review_log", review_log, blob_store)
+    second = ReviewLogCodec.write(
+        tmp_path / "second_review_log", review_log, blob_store
+    )
+
+    blob_files = [p for p in blob_store.root.rglob("*") if p.is_file()]
+    assert len(blob_files) == 1
+    assert ReviewLogCodec.read(first) == review_log
+    assert ReviewLogCodec.read(second) == review_log
+
+
+def test_read_without_rehydrate_skips_blobs(tmp_path, review_log):
+    """rehydrate=False로 읽으면 blob 없이 리뷰 결과를 볼 수 있는지 테스트"""
+    file_path = ReviewLogCodec.write(tmp_path / LOG_NAME, review_log)
+    for blob_file in (tmp_path / BLOB_DIR_NAME).rglob("*"):
+        if blob_file.is_file():
+            blob_file.unlink()
+
+    lazy_log = ReviewLogCodec.read(file_path, rehydrate=False)
+
+    assert lazy_log["status"] == "SUCCESS"
+    with pytest.raises(FileNotFoundError):
+        ReviewLogCodec.rehydrate(file_path, lazy_log)
+
+
+def test_prune_blobs_keeps_only_referenced_blobs(tmp_path, review_log):
+    """삭제된 로그만 참조하던 blob을 지우고 남은 로그의 blob은 유지하는지 테스트"""
+    kept = ReviewLogCodec.write(tmp_path / "kept_review_log", review_log)
+    other_log = copy.deepcopy(review_log)
+    other_log["review_request"]["processed_diff"]["files"][0]["file_content"] = "x"
+    ReviewLogCodec.write(tmp_path / "deleted_review_log", other_log).unlink()
+    blob_store = BlobStore(tmp_path / BLOB_DIR_NAME)
+    assert BlobStore.digest("x") in blob_store
+
+    # 최근에 저장한 blob은 유예 기간 동안 남겨 둡니다.
+    assert ReviewLogCodec.prune_blobs(tmp_path) == 0
+
+    assert ReviewLogCodec.prune_blobs(tmp_path, grace_seconds=0) == 1
+    assert BlobStore.digest("x") not in blob_store
+    assert ReviewLogCodec.read(kept) == review_log
+
+
+def test_read_inline_blob_log(tmp_path, review_log):
+    """로그 안에 blobs 표를 둔 형식 버전 2 로그를 읽는지 테스트"""
+    blobs: dict[str, str] = {}
+
+    def store_inline(content: str) -> str:
+        digest = BlobStore.digest(content)
+        blobs[digest] = content
+        return digest
+
+    deduplicated = ReviewLogCodec.deduplicate_file_contents(review_log, store_inline)
+    file_path = tmp_path / f"{LOG_NAME}.json.gz"
+    file_path.write_bytes(
+        gzip.compress(
+            json.dumps({**deduplicated, "log_format": 2, "blobs": blobs}).encode()
+        )
+    )
+
+    assert ReviewLogCodec.read(file_path) == review_log
+
+
+def test_read_legacy_uncompressed_log(tmp_path, review_log):
+    """압축하지 않은 이전 형식의 리뷰 로그를 그대로 읽는지 테스트"""
+    file_path = tmp_path / f"{LOG_NAME}.json"
+    file_path.write_text(
+        json.dumps(review_log, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+
+    assert ReviewLogCodec.read(file_path) == review_log
+
+
+@pytest.mark.parametrize("suffix", [".json", ".json.gz", ".json.zst"])
+def test_strip_suffix(suffix):
+    """리뷰 로그 확장자를 제거하는지 테스트"""
+    assert ReviewLogCodec.strip_suffix(f"{LOG_NAME}{suffix}") == LOG_NAME
+    assert ReviewLogCodec.strip_suffix("notes.txt") == "notes.txt"
+
+
+def test_write_does_not_overwrite_existing_log(tmp_path, review_log):
+    """같은 이름으로 저장하면 기존 로그를 덮어쓰지 않고 번호를 붙이는지 테스트"""
+    first = ReviewLogCodec.write(tmp_path / LOG_NAME, review_log)
+    second = ReviewLogCodec.write(tmp_path / LOG_NAME, {**review_log, "id": "second"})
+
+    assert first != second
+    assert ReviewLogCodec.strip_suffix(second.name) == f"{LOG_NAME}_1"
+    assert ReviewLogCodec.read(first)["id"] == review_log["id"]
+    assert ReviewLogCodec.read(second)["id"] == "second"
@@ -0,0 +1,136 @@
+"""ReviewLogIndex 목록 조회와 필터링에 대한 테스트"""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from selvage.cli import save_review_log
+from selvage.src.diff_parser.models.diff_result import DiffResult
+from selvage.src.models import ReviewStatus
+from selvage.src.review_log import ReviewLogCodec, ReviewLogIndex, ReviewLogIndexEntry
+from selvage.src.utils.token.models import (
+    EstimatedCost,
+    ReviewIssue,
+    ReviewRequest,
+    ReviewResponse,
+)
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def make_entry(index: int, model: str, status: str) -> ReviewLogIndexEntry:
+    return ReviewLogIndexEntry(
+        log_id=f"log-{index}",
+        created_at=BASE_TIME + timedelta(days=index),
+        provider="openai",
+        model=model,
+        status=status,
+        total_cost_usd=0.01 * index,
+        file_count=index,
+        issue_count=index * 2,
+        file_name=f"log_{index}_review_log.json.gz",
+        size_bytes=1024,
+    )
+
+
+@pytest.fixture
+def index(tmp_path) -> ReviewLogIndex:
+    review_log_index = ReviewLogIndex(tmp_path)
+    review_log_index.add(
+        [
+            make_entry(i, "gpt-4o" if i % 2 else "claude-sonnet-4", status)
+            for i, status in enumerate(["SUCCESS", "FAILED", "SUCCESS", "SUCCESS"])
+        ]
+    )
+    return review_log_index
+
+
+def test_query_sorts_and_paginates(index):
+    """생성 시각 순 정렬과 페이지 나누기를 지원하는지 테스트"""
+    first_page = index.query(limit=3)
+    second_page = index.query(limit=3, offset=3)
+    oldest_first = index.query(newest_first=False, limit=1)
+
+    assert [entry.log_id for entry in first_page] == ["log-3", "log-2", "log-1"]
+    assert [entry.log_id for entry in second_page] == ["log-0"]
+    assert oldest_first[0].log_id == "log-0"
+    assert first_page[0] == make_entry(3, "gpt-4o", "SUCCESS")
+
+
+def test_query_filters_by_model_status_and_date(index):
+    """모델, 상태, 기간으로 필터링하는지 테스트"""
+    assert index.count() == 4
+    assert index.count(model="gpt-4o") == 2
+    assert [e.log_id for e in index.query(model="gpt-4o", status="SUCCESS")] == [
+        "log-3"
+    ]
+    assert index.count(since=BASE_TIME + timedelta(days=2)) == 2
+    assert index.count(until=BASE_TIME) == 1
+    assert index.distinct_values("status") == ["FAILED", "SUCCESS"]
+    with pytest.raises(ValueError):
+        index.distinct_values("file_name")
+
+
+def test_rebuild_indexes_existing_logs(tmp_path):
+    """인덱스 도입 이전의 로그 파일로 인덱스를 만드는지 테스트"""
+    (tmp_path / "20240101_120000_gpt-4o_review_log.json").write_text(
+        '{"id": "legacy", "model": {"provider": "openai", "name": "gpt-4o"}, '
+        '"created_at": "2024-01-01T12:00:00", "status": "SUCCESS", '
+        '"review_request": {"file_paths": ["a.py", "b.py"]}, '
+        '"review_response": {"issues": [{}], "summary": ""}}',
+        encoding="utf-8",
+    )
+    (tmp_path / "notes.txt").write_text("not a review log", encoding="utf-8")
+    index = ReviewLogIndex(tmp_path)
+
+    assert index.rebuild() == 1
+    [entry] = index.query()
+    assert entry.log_id == "legacy"
+    assert entry.file_count == 2
+    assert entry.issue_count == 1
+    assert entry.total_cost_usd is None
+    assert index.path_for(entry).exists()
+
+
+def test_save_review_log_updates_index(tmp_path):
+    """save_review_log가 리뷰 로그를 인덱스에 추가하는지 테스트"""
+    review_request = ReviewRequest(
+        diff_content="diff",
+        processed_diff=DiffResult(files=[]),
+        file_paths=["a.py"],
+        model="gpt-4o",
+        repo_path="/repo",
+    )
+    review_response = ReviewResponse(
+        issues=[ReviewIssue(type="bug", description="버그", file="a.py")],
+        summary="요약",
+    )
+    estimated_cost = EstimatedCost(
+        model="gpt-4o",
+        input_tokens=100,
+        input_cost_usd=0.1,
+        output_tokens=10,
+        output_cost_usd=0.2,
+        total_cost_usd=0.3,
+    )
+
+    with patch("selvage.cli.get_default_review_log_dir", return_value=tmp_path):
+        log_path = save_review_log(
+            None,
+            review_request,
+            review_response,
+            ReviewStatus.SUCCESS,
+            log_id="openai-gpt-4o-1",
+            estimated_cost=estimated_cost,
+        )
+
+    [entry] = ReviewLogIndex(tmp_path).query()
+    assert entry.log_id == "openai-gpt-4o-1"
+    assert entry.status == ReviewStatus.SUCCESS.value
+    assert entry.total_cost_usd == 0.3
+    assert (entry.file_count, entry.issue_count) == (1, 1)
+    assert str(tmp_path / entry.file_name) == log_path
+    assert ReviewLogCodec.read(tmp_path / entry.file_name)["estimated_cost"][
+        "total_cost_usd"
+    ] == pytest.approx(0.3)
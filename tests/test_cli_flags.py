@@ -2,12 +2,15 @@
 CLI 플래그 기능 테스트 모듈.
 """
 
+import tempfile
 import unittest
+from pathlib import Path
 from unittest.mock import patch
 
 from click.testing import CliRunner
 
-from selvage.cli import cli
+from selvage.cli import _build_review_request, cli
+from selvage.src.diff_parser import DiffResult
 from selvage.src.model_config import ModelProvider
 
 
@@ -156,6 +159,23 @@ class TestCLIFlags(unittest.TestCase):
         self.assertEqual(result.exit_code, 0)
         self.assertIn("설정 관리", result.output)
 
+    def test_config_file_load_workers(self) -> None:
+        """설정한 파일 읽기 스레드 수를 diff 파싱에 전달하는지 테스트."""
+        with (
+            tempfile.TemporaryDirectory() as config_dir,
+            patch("selvage.src.config.CONFIG_DIR", Path(config_dir)),
+            patch("selvage.src.config.CONFIG_FILE", Path(config_dir) / "config.ini"),
+            patch("selvage.src.diff_parser.parse_git_diff") as mock_parse_git_diff,
+        ):
+            invalid = self.runner.invoke(cli, ["config", "file-load-workers", "0"])
+            result = self.runner.invoke(cli, ["config", "file-load-workers", "3"])
+            mock_parse_git_diff.return_value = DiffResult(files=[])
+            _build_review_request("gpt-4o", repo_path=config_dir, diff_content="diff")
+
+        self.assertNotEqual(invalid.exit_code, 0)
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(mock_parse_git_diff.call_args.kwargs["max_workers"], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+"""CompactHunk 클래스 테스트 모듈"""
+
+import pytest
+
+from selvage.src.diff_parser.models import CompactHunk, DiffResult, FileDiff, Hunk
+from selvage.src.utils.token.models import ReviewRequest
+
+
+@pytest.fixture
+def hunk_text() -> str:
+    """컨텍스트, 삭제, 추가, 비표준 라인을 모두 포함한 hunk 텍스트 fixture"""
+    return (
+        "@@ -1,4 +1,4 @@ def main():\n"
+        " def main():\n"
+        "-    return 1\n"
+        "+    return 2\n"
+        "+    # ```코드 블록```\n"
+        "\\ No newline at end of file\n"
+    )
+
+
+@pytest.fixture
+def compact_hunk(hunk_text: str) -> CompactHunk:
+    """hunk_text로부터 생성한 CompactHunk fixture"""
+    hunk = Hunk.from_hunk_text(hunk_text)
+    return CompactHunk.from_content(
+        header=hunk.header,
+        content=hunk.content,
+        start_line_original=hunk.start_line_original,
+        line_count_original=hunk.line_count_original,
+        start_line_modified=hunk.start_line_modified,
+        line_count_modified=hunk.line_count_modified,
+    )
+
+
+def test_compact_hunk_matches_hunk_api(hunk_text: str, compact_hunk: CompactHunk):
+    """CompactHunk가 Hunk와 동일한 코드와 속성을 제공하는지 검증"""
+    hunk = Hunk.from_hunk_text(hunk_text)
+
+    assert compact_hunk.before_code == hunk.before_code
+    assert compact_hunk.after_code == hunk.after_code
+    assert compact_hunk.get_safe_before_code() == hunk.get_safe_before_code()
+    assert compact_hunk.get_safe_after_code() == hunk.get_safe_after_code()
+    assert compact_hunk.to_dict() == hunk.to_dict()
+    assert compact_hunk.to_hunk() == hunk
+
+
+def test_compact_hunk_uses_slots(compact_hunk: CompactHunk):
+    """CompactHunk가 인스턴스 __dict__ 없이 라인 종류를 바이트로 저장하는지 검증"""
+    assert not hasattr(compact_hunk, "__dict__")
+    assert isinstance(compact_hunk.line_kinds, bytes)
+    assert len(compact_hunk.line_kinds) == 5
+
+
+def test_compact_hunk_review_request_round_trip(compact_hunk: CompactHunk):
+    """ReviewRequest 직렬화 결과가 Hunk와 같고 다시 역직렬화되는지 검증"""
+    review_request = ReviewRequest(
+        diff_content="diff",
+        processed_diff=DiffResult(
+            files=[FileDiff(filename="main.py", hunks=[compact_hunk])]
+        ),
+        model="gpt-4o",
+        repo_path=".",
+    )
+
+    dumped = review_request.model_dump(mode="json")
+    restored = ReviewRequest.model_validate(dumped)
+
+    assert dumped["processed_diff"]["files"][0]["hunks"][0] == compact_hunk.to_dict()
+    assert restored.processed_diff.files[0].hunks[0].after_code == (
+        compact_hunk.after_code
+    )
@@ -1,8 +1,11 @@
+import io
+import threading
+from collections.abc import Iterator
 from unittest.mock import patch
 
 import pytest
 
-from selvage.src.diff_parser.parser import parse_git_diff
+from selvage.src.diff_parser.parser import parse_git_diff, parse_git_diff_stream
 from selvage.src.exceptions.diff_parsing_error import DiffParsingError
 
 
@@ -339,3 +342,108 @@ def test_parse_git_diff_with_null_path_in_code(
         "+    print('파일이 삭제되었을 때: +++ /dev/null')"
         in result.files[0].hunks[0].content
     )
+
+
+@patch("selvage.src.diff_parser.parser.load_file_content")
+def test_parse_git_diff_stream_matches_parse_git_diff(
+    mock_load_file_content, multiple_files_diff_text
+):
+    """스트리밍 파서가 문자열 파서와 동일한 결과를 반환하는지 검증"""
+    mock_load_file_content.return_value = "파일 내용"
+
+    expected = parse_git_diff(
+        multiple_files_diff_text, use_full_context=True, repo_path="."
+    )
+    streamed = list(
+        parse_git_diff_stream(
+            io.StringIO(multiple_files_diff_text), use_full_context=True, repo_path="."
+        )
+    )
+
+    assert streamed == expected.files
+
+
+def test_parse_git_diff_stream_single_pass_fields():
+    """한 번의 순회로 추가/삭제 수와 변경 전/후 코드가 계산되는지 검증"""
+    diff_lines = [
+        "diff --git a/app.py b/app.py\n",
+        "index 1234567..8901234 100644\n",
+        "--- a/app.py\n",
+        "+++ b/app.py\n",
+        "@@ -1,3 +1,3 @@\n",
+        " def main():\n",
+        "-    return 1\n",
+        "+    return 2\n",
+        " \n",
+    ]
+
+    file_diffs = list(
+        parse_git_diff_stream(iter(diff_lines), use_full_context=False, repo_path=".")
+    )
+
+    assert len(file_diffs) == 1
+    file_diff = file_diffs[0]
+    assert file_diff.filename == "app.py"
+    assert file_diff.language == "python"
+    assert file_diff.additions == 1
+    assert file_diff.deletions == 1
+
+    hunk = file_diff.hunks[0]
+    assert hunk.header == "@@ -1,3 +1,3 @@"
+    assert hunk.content == "".join(diff_lines[5:])
+    assert hunk.before_code == " def main():\n-    return 1\n "
+    assert hunk.after_code == " def main():\n+    return 2\n "
+
+
+def test_parse_git_diff_stream_is_lazy():
+    """다음 파일 헤더를 읽기 전에는 이전 파일만 생성되는지 검증"""
+
+    def diff_lines() -> Iterator[str]:
+        yield "diff --git a/first.py b/first.py\n"
+        yield "@@ -1,1 +1,1 @@\n"
+        yield "-a\n"
+        yield "+b\n"
+        yield "diff --git a/second.py b/second.py\n"
+        raise AssertionError("두 번째 파일 본문까지 미리 읽으면 안 됩니다")
+
+    stream = parse_git_diff_stream(diff_lines(), use_full_context=False, repo_path=".")
+
+    assert next(stream).filename == "first.py"
+
+
+@patch("selvage.src.diff_parser.parser.load_file_content")
+def test_parse_git_diff_loads_file_contents_concurrently(mock_load_file_content):
+    """파일 내용을 동시에 읽으면서도 원래 파일 순서를 유지하는지 검증"""
+    filenames = [f"file_{idx}.py" for idx in range(4)]
+    diff_text = "".join(
+        f"diff --git a/{name} b/{name}\n@@ -1,1 +1,1 @@\n-a\n+b\n" for name in filenames
+    )
+    # 모든 스레드가 동시에 대기해야 통과하므로 병렬로 실행되었음을 보장합니다.
+    barrier = threading.Barrier(len(filenames), timeout=5)
+
+    def mock_file_content(filename: str, *_: str) -> str:
+        barrier.wait()
+        if filename == "file_1.py":
+            raise FileNotFoundError(filename)
+        return f"{filename} 내용"
+
+    mock_load_file_content.side_effect = mock_file_content
+
+    result = parse_git_diff(
+        diff_text, use_full_context=True, repo_path=".", max_workers=len(filenames)
+    )
+
+    assert [file.filename for file in result.files] == filenames
+    assert result.files[0].file_content == "file_0.py 내용"
+    assert result.files[1].file_content == (
+        "[파일 읽기 오류: file_1.py (FileNotFoundError)]"
+    )
+    assert result.files[3].file_content == "file_3.py 내용"
+
+
+def test_parse_git_diff_invalid_max_workers(one_file_one_diff_text):
+    """max_workers가 1보다 작으면 ValueError가 발생하는지 검증"""
+    with pytest.raises(ValueError):
+        parse_git_diff(
+            one_file_one_diff_text, use_full_context=True, repo_path=".", max_workers=0
+        )
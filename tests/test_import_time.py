@@ -0,0 +1,100 @@
+"""CLI 시작 시 불러오는 모듈과 import 시간에 대한 회귀 테스트.
+
+`python -X importtime`으로 새 인터프리터에서 `selvage.cli`를 불러와, 프로바이더
+SDK와 streamlit, 리뷰 데몬에 리뷰를 맡길 때 필요 없는 배치/캐시/프롬프트/LLM
+게이트웨이 모듈이 필요할 때까지 로드되지 않는지 확인합니다.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# CLI를 불러올 때 로드되면 안 되는 무거운 모듈
+LAZY_MODULES = (
+    "anthropic",
+    "openai",
+    "google.genai",
+    "instructor",
+    "tiktoken",
+    "streamlit",
+    "requests",
+    "watchdog",
+    "pydantic",
+    "rich",
+    "selvage.src.batch",
+    "selvage.src.cache",
+    "selvage.src.llm_gateway",
+    "selvage.src.utils.prompts",
+)
+# `import selvage.cli`의 누적 import 시간 상한(ms). 느린 CI에서는 환경변수로 조정합니다.
+IMPORT_TIME_BUDGET_MS = int(os.getenv("SELVAGE_IMPORT_TIME_BUDGET_MS", "1500"))
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    return subprocess.run(  # noqa: S603
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+        env=env,
+        check=True,
+    )
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """`-X importtime` 출력을 모듈별 누적 시간(us)으로 변환합니다."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def cli_import_times() -> dict[str, int]:
+    result = run_python("import selvage.cli", "-X", "importtime")
+    return parse_importtime(result.stderr)
+
+
+@pytest.mark.slow
+def test_cli_import_does_not_load_heavy_modules(cli_import_times):
+    """CLI를 불러올 때 프로바이더 SDK, tiktoken, streamlit을 불러오지 않는지 테스트"""
+    loaded = [
+        module
+        for module in LAZY_MODULES
+        if any(
+            name == module or name.startswith(f"{module}.") for name in cli_import_times
+        )
+    ]
+    assert loaded == []
+
+
+@pytest.mark.slow
+def test_cli_import_time_budget(cli_import_times):
+    """`import selvage.cli`의 누적 import 시간이 상한을 넘지 않는지 테스트"""
+    elapsed_ms = cli_import_times["selvage.cli"] / 1000
+
+    assert elapsed_ms < IMPORT_TIME_BUDGET_MS
+
+
+@pytest.mark.slow
+def test_client_creation_loads_only_its_provider_sdk():
+    """클라이언트를 만들 때 해당 프로바이더의 SDK만 불러오는지 테스트"""
+    result = run_python(
+        "import sys\n"
+        "from selvage.src.models.model_provider import ModelProvider\n"
+        "from selvage.src.utils.llm_client_factory import LLMClientFactory\n"
+        "LLMClientFactory.create_sdk_client(ModelProvider.ANTHROPIC, 'test-key')\n"
+        "print(' '.join(m for m in ('anthropic', 'openai', 'google.genai')"
+        " if m in sys.modules))\n"
+    )
+
+    assert result.stdout.split() == ["anthropic"]
@@ -2,13 +2,16 @@
 LLM Gateway의 코드 리뷰 기능을 테스트하는 모듈입니다.
 """
 
+import asyncio
 import json
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import anthropic
 import instructor
 import pytest
 from google import genai
+from google.genai.client import AsyncClient as AsyncGenaiClient
 
 from selvage.src.exceptions.context_limit_exceeded_error import (
     ContextLimitExceededError,
@@ -18,6 +21,7 @@ from selvage.src.model_config import ModelInfoDict, ModelParamsDict, ModelProvid
 from selvage.src.models.review_result import ReviewResult
 from selvage.src.utils.prompts.models import ReviewPrompt, SystemPrompt, UserPrompt
 from selvage.src.utils.token.models import (
+    EstimatedCost,
     IssueSeverityEnum,
     ReviewResponse,
     StructuredReviewIssue,
@@ -374,3 +378,275 @@ def test_review_code_parsing_error(
 
 if __name__ == "__main__":
     pytest.main()
+
+
+def _make_sharding_prompt(file_count: int) -> ReviewPrompt:
+    system_prompt = SystemPrompt(role="system", content="코드를 분석하고 리뷰하세요.")
+    user_prompts = [
+        UserPrompt(
+            hunk_idx="1",
+            file_name=f"file_{idx}.py",
+            before_code="def example(): pass",
+            after_code="def example(): return 'Hello'",
+            after_code_start_line_number=1,
+            language="python",
+        )
+        for idx in range(file_count)
+    ]
+    return ReviewPrompt(system_prompt=system_prompt, user_prompts=user_prompts)
+
+
+def _make_shard_result(review_prompt: ReviewPrompt) -> ReviewResult:
+    file_names = [prompt.file_name for prompt in review_prompt.user_prompts]
+    return ReviewResult(
+        review_response=ReviewResponse(
+            issues=[],
+            summary=",".join(file_names),
+            score=float(len(file_names)),
+            recommendations=["테스트 추가"],
+        ),
+        estimated_cost=EstimatedCost(
+            model="test-model-fixture",
+            input_tokens=100,
+            input_cost_usd=0.1,
+            output_tokens=10,
+            output_cost_usd=0.01,
+            total_cost_usd=0.11,
+        ),
+    )
+
+
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.estimate_segment_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.count_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.get_model_context_limit")
+def test_review_code_sharded_merges_shard_results(
+    mock_get_model_context_limit,
+    mock_count_tokens,
+    mock_estimate_segment_tokens,
+    model_info_fixture: ModelInfoDict,
+):
+    """컨텍스트 제한 초과 시 분할 요청 결과가 하나로 병합되는지 테스트합니다."""
+    mock_get_model_context_limit.return_value = 1000
+    mock_estimate_segment_tokens.return_value = 400
+    # 파일 하나당 400 토큰으로 계산
+    mock_count_tokens.side_effect = lambda prompt, model: 400 * len(
+        prompt.user_prompts
+    )
+    gateway = MockBaseGateway(model_info_fixture)
+
+    with patch.object(
+        MockBaseGateway, "_request_review", side_effect=_make_shard_result
+    ) as mock_request_review:
+        result = gateway.review_code_sharded(
+            _make_sharding_prompt(4), max_concurrency=2
+        )
+
+    # 시스템 400 + 파일 400 = 800 <= 900 이므로 파일 하나씩 4개로 분할
+    assert mock_request_review.call_count == 4
+    assert result.review_response.summary.split("\n\n") == [
+        "file_0.py",
+        "file_1.py",
+        "file_2.py",
+        "file_3.py",
+    ]
+    assert result.review_response.score == 1.0
+    assert result.review_response.recommendations == ["테스트 추가"]
+    assert result.review_response.error is None
+    assert result.estimated_cost.input_tokens == 400
+    assert result.estimated_cost.total_cost_usd == pytest.approx(0.44)
+
+
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.estimate_segment_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.count_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.get_model_context_limit")
+def test_review_code_sharded_marks_partial_failure(
+    mock_get_model_context_limit,
+    mock_count_tokens,
+    mock_estimate_segment_tokens,
+    model_info_fixture: ModelInfoDict,
+):
+    """일부 묶음이 실패하면 병합된 결과에 오류가 남는지 테스트합니다."""
+    mock_get_model_context_limit.return_value = 1000
+    mock_estimate_segment_tokens.return_value = 400
+    mock_count_tokens.side_effect = lambda prompt, *_: 400 * len(
+        prompt.user_prompts
+    )
+    gateway = MockBaseGateway(model_info_fixture)
+
+    def request_review(review_prompt: ReviewPrompt) -> ReviewResult:
+        if review_prompt.user_prompts[0].file_name == "file_1.py":
+            return ReviewResult.get_error_result(ValueError("파싱 실패"))
+        return _make_shard_result(review_prompt)
+
+    with patch.object(MockBaseGateway, "_request_review", side_effect=request_review):
+        result = gateway.review_code_sharded(_make_sharding_prompt(3))
+
+    assert result.review_response.error == "파싱 실패"
+    assert "file_0.py" in result.review_response.summary
+
+
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.estimate_segment_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.count_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.get_model_context_limit")
+def test_review_code_sharded_splits_shard_exceeding_limit(
+    mock_get_model_context_limit,
+    mock_count_tokens,
+    mock_estimate_segment_tokens,
+    model_info_fixture: ModelInfoDict,
+):
+    """추정치와 달리 실제 토큰 수가 제한을 넘으면 묶음을 절반으로 나누는지 테스트합니다."""
+    mock_get_model_context_limit.return_value = 1000
+    # 로컬 추정으로는 모두 한 묶음에 들어가지만 실제로는 파일 하나만 허용
+    mock_estimate_segment_tokens.return_value = 1
+    mock_count_tokens.side_effect = lambda prompt, model: 600 * len(
+        prompt.user_prompts
+    )
+    gateway = MockBaseGateway(model_info_fixture)
+
+    with patch.object(
+        MockBaseGateway, "_request_review", side_effect=_make_shard_result
+    ) as mock_request_review:
+        result = gateway.review_code_sharded(_make_sharding_prompt(3))
+
+    assert mock_request_review.call_count == 3
+    assert result.review_response.summary.split("\n\n") == [
+        "file_0.py",
+        "file_1.py",
+        "file_2.py",
+    ]
+
+
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.count_tokens")
+@patch("selvage.src.llm_gateway.base_gateway.TokenUtils.get_model_context_limit")
+def test_review_code_sharded_single_file_exceeding_limit(
+    mock_get_model_context_limit,
+    mock_count_tokens,
+    model_info_fixture: ModelInfoDict,
+    review_prompt_fixture: ReviewPrompt,
+):
+    """더 나눌 수 없는 프롬프트가 제한을 넘으면 오류 결과를 반환하는지 테스트합니다."""
+    mock_get_model_context_limit.return_value = 1000
+    mock_count_tokens.return_value = 5000
+    gateway = MockBaseGateway(model_info_fixture)
+
+    with patch.object(MockBaseGateway, "_request_review") as mock_request_review:
+        result = gateway.review_code_sharded(review_prompt_fixture)
+
+    mock_request_review.assert_not_called()
+    assert "컨텍스트 크기 제한" in result.review_response.summary
+
+
+def test_review_code_sharded_invalid_concurrency(
+    model_info_fixture: ModelInfoDict, review_prompt_fixture: ReviewPrompt
+):
+    """동시 요청 수가 1보다 작으면 ValueError가 발생하는지 테스트합니다."""
+    gateway = MockBaseGateway(model_info_fixture)
+
+    with pytest.raises(ValueError):
+        gateway.review_code_sharded(review_prompt_fixture, max_concurrency=0)
+
+
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway.validate_review_request")
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway._create_async_client")
+def test_areview_code_success_with_async_instructor(
+    mock_create_async_client,
+    mock_validate_request,
+    model_info_fixture: ModelInfoDict,
+    review_prompt_fixture: ReviewPrompt,
+):
+    """비동기 Instructor 클라이언트를 사용한 리뷰를 테스트합니다."""
+    mock_instructor = MagicMock(spec=instructor.AsyncInstructor)
+    mock_instructor.chat.completions.create_with_completion = AsyncMock(
+        return_value=(
+            StructuredReviewResponse(
+                issues=[],
+                summary="비동기 리뷰 요약",
+                score=90.0,
+                recommendations=["비동기 권장 사항"],
+            ),
+            None,
+        )
+    )
+    mock_create_async_client.return_value = mock_instructor
+
+    gateway = MockBaseGateway(model_info_fixture)
+    review_result = asyncio.run(gateway.areview_code(review_prompt_fixture))
+
+    mock_validate_request.assert_called_once_with(review_prompt_fixture)
+    mock_instructor.chat.completions.create_with_completion.assert_awaited_once()
+    assert review_result.review_response.summary == "비동기 리뷰 요약"
+    assert review_result.review_response.score == 90.0
+    assert review_result.review_response.recommendations == ["비동기 권장 사항"]
+
+
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway.validate_review_request")
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway._create_async_client")
+def test_areview_code_success_with_async_genai(
+    mock_create_async_client,
+    mock_validate_request,
+    google_model_info_fixture: ModelInfoDict,
+    review_prompt_fixture: ReviewPrompt,
+):
+    """genai aio 클라이언트를 사용한 리뷰를 테스트합니다."""
+    mock_genai_client = MagicMock(spec=AsyncGenaiClient)
+    mock_genai_response = MagicMock()
+    mock_genai_response.text = json.dumps(
+        {
+            "issues": [],
+            "summary": "GenAI 비동기 요약",
+            "score": 70.0,
+            "recommendations": [],
+        }
+    )
+    mock_genai_client.models.generate_content = AsyncMock(
+        return_value=mock_genai_response
+    )
+    mock_create_async_client.return_value = mock_genai_client
+
+    gateway = MockBaseGateway(google_model_info_fixture)
+    review_result = asyncio.run(gateway.areview_code(review_prompt_fixture))
+
+    mock_genai_client.models.generate_content.assert_awaited_once()
+    assert review_result.review_response.summary == "GenAI 비동기 요약"
+    assert review_result.review_response.score == 70.0
+
+
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway.validate_review_request")
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway._create_async_client")
+def test_areview_code_anthropic_without_text_block(
+    mock_create_async_client,
+    mock_validate_request,
+    model_info_fixture: ModelInfoDict,
+    review_prompt_fixture: ReviewPrompt,
+):
+    """텍스트 블록이 없는 Claude 비동기 응답은 빈 결과를 반환하는지 테스트합니다."""
+    mock_anthropic_client = MagicMock(spec=anthropic.AsyncAnthropic)
+    mock_message = MagicMock()
+    mock_message.content = []
+    mock_anthropic_client.messages = MagicMock()
+    mock_anthropic_client.messages.create = AsyncMock(return_value=mock_message)
+    mock_create_async_client.return_value = mock_anthropic_client
+
+    gateway = MockBaseGateway(model_info_fixture)
+    review_result = asyncio.run(gateway.areview_code(review_prompt_fixture))
+
+    assert review_result == ReviewResult.get_empty_result("test-model-fixture")
+
+
+@patch("selvage.src.llm_gateway.base_gateway.BaseGateway.validate_review_request")
+def test_areview_code_context_limit_exceeded(
+    mock_validate_request,
+    model_info_fixture: ModelInfoDict,
+    review_prompt_fixture: ReviewPrompt,
+):
+    """비동기 리뷰에서도 컨텍스트 제한 초과 시 오류 결과를 반환하는지 테스트합니다."""
+    mock_validate_request.side_effect = ContextLimitExceededError(
+        input_tokens=10000, context_limit=5000
+    )
+    gateway = MockBaseGateway(model_info_fixture)
+
+    with patch.object(MockBaseGateway, "_arequest_review") as mock_arequest_review:
+        review_result = asyncio.run(gateway.areview_code(review_prompt_fixture))
+
+    mock_arequest_review.assert_not_called()
+    assert "컨텍스트 크기 제한" in review_result.review_response.summary
@@ -0,0 +1,115 @@
+"""컴파일된 모델 설정 캐시와 모델 색인에 대한 테스트"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from selvage.src.exceptions.unsupported_model_error import UnsupportedModelError
+from selvage.src.model_config import ModelConfig
+from selvage.src.model_registry_cache import ModelRegistryCache
+
+MODELS = {
+    "gpt-4o": {"aliases": ["4o"], "provider": "openai"},
+    "o3": {"aliases": ["gpt-4o"], "provider": "openai"},
+}
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / "models.yml"
+    path.write_text("models: {}\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def registry_cache(tmp_path):
+    return ModelRegistryCache(tmp_path / "config" / "models_registry.json")
+
+
+def test_load_returns_saved_models(source_path, registry_cache):
+    """저장한 모델 설정을 원본이 바뀌지 않은 동안 그대로 반환하는지 테스트"""
+    assert registry_cache.load(source_path) is None
+
+    registry_cache.save(source_path, MODELS)
+
+    assert registry_cache.load(source_path) == MODELS
+
+
+def test_load_ignores_cache_when_source_changes(source_path, registry_cache):
+    """원본 내용이 바뀌면 캐시를 사용하지 않는지 테스트"""
+    registry_cache.save(source_path, MODELS)
+
+    source_path.write_text("models: {changed: {}}\n", encoding="utf-8")
+
+    assert registry_cache.load(source_path) is None
+
+
+def test_load_reuses_cache_when_only_mtime_changes(source_path, registry_cache):
+    """내용이 같으면 수정 시각이 바뀌어도 캐시를 사용하고 시각을 갱신하는지 테스트"""
+    registry_cache.save(source_path, MODELS)
+    stat = source_path.stat()
+    os.utime(source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert registry_cache.load(source_path) == MODELS
+    cached = json.loads(registry_cache.cache_path.read_text(encoding="utf-8"))
+    assert cached["source"]["mtime_ns"] == source_path.stat().st_mtime_ns
+
+
+def test_load_ignores_other_version(source_path, registry_cache):
+    """다른 패키지 버전이 저장한 캐시는 사용하지 않는지 테스트"""
+    registry_cache.save(source_path, MODELS)
+
+    with patch("selvage.src.model_registry_cache.__version__", "0.0.0"):
+        assert registry_cache.load(source_path) is None
+
+
+def test_save_skips_unwritable_config_dir(tmp_path, source_path):
+    """설정 디렉토리 경로가 파일이어도 예외 없이 저장을 건너뛰는지 테스트"""
+    (tmp_path / "config").write_text("", encoding="utf-8")
+    registry_cache = ModelRegistryCache(tmp_path / "config" / "models_registry.json")
+
+    registry_cache.save(source_path, MODELS)
+
+    assert registry_cache.load(source_path) is None
+
+
+def test_model_config_uses_cache_without_parsing_yaml(tmp_path):
+    """캐시가 있으면 YAML을 다시 파싱하지 않고 같은 설정을 로드하는지 테스트"""
+    cache_path = tmp_path / "models_registry.json"
+    with (
+        patch(
+            "selvage.src.model_config.ModelRegistryCache",
+            lambda: ModelRegistryCache(cache_path),
+        ),
+        patch.object(ModelConfig, "_config", None),
+        patch.object(ModelConfig, "_index", {}),
+    ):
+        parsed = ModelConfig().get_all_models_config()
+        assert cache_path.exists()
+
+        ModelConfig._config = None
+        with patch.object(ModelConfig, "_parse_yaml", side_effect=AssertionError):
+            assert ModelConfig().get_all_models_config() == parsed
+
+
+def test_index_prefers_full_name_over_alias():
+    """색인이 별칭보다 정식 이름을 우선하는지 테스트"""
+    index = ModelConfig._build_index(MODELS)
+
+    assert index["gpt-4o"] is MODELS["gpt-4o"]
+    assert index["4o"] is MODELS["gpt-4o"]
+    assert index["o3"] is MODELS["o3"]
+
+
+def test_get_model_info_resolves_aliases():
+    """별칭과 정식 이름으로 같은 모델 정보를 조회하는지 테스트"""
+    model_config = ModelConfig()
+    full_name, info = next(iter(model_config.get_all_models_config().items()))
+
+    for alias in info["aliases"]:
+        assert model_config.get_model_info(alias) is info
+    assert model_config.get_model_info(full_name) is info
+    with pytest.raises(UnsupportedModelError):
+        model_config.get_model_info("no-such-model")
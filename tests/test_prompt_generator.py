@@ -1,6 +1,8 @@
 """프롬프트 생성기 테스트"""
 
+import io
 import json
+from dataclasses import asdict
 from unittest.mock import patch
 
 import pytest
@@ -435,3 +437,47 @@ class TestPromptGenerator:
         assert "print('Debug')" in second_prompt.before_code
         assert "print('Log')" in second_prompt.after_code
         assert "print('Info')" in second_prompt.after_code
+
+
+def test_combined_text_matches_segments_and_stream():
+    """결합 텍스트가 구간을 이어 붙인 결과와 같고 스트림 기록과 일치하는지 테스트"""
+    user_prompt = UserPrompt(
+        hunk_idx="1",
+        file_name="file.py",
+        before_code="print('World')\n",
+        after_code="print('Hello')\nprint('World')\n",
+        after_code_start_line_number=1,
+        language="python",
+    )
+    review_prompt = ReviewPrompt(
+        system_prompt=SystemPrompt(role="system", content="시스템 프롬프트"),
+        user_prompts=[user_prompt, user_prompt],
+    )
+
+    user_message = json.dumps(asdict(user_prompt), ensure_ascii=False)
+    expected = "시스템 프롬프트\n\n" + (user_message + "\n\n") * 2
+    stream = io.StringIO()
+    review_prompt.write_combined_text(stream)
+
+    assert review_prompt.to_combined_text() == expected
+    assert stream.getvalue() == expected
+    assert "".join(review_prompt.iter_text_segments()) == expected
+
+
+def test_user_prompt_message_content_is_serialized_once():
+    """사용자 메시지 직렬화 결과를 재사용하는지 테스트"""
+    user_prompt = UserPromptWithFileContent(
+        file_name="file.py",
+        file_content="print('Hello')\n",
+        hunks=[],
+    )
+
+    with patch(
+        "selvage.src.utils.prompts.models.user_prompt_with_file_content.json.dumps",
+        return_value="{}",
+    ) as mock_dumps:
+        first = user_prompt.to_message()
+        second = user_prompt.to_message()
+
+    assert first["content"] == second["content"] == "{}"
+    mock_dumps.assert_called_once()
@@ -0,0 +1,75 @@
+"""Streamlit UI 데이터 처리 함수에 대한 테스트"""
+
+import json
+
+from selvage.src.review_log import ReviewLogCodec
+from selvage.src.ui import (
+    filter_failed_test_cases,
+    load_json_file,
+    load_review_log_section,
+    parse_prompt_content,
+)
+
+FILE_CONTENT = "print('hello')\n" * 100
+
+
+def test_parse_prompt_content_does_not_mutate_input():
+    """prompt 메시지 본문을 파싱하되 원본 목록은 변경하지 않는지 테스트"""
+    prompt = [
+        {"role": "system", "content": "시스템 프롬프트"},
+        {"role": "user", "content": json.dumps({"file_name": "a.py"})},
+    ]
+
+    parsed = parse_prompt_content(prompt)
+
+    assert parsed[0] is prompt[0]
+    assert parsed[1]["content"] == {"file_name": "a.py"}
+    assert isinstance(prompt[1]["content"], str)
+
+
+def test_filter_failed_test_cases_does_not_mutate_input():
+    """실패한 테스트 케이스를 필터링하되 원본은 변경하지 않는지 테스트"""
+    test_cases = [
+        {"success": True, "metricsData": []},
+        {
+            "success": False,
+            "metricsData": [{"success": True}, {"success": False}],
+        },
+    ]
+
+    filtered, count = filter_failed_test_cases(test_cases)
+
+    assert count == 1
+    assert filtered[0]["metricsData"] == [{"success": False}]
+    assert len(test_cases[1]["metricsData"]) == 2
+
+
+def test_load_review_log_section_rehydrates_lazily(tmp_path):
+    """리뷰 로그는 blob 없이 읽고, 필드를 요청할 때만 파일 내용을 복원하는지 테스트"""
+    review_log = {
+        "id": "log-1",
+        "prompt": [
+            {
+                "role": "user",
+                "content": json.dumps(
+                    {"file_name": "a.py", "file_content": FILE_CONTENT}
+                ),
+            }
+        ],
+        "review_request": {
+            "processed_diff": {
+                "files": [{"filename": "a.py", "file_content": FILE_CONTENT}]
+            }
+        },
+        "review_response": None,
+    }
+    file_path = ReviewLogCodec.write(tmp_path / "review_log", review_log)
+    mtime_ns = file_path.stat().st_mtime_ns
+
+    json_data = load_json_file(str(file_path), mtime_ns)
+    prompt = load_review_log_section(str(file_path), mtime_ns, "prompt")
+    review_request = load_review_log_section(str(file_path), mtime_ns, "review_request")
+
+    assert FILE_CONTENT not in json.dumps(json_data)
+    assert prompt[0]["content"]["file_content"] == FILE_CONTENT
+    assert review_request["processed_diff"]["files"][0]["file_content"] == FILE_CONTENT
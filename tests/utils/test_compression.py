@@ -0,0 +1,57 @@
+"""압축 유틸리티에 대한 테스트"""
+
+import gzip
+import zlib
+from unittest.mock import patch
+
+import pytest
+
+from selvage.src.utils import compression
+from selvage.src.utils.compression import (
+    GZIP_SUFFIX,
+    compress,
+    compressed_suffix,
+    decompress,
+)
+
+PAYLOAD = ('{"review_response": "' + "리뷰 결과 " * 500 + '"}').encode("utf-8")
+
+
+def test_compress_roundtrip():
+    """압축한 데이터를 해제하면 원본과 같은지 테스트"""
+    compressed = compress(PAYLOAD)
+
+    assert len(compressed) < len(PAYLOAD)
+    assert decompress(compressed) == PAYLOAD
+
+
+def test_compress_falls_back_to_gzip_without_zstandard():
+    """zstandard가 없으면 gzip으로 압축하는지 테스트"""
+    with patch.object(compression, "zstandard", None):
+        compressed = compress(PAYLOAD)
+        suffix = compressed_suffix()
+
+    assert suffix == GZIP_SUFFIX
+    assert gzip.decompress(compressed) == PAYLOAD
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        pytest.param(zlib.compress(PAYLOAD), id="zlib"),
+        pytest.param(gzip.compress(PAYLOAD), id="gzip"),
+        pytest.param(PAYLOAD, id="uncompressed"),
+    ],
+)
+def test_decompress_detects_format(stored):
+    """이전에 저장한 zlib, gzip, 비압축 데이터를 판별하여 읽는지 테스트"""
+    assert decompress(stored) == PAYLOAD
+
+
+def test_decompress_zstd_without_zstandard_raises():
+    """zstandard 없이 zstd 데이터를 읽으면 설치 안내 오류가 발생하는지 테스트"""
+    with (
+        patch.object(compression, "zstandard", None),
+        pytest.raises(RuntimeError, match="zstandard"),
+    ):
+        decompress(compression.ZSTD_MAGIC + b"\x00" * 8)
@@ -0,0 +1,32 @@
+"""FileLock 클래스에 대한 테스트"""
+
+import pytest
+
+from selvage.src.utils.file_lock import FileLock
+
+
+def test_non_blocking_acquire_fails_while_locked(tmp_path):
+    """다른 잠금이 잡혀 있으면 비차단 획득이 실패하는지 테스트"""
+    lock_path = tmp_path / "locks" / ".cache.lock"
+    holder = FileLock(lock_path)
+    contender = FileLock(lock_path)
+
+    with holder:
+        assert lock_path.exists()
+        assert contender.acquire(blocking=False) is False
+
+    assert contender.acquire(blocking=False) is True
+    contender.release()
+
+
+def test_acquire_twice_raises(tmp_path):
+    """같은 객체로 잠금을 두 번 획득하면 RuntimeError가 발생하는지 테스트"""
+    lock = FileLock(tmp_path / ".cache.lock")
+
+    with lock, pytest.raises(RuntimeError):
+        lock.acquire()
+
+
+def test_release_without_acquire_is_noop(tmp_path):
+    """잠금을 얻지 않은 상태에서 해제해도 오류가 없는지 테스트"""
+    FileLock(tmp_path / ".cache.lock").release()
@@ -0,0 +1,124 @@
+"""GitBlobLoader 클래스에 대한 단위 테스트 모듈."""
+
+import subprocess
+
+import pytest
+
+from selvage.src.diff_parser.parser import parse_git_diff
+from selvage.src.utils.git_blob_loader import GitBlobLoader
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """파일 몇 개가 커밋된 임시 Git 저장소를 생성합니다.
+
+    Args:
+        tmp_path: pytest의 임시 디렉터리 경로
+
+    Returns:
+        str: 생성된 git 저장소의 경로
+    """
+    repo_dir = tmp_path / "git-repo"
+    repo_dir.mkdir()
+    subprocess.run(["git", "init"], cwd=str(repo_dir), check=True)
+    subprocess.run(
+        ["git", "config", "user.email", "test@example.com"], cwd=str(repo_dir)
+    )
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=str(repo_dir))
+
+    (repo_dir / "app.py").write_text("print('커밋된 내용')\n", encoding="utf-8")
+    (repo_dir / "src").mkdir()
+    (repo_dir / "src" / "util.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (repo_dir / "latin1.txt").write_bytes("caf\xe9".encode("latin-1"))
+
+    subprocess.run(["git", "add", "."], cwd=str(repo_dir), check=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Initial commit"], cwd=str(repo_dir), check=True
+    )
+
+    return str(repo_dir)
+
+
+def test_iter_file_contents_reads_committed_blobs(git_repo, tmp_path):
+    """작업 트리가 변경되어도 리비전의 내용을 읽는지 검증합니다."""
+    (tmp_path / "git-repo" / "app.py").write_text("작업 트리 내용", encoding="utf-8")
+
+    loader = GitBlobLoader(git_repo, revision="HEAD")
+    contents = list(loader.iter_file_contents(["app.py", "src/util.py"]))
+
+    assert contents == [
+        ("app.py", "print('커밋된 내용')\n"),
+        ("src/util.py", "VALUE = 1\n"),
+    ]
+
+
+def test_iter_file_contents_placeholders(git_repo):
+    """없는 파일, 무시 대상 파일, 인코딩 오류 파일 처리를 검증합니다."""
+    loader = GitBlobLoader(git_repo)
+    contents = dict(
+        loader.iter_file_contents(["missing.py", "image.png", "latin1.txt"])
+    )
+
+    assert contents["missing.py"] is None
+    assert contents["image.png"] == "[제외 파일: image.png]"
+    assert contents["latin1.txt"] == "[인코딩 오류로 읽을 수 없는 파일: latin1.txt]"
+
+
+def test_iter_file_contents_many_large_files(git_repo, tmp_path):
+    """파이프 버퍼보다 큰 출력도 교착 없이 순서대로 읽는지 검증합니다."""
+    repo_dir = tmp_path / "git-repo"
+    filenames = [f"big_{idx}.txt" for idx in range(50)]
+    for idx, name in enumerate(filenames):
+        (repo_dir / name).write_text(f"{idx}\n" * 20000, encoding="utf-8")
+    subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+    subprocess.run(["git", "commit", "-m", "Big files"], cwd=git_repo, check=True)
+
+    contents = list(GitBlobLoader(git_repo).iter_file_contents(filenames))
+
+    assert [name for name, _ in contents] == filenames
+    assert contents[7][1] == "7\n" * 20000
+
+
+def test_parse_git_diff_with_revision_uses_git_blobs(git_repo, tmp_path):
+    """revision이 주어지면 git 오브젝트 저장소에서 파일 내용을 읽는지 검증합니다."""
+    (tmp_path / "git-repo" / "app.py").write_text("작업 트리 내용", encoding="utf-8")
+    diff_text = (
+        "diff --git a/app.py b/app.py\n"
+        "@@ -1,1 +1,1 @@\n"
+        "-print('이전 내용')\n"
+        "+print('커밋된 내용')\n"
+    )
+
+    result = parse_git_diff(
+        diff_text, use_full_context=True, repo_path=git_repo, revision="HEAD"
+    )
+
+    assert result.files[0].file_content == "print('커밋된 내용')\n"
+
+
+def test_parse_git_diff_with_revision_falls_back_per_path(git_repo, tmp_path):
+    """리비전에 없는 파일만 작업 트리에서 읽는지 검증합니다."""
+    repo_dir = tmp_path / "git-repo"
+    (repo_dir / "app.py").write_text("작업 트리 내용", encoding="utf-8")
+    (repo_dir / "new.py").write_text("NEW = 1\n", encoding="utf-8")
+    diff_text = (
+        "diff --git a/app.py b/app.py\n"
+        "@@ -1,1 +1,1 @@\n"
+        "-print('이전 내용')\n"
+        "+print('커밋된 내용')\n"
+        "diff --git a/new.py b/new.py\n"
+        "@@ -0,0 +1,1 @@\n"
+        "+NEW = 1\n"
+        "diff --git a/gone.py b/gone.py\n"
+        "@@ -0,0 +1,1 @@\n"
+        "+GONE = 1\n"
+    )
+
+    result = parse_git_diff(
+        diff_text, use_full_context=True, repo_path=git_repo, revision="HEAD"
+    )
+
+    contents = {file.filename: file.file_content for file in result.files}
+    assert contents["app.py"] == "print('커밋된 내용')\n"
+    assert contents["new.py"] == "NEW = 1\n"
+    assert contents["gone.py"].startswith("[파일 읽기 오류: gone.py")
@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+import sys
 from dataclasses import dataclass
 
 import pytest
@@ -116,3 +117,64 @@ def test_git_diff_utility_from_args(git_repo):
     assert git_diff.mode == GitDiffMode.STAGED
     assert git_diff.repo_path == git_repo
     assert git_diff.target is None
+
+
+def test_git_diff_utility_iter_diff_lines(git_repo):
+    """스트리밍 diff 라인이 get_diff 결과와 동일한지 검증합니다."""
+    file_path = os.path.join(git_repo, "file.txt")
+    with open(file_path, "w") as f:
+        f.write("Modified content")
+
+    git_diff = GitDiffUtility(git_repo, mode=GitDiffMode.UNSTAGED)
+
+    assert "".join(git_diff.iter_diff_lines()) == git_diff.get_diff()
+
+
+def test_git_diff_utility_iter_diff_lines_with_empty_target(git_repo):
+    """빈 target 값이면 스트리밍 diff도 아무 라인도 반환하지 않는지 검증합니다."""
+    git_diff = GitDiffUtility(git_repo, mode=GitDiffMode.TARGET_BRANCH, target="")
+
+    assert list(git_diff.iter_diff_lines()) == []
+
+
+def test_git_diff_utility_iter_diff_lines_with_invalid_utf8(git_repo):
+    """UTF-8이 아닌 내용도 예외 없이 대체 문자로 읽는지 검증합니다."""
+    with open(os.path.join(git_repo, "file.txt"), "wb") as f:
+        f.write("caf\xe9\n".encode("latin-1"))
+
+    git_diff = GitDiffUtility(git_repo, mode=GitDiffMode.UNSTAGED)
+    lines = list(git_diff.iter_diff_lines())
+
+    assert "+caf\ufffd\n" in lines
+    assert "".join(lines) == git_diff.get_diff()
+
+
+def test_git_diff_utility_iter_diff_lines_with_large_stderr(git_repo, monkeypatch):
+    """stderr가 파이프 버퍼보다 커도 멈추지 않고 stdout을 모두 읽는지 검증합니다."""
+    git_diff = GitDiffUtility(git_repo, mode=GitDiffMode.UNSTAGED)
+    script = (
+        "import sys; sys.stderr.write('warning\\n' * 100000); "
+        "sys.stdout.write('line\\n' * 3)"
+    )
+    monkeypatch.setattr(
+        git_diff, "_build_diff_command", lambda: [sys.executable, "-c", script]
+    )
+
+    assert list(git_diff.iter_diff_lines()) == ["line\n"] * 3
+
+
+def test_git_diff_utility_with_paths(git_repo):
+    """paths를 지정하면 해당 파일의 diff만 가져오는지 검증합니다."""
+    for name in ("file.txt", "other.txt"):
+        with open(os.path.join(git_repo, name), "w") as f:
+            f.write(f"{name} v1")
+    subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+    subprocess.run(["git", "commit", "-m", "Add other"], cwd=git_repo, check=True)
+    for name in ("file.txt", "other.txt"):
+        with open(os.path.join(git_repo, name), "w") as f:
+            f.write(f"{name} v2")
+
+    diff = GitDiffUtility(git_repo, paths=["other.txt"]).get_diff()
+
+    assert "+other.txt v2" in diff
+    assert "file.txt v2" not in diff
@@ -0,0 +1,156 @@
+"""LLMClientRegistry 클래스에 대한 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from selvage.src.model_config import ModelInfoDict
+from selvage.src.models.model_provider import ModelProvider
+from selvage.src.utils.llm_client_factory import (
+    ANTHROPIC_THINKING_MODE_TIMEOUT_SECONDS,
+    LLMClientFactory,
+)
+from selvage.src.utils.llm_client_registry import LLMClientRegistry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """각 테스트 전후로 레지스트리를 비웁니다."""
+    LLMClientRegistry.shutdown()
+    yield
+    LLMClientRegistry.shutdown()
+
+
+@pytest.fixture
+def mock_create_sdk_client():
+    with patch(
+        "selvage.src.utils.llm_client_registry.LLMClientFactory.create_sdk_client",
+        wraps=LLMClientFactory.create_sdk_client,
+    ) as mock:
+        yield mock
+
+
+def _model_info(thinking_mode: bool = False) -> ModelInfoDict:
+    return {
+        "full_name": "claude-test",
+        "aliases": [],
+        "description": "테스트용 모델",
+        "provider": ModelProvider.ANTHROPIC,
+        "params": {},
+        "thinking_mode": thinking_mode,
+        "pricing": {"input": 0.0, "output": 0.0, "description": ""},
+        "context_limit": 200000,
+    }
+
+
+def test_get_client_reuses_client(mock_create_sdk_client):
+    """같은 프로바이더와 API 키로 요청하면 같은 클라이언트를 반환하는지 테스트"""
+    first = LLMClientRegistry.get_client(
+        ModelProvider.ANTHROPIC, "key-1", _model_info()
+    )
+    second = LLMClientRegistry.get_client(
+        ModelProvider.ANTHROPIC, "key-1", _model_info()
+    )
+
+    assert first is second
+    mock_create_sdk_client.assert_called_once_with(
+        ModelProvider.ANTHROPIC, "key-1", None
+    )
+
+
+def test_get_client_separates_api_key_and_timeout(mock_create_sdk_client):
+    """API 키나 타임아웃이 다르면 별도의 클라이언트를 생성하는지 테스트"""
+    default = LLMClientRegistry.get_client(
+        ModelProvider.ANTHROPIC, "key-1", _model_info()
+    )
+    other_key = LLMClientRegistry.get_client(
+        ModelProvider.ANTHROPIC, "key-2", _model_info()
+    )
+    thinking = LLMClientRegistry.get_client(
+        ModelProvider.ANTHROPIC, "key-1", _model_info(thinking_mode=True)
+    )
+
+    assert default is not other_key
+    assert default is not thinking
+    assert mock_create_sdk_client.call_count == 3
+    mock_create_sdk_client.assert_any_call(
+        ModelProvider.ANTHROPIC, "key-1", ANTHROPIC_THINKING_MODE_TIMEOUT_SECONDS
+    )
+
+
+def test_get_sdk_client_shared_with_structured_client(mock_create_sdk_client):
+    """토큰 계산용 SDK 클라이언트와 리뷰 클라이언트가 커넥션 풀을 공유하는지 테스트"""
+    sdk_client = LLMClientRegistry.get_sdk_client(ModelProvider.ANTHROPIC, "key-1")
+    thinking_model_info = _model_info(thinking_mode=True)
+    LLMClientRegistry.get_client(ModelProvider.ANTHROPIC, "key-1", _model_info())
+
+    assert mock_create_sdk_client.call_count == 1
+    assert LLMClientRegistry.get_sdk_client(ModelProvider.ANTHROPIC, "key-1") is (
+        sdk_client
+    )
+    # thinking 모드는 타임아웃이 달라 별도의 SDK 클라이언트를 사용합니다.
+    assert (
+        LLMClientRegistry.get_client(
+            ModelProvider.ANTHROPIC, "key-1", thinking_model_info
+        )
+        is not sdk_client
+    )
+
+
+def test_shutdown_closes_clients(mock_create_sdk_client):
+    """shutdown 호출 시 SDK 클라이언트를 닫고 레지스트리를 비우는지 테스트"""
+    mock_create_sdk_client.side_effect = lambda *args, **kwargs: MagicMock()
+    sdk_client = LLMClientRegistry.get_sdk_client(ModelProvider.OPENAI, "key-1")
+
+    LLMClientRegistry.shutdown()
+
+    sdk_client.close.assert_called_once()
+    assert (
+        LLMClientRegistry.get_sdk_client(ModelProvider.OPENAI, "key-1")
+        is not sdk_client
+    )
+
+
+def test_get_async_client_per_event_loop():
+    """비동기 클라이언트가 이벤트 루프 안에서 재사용되고 루프별로 분리되는지 테스트"""
+
+    async def get_twice():
+        first = LLMClientRegistry.get_async_client(
+            ModelProvider.ANTHROPIC, "key-1", _model_info(thinking_mode=True)
+        )
+        second = LLMClientRegistry.get_async_client(
+            ModelProvider.ANTHROPIC, "key-1", _model_info(thinking_mode=True)
+        )
+        return first, second
+
+    first, second = asyncio.run(get_twice())
+    other_loop_client, _ = asyncio.run(get_twice())
+
+    assert first is second
+    assert first is not other_loop_client
+
+
+def test_ashutdown_closes_async_clients(mock_create_sdk_client):
+    """ashutdown 호출 시 현재 루프의 비동기 클라이언트를 닫는지 테스트"""
+    async_sdk_client = MagicMock()
+    async_sdk_client.close = AsyncMock()
+    mock_create_sdk_client.return_value = async_sdk_client
+
+    async def use_and_shutdown():
+        LLMClientRegistry.get_async_client(
+            ModelProvider.ANTHROPIC, "key-1", _model_info(thinking_mode=True)
+        )
+        await LLMClientRegistry.ashutdown()
+
+    asyncio.run(use_and_shutdown())
+
+    async_sdk_client.close.assert_awaited_once()
+
+
+def test_get_async_client_requires_running_loop():
+    """실행 중인 이벤트 루프 밖에서 호출하면 RuntimeError가 발생하는지 테스트"""
+    with pytest.raises(RuntimeError):
+        LLMClientRegistry.get_async_client(
+            ModelProvider.ANTHROPIC, "key-1", _model_info()
+        )
@@ -0,0 +1,200 @@
+"""TokenUtils 토큰 계산 정책에 대한 테스트"""
+
+from unittest.mock import patch
+
+import pytest
+
+from selvage.src.exceptions.token_count_error import TokenCountError
+from selvage.src.models.token_count_policy import TokenCountPolicy
+from selvage.src.utils.prompts.models import ReviewPrompt, SystemPrompt, UserPrompt
+from selvage.src.utils.token.token_count_cache import (
+    TokenCountCache,
+    token_count_cache,
+)
+from selvage.src.utils.token.token_utils import TokenUtils
+
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+
+
+@pytest.fixture(autouse=True)
+def clear_token_count_cache():
+    """테스트 간 토큰 수 캐시가 공유되지 않도록 비웁니다."""
+    token_count_cache.clear()
+    yield
+    token_count_cache.clear()
+
+
+@pytest.fixture
+def review_prompt() -> ReviewPrompt:
+    return ReviewPrompt(
+        system_prompt=SystemPrompt(role="system", content="코드를 리뷰하세요."),
+        user_prompts=[
+            UserPrompt(
+                hunk_idx="1",
+                file_name="example.py",
+                before_code="def example(): pass",
+                after_code="def example(): return 'Hello'",
+                after_code_start_line_number=1,
+                language="python",
+            )
+        ],
+    )
+
+
+@pytest.fixture
+def mock_remote_count():
+    with patch.object(
+        TokenUtils, "_count_claude_tokens_remotely", return_value=12345
+    ) as mock:
+        yield mock
+
+
+def test_count_tokens_openai_uses_tiktoken(review_prompt, mock_remote_count):
+    """OpenAI 모델은 정책과 무관하게 구간별 tiktoken 결과를 합산하는지 테스트"""
+    with patch.object(
+        TokenUtils, "count_text_tokens_locally", return_value=42
+    ) as mock_tiktoken:
+        result = TokenUtils.count_tokens(
+            review_prompt, "gpt-4o", TokenCountPolicy.REMOTE
+        )
+
+    # 시스템 프롬프트 + 사용자 메시지 1개
+    assert result == 84
+    assert mock_tiktoken.call_count == 2
+    mock_remote_count.assert_not_called()
+
+
+def test_count_tokens_reuses_segment_counts(review_prompt):
+    """변경되지 않은 구간은 다시 인코딩하지 않는지 테스트"""
+    with patch.object(
+        TokenUtils, "count_text_tokens_locally", return_value=10
+    ) as mock_tiktoken:
+        TokenUtils.count_tokens(review_prompt, "gpt-4o")
+        review_prompt.user_prompts.append(
+            UserPrompt(
+                hunk_idx="2",
+                file_name="new_file.py",
+                before_code="",
+                after_code="print('new')",
+                after_code_start_line_number=1,
+                language="python",
+            )
+        )
+        result = TokenUtils.count_tokens(review_prompt, "gpt-4o")
+
+    assert result == 30
+    # 첫 호출 2개 구간 + 두 번째 호출에서 새로 추가된 1개 구간
+    assert mock_tiktoken.call_count == 3
+
+
+def test_token_count_cache_persistence(tmp_path):
+    """토큰 수 캐시를 파일로 저장하고 다시 불러올 수 있는지 테스트"""
+    cache_file = tmp_path / "token_counts" / "token_counts.json"
+    cache = TokenCountCache()
+    cache.count("segment", "gpt-4o", "tiktoken", lambda text, model: 7)
+    cache.save(cache_file)
+
+    restored = TokenCountCache()
+    restored.load(cache_file)
+
+    assert len(restored) == 1
+    assert (
+        restored.count(
+            "segment", "gpt-4o", "tiktoken", lambda text, model: pytest.fail()
+        )
+        == 7
+    )
+
+
+def test_token_count_cache_evicts_oldest_entries():
+    """최대 항목 수를 넘으면 가장 오래된 구간부터 제거하는지 테스트"""
+    cache = TokenCountCache(max_entries=2)
+    for segment in ["a", "b", "c"]:
+        cache.count(segment, "gpt-4o", "tiktoken", lambda text, model: 1)
+
+    assert len(cache) == 2
+    recounted = []
+    cache.count("a", "gpt-4o", "tiktoken", lambda text, model: recounted.append(1) or 1)
+    assert recounted == [1]
+
+
+def test_count_tokens_local_policy(review_prompt, mock_remote_count):
+    """LOCAL 정책은 원격 호출 없이 로컬 추정치를 반환하는지 테스트"""
+    result = TokenUtils.count_tokens(
+        review_prompt, CLAUDE_MODEL, TokenCountPolicy.LOCAL
+    )
+
+    assert result == TokenUtils.estimate_tokens_locally(review_prompt, CLAUDE_MODEL)
+    mock_remote_count.assert_not_called()
+
+
+def test_estimate_text_tokens_applies_safety_margin():
+    """문자-토큰 비율 추정치가 안전 여유분을 포함하는지 테스트"""
+    ascii_text = "x" * 3200
+    korean_text = "한" * 100
+
+    assert TokenUtils.estimate_text_tokens(ascii_text, CLAUDE_MODEL) == 1100
+    assert TokenUtils.estimate_text_tokens(korean_text, CLAUDE_MODEL) == 110
+    assert TokenUtils.estimate_text_tokens("", CLAUDE_MODEL) == 0
+
+
+def test_count_tokens_remote_policy(review_prompt, mock_remote_count):
+    """REMOTE 정책은 항상 원격 API로 계산하는지 테스트"""
+    result = TokenUtils.count_tokens(
+        review_prompt, CLAUDE_MODEL, TokenCountPolicy.REMOTE
+    )
+
+    assert result == 12345
+    mock_remote_count.assert_called_once_with(review_prompt, CLAUDE_MODEL)
+
+
+@patch("selvage.src.utils.token.token_utils.get_model_context_limit")
+def test_count_tokens_auto_policy_far_from_limit(
+    mock_context_limit, review_prompt, mock_remote_count
+):
+    """AUTO 정책에서 추정치가 제한에서 멀면 원격 호출을 생략하는지 테스트"""
+    mock_context_limit.return_value = 200000
+
+    result = TokenUtils.count_tokens(review_prompt, CLAUDE_MODEL, TokenCountPolicy.AUTO)
+
+    assert result == TokenUtils.estimate_tokens_locally(review_prompt, CLAUDE_MODEL)
+    mock_remote_count.assert_not_called()
+
+
+@patch("selvage.src.utils.token.token_utils.get_model_context_limit")
+def test_count_tokens_auto_policy_near_limit(
+    mock_context_limit, review_prompt, mock_remote_count
+):
+    """AUTO 정책에서 추정치가 제한에 가까우면 원격으로 정확히 계산하는지 테스트"""
+    mock_context_limit.return_value = TokenUtils.estimate_tokens_locally(
+        review_prompt, CLAUDE_MODEL
+    )
+
+    result = TokenUtils.count_tokens(review_prompt, CLAUDE_MODEL, TokenCountPolicy.AUTO)
+
+    assert result == 12345
+    mock_remote_count.assert_called_once()
+
+
+@patch("selvage.src.utils.token.token_utils.get_model_context_limit")
+def test_count_tokens_auto_policy_remote_failure_falls_back(
+    mock_context_limit, review_prompt, mock_remote_count
+):
+    """AUTO 정책에서 원격 계산이 실패하면 로컬 추정치를 사용하는지 테스트"""
+    mock_context_limit.return_value = 1
+    mock_remote_count.side_effect = TokenCountError(CLAUDE_MODEL, "네트워크 오류")
+
+    result = TokenUtils.count_tokens(review_prompt, CLAUDE_MODEL, TokenCountPolicy.AUTO)
+
+    assert result == TokenUtils.estimate_tokens_locally(review_prompt, CLAUDE_MODEL)
+
+
+def test_count_tokens_uses_configured_policy(review_prompt, mock_remote_count):
+    """정책을 지정하지 않으면 설정 파일의 기본 정책을 사용하는지 테스트"""
+    with patch(
+        "selvage.src.config.get_default_token_count_policy",
+        return_value=TokenCountPolicy.REMOTE,
+    ):
+        result = TokenUtils.count_tokens(review_prompt, CLAUDE_MODEL)
+
+    assert result == 12345
@@ -0,0 +1,252 @@
+"""감시 모드의 변경 묶기, 파일 감시, 파일별 재리뷰에 대한 테스트"""
+
+import subprocess
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from rich.console import Console
+
+from selvage.src.utils.review_display import ReviewDisplay
+from selvage.src.utils.token.models import (
+    EstimatedCost,
+    ReviewIssue,
+    ReviewRequest,
+    ReviewResponse,
+)
+from selvage.src.watch import (
+    ChangeDebouncer,
+    FileWatcher,
+    WatchSession,
+    is_watchdog_available,
+)
+from selvage.src.watch.file_watcher import _create_watchdog_handler
+
+MODEL = "gpt-4o"
+
+
+@pytest.fixture
+def git_repo(tmp_path) -> Path:
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    subprocess.run(["git", "init", "-q"], cwd=repo_dir, check=True)
+    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=repo_dir)
+    subprocess.run(["git", "config", "user.name", "Test User"], cwd=repo_dir)
+    for name in ("a.py", "b.py"):
+        (repo_dir / name).write_text(f"# {name}\nvalue = 1\n")
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True)
+    subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo_dir, check=True)
+    return repo_dir
+
+
+class FakeReviewer:
+    """리뷰 요청을 기록하고 파일마다 이슈 하나를 반환하는 리뷰 함수"""
+
+    def __init__(self) -> None:
+        self.requests: list[ReviewRequest] = []
+        self.fail = False
+        self.empty = False
+
+    def __call__(
+        self, review_request: ReviewRequest
+    ) -> tuple[ReviewResponse, EstimatedCost]:
+        self.requests.append(review_request)
+        if self.fail:
+            raise RuntimeError("리뷰 실패")
+        if self.empty:
+            return ReviewResponse.get_empty_response(), EstimatedCost.get_zero_cost(
+                MODEL
+            )
+        issues = [
+            ReviewIssue(
+                type="bug", file=filename, line_number=2, description=f"{filename} 이슈"
+            )
+            for filename in review_request.file_paths
+        ]
+        cost = EstimatedCost.get_zero_cost(MODEL).model_copy(
+            update={"total_cost_usd": 0.01}
+        )
+        return ReviewResponse(issues=issues, summary="요약"), cost
+
+    @property
+    def reviewed_files(self) -> list[list[str]]:
+        return [request.file_paths for request in self.requests]
+
+
+@pytest.fixture
+def reviewer() -> FakeReviewer:
+    return FakeReviewer()
+
+
+@pytest.fixture
+def session(git_repo, reviewer) -> WatchSession:
+    return WatchSession(str(git_repo), MODEL, reviewer, diff_only=True)
+
+
+def test_reviews_only_files_whose_hunks_changed(git_repo, reviewer, session):
+    """저장된 파일 중 hunk가 바뀐 파일만 다시 리뷰하는지 테스트"""
+    (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+    (git_repo / "b.py").write_text("# b.py\nvalue = 2\n")
+    session.review_all()
+    assert reviewer.reviewed_files == [["a.py", "b.py"]]
+
+    # 내용 변화 없이 다시 저장한 파일은 리뷰하지 않습니다.
+    session.review_paths([str(git_repo / "a.py"), str(git_repo / "b.py")])
+    assert len(reviewer.requests) == 1
+
+    (git_repo / "b.py").write_text("# b.py\nvalue = 3\n")
+    session.review_paths([str(git_repo / "a.py"), str(git_repo / "b.py")])
+
+    assert reviewer.reviewed_files[-1] == ["b.py"]
+    assert "a.py" not in reviewer.requests[-1].diff_content
+    assert [filename for filename, _ in session.issues] == ["a.py", "b.py"]
+    assert session.review_count == 2
+    assert session.total_cost.total_cost_usd == pytest.approx(0.02)
+
+
+def test_reverted_file_is_removed(git_repo, session):
+    """변경을 되돌린 파일의 이슈를 목록에서 지우는지 테스트"""
+    (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+    session.review_all()
+    assert session.issues_by_file.keys() == {"a.py"}
+
+    (git_repo / "a.py").write_text("# a.py\nvalue = 1\n")
+    session.review_paths([str(git_repo / "a.py")])
+
+    assert session.issues == []
+
+
+def test_failed_review_is_retried_on_next_save(git_repo, reviewer, session):
+    """리뷰에 실패하면 오류를 기록하고 다음 저장 때 다시 리뷰하는지 테스트"""
+    (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+    reviewer.fail = True
+    session.review_all()
+    assert session.last_error == "리뷰 실패"
+
+    reviewer.fail = False
+    session.review_paths(["a.py"])
+
+    assert len(reviewer.requests) == 2
+    assert session.last_error is None
+    assert session.issues_by_file.keys() == {"a.py"}
+
+
+def test_empty_review_response_is_retried_on_next_save(git_repo, reviewer, session):
+    """비어 있거나 실패한 응답은 예외처럼 오류를 기록하고 다시 리뷰하는지 테스트"""
+    (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+    reviewer.empty = True
+    session.review_all()
+
+    assert session.last_error == ReviewResponse.get_empty_response().error
+    assert session.issues_by_file == {}
+    assert session.review_count == 0
+
+    reviewer.empty = False
+    session.review_paths(["a.py"])
+
+    assert len(reviewer.requests) == 2
+    assert session.last_error is None
+    assert session.issues_by_file.keys() == {"a.py"}
+
+
+def test_ignores_paths_outside_repository(tmp_path, reviewer, session):
+    """저장소 밖의 경로는 무시하는지 테스트"""
+    session.review_paths([str(tmp_path / "elsewhere.py")])
+
+    assert reviewer.requests == []
+
+
+def test_group_issues_assigns_by_path_suffix():
+    """경로 끝부분으로 파일을 찾고, 찾지 못하면 첫 파일에 포함하는지 테스트"""
+    issues = [
+        ReviewIssue(type="bug", file="b.py", description="b"),
+        ReviewIssue(type="bug", file=None, description="unknown"),
+    ]
+
+    grouped = WatchSession._group_issues(["src/a.py", "src/b.py"], issues)
+
+    assert [issue.description for issue in grouped["src/b.py"]] == ["b"]
+    assert [issue.description for issue in grouped["src/a.py"]] == ["unknown"]
+
+
+def test_debouncer_waits_until_changes_settle():
+    """변경이 잠잠해진 뒤 모인 경로를 한 번에 반환하는지 테스트"""
+    debouncer = ChangeDebouncer(quiet_seconds=0.1)
+    assert debouncer.wait(timeout=0.01) == set()
+
+    def save_files() -> None:
+        for name in ("a.py", "b.py", "a.py"):
+            debouncer.add(name)
+            time.sleep(0.03)
+
+    thread = threading.Thread(target=save_files)
+    started = time.monotonic()
+    thread.start()
+    paths = debouncer.wait(timeout=1)
+    thread.join()
+
+    assert paths == {"a.py", "b.py"}
+    assert time.monotonic() - started >= 0.1
+    assert debouncer.wait(timeout=0.01) == set()
+
+
+@pytest.mark.parametrize("use_polling", [True, False])
+def test_file_watcher_reports_saved_files(git_repo, use_polling):
+    """파일을 저장하면 절대 경로로 알리고 .git 안의 변경은 무시하는지 테스트"""
+    if not use_polling and not is_watchdog_available():
+        pytest.skip("watchdog이 설치되지 않은 환경")
+    debouncer = ChangeDebouncer(quiet_seconds=0.1)
+    watcher = FileWatcher(
+        git_repo, debouncer.add, poll_interval=0.05, use_polling=use_polling
+    )
+    watcher.start()
+    try:
+        time.sleep(0.1)
+        (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+        subprocess.run(["git", "add", "a.py"], cwd=git_repo, check=True)
+        paths = debouncer.wait(timeout=5)
+    finally:
+        watcher.stop()
+
+    assert str(git_repo.resolve() / "a.py") in paths
+    assert not any("/.git/" in path for path in paths)
+
+
+def test_watchdog_handler_accepts_events_without_dest_path():
+    """이동 이벤트가 아니면 dest_path가 없는 watchdog 3.x 이벤트도 처리하는지 테스트"""
+    if not is_watchdog_available():
+        pytest.skip("watchdog이 설치되지 않은 환경")
+    paths: list[str] = []
+    handler = _create_watchdog_handler(paths.append)
+
+    # watchdog 3.x의 FileModifiedEvent처럼 dest_path 속성이 없는 이벤트
+    handler.on_any_event(
+        SimpleNamespace(is_directory=False, event_type="modified", src_path="/r/a.py")
+    )
+    handler.on_any_event(
+        SimpleNamespace(
+            is_directory=False,
+            event_type="moved",
+            src_path="/r/.a.py.swp",
+            dest_path="/r/a.py",
+        )
+    )
+
+    assert paths == ["/r/a.py", "/r/.a.py.swp", "/r/a.py"]
+
+
+def test_watch_panel_renders_issues(git_repo, session):
+    """감시 모드 패널이 현재 이슈와 상태를 표시하는지 테스트"""
+    (git_repo / "a.py").write_text("# a.py\nvalue = 2\n")
+    session.review_all()
+    display = ReviewDisplay()
+    display.console = Console(record=True, width=120)
+
+    display.console.print(display.watch_panel(session, "polling"))
+
+    output = display.console.export_text()
+    assert "a.py:2" in output
+    assert "a.py 이슈" in output
+    assert "리뷰 1회" in output